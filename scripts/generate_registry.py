@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Generate src/aws_inventory/registry.py, the static collector registry.
+
+Imports every collector module once, at build time, so awsmap itself can
+list and validate services without importing any of them.
+
+Run after adding or changing a collector:
+
+    python scripts/generate_registry.py
+
+With --check, exit 1 if the committed registry is out of date (for CI).
+"""
+
+import os
+import sys
+import pkgutil
+import argparse
+import importlib
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from aws_inventory import collectors  # noqa: E402
+from aws_inventory.collector import SERVICE_MODULE_MAP  # noqa: E402
+
+REGISTRY_PATH = os.path.join(ROOT, 'src', 'aws_inventory', 'registry.py')
+
+HEADER = '''"""
+Static collector registry: service name to collector module and metadata.
+
+GENERATED by scripts/generate_registry.py - do not edit by hand.
+
+Each entry has:
+    module: Module name in aws_inventory.collectors
+    function: Collector function name
+    async_function: Async collector function name, or None
+    subresources: Resource types scheduled as separate tasks, to function name
+"""
+
+from typing import Dict, Any
+
+
+COLLECTORS: Dict[str, Dict[str, Any]] = {
+'''
+
+
+def build_registry() -> dict:
+    """Import every collector module and describe it."""
+    module_services = {module: service for service, module in SERVICE_MODULE_MAP.items()}
+
+    registry = {}
+    for info in pkgutil.iter_modules(collectors.__path__):
+        module_name = info.name
+        module = importlib.import_module(f'aws_inventory.collectors.{module_name}')
+        function = f"collect_{module_name}_resources"
+        if not hasattr(module, function):
+            continue
+        async_function = f"{function}_async"
+        service = module_services.get(module_name, module_name)
+        registry[service] = {
+            'module': module_name,
+            'function': function,
+            'async_function': async_function if hasattr(module, async_function) else None,
+            'subresources': {
+                name: func.__name__ for name, func in getattr(module, 'SUBRESOURCES', {}).items()
+            },
+        }
+    return registry
+
+
+def render(registry: dict) -> str:
+    """Render the registry module source, one entry per line."""
+    lines = [HEADER]
+    for service in sorted(registry):
+        lines.append(f"    {service!r}: {registry[service]!r},\n")
+    lines.append("}\n")
+    return ''.join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--check', action='store_true', help='Fail if the registry is out of date')
+    args = parser.parse_args()
+
+    source = render(build_registry())
+    try:
+        with open(REGISTRY_PATH, 'r', encoding='utf-8') as f:
+            current = f.read()
+    except OSError:
+        current = None
+
+    if args.check:
+        if source != current:
+            print(f"{REGISTRY_PATH} is out of date; run scripts/generate_registry.py", file=sys.stderr)
+            return 1
+        return 0
+
+    if source != current:
+        with open(REGISTRY_PATH, 'w', encoding='utf-8') as f:
+            f.write(source)
+        print(f"Wrote {REGISTRY_PATH}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
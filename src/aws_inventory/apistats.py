@@ -0,0 +1,196 @@
+"""
+API call accounting per (service, operation, region) via botocore event hooks.
+"""
+
+import json
+import math
+import time
+import threading
+from typing import List, Dict, Any, Tuple
+
+from aws_inventory.ratelimit import is_throttle_response
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(pct / 100.0 * len(sorted_values)) - 1
+    return sorted_values[max(0, min(len(sorted_values) - 1, rank))]
+
+
+class ApiStats:
+    """
+    Counts calls, retries, throttles, errors, response bytes and latencies.
+
+    Attaches to botocore (and aiobotocore) clients through their event system:
+
+    - before-call: note the start time
+    - needs-retry: count throttled attempts
+    - after-call / after-call-error: record latency, retries, bytes and errors
+
+    Latency covers the whole call, retries and rate limiter waits included.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+
+    def _entry(self, key: Tuple[str, str, str]) -> Dict[str, Any]:
+        entry = self._stats.get(key)
+        if entry is None:
+            entry = {'calls': 0, 'errors': 0, 'retries': 0, 'throttles': 0, 'bytes': 0, 'latencies': []}
+            self._stats[key] = entry
+        return entry
+
+    def register(self, client, service_name: str) -> None:
+        """
+        Attach accounting hooks to a client.
+
+        Args:
+            client: botocore or aiobotocore client
+            service_name: boto3 service name the client was created for
+        """
+        region = client.meta.region_name or 'global'
+
+        def before_call(model, context, **kwargs):
+            context['awsmap_api_start'] = time.monotonic()
+            # after-call-error isn't given the operation model
+            context['awsmap_api_operation'] = model.name
+
+        def needs_retry(response=None, operation=None, **kwargs):
+            if is_throttle_response(response):
+                with self._lock:
+                    self._entry((service_name, operation.name, region))['throttles'] += 1
+
+        def after_call(model, context, http_response=None, parsed=None, **kwargs):
+            start = context.pop('awsmap_api_start', None)
+            context.pop('awsmap_api_operation', None)
+            parsed = parsed or {}
+            size = 0
+            if http_response is not None:
+                size = int(http_response.headers.get('content-length') or 0)
+                if not size:
+                    # Body already read during parsing (aiobotocore's .content is a coroutine)
+                    body = getattr(http_response, '_content', None)
+                    size = len(body) if isinstance(body, bytes) else 0
+            error_code = parsed.get('Error', {}).get('Code')
+            with self._lock:
+                entry = self._entry((service_name, model.name, region))
+                entry['calls'] += 1
+                entry['retries'] += parsed.get('ResponseMetadata', {}).get('RetryAttempts', 0)
+                entry['bytes'] += size
+                if error_code:
+                    entry['errors'] += 1
+                if start is not None:
+                    entry['latencies'].append(time.monotonic() - start)
+
+        def after_call_error(context, **kwargs):
+            start = context.pop('awsmap_api_start', None)
+            operation = context.pop('awsmap_api_operation', 'unknown')
+            with self._lock:
+                entry = self._entry((service_name, operation, region))
+                entry['calls'] += 1
+                entry['errors'] += 1
+                if start is not None:
+                    entry['latencies'].append(time.monotonic() - start)
+
+        events = client.meta.events
+        events.register('before-call', before_call)
+        events.register('needs-retry', needs_retry)
+        events.register('after-call', after_call)
+        events.register('after-call-error', after_call_error)
+
+    def raw(self) -> Dict[Tuple[str, str, str], Dict[str, Any]]:
+        """Get a copy of the raw counters (picklable, for merging)."""
+        with self._lock:
+            return {key: dict(entry, latencies=list(entry['latencies'])) for key, entry in self._stats.items()}
+
+    def merge(self, raw: Dict[Tuple[str, str, str], Dict[str, Any]]) -> None:
+        """
+        Add raw counters from another ApiStats (e.g. a worker process).
+
+        Args:
+            raw: Output of another instance's raw()
+        """
+        with self._lock:
+            for key, part in raw.items():
+                entry = self._entry(key)
+                for field in ('calls', 'errors', 'retries', 'throttles', 'bytes'):
+                    entry[field] += part[field]
+                entry['latencies'].extend(part['latencies'])
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        Get per-(service, operation, region) statistics.
+
+        Returns:
+            List of dicts with service, operation, region, calls, errors,
+            retries, throttles, bytes, total_seconds and p50/p90/p99/max
+            latency in milliseconds, sorted by total time
+        """
+        rows = []
+        for (service, operation, region), entry in self.raw().items():
+            latencies = sorted(entry['latencies'])
+            rows.append({
+                'service': service,
+                'operation': operation,
+                'region': region,
+                'calls': entry['calls'],
+                'errors': entry['errors'],
+                'retries': entry['retries'],
+                'throttles': entry['throttles'],
+                'bytes': entry['bytes'],
+                'total_seconds': round(sum(latencies), 3),
+                'p50_ms': round(_percentile(latencies, 50) * 1000, 1),
+                'p90_ms': round(_percentile(latencies, 90) * 1000, 1),
+                'p99_ms': round(_percentile(latencies, 99) * 1000, 1),
+                'max_ms': round(latencies[-1] * 1000, 1) if latencies else 0.0,
+            })
+        return sorted(rows, key=lambda r: r['total_seconds'], reverse=True)
+
+    def print_summary(self, limit: int = 25) -> None:
+        """
+        Print the operations with the most total time, aggregated over regions.
+
+        Args:
+            limit: Maximum number of operations to print
+        """
+        totals: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        latencies: Dict[Tuple[str, str], List[float]] = {}
+        for (service, operation, _), entry in self.raw().items():
+            total = totals.setdefault((service, operation), {'calls': 0, 'retries': 0, 'throttles': 0, 'bytes': 0})
+            for field in total:
+                total[field] += entry[field]
+            latencies.setdefault((service, operation), []).extend(entry['latencies'])
+
+        rows = sorted(totals.items(), key=lambda item: sum(latencies[item[0]]), reverse=True)
+        print("\n" + "="*96)
+        print("API CALLS (sorted by total time, all regions)")
+        print("="*96)
+        print(f"{'service:operation':44} {'calls':>7} {'total':>8} {'p50':>7} {'p99':>7} "
+              f"{'retry':>5} {'thr':>4} {'MB':>7}")
+        for (service, operation), total in rows[:limit]:
+            values = sorted(latencies[(service, operation)])
+            print(f"{service + ':' + operation:44.44} {total['calls']:7} {sum(values):7.1f}s "
+                  f"{_percentile(values, 50) * 1000:5.0f}ms {_percentile(values, 99) * 1000:5.0f}ms "
+                  f"{total['retries']:5} {total['throttles']:4} {total['bytes'] / 1e6:7.2f}")
+        if len(rows) > limit:
+            print(f"... {len(rows) - limit} more operations")
+        print("-"*96)
+        all_calls = sum(t['calls'] for t in totals.values())
+        all_bytes = sum(t['bytes'] for t in totals.values())
+        print(f"{'TOTAL':44} {all_calls:7} {'':8} {'':7} {'':7} "
+              f"{sum(t['retries'] for t in totals.values()):5} "
+              f"{sum(t['throttles'] for t in totals.values()):4} {all_bytes / 1e6:7.2f}")
+        print("="*96 + "\n")
+
+    def write_json(self, path: str) -> None:
+        """
+        Write summary() to a JSON file.
+
+        Args:
+            path: Output file path
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'operations': self.summary()}, f, indent=2)
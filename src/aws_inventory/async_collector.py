@@ -0,0 +1,329 @@
+"""
+Asyncio collection backend built on aiobotocore.
+
+Collectors can opt in by defining an async variant next to the sync one:
+
+    async def collect_<module>_resources_async(session, region, account_id)
+
+where ``session`` is an AsyncClientFactory (``await session.client(...)``).
+Services without an async variant run unchanged in a thread pool, so the
+whole scan shares one event loop.
+"""
+
+import time
+import asyncio
+import datetime
+import importlib
+import contextlib
+import concurrent.futures
+from typing import List, Dict, Any, Optional, Callable, Tuple
+
+import aiobotocore.session
+from aiobotocore.config import AioConfig
+from aiobotocore.credentials import AioCredentialResolver, AioDeferredRefreshableCredentials
+from botocore.credentials import CredentialProvider
+
+from aws_inventory.clients import ClientFactory
+from aws_inventory.ratelimit import RateLimiter
+from aws_inventory.scheduling import TaskHistory
+from aws_inventory.apistats import ApiStats
+from aws_inventory.registry import COLLECTORS
+from aws_inventory.records import compact_records
+from aws_inventory.tagging import TagIndex
+from aws_inventory.collector import (
+    plan_scan,
+    order_tasks,
+    collect_service_resources,
+    collect_s3_with_region_filter,
+    _start_progress,
+    _record_completion,
+    _print_timing_summary,
+    _build_result,
+)
+
+
+# How long aiobotocore trusts credentials read from the boto3 session. Just
+# above botocore's 15 minute advisory refresh window, so aiobotocore re-reads
+# them about once a minute and never runs on keys the session has replaced.
+CREDENTIAL_READ_TTL = datetime.timedelta(minutes=16)
+
+
+class SessionCredentialProvider(CredentialProvider):
+    """
+    Credential provider handing a boto3 session's credentials to aiobotocore.
+
+    The boto3 credentials object refreshes itself (SSO, assumed roles), so
+    the aiobotocore side periodically re-reads it instead of holding one
+    frozen copy that expires during long scans.
+    """
+
+    METHOD = 'awsmap-session'
+
+    def __init__(self, credentials):
+        """
+        Args:
+            credentials: botocore Credentials (refreshable or not)
+        """
+        self.credentials = credentials
+
+    async def load(self) -> AioDeferredRefreshableCredentials:
+        return AioDeferredRefreshableCredentials(refresh_using=self._refresh, method=self.METHOD)
+
+    async def _refresh(self) -> Dict[str, Any]:
+        # A refresh on the boto3 side may call STS/SSO, so keep it off the loop
+        loop = asyncio.get_running_loop()
+        frozen = await loop.run_in_executor(None, self.credentials.get_frozen_credentials)
+        expiry = datetime.datetime.now(datetime.timezone.utc) + CREDENTIAL_READ_TTL
+        return {
+            'access_key': frozen.access_key,
+            'secret_key': frozen.secret_key,
+            'token': frozen.token,
+            'expiry_time': expiry.isoformat(),
+        }
+
+
+def create_aio_session(session) -> aiobotocore.session.AioSession:
+    """
+    Create an aiobotocore session with the same credentials and region.
+
+    Args:
+        session: boto3.Session (or ClientFactory) to copy from
+
+    Returns:
+        AioSession reading (and re-reading) the session's credentials
+    """
+    aio_session = aiobotocore.session.AioSession()
+    credentials = session.get_credentials()
+    if credentials is not None:
+        aio_session.register_component(
+            'credential_provider', AioCredentialResolver([SessionCredentialProvider(credentials)])
+        )
+    if session.region_name:
+        aio_session.set_config_variable('region', session.region_name)
+    return aio_session
+
+
+def get_async_collector_function(service_name: str) -> Optional[Callable]:
+    """
+    Return the async collector function for a service, if it has one.
+
+    Args:
+        service_name: Name of the AWS service
+
+    Returns:
+        Coroutine function or None
+    """
+    entry = COLLECTORS.get(service_name)
+    if entry is None or entry['async_function'] is None:
+        return None
+
+    try:
+        module = importlib.import_module(f"aws_inventory.collectors.{entry['module']}")
+        return getattr(module, entry['async_function'], None)
+    except ImportError:
+        return None
+
+
+class AsyncClientFactory:
+    """
+    Caching aiobotocore client factory, the async counterpart of ClientFactory.
+
+    Clients are cached per (service, region, endpoint_url) and kept open
+    until close() is awaited.
+    """
+
+    def __init__(
+        self,
+        session,
+        max_pool_connections: int = 10,
+        limiter: Optional[RateLimiter] = None,
+        hooks: Optional[List[Any]] = None
+    ):
+        """
+        Args:
+            session: boto3.Session (or ClientFactory) providing credentials
+            max_pool_connections: Concurrent HTTP connections per client
+            limiter: Optional RateLimiter attached to every client created
+            hooks: Objects with register(client, service_name), attached to
+                every client created, before the limiter
+        """
+        self.session = session
+        self.limiter = limiter
+        self.hooks = list(hooks or [])
+        self.aio_session = create_aio_session(session)
+        self.config = AioConfig(max_pool_connections=max(10, max_pool_connections))
+        self._clients: Dict[Tuple[str, Optional[str], Optional[str]], Any] = {}
+        self._locks: Dict[Tuple[str, Optional[str], Optional[str]], asyncio.Lock] = {}
+        self._stack = contextlib.AsyncExitStack()
+        self.clients_created = 0
+        self.cache_hits = 0
+        self.construction_time = 0.0
+
+    async def client(
+        self,
+        service_name: str,
+        region_name: Optional[str] = None,
+        endpoint_url: Optional[str] = None
+    ):
+        """
+        Return a cached aiobotocore client, creating it on first use.
+
+        Args:
+            service_name: boto3 service name
+            region_name: AWS region (None for the session default)
+            endpoint_url: Optional custom endpoint
+
+        Returns:
+            aiobotocore client
+        """
+        key = (service_name, region_name, endpoint_url)
+        if key in self._clients:
+            self.cache_hits += 1
+            return self._clients[key]
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            if key in self._clients:
+                self.cache_hits += 1
+                return self._clients[key]
+            start = time.time()
+            client = await self._stack.enter_async_context(
+                self.aio_session.create_client(
+                    service_name,
+                    region_name=region_name,
+                    endpoint_url=endpoint_url,
+                    config=self.config
+                )
+            )
+            self.construction_time += time.time() - start
+            self.clients_created += 1
+            for hook in self.hooks:
+                hook.register(client, service_name)
+            if self.limiter is not None:
+                self.limiter.register_async(client, service_name)
+            self._clients[key] = client
+            return client
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get client construction statistics.
+
+        Returns:
+            Dict with clients_created, cache_hits, construction_seconds
+        """
+        return {
+            'clients_created': self.clients_created,
+            'cache_hits': self.cache_hits,
+            'construction_seconds': round(self.construction_time, 2),
+        }
+
+    async def close(self) -> None:
+        """Close every cached client."""
+        await self._stack.aclose()
+        self._clients.clear()
+
+
+async def collect_all_async(
+    session,
+    services: Optional[List[str]] = None,
+    regions: Optional[List[str]] = None,
+    max_workers: int = 20,
+    max_in_flight: int = 500,
+    progress_callback: Optional[Callable[[str, str], None]] = None,
+    show_timings: bool = False,
+    include_global: bool = False,
+    history: Optional[TaskHistory] = None,
+    estimate_callback: Optional[Callable[[float], None]] = None,
+    rate_limit: bool = True,
+    api_stats: Optional[ApiStats] = None,
+    compact: bool = False,
+    bulk_tags: bool = False
+) -> Dict[str, Any]:
+    """
+    Collect resources from all specified services and regions on one event loop.
+
+    Async collectors run as coroutines sharing aiobotocore clients; the rest
+    run in a thread pool of max_workers through the sync ClientFactory.
+
+    Args:
+        session: boto3.Session to use
+        services: List of service names to collect (None for all)
+        regions: List of regions to collect from (None for all enabled)
+        max_workers: Thread pool size for collectors without an async variant
+        max_in_flight: Concurrent HTTP connections per async client
+        progress_callback: Optional callback(service_name, status) for progress updates
+        show_timings: If True, print service timing summary at the end
+        include_global: If True, include global services even when filtering by non-global regions
+        history: Optional TaskHistory for longest-first ordering
+        estimate_callback: Optional callback(seconds) with the estimated scan duration
+        rate_limit: If True, rate limit API calls per service and region
+        api_stats: Optional ApiStats to record every API call in
+        compact: If True, store compact Resource records instead of dicts
+        bulk_tags: If True, thread-pool collectors resolve tags from one Resource
+            Groups Tagging API sweep per region
+
+    Returns:
+        Dict with metadata and resources list
+    """
+    start_time = time.time()
+    loop = asyncio.get_running_loop()
+
+    plan = await loop.run_in_executor(None, plan_scan, session, services, regions, include_global)
+    account_id = plan['account_id']
+    tasks = order_tasks(plan['tasks'], max_workers, history, estimate_callback)
+    _start_progress(plan, progress_callback)
+
+    limiter = RateLimiter(max_concurrency=max(max_workers, max_in_flight)) if rate_limit else None
+    hooks = [api_stats] if api_stats is not None else []
+    clients = ClientFactory(session, max_pool_connections=max_workers, limiter=limiter, hooks=hooks)
+    if bulk_tags:
+        clients.tag_index = TagIndex(clients)
+    aio_clients = AsyncClientFactory(session, max_pool_connections=max_in_flight, limiter=limiter, hooks=hooks)
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+
+    all_resources = []
+
+    async def run_task(service: str, region: Optional[str]) -> None:
+        start = time.time()
+        async_func = None if service == 's3' else get_async_collector_function(service)
+        try:
+            if async_func is not None:
+                resources = await async_func(aio_clients, region, account_id)
+                elapsed = time.time() - start
+            elif service == 's3':
+                resources, elapsed = await loop.run_in_executor(
+                    executor, collect_s3_with_region_filter,
+                    clients, account_id, plan['filter_regions']
+                )
+            else:
+                resources, elapsed = await loop.run_in_executor(
+                    executor, collect_service_resources,
+                    clients, service, region, account_id
+                )
+        except Exception:
+            resources, elapsed = [], time.time() - start
+
+        all_resources.extend(compact_records(resources) if compact else resources)
+        _record_completion(service, resources, elapsed, progress_callback)
+        if history is not None:
+            history.record(service, region, elapsed)
+
+    try:
+        await asyncio.gather(*(run_task(service, region) for service, region in tasks))
+    finally:
+        executor.shutdown(wait=False)
+        await aio_clients.close()
+        clients.close()
+
+    if history is not None:
+        history.save()
+    elapsed_time = time.time() - start_time
+
+    limiter_stats = limiter.stats() if limiter is not None else None
+    if show_timings:
+        _print_timing_summary(elapsed_time, len(all_resources), clients.stats(), limiter_stats)
+        aio_stats = aio_clients.stats()
+        print(f"{'Async client construction':30} {aio_stats['construction_seconds']:8.2f}s  "
+              f"({aio_stats['clients_created']} created, {aio_stats['cache_hits']} cache hits)\n")
+
+    return _build_result(plan, all_resources, elapsed_time, limiter_stats['throttles'] if limiter_stats else {})
@@ -64,6 +64,9 @@ def get_account_id(session: boto3.Session) -> str:
     Returns:
         AWS account ID as string
     """
+    context = getattr(session, 'scan_context', None)
+    if context is not None:
+        return context.account_id
     sts_client = session.client('sts')
     return sts_client.get_caller_identity()['Account']
 
@@ -78,6 +81,9 @@ def get_enabled_regions(session: boto3.Session) -> List[str]:
     Returns:
         List of enabled region names
     """
+    context = getattr(session, 'scan_context', None)
+    if context is not None:
+        return list(context.enabled_regions)
     try:
         account = session.client('account', region_name='us-east-1')
         paginator = account.get_paginator('list_regions')
@@ -111,6 +117,9 @@ def get_account_alias(session: boto3.Session) -> Optional[str]:
     Returns:
         Account alias or None if not set
     """
+    context = getattr(session, 'scan_context', None)
+    if context is not None:
+        return context.alias
     try:
         iam_client = session.client('iam')
         response = iam_client.list_account_aliases()
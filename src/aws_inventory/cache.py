@@ -0,0 +1,233 @@
+"""
+On-disk TTL cache of collection results per (account, service, region).
+"""
+
+import os
+import json
+import time
+import tempfile
+import threading
+from urllib.parse import quote
+from typing import List, Dict, Any, Optional
+
+from aws_inventory.ratelimit import THROTTLE_ERROR_CODES
+
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.awsmap', 'cache')
+
+# Seconds a cached result stays valid, for services that change slowly.
+# Keys are awsmap service names.
+SERVICE_CACHE_TTLS = {
+    'iam': 6 * 3600,
+    'organizations': 24 * 3600,
+    'route53domains': 24 * 3600,
+    'sso': 6 * 3600,
+    'budgets': 6 * 3600,
+    'ce': 6 * 3600,
+    'shield': 24 * 3600,
+    'acm-pca': 6 * 3600,
+    'service-quotas': 24 * 3600,
+    'cloudfront': 3600,
+    'route53': 3600,
+}
+DEFAULT_CACHE_TTL = 15 * 60
+
+# Error codes meaning a call failed rather than found nothing. Collectors
+# swallow them and return partial or empty lists, which must not be cached.
+FAILURE_ERROR_CODES = THROTTLE_ERROR_CODES | {
+    'AccessDenied',
+    'AccessDeniedException',
+    'UnauthorizedOperation',
+    'AuthorizationError',
+    'AuthFailure',
+    'UnrecognizedClientException',
+    'InvalidClientTokenId',
+    'ExpiredToken',
+    'ExpiredTokenException',
+    'RequestExpired',
+    'InternalError',
+    'InternalFailure',
+    'ServiceUnavailable',
+}
+
+
+class ResultCache:
+    """
+    Collection results stored as one JSON file per (account, service, region).
+
+    Values are serialized like the JSON output (datetimes become strings),
+    so cached records are exactly what a fresh `-f json` run would write.
+
+    Registered as a client hook, it also notes failed API calls per thread:
+    a task started with track() whose calls were throttled, denied or never
+    answered has its result left out of the cache.
+    """
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_CACHE_DIR,
+        ttls: Optional[Dict[str, int]] = None,
+        refresh: bool = False
+    ):
+        """
+        Args:
+            directory: Cache directory
+            ttls: Per-service TTLs in seconds, overriding SERVICE_CACHE_TTLS
+            refresh: If True, never read the cache but still write fresh results
+        """
+        self.directory = directory
+        self.ttls = dict(SERVICE_CACHE_TTLS)
+        self.ttls.update(ttls or {})
+        self.refresh = refresh
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.hits = 0
+        self.misses = 0
+        self.skipped = 0
+
+    def ttl(self, service: str) -> int:
+        """Get the TTL in seconds for a service (or 'service:type' task)."""
+        if service in self.ttls:
+            return self.ttls[service]
+        return self.ttls.get(service.split(':')[0], DEFAULT_CACHE_TTL)
+
+    def _path(self, account_id: str, service: str, region: Optional[str]) -> str:
+        # Sub-resource tasks ('ec2:snapshot') contain ':', which Windows doesn't allow in file names
+        return os.path.join(self.directory, account_id, f"{quote(service, safe='')}.{region or 'global'}.json")
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def register(self, client, service_name: str) -> None:
+        """
+        Attach the failed-call check to a botocore client.
+
+        Args:
+            client: botocore client
+            service_name: boto3 service name the client was created for
+        """
+        def after_call(parsed=None, **kwargs):
+            if (parsed or {}).get('Error', {}).get('Code') in FAILURE_ERROR_CODES:
+                self._local.failed = True
+
+        def after_call_error(**kwargs):
+            self._local.failed = True
+
+        client.meta.events.register('after-call', after_call)
+        client.meta.events.register('after-call-error', after_call_error)
+
+    def track(self) -> None:
+        """Start noting failed API calls for the task running on this thread."""
+        self._local.failed = False
+
+    def lookup(self, account_id: str, service: str, region: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached entry if it is younger than the service's TTL.
+
+        Args:
+            account_id: AWS account ID
+            service: Service name
+            region: AWS region (None for global services and S3)
+
+        Returns:
+            Dict with resources and fingerprint (the slice's baseline
+            fingerprint when it was collected, or None), or None on a miss
+        """
+        if self.refresh:
+            self._count(False)
+            return None
+
+        try:
+            with open(self._path(account_id, service, region), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            if time.time() - entry['created'] <= self.ttl(service):
+                self._count(True)
+                return {'resources': entry['resources'], 'fingerprint': entry.get('fingerprint')}
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        self._count(False)
+        return None
+
+    def get(self, account_id: str, service: str, region: Optional[str]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get a cached result if it is younger than the service's TTL.
+
+        Args:
+            account_id: AWS account ID
+            service: Service name
+            region: AWS region (None for global services and S3)
+
+        Returns:
+            List of resource dictionaries, or None on a miss
+        """
+        entry = self.lookup(account_id, service, region)
+        return entry['resources'] if entry is not None else None
+
+    def put(
+        self,
+        account_id: str,
+        service: str,
+        region: Optional[str],
+        resources: List[Dict[str, Any]],
+        fingerprint: Optional[str] = None
+    ) -> bool:
+        """
+        Store a result (write errors are ignored).
+
+        Empty results, and results of a task whose API calls failed since
+        track(), aren't stored: they may only reflect a throttled or denied
+        scan, and would hide the resources until the TTL runs out.
+
+        Args:
+            account_id: AWS account ID
+            service: Service name
+            region: AWS region (None for global services and S3)
+            resources: List of resource dictionaries
+            fingerprint: The slice's baseline fingerprint, if one was taken
+
+        Returns:
+            True if the result was stored
+        """
+        if not resources or getattr(self._local, 'failed', False):
+            with self._lock:
+                self.skipped += 1
+            return False
+
+        path = self._path(account_id, service, region)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temp file and rename, so concurrent runs never read half a file
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump({'created': time.time(), 'fingerprint': fingerprint, 'resources': resources},
+                              f, default=str)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            return False
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with hits, misses, hit_rate (0-1) and skipped (results not
+            stored because they were empty or their task saw failed calls)
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'skipped': self.skipped,
+                'hit_rate': round(self.hits / total, 3) if total else 0.0,
+            }
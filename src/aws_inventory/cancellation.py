@@ -0,0 +1,94 @@
+"""
+Cooperative cancellation of collection tasks running in worker threads.
+
+Threads can't be killed, so a cancelled task is stopped at its next AWS API
+call: a before-call hook on every client raises TaskCancelled when the task
+running on the current thread has been cancelled.
+"""
+
+import threading
+from typing import Any, Callable, Hashable, Optional, Set
+
+
+class TaskCancelled(BaseException):
+    """
+    Raised inside a cancelled task at its next API call.
+
+    Derives from BaseException (like KeyboardInterrupt), so the collectors'
+    `except Exception` handlers don't swallow it and the task unwinds at once.
+    """
+
+
+class CancellationScope:
+    """Tracks which tasks are cancelled and stops them through client hooks."""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._cancelled: Set[Hashable] = set()
+        self._all = threading.Event()
+
+    def run(self, token: Hashable, func: Callable, *args) -> Any:
+        """
+        Run func(*args) as the task identified by token on this thread.
+
+        Args:
+            token: Task identifier passed to cancel()
+            func: Function to run
+            *args: Arguments for func
+
+        Returns:
+            func's return value
+        """
+        self._local.token = token
+        try:
+            return func(*args)
+        finally:
+            self._local.token = None
+
+    def cancel(self, token: Hashable) -> None:
+        """Cancel one task."""
+        with self._lock:
+            self._cancelled.add(token)
+
+    def cancel_all(self) -> None:
+        """Cancel every task, running or not yet started."""
+        self._all.set()
+
+    def is_cancelled(self, token: Optional[Hashable] = None) -> bool:
+        """
+        Check whether a task (by default the current thread's) is cancelled.
+
+        Args:
+            token: Task identifier, or None for the task on this thread
+
+        Returns:
+            True if the task should stop
+        """
+        if self._all.is_set():
+            return True
+        if token is None:
+            token = getattr(self._local, 'token', None)
+        if token is None:
+            return False
+        with self._lock:
+            return token in self._cancelled
+
+    def register(self, client, service_name: str) -> None:
+        """
+        Attach the cancellation check to a botocore client.
+
+        Args:
+            client: botocore client
+            service_name: boto3 service name the client was created for
+        """
+        # Only before the call starts: botocore emits after-call-error for
+        # Exceptions only, so raising this BaseException between retry
+        # attempts would leave the rate limiter slot (and other hooks'
+        # per-call state) held. Retries are bounded, and with --task-timeout
+        # so are reads.
+        def check(**kwargs):
+            if self.is_cancelled():
+                raise TaskCancelled()
+
+        client.meta.events.register('before-call', check)
@@ -2,45 +2,196 @@
 Command-line interface for AWS Inventory Tool.
 """
 
+import os
 import sys
 import time
 import click
-from typing import Optional, List
-
-from aws_inventory.auth import create_session, validate_credentials, get_account_alias
-from aws_inventory.collector import collect_all, get_available_services, validate_services
-from aws_inventory.formatter import format_output, export_file
+from typing import Optional, List, Dict, Any, TextIO
+
+from aws_inventory.auth import create_session
+from aws_inventory.context import ScanContext, DEFAULT_CONTEXT_FILE
+from aws_inventory.collector import (
+    collect_all, iter_resources, get_available_services, get_subresource_types, validate_services
+)
+from aws_inventory.formatter import format_output, export_file, atomic_output, write_html, write_ndjson
+from aws_inventory.scheduling import TaskHistory, DEFAULT_HISTORY_FILE
+from aws_inventory.incremental import Baseline
+from aws_inventory.cache import ResultCache, DEFAULT_CACHE_DIR
+from aws_inventory.apistats import ApiStats
+from aws_inventory.tracing import Tracer
+from aws_inventory.records import memory_per_resource
 
 
 def print_progress(service: str, status: str) -> None:
     """Print progress update for a service."""
-    click.echo(f"  {service.upper():20} {status}")
+    click.echo(f"  {service.upper():24} {status}")
+
+
+def exit_now(code: int, *extra_streams: Optional[TextIO]) -> None:
+    """
+    Flush and close output streams, then exit without waiting for abandoned
+    worker threads.
+
+    Timed-out or interrupted tasks may still be blocked in an HTTP read, and
+    the interpreter would otherwise join their threads before exiting.
+    os._exit skips atexit handlers and interpreter shutdown, so buffered
+    output (including the real stdout while -o - has it swapped for stderr)
+    is written out here first.
+
+    Args:
+        code: Process exit code
+        extra_streams: Other streams to flush and close (None entries are skipped)
+    """
+    streams = []
+    for stream in (*extra_streams, sys.stdout, sys.__stdout__, sys.stderr, sys.__stderr__):
+        if stream is not None and not any(stream is seen for seen in streams):
+            streams.append(stream)
+    for stream in streams:
+        try:
+            stream.flush()
+            stream.close()
+        except (OSError, ValueError):
+            pass
+    os._exit(code)
+
+
+def parse_tag_filters(tags: tuple) -> Dict[str, List[str]]:
+    """
+    Parse Key=Value tag filters into {key: [values]}.
+
+    Args:
+        tags: Tuple of Key=Value strings
+
+    Returns:
+        Dict of tag key to accepted values
+    """
+    tag_filters = {}
+    for t in tags:
+        if '=' in t:
+            key, value = t.split('=', 1)
+            if key not in tag_filters:
+                tag_filters[key] = []
+            tag_filters[key].append(value)
+    return tag_filters
+
+
+def parse_cache_ttls(values: tuple) -> Dict[str, int]:
+    """
+    Parse SERVICE=SECONDS cache TTL overrides.
+
+    Args:
+        values: Tuple of SERVICE=SECONDS strings
+
+    Returns:
+        Dict of service name to TTL in seconds
+
+    Raises:
+        ValueError: If a value isn't SERVICE=SECONDS
+    """
+    ttls = {}
+    for value in values:
+        service, sep, seconds = value.partition('=')
+        if not sep or not seconds.strip().isdigit():
+            raise ValueError(f"Invalid --cache-ttl '{value}' (expected SERVICE=SECONDS)")
+        ttls[service.strip().lower()] = int(seconds)
+    return ttls
+
+
+def matches_tags(resource: Dict[str, Any], tag_filters: Dict[str, List[str]]) -> bool:
+    """
+    Check a resource against tag filters (same key = OR, different keys = AND).
+
+    Args:
+        resource: Resource dictionary
+        tag_filters: Dict from parse_tag_filters
+
+    Returns:
+        True if the resource matches
+    """
+    resource_tags = resource.get('tags', {})
+    # All keys must match (AND), but values are OR within same key
+    return all(
+        resource_tags.get(k) in values
+        for k, values in tag_filters.items()
+    )
 
 
 @click.command()
 @click.option('--profile', '-p', default=None, help='AWS profile name to use')
 @click.option('--region', '-r', multiple=True, help='AWS region(s) to scan (can be specified multiple times)')
 @click.option('--services', '-s', multiple=True, help='Service(s) to scan (can be specified multiple times)')
-@click.option('--format', '-f', 'output_format', type=click.Choice(['json', 'csv', 'html']), default='html', help='Output format')
-@click.option('--output', '-o', 'output_file', default=None, help='Output file path (auto-generated if not specified)')
+@click.option('--format', '-f', 'output_format', type=click.Choice(['json', 'ndjson', 'csv', 'html']), default='html', help='Output format')
+@click.option('--html-mode', type=click.Choice(['auto', 'static', 'virtual']), default='auto', help='HTML report mode (default: auto, virtual above 20,000 resources)')
+@click.option('--report-processes', default=1, type=int, help='Render HTML report sections across N worker processes (static mode, default: 1)')
+@click.option('--compress-report', is_flag=True, help='Embed the HTML report data gzip-compressed (virtual mode; smaller file, unpacked in the browser)')
+@click.option('--output', '-o', 'output_file', default=None, help="Output file path (auto-generated if not specified, '-' for stdout)")
 @click.option('--workers', '-w', default=40, type=int, help='Maximum parallel workers (default: 40)')
+@click.option('--engine', type=click.Choice(['threads', 'async', 'resource-explorer', 'config']), default='threads', help='Collection backend (default: threads); resource-explorer lists everything from the aggregator index and runs collectors only for -s services; config reads recorded resources from AWS Config')
+@click.option('--config-aggregator', default=None, help='Query this AWS Config aggregator with --engine config (all aggregated accounts and regions)')
+@click.option('--processes', default=1, type=int, help='Shard tasks across N worker processes (threads engine, default: 1)')
+@click.option('--max-in-flight', default=500, type=int, help='Concurrent requests per client with --engine async (default: 500)')
 @click.option('--list-services', is_flag=True, help='List available service collectors')
 @click.option('--tag', '-t', multiple=True, help='Filter by tag (Key=Value format, can be specified multiple times)')
 @click.option('--quiet', '-q', is_flag=True, help='Suppress progress output')
 @click.option('--timings', is_flag=True, help='Show timing summary per service')
 @click.option('--include-global', is_flag=True, help='Include global services even when filtering by non-global regions')
+@click.option('--lpt', is_flag=True, help='Schedule longest tasks first using durations from previous runs')
+@click.option('--no-rate-limit', is_flag=True, help='Disable per-service rate limiting and throttle back-off')
+@click.option('--history-file', default=DEFAULT_HISTORY_FILE, show_default=True, help='Task duration history used by --lpt')
+@click.option('--api-stats', 'show_api_stats', is_flag=True, help='Count API calls per service/operation/region and write them as JSON next to the output')
+@click.option('--trace', 'trace_file', default=None, help='Write task and API call spans to FILE (open in Perfetto)')
+@click.option('--trace-format', type=click.Choice(['chrome', 'otlp']), default='chrome', help='Span file format for --trace (default: chrome)')
+@click.option('--compact-records', is_flag=True, help='Hold resources as slotted records with interned strings (less memory for large inventories)')
+@click.option('--bulk-tags', is_flag=True, help='Resolve tags with one Resource Groups Tagging API sweep per region instead of per-resource calls')
+@click.option('--task-timeout', default=None, type=float, help='Abandon a service/region task after SECONDS')
+@click.option('--deadline', default=None, type=float, help='Stop the scan after SECONDS and keep what has finished')
+@click.option('--org-role', default=None, help='Scan every organization account by assuming this role in each')
+@click.option('--account-workers', default=8, type=int, help='Maximum parallel tasks per account with --org-role (default: 8)')
+@click.option('--account', 'org_accounts', multiple=True, help='Limit --org-role to these account IDs (can be specified multiple times)')
+@click.option('--cache', 'use_cache', is_flag=True, help='Reuse per service/region results younger than their TTL')
+@click.option('--refresh', is_flag=True, help='Ignore cached results but update the cache')
+@click.option('--cache-dir', default=DEFAULT_CACHE_DIR, show_default=True, help='Result cache directory')
+@click.option('--cache-ttl', multiple=True, help='Cache TTL override SERVICE=SECONDS (can be specified multiple times)')
+@click.option('--identity-cache-ttl', default=None, type=float, help='Reuse the account alias and enabled regions resolved within SECONDS by a previous run (credentials are still checked with one STS call)')
+@click.option('--baseline', 'baseline_file', default=None, help='Previous JSON inventory; unchanged service/region slices are reused from it')
 def main(
     profile: Optional[str],
     region: tuple,
     services: tuple,
     output_format: str,
+    html_mode: str,
+    report_processes: int,
+    compress_report: bool,
     output_file: Optional[str],
     workers: int,
+    engine: str,
+    config_aggregator: Optional[str],
+    processes: int,
+    max_in_flight: int,
     list_services: bool,
     tag: tuple,
     quiet: bool,
     timings: bool,
-    include_global: bool
+    include_global: bool,
+    lpt: bool,
+    no_rate_limit: bool,
+    history_file: str,
+    show_api_stats: bool,
+    trace_file: Optional[str],
+    trace_format: str,
+    compact_records: bool,
+    bulk_tags: bool,
+    task_timeout: Optional[float],
+    deadline: Optional[float],
+    org_role: Optional[str],
+    account_workers: int,
+    org_accounts: tuple,
+    use_cache: bool,
+    refresh: bool,
+    cache_dir: str,
+    cache_ttl: tuple,
+    identity_cache_ttl: Optional[float],
+    baseline_file: Optional[str]
 ) -> None:
     """
     awsmap - Map and inventory AWS resources.
@@ -53,6 +204,9 @@ def main(
         # Scan specific services
         awsmap -s ec2 -s s3 -s rds
 
+        # Scan a single resource type
+        awsmap -s ec2:snapshot
+
         # Scan specific regions
         awsmap -r us-east-1 -r eu-west-1
 
@@ -65,18 +219,124 @@ def main(
         # Output as JSON
         awsmap -f json -o inventory.json
 
+        # Stream one JSON record per line to stdout
+        awsmap -f ndjson -o -
+
         # List available collectors
         awsmap --list-services
+
+        # Run slowest tasks first, based on previous runs
+        awsmap --lpt
+
+        # Use the asyncio backend
+        awsmap --engine async
+
+        # List everything from Resource Explorer in seconds, with full details for EC2
+        awsmap --engine resource-explorer -s ec2
+
+        # Read what AWS Config records with one query per region, collect the rest
+        awsmap --engine config
+
+        # Spread 80 workers over 4 processes
+        awsmap -w 80 --processes 4
+
+        # Find N+1 API calls and retries behind a slow service
+        awsmap -s ec2 --api-stats
+
+        # See where a slow scan spends its time (open scan.trace.json in ui.perfetto.dev)
+        awsmap --trace scan.trace.json
+
+        # Cut memory on a very large inventory (--timings shows bytes per resource)
+        awsmap --compact-records --timings -f json
+
+        # Fetch tags in bulk instead of one call per queue, key, alarm...
+        awsmap --bulk-tags
+
+        # Fit a scheduled job into 10 minutes, giving up on tasks stuck for 2
+        awsmap --deadline 600 --task-timeout 120 -f json
+
+        # Scan every account in the organization through a member role
+        awsmap --org-role OrganizationAccountAccessRole -f json
+
+        # Re-run with different filters, reusing results from the last 15 minutes
+        awsmap --cache -t Environment=Production
+
+        # Daily rescan, reusing unchanged slices from yesterday's inventory
+        awsmap -f json -o today.json --baseline yesterday.json
     """
     # List services mode
     if list_services:
         services = get_available_services()
         click.echo(f"\nAvailable service collectors ({len(services)}):\n")
         for i, svc in enumerate(services, 1):
-            click.echo(f"  {i:3}. {svc}")
+            subtypes = get_subresource_types(svc)
+            click.echo(f"  {i:3}. {svc}" + (f"  ({', '.join(subtypes)})" if subtypes else ""))
         click.echo()
         return
 
+    if processes > 1 and engine != 'threads':
+        click.echo(f"Error: --processes can't be combined with --engine {engine}", err=True)
+        sys.exit(1)
+
+    if config_aggregator and engine != 'config':
+        click.echo("Error: --config-aggregator requires --engine config", err=True)
+        sys.exit(1)
+
+    if report_processes < 1:
+        click.echo("Error: --report-processes must be at least 1", err=True)
+        sys.exit(1)
+
+    if report_processes > 1 and (output_format != 'html' or html_mode == 'virtual' or compress_report):
+        click.echo("Error: --report-processes requires --format html with a static (or auto) --html-mode, "
+                   "without --compress-report", err=True)
+        sys.exit(1)
+
+    if compress_report and (output_format != 'html' or html_mode == 'static'):
+        click.echo("Error: --compress-report requires --format html and a virtual (or auto) --html-mode", err=True)
+        sys.exit(1)
+
+    if trace_file and engine != 'threads':
+        click.echo("Error: --trace requires --engine threads", err=True)
+        sys.exit(1)
+
+    if (task_timeout or deadline) and (engine != 'threads' or processes > 1 or org_role):
+        click.echo("Error: --task-timeout and --deadline require --engine threads without --processes or --org-role", err=True)
+        sys.exit(1)
+
+    if org_role and (engine != 'threads' or processes > 1 or baseline_file or lpt):
+        click.echo("Error: --org-role requires --engine threads and can't be combined with --processes, --baseline or --lpt", err=True)
+        sys.exit(1)
+
+    cache = None
+    if use_cache or refresh:
+        if engine != 'threads' or processes > 1:
+            click.echo("Error: --cache requires --engine threads without --processes", err=True)
+            sys.exit(1)
+        try:
+            cache = ResultCache(cache_dir, ttls=parse_cache_ttls(cache_ttl), refresh=refresh)
+        except ValueError as e:
+            click.echo(f"Error: {e}", err=True)
+            sys.exit(1)
+
+    baseline = None
+    if baseline_file:
+        if engine != 'threads' or processes > 1:
+            click.echo("Error: --baseline requires --engine threads without --processes", err=True)
+            sys.exit(1)
+        try:
+            baseline = Baseline.load(baseline_file)
+        except ValueError as e:
+            click.echo(f"Error: {e}", err=True)
+            sys.exit(1)
+
+    # With -o -, the inventory goes to stdout, so status output moves to stderr
+    records_stream = None
+    if output_file == '-':
+        records_stream = sys.stdout
+        sys.stdout = sys.stderr
+        # Put stdout back however the command ends, for callers embedding main
+        click.get_current_context().call_on_close(lambda: setattr(sys, 'stdout', records_stream))
+
     # Parse and validate services early (no AWS credentials needed)
     services_list: Optional[List[str]] = None
     if services:
@@ -101,15 +361,19 @@ def main(
         click.echo("\nValidating AWS credentials...")
 
     try:
-        identity = validate_credentials(session)
-        account_id = identity['account_id']
-        account_alias = get_account_alias(session)
+        context = ScanContext.resolve(session, cache_file=DEFAULT_CONTEXT_FILE, ttl=identity_cache_ttl)
+        context.attach(session)
+        identity = context.identity
+        account_id = context.account_id
+        account_alias = context.alias
 
         if not quiet:
             click.echo(f"  Account ID: {account_id}")
             if account_alias:
                 click.echo(f"  Account Alias: {account_alias}")
             click.echo(f"  User ARN: {identity['arn']}")
+            if context.from_cache:
+                click.echo(f"  (cached {time.time() - context.resolved_at:.0f}s ago)")
     except ValueError as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
@@ -130,47 +394,125 @@ def main(
 
     progress_callback = None if quiet else print_progress
 
+    history = TaskHistory(history_file) if lpt else None
+
+    def print_estimate(seconds: float) -> None:
+        if not quiet:
+            click.echo(f"  Estimated scan duration: ~{seconds:.0f}s")
+
+    scan_options = dict(
+        session=session,
+        services=services_list,
+        regions=regions_list,
+        max_workers=workers,
+        progress_callback=progress_callback,
+        show_timings=timings,
+        include_global=include_global,
+        history=history,
+        estimate_callback=print_estimate,
+        rate_limit=not no_rate_limit
+    )
+    if baseline is not None:
+        scan_options['baseline'] = baseline
+    if cache is not None:
+        scan_options['cache'] = cache
+    api_stats = ApiStats() if show_api_stats else None
+    if api_stats is not None:
+        scan_options['api_stats'] = api_stats
+    tracer = Tracer() if trace_file else None
+    if tracer is not None:
+        scan_options['tracer'] = tracer
+    if compact_records:
+        scan_options['compact'] = True
+    if bulk_tags:
+        scan_options['bulk_tags'] = True
+    if task_timeout:
+        scan_options['task_timeout'] = task_timeout
+    if deadline:
+        scan_options['deadline'] = deadline
+
+    tag_filters = parse_tag_filters(tag)
+
+    # Determine output file path
+    if not output_file:
+        timestamp = time.strftime('%Y%m%d_%H%M%S')
+        ext = output_format
+        output_file = f"{account_id}_inventory_{timestamp}.{ext}"
+
+    # NDJSON on the thread engine streams records as they arrive
+    streaming = output_format == 'ndjson' and engine == 'threads' and processes <= 1 and not org_role
+
     try:
-        result = collect_all(
-            session=session,
-            services=services_list,
-            regions=regions_list,
-            max_workers=workers,
-            progress_callback=progress_callback,
-            show_timings=timings,
-            include_global=include_global
-        )
+        if streaming:
+            metadata: Dict[str, Any] = {}
+            resources = iter_resources(metadata=metadata, **scan_options)
+            if tag_filters:
+                resources = (r for r in resources if matches_tags(r, tag_filters))
+            if records_stream is not None:
+                count = write_ndjson(resources, records_stream)
+            else:
+                with atomic_output(output_file) as f:
+                    count = write_ndjson(resources, f)
+            metadata['resource_count'] = count
+            result = {'metadata': metadata, 'resources': []}
+        elif org_role:
+            from aws_inventory.organization import collect_organization
+            org_options = {k: v for k, v in scan_options.items() if k not in ('history', 'estimate_callback')}
+            result = collect_organization(
+                role_name=org_role,
+                account_workers=account_workers,
+                accounts=list(org_accounts) or None,
+                **org_options
+            )
+        elif engine == 'resource-explorer':
+            from aws_inventory.explorer import collect_with_explorer
+            result = collect_with_explorer(**scan_options)
+        elif engine == 'config':
+            from aws_inventory.configquery import collect_with_config
+            result = collect_with_config(aggregator=config_aggregator, **scan_options)
+        elif engine == 'async':
+            import asyncio
+            from aws_inventory.async_collector import collect_all_async
+            result = asyncio.run(collect_all_async(max_in_flight=max_in_flight, **scan_options))
+        elif processes > 1:
+            from aws_inventory.process_collector import collect_all_sharded
+            result = collect_all_sharded(processes=processes, **scan_options)
+        else:
+            result = collect_all(**scan_options)
+    except KeyboardInterrupt:
+        click.echo("\nInterrupted", err=True)
+        exit_now(130, records_stream)
     except Exception as e:
         click.echo(f"Error during collection: {e}", err=True)
         sys.exit(1)
 
     elapsed = time.time() - start_time
 
+    if api_stats is not None:
+        api_stats.print_summary()
+        if records_stream is None:
+            stats_file = f"{os.path.splitext(output_file)[0]}.api_stats.json"
+            try:
+                api_stats.write_json(stats_file)
+                if not quiet:
+                    click.echo(f"API call statistics saved to: {stats_file}")
+            except OSError as e:
+                click.echo(f"Error writing API statistics: {e}", err=True)
+
+    if tracer is not None:
+        try:
+            tracer.write(trace_file, trace_format)
+            if not quiet:
+                click.echo(f"Trace saved to: {trace_file}")
+        except OSError as e:
+            click.echo(f"Error writing trace: {e}", err=True)
+
     # Apply tag filters (same key = OR, different keys = AND)
-    if tag:
-        tag_filters = {}
-        for t in tag:
-            if '=' in t:
-                key, value = t.split('=', 1)
-                if key not in tag_filters:
-                    tag_filters[key] = []
-                tag_filters[key].append(value)
-
-        if tag_filters:
-            filtered_resources = []
-            for resource in result['resources']:
-                resource_tags = resource.get('tags', {})
-                # All keys must match (AND), but values are OR within same key
-                match = all(
-                    resource_tags.get(k) in values
-                    for k, values in tag_filters.items()
-                )
-                if match:
-                    filtered_resources.append(resource)
-
-            result['resources'] = filtered_resources
-            result['metadata']['resource_count'] = len(filtered_resources)
-            result['metadata']['tag_filter'] = tag_filters
+    if tag_filters:
+        if not streaming:
+            result['resources'] = [r for r in result['resources'] if matches_tags(r, tag_filters)]
+            result['metadata']['resource_count'] = len(result['resources'])
+        result['metadata']['tag_filter'] = tag_filters
 
     # Summary
     if not quiet:
@@ -179,29 +521,86 @@ def main(
         click.echo(f"  Resources found: {result['metadata']['resource_count']:,}")
         click.echo(f"  Services scanned: {result['metadata']['services_scanned']}")
         click.echo(f"  Regions scanned: {result['metadata']['regions_scanned']}")
+        if result['metadata'].get('incomplete'):
+            reasons = sorted({task['reason'] for task in result['metadata']['incomplete']})
+            click.echo(f"  Incomplete tasks: {len(result['metadata']['incomplete'])} ({', '.join(reasons)})")
+        if 'accounts_scanned' in result['metadata']:
+            click.echo(f"  Accounts scanned: {result['metadata']['accounts_scanned']}")
+            for failed_id, error in result['metadata']['accounts_failed'].items():
+                click.echo(f"  Account {failed_id} failed: {error}")
+        if result['metadata'].get('tasks_pruned'):
+            click.echo(f"  Skipped (service not offered in region): {result['metadata']['tasks_pruned']}")
+        if baseline is not None:
+            click.echo(f"  Reused from baseline: {result['metadata']['slices_reused']} slices "
+                       f"({result['metadata']['resources_reused']:,} resources)")
+        if timings and result['resources']:
+            click.echo(f"  Memory per resource: {memory_per_resource(result['resources']):,.0f} bytes "
+                       f"({'compact' if compact_records else 'dict'} records)")
         click.echo(f"  Duration: {elapsed:.1f}s")
 
-    # Format output
-    try:
-        output_content = format_output(result, output_format)
-    except Exception as e:
-        click.echo(f"Error formatting output: {e}", err=True)
-        sys.exit(1)
+    if streaming:
+        if not quiet and records_stream is None:
+            click.echo(f"\nOutput saved to: {output_file}")
+        if result['metadata'].get('incomplete'):
+            exit_now(0, records_stream)
+        return
 
-    # Determine output file path
-    if not output_file:
-        timestamp = time.strftime('%Y%m%d_%H%M%S')
-        ext = output_format
-        output_file = f"{account_id}_inventory_{timestamp}.{ext}"
+    # Format and write output; HTML streams into the file section by section
+    report_stats: Dict[str, Any] = {}
+    format_start = time.time()
+    if output_format == 'html':
+        try:
+            if records_stream is not None:
+                write_html(result, records_stream, mode=html_mode, stats=report_stats, compress=compress_report,
+                           processes=report_processes)
+                records_stream.flush()
+            else:
+                # Streamed to a temporary file and renamed, so a failure leaves no partial report
+                with atomic_output(output_file) as f:
+                    write_html(result, f, mode=html_mode, stats=report_stats, compress=compress_report,
+                               processes=report_processes)
+        except Exception as e:
+            click.echo(f"Error writing output: {e}", err=True)
+            sys.exit(1)
+    else:
+        try:
+            output_content = format_output(result, output_format)
+        except Exception as e:
+            click.echo(f"Error formatting output: {e}", err=True)
+            sys.exit(1)
 
-    # Write output
-    try:
-        export_file(output_content, output_file)
-        if not quiet:
-            click.echo(f"\nOutput saved to: {output_file}")
-    except Exception as e:
-        click.echo(f"Error writing output: {e}", err=True)
-        sys.exit(1)
+        try:
+            if records_stream is not None:
+                records_stream.write(output_content)
+                records_stream.flush()
+            else:
+                export_file(output_content, output_file)
+        except Exception as e:
+            click.echo(f"Error writing output: {e}", err=True)
+            sys.exit(1)
+
+    format_elapsed = time.time() - format_start
+    if report_processes > 1 and report_stats.get('render_processes', 1) == 1:
+        click.echo("Warning: --report-processes had no effect: the report used the virtual HTML mode "
+                   "(use --html-mode static to render across processes)", err=True)
+
+    if timings and not quiet:
+        render_processes = report_stats.get('render_processes', 1)
+        workers_note = f" across {render_processes} processes" if render_processes > 1 else ''
+        click.echo(f"  Report: formatted and written in {format_elapsed:.2f}s{workers_note}")
+    if timings and not quiet and 'search_index' in report_stats:
+        index_stats = report_stats['search_index']
+        click.echo(f"  Search index: {index_stats['tokens']:,} tokens, {index_stats['bytes'] / 1024:,.0f} KB, "
+                   f"built in {index_stats['seconds']:.2f}s")
+    if timings and not quiet and 'payload' in report_stats:
+        payload = report_stats['payload']
+        click.echo(f"  Report data: {payload['raw_bytes'] / 1024:,.0f} KB, "
+                   f"{payload['compressed_bytes'] / 1024:,.0f} KB compressed")
+    if records_stream is None and not quiet:
+        click.echo(f"\nOutput saved to: {output_file}")
+
+    if result['metadata'].get('incomplete'):
+        exit_now(0, records_stream)
 
 
 if __name__ == '__main__':
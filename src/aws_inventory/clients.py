@@ -0,0 +1,167 @@
+"""
+Thread-safe boto3 client factory shared by every collector in a scan.
+"""
+
+import time
+import logging
+import threading
+from typing import Dict, Any, Optional, Tuple, List
+
+import boto3
+from botocore.config import Config
+
+from aws_inventory.ratelimit import RateLimiter
+
+
+class _PoolFullCounter(logging.Filter):
+    """Count urllib3 'Connection pool is full' warnings without hiding them."""
+
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.getMessage().startswith('Connection pool is full'):
+            self.count += 1
+        return True
+
+
+class ClientFactory:
+    """
+    Caching replacement for boto3.Session.client().
+
+    Collectors receive a ClientFactory in place of the session. It exposes the
+    same client() signature and proxies every other attribute to the wrapped
+    session, so collectors don't need to know about it.
+
+    Clients are cached per (service, region, endpoint_url) and share a
+    botocore Config whose connection pool is sized to the worker count.
+    """
+
+    def __init__(
+        self,
+        session: boto3.Session,
+        max_pool_connections: int = 10,
+        limiter: Optional[RateLimiter] = None,
+        hooks: Optional[List[Any]] = None,
+        read_timeout: Optional[float] = None
+    ):
+        """
+        Args:
+            session: boto3.Session to create clients from
+            max_pool_connections: HTTP connection pool size per client
+            limiter: Optional RateLimiter attached to every client created
+            hooks: Other objects with register(client, service_name), attached
+                to every client before the limiter
+            read_timeout: Optional socket read timeout in seconds (botocore's
+                default is 60)
+        """
+        self.session = session
+        self.limiter = limiter
+        self.hooks = list(hooks or [])
+        # Optional TagIndex collectors look tags up in (see tagging.lookup_tags)
+        self.tag_index = None
+        config_options: Dict[str, Any] = {'max_pool_connections': max(10, max_pool_connections)}
+        if read_timeout is not None:
+            config_options['read_timeout'] = read_timeout
+        self.config = Config(**config_options)
+        self._clients: Dict[Tuple[str, Optional[str], Optional[str]], Any] = {}
+        self._lock = threading.Lock()
+        self.clients_created = 0
+        self.cache_hits = 0
+        self.construction_time = 0.0
+        self._pool_full = _PoolFullCounter()
+        logging.getLogger('urllib3.connectionpool').addFilter(self._pool_full)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not found on the factory itself
+        return getattr(self.session, name)
+
+    def client(
+        self,
+        service_name: str,
+        region_name: Optional[str] = None,
+        endpoint_url: Optional[str] = None,
+        **kwargs
+    ):
+        """
+        Return a cached client, creating it on first use.
+
+        Args:
+            service_name: boto3 service name
+            region_name: AWS region (None for the session default)
+            endpoint_url: Optional custom endpoint
+            **kwargs: Extra boto3 client arguments (bypass the cache)
+
+        Returns:
+            botocore client
+        """
+        if kwargs:
+            with self._lock:
+                return self._create(service_name, region_name, endpoint_url, **kwargs)
+
+        key = (service_name, region_name, endpoint_url)
+        # boto3 sessions are not thread-safe, so creation is serialized too
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self.cache_hits += 1
+                return client
+            client = self._create(service_name, region_name, endpoint_url)
+            self._clients[key] = client
+            return client
+
+    def _create(
+        self,
+        service_name: str,
+        region_name: Optional[str],
+        endpoint_url: Optional[str],
+        **kwargs
+    ):
+        config = kwargs.pop('config', None)
+        config = self.config.merge(config) if config else self.config
+
+        start = time.time()
+        client = self.session.client(
+            service_name,
+            region_name=region_name,
+            endpoint_url=endpoint_url,
+            config=config,
+            **kwargs
+        )
+        self.construction_time += time.time() - start
+        self.clients_created += 1
+
+        # Hooks that may abort a call must run before the limiter takes a slot
+        for hook in self.hooks:
+            hook.register(client, service_name)
+        if self.limiter is not None:
+            self.limiter.register(client, service_name)
+        return client
+
+    @property
+    def pool_full_events(self) -> int:
+        """Number of connections discarded because a client pool was full."""
+        return self._pool_full.count
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get client construction statistics.
+
+        Returns:
+            Dict with clients_created, cache_hits, construction_seconds,
+            pool_full_events and pool_size
+        """
+        return {
+            'clients_created': self.clients_created,
+            'cache_hits': self.cache_hits,
+            'construction_seconds': round(self.construction_time, 2),
+            'pool_full_events': self.pool_full_events,
+            'pool_size': self.config.max_pool_connections,
+        }
+
+    def close(self) -> None:
+        """Stop counting pool-full events and drop cached clients."""
+        logging.getLogger('urllib3.connectionpool').removeFilter(self._pool_full)
+        with self._lock:
+            self._clients.clear()
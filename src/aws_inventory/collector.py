@@ -6,9 +6,20 @@ import time
 import importlib
 import threading
 import concurrent.futures
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Iterator
 
 from aws_inventory.auth import get_account_id, get_enabled_regions
+from aws_inventory.clients import ClientFactory
+from aws_inventory.ratelimit import RateLimiter
+from aws_inventory.scheduling import TaskHistory, order_longest_first, estimate_duration
+from aws_inventory.incremental import Baseline
+from aws_inventory.cache import ResultCache
+from aws_inventory.cancellation import CancellationScope
+from aws_inventory.apistats import ApiStats
+from aws_inventory.tracing import Tracer
+from aws_inventory.registry import COLLECTORS
+from aws_inventory.records import compact_records
+from aws_inventory.tagging import TagIndex
 
 
 # Global services grouped by control plane region
@@ -21,7 +32,11 @@ GLOBAL_SERVICES = US_EAST_1_GLOBAL_SERVICES + US_WEST_2_GLOBAL_SERVICES
 
 # S3 is treated as regional - buckets have specific regions
 
-# Service name to module name mapping (for special cases)
+# Socket read timeout (botocore's default) lowered to --task-timeout when shorter
+DEFAULT_READ_TIMEOUT = 60.0
+
+# Service name to module name mapping (for special cases).
+# Used by scripts/generate_registry.py; at runtime the registry has the module names.
 SERVICE_MODULE_MAP = {
     'lambda': 'lambda_',
     'ecr-public': 'ecr_public',
@@ -41,6 +56,23 @@ SERVICE_MODULE_MAP = {
     'timestream-influxdb': 'timestream_influxdb',
 }
 
+# Service name to botocore endpoint name mapping (where they differ)
+# Used to look up which regions offer a service in botocore's endpoint data
+BOTO3_SERVICE_MAP = {
+    'vpc': 'ec2',
+    'cognito': 'cognito-idp',
+    'lexv2': 'lexv2-models',
+    'sso': 'sso-admin',
+    'opensearch-serverless': 'opensearchserverless',
+    'eventbridge-scheduler': 'scheduler',
+    'eventbridge-pipes': 'pipes',
+}
+
+# Regions to scan even when botocore's bundled endpoint data doesn't list them
+# for a service yet (e.g. a service newly launched in a region).
+# Format: {'service': ['region', ...]}
+REGION_SUPPORT_OVERRIDES: Dict[str, List[str]] = {}
+
 # Thread-safe tracking for progress
 _lock = threading.Lock()
 _service_progress = {}
@@ -59,11 +91,20 @@ def validate_services(services: List[str]) -> None:
     """
     from difflib import get_close_matches
     available = set(get_available_services())
-    unknown = [s for s in services if s.lower() not in available]
+    unknown = []
+    for s in services:
+        service, subresource = split_service(s.lower())
+        if service not in available or (subresource and subresource not in get_subresource_types(service)):
+            unknown.append(s)
     if unknown:
         msgs = []
         for s in unknown:
-            matches = get_close_matches(s.lower(), sorted(available), n=3, cutoff=0.5)
+            service, subresource = split_service(s.lower())
+            if subresource and service in available:
+                candidates = [f"{service}:{t}" for t in get_subresource_types(service)]
+            else:
+                candidates = sorted(available)
+            matches = get_close_matches(s.lower(), candidates, n=3, cutoff=0.5)
             msg = f"Unknown service '{s}'"
             if matches:
                 msg += f". Did you mean: {', '.join(matches)}?"
@@ -73,162 +114,133 @@ def validate_services(services: List[str]) -> None:
         )
 
 
+def split_service(service_name: str) -> tuple:
+    """
+    Split a task name like 'ec2:snapshot' into (service, resource type).
+
+    Args:
+        service_name: Service name, optionally with a ':type' suffix
+
+    Returns:
+        Tuple of (service, resource type or None)
+    """
+    service, _, subresource = service_name.partition(':')
+    return service, subresource or None
+
+
+def _get_collector_module(service: str):
+    return importlib.import_module(f"aws_inventory.collectors.{COLLECTORS[service]['module']}")
+
+
 def get_collector_function(service_name: str) -> Optional[Callable]:
     """
-    Dynamically import and return the collector function for a service.
+    Import and return the collector function for a service.
+
+    Modules are looked up in the static registry and imported only now, so
+    services that are never collected are never imported. Names like
+    'ec2:snapshot' return that resource type's function from the collector
+    module's SUBRESOURCES.
 
     Args:
-        service_name: Name of the AWS service
+        service_name: Name of the AWS service, optionally with a ':type' suffix
 
     Returns:
         Collector function or None if not found
     """
-    module_name = SERVICE_MODULE_MAP.get(service_name, service_name)
-    function_name = f"collect_{module_name}_resources"
+    service, subresource = split_service(service_name)
+    entry = COLLECTORS.get(service)
+    if entry is None:
+        return None
+    function_name = entry['subresources'].get(subresource) if subresource else entry['function']
+    if function_name is None:
+        return None
 
     try:
-        module = importlib.import_module(f'aws_inventory.collectors.{module_name}')
-        return getattr(module, function_name)
+        return getattr(_get_collector_module(service), function_name)
     except (ImportError, AttributeError):
         return None
 
 
+def get_subresource_types(service_name: str) -> List[str]:
+    """
+    Get the resource types a collector schedules as separate tasks.
+
+    Collector modules opt in with a SUBRESOURCES dict mapping resource type
+    to a collect function (same signature as the main collector). Each type
+    then runs as its own task, e.g. 'ec2:snapshot', so one huge type doesn't
+    hold up the rest of the service.
+
+    Args:
+        service_name: Name of the AWS service
+
+    Returns:
+        Resource types in collection order (empty if the collector has none)
+    """
+    entry = COLLECTORS.get(service_name)
+    return list(entry['subresources']) if entry else []
+
+
 def get_available_services() -> List[str]:
     """
-    Get list of available service collectors.
+    Get list of available service collectors (from the static registry).
 
     Returns:
         List of service names that have collectors
     """
-    services = [
-        # Compute
-        'ec2', 'lambda', 'ecs', 'eks', 'ecr', 'ecr-public', 'lightsail', 'autoscaling', 'application-autoscaling', 'elasticbeanstalk', 'batch', 'apprunner',
-        # Storage
-        's3', 'efs', 'fsx', 'backup', 'datasync', 'dlm', 'storagegateway',
-        # Database
-        'rds', 'dynamodb', 'elasticache', 'memorydb', 'docdb', 'neptune', 'redshift',
-        'keyspaces', 'opensearch', 'opensearch-serverless', 'dax', 'redshift-serverless',
-        'dsql', 'timestream-influxdb',
-        # Networking
-        'vpc', 'elbv2', 'elb', 'route53', 'cloudfront', 'globalaccelerator', 'apigateway', 'apigatewayv2', 'appsync', 'directconnect', 'network-firewall',
-        # Security
-        'iam', 'sso', 'kms', 'secretsmanager', 'acm', 'wafv2', 'guardduty', 'inspector2',
-        'securityhub', 'ds', 'cognito', 'accessanalyzer', 'macie2', 'detective', 'shield', 'fms', 'acm-pca', 'cloudhsmv2',
-        # Management
-        'cloudwatch', 'logs', 'cloudtrail', 'ssm', 'config', 'sns', 'sqs', 'events',
-        'xray', 'grafana', 'amp', 'ce', 'budgets', 'compute-optimizer', 'service-quotas', 'resource-groups', 'health',
-        # Serverless
-        'stepfunctions', 'kinesis', 'firehose', 'kafka', 'eventbridge-scheduler', 'eventbridge-pipes', 'schemas',
-        # DevTools
-        'cloudformation', 'codeartifact', 'codebuild', 'codepipeline', 'codedeploy',
-        # Analytics
-        'athena', 'glue', 'mwaa', 'quicksight', 'lakeformation', 'emr', 'emr-serverless', 'cleanrooms',
-        # AI/ML
-        'sagemaker', 'bedrock', 'frauddetector',
-        # Data Governance
-        'datazone',
-        # Image Building
-        'imagebuilder',
-        # End User
-        'workspaces', 'amplify',
-        # IoT
-        'iot',
-        # Messaging
-        'mq',
-        # Migration & Transfer
-        'transfer',
-        # Management
-        'organizations',
-        # Other
-        'ram',
-        # Service Discovery
-        'servicediscovery',
-        # Route 53 Resolver
-        'route53resolver',
-        # Route 53 Domains
-        'route53domains',
-        # VPC Lattice
-        'vpc-lattice',
-        # Network Manager
-        'networkmanager',
-        # Database Migration
-        'dms',
-        # Email
-        'sesv2',
-        # Integration
-        'appflow',
-        # Media
-        'mediaconvert',
-        'mediaconnect',
-        'mediapackage',
-        'medialive',
-        'mediastore',
-        'mediatailor',
-        # Conversational AI
-        'lexv2',
-        # Contact Center
-        'connect',
-        # AI/ML - Vision
-        'rekognition',
-        # AI/ML - Document
-        'textract',
-        # AI/ML - Speech
-        'transcribe',
-        # AI/ML - Language
-        'translate',
-        # AI/ML - NLP
-        'comprehend',
-        # AI/ML - Text to Speech
-        'polly',
-        # AI/ML - Recommendations
-        'personalize',
-        # AI/ML - Search
-        'kendra',
-        # Interactive Video
-        'ivs',
-        # Game Development
-        'gamelift',
-        # IoT
-        'iotsitewise',
-        # Hybrid
-        'outposts',
-        # Serverless
-        'serverlessrepo',
-        # Monitoring
-        'synthetics',
-        # Chaos Engineering
-        'fis',
-        # Service Management
-        'servicecatalog',
-        # Location
-        'location',
-        # Configuration
-        'appconfig',
-        # Resource Discovery
-        'resource-explorer-2',
-        # Compliance
-        'auditmanager',
-        # Resilience
-        'resiliencehub',
-        # Security Data Lake
-        'securitylake',
-        # Testing
-        'devicefarm',
-    ]
-
-    # Return only services that have collectors implemented
-    available = []
-    for service in services:
-        if get_collector_function(service):
-            available.append(service)
-
-    return sorted(available)
+    return sorted(COLLECTORS)
+
+
+def get_supported_regions(session, service_name: str, regions: List[str]) -> List[str]:
+    """
+    Filter regions down to those where a service is offered.
+
+    Uses botocore's bundled endpoint/partition data. A region is kept when the
+    service is listed there, when it appears in REGION_SUPPORT_OVERRIDES, when
+    botocore has no endpoint data for the service at all, or when botocore
+    doesn't know the region yet (newer than the installed botocore).
+
+    Args:
+        session: boto3.Session to use
+        service_name: Name of the AWS service
+        regions: Candidate regions
+
+    Returns:
+        Regions (in input order) where the service should be collected
+    """
+    boto_name = BOTO3_SERVICE_MAP.get(service_name, service_name)
+    overrides = set(REGION_SUPPORT_OVERRIDES.get(service_name, []))
+
+    partitions = {}
+    for region in regions:
+        try:
+            partition = session.get_partition_for_region(region)
+        except Exception:
+            partition = 'aws'
+        partitions.setdefault(partition, []).append(region)
+
+    supported = set()
+    for partition, partition_regions in partitions.items():
+        try:
+            offered = set(session.get_available_regions(boto_name, partition_name=partition))
+            known = set(session.get_available_regions('ec2', partition_name=partition))
+        except Exception:
+            offered = set()
+        if not offered:
+            # No endpoint data for this service - can't tell, so don't prune
+            supported.update(partition_regions)
+            continue
+        for region in partition_regions:
+            if region in offered or region in overrides or region not in known:
+                supported.add(region)
+
+    return [r for r in regions if r in supported]
 
 
 def collect_s3_with_region_filter(
     session,
     account_id: str,
-    filter_regions: Optional[List[str]] = None
+    filter_regions: Optional[List[str]] = None,
+    cache: Optional[ResultCache] = None
 ) -> tuple:
     """
     Collect S3 buckets with optional region filtering.
@@ -240,6 +252,7 @@ def collect_s3_with_region_filter(
         session: boto3.Session to use
         account_id: AWS account ID
         filter_regions: Optional list of regions to filter by
+        cache: Optional ResultCache (stores all buckets, filtered on read)
 
     Returns:
         Tuple of (resources list, elapsed time)
@@ -248,7 +261,13 @@ def collect_s3_with_region_filter(
 
     start = time.time()
     try:
-        resources = collect_s3_resources(session, None, account_id)
+        resources = cache.get(account_id, 's3', None) if cache is not None else None
+        if resources is None:
+            if cache is not None:
+                cache.track()
+            resources = collect_s3_resources(session, None, account_id)
+            if cache is not None:
+                cache.put(account_id, 's3', None, resources)
 
         # Filter by region if specified
         if filter_regions:
@@ -265,7 +284,9 @@ def collect_service_resources(
     session,
     service_name: str,
     region: Optional[str],
-    account_id: str
+    account_id: str,
+    baseline: Optional[Baseline] = None,
+    cache: Optional[ResultCache] = None
 ) -> tuple:
     """
     Collect resources for a single service in a single region.
@@ -275,6 +296,8 @@ def collect_service_resources(
         service_name: Name of the AWS service
         region: AWS region (None for global services)
         account_id: AWS account ID
+        baseline: Optional Baseline; unchanged slices are reused from it
+        cache: Optional ResultCache; fresh cached results skip collection
 
     Returns:
         Tuple of (resources list, elapsed time)
@@ -285,7 +308,22 @@ def collect_service_resources(
 
     start = time.time()
     try:
-        resources = collector_func(session, region, account_id)
+        entry = cache.lookup(account_id, service_name, region) if cache is not None else None
+        if entry is not None:
+            resources = entry['resources']
+            # Keep the slice's fingerprint in this scan's output for the next --baseline run
+            if baseline is not None and entry['fingerprint']:
+                baseline.record(service_name, region, entry['fingerprint'])
+        else:
+            if cache is not None:
+                cache.track()
+            if baseline is not None:
+                resources = baseline.collect(collector_func, session, service_name, region, account_id)
+            else:
+                resources = collector_func(session, region, account_id)
+            if cache is not None:
+                fingerprint = baseline.fingerprint(service_name, region) if baseline is not None else None
+                cache.put(account_id, service_name, region, resources, fingerprint=fingerprint)
         elapsed = time.time() - start
         return resources, elapsed
     except Exception:
@@ -293,36 +331,29 @@ def collect_service_resources(
         return [], elapsed
 
 
-def collect_all(
+def plan_scan(
     session,
     services: Optional[List[str]] = None,
     regions: Optional[List[str]] = None,
-    max_workers: int = 20,
-    progress_callback: Optional[Callable[[str, str], None]] = None,
-    show_timings: bool = False,
     include_global: bool = False
 ) -> Dict[str, Any]:
     """
-    Collect resources from all specified services and regions.
+    Resolve services, regions and the (service, region) task list for a scan.
 
     Args:
         session: boto3.Session to use
         services: List of service names to collect (None for all)
         regions: List of regions to collect from (None for all enabled)
-        max_workers: Maximum parallel workers
-        progress_callback: Optional callback(service_name, status) for progress updates
-        show_timings: If True, print service timing summary at the end
         include_global: If True, include global services even when filtering by non-global regions
 
     Returns:
-        Dict with metadata and resources list
-    """
-    global _service_progress, _service_timings
-    _service_progress = {}
-    _service_timings = {}
-
-    start_time = time.time()
+        Dict with account_id, service_list, region_list, filter_regions,
+        service_regions, service_units (task names per service), tasks and
+        tasks_pruned
 
+    Raises:
+        ValueError: If a service or region is unknown
+    """
     # Get account info
     account_id = get_account_id(session)
 
@@ -333,7 +364,10 @@ def collect_all(
     else:
         service_list = get_available_services()
 
-    service_list = sorted(service_list)
+    # A whole service already covers its resource types, so -s ec2 -s ec2:snapshot
+    # mustn't schedule (and output) snapshots twice
+    requested = set(service_list)
+    service_list = sorted(s for s in requested if s == split_service(s)[0] or split_service(s)[0] not in requested)
 
     # Determine regions
     if regions:
@@ -370,103 +404,461 @@ def collect_all(
         if 'us-west-2' in region_list:
             active_global_services.update(US_WEST_2_GLOBAL_SERVICES)
 
-    # Initialize progress tracking
+    # Drop regions where a regional service isn't offered before scheduling
+    service_regions = {}
+    tasks_pruned = 0
     for service in service_list:
-        if service in active_global_services:
-            _service_progress[service] = {'total': 1, 'completed': 0, 'resources': 0}
-        elif service == 's3':
-            # S3 is treated as regional - will filter by bucket region
-            _service_progress[service] = {'total': 1, 'completed': 0, 'resources': 0}
-        else:
-            _service_progress[service] = {'total': len(region_list), 'completed': 0, 'resources': 0}
+        base = split_service(service)[0]
+        if base in GLOBAL_SERVICES or base == 's3':
+            continue
+        service_regions[service] = get_supported_regions(session, base, region_list)
+        tasks_pruned += len(region_list) - len(service_regions[service])
+
+    # Collectors with SUBRESOURCES run one task per resource type
+    service_units = {}
+    for service in service_list:
+        base, subresource = split_service(service)
+        subtypes = [] if subresource else get_subresource_types(base)
+        service_units[service] = [f"{base}:{t}" for t in subtypes] or [service]
 
-    all_resources = []
-    futures_map = {}
+    # Build the task list: (service, region), region None for global services and S3
+    tasks = []
+    for service in service_list:
+        base = split_service(service)[0]
+        if base in active_global_services or base == 's3':
+            # Global service - single call, no region
+            # S3 - collect all buckets, filter by region later
+            tasks.extend((unit, None) for unit in service_units[service])
+        elif base not in GLOBAL_SERVICES:
+            # Regional service - one call per region that offers it
+            for region in service_regions[service]:
+                tasks.extend((unit, region) for unit in service_units[service])
+        # else: skip global services not in active_global_services
 
-    def on_complete(service: str, resources: List[Dict[str, Any]], elapsed: float):
-        """Track completion, resources, and timing."""
-        with _lock:
-            _service_progress[service]['completed'] += 1
-            _service_progress[service]['resources'] += len(resources)
-
-            if service not in _service_timings:
-                _service_timings[service] = 0.0
-            _service_timings[service] += elapsed
-
-            progress = _service_progress[service]
-            if progress['completed'] >= progress['total']:
-                if progress_callback:
-                    progress_callback(service, f"Done: {progress['resources']} resources")
-
-    # Submit all collection tasks
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        for service in service_list:
-            if service in active_global_services:
-                # Global service - single call, no region
-                if progress_callback:
-                    progress_callback(service, "Collecting...")
-                future = executor.submit(
-                    collect_service_resources,
-                    session, service, None, account_id
-                )
-                futures_map[future] = (service, None)
-            elif service == 's3':
-                # S3 - collect all buckets, filter by region later
-                if progress_callback:
-                    progress_callback(service, "Collecting...")
-                future = executor.submit(
-                    collect_s3_with_region_filter,
-                    session, account_id, region_list if regions else None
-                )
-                futures_map[future] = (service, None)
-            elif service not in GLOBAL_SERVICES:
-                # Regional service - one call per region
-                if progress_callback:
-                    progress_callback(service, "Collecting...")
-                for region in region_list:
-                    future = executor.submit(
-                        collect_service_resources,
-                        session, service, region, account_id
-                    )
-                    futures_map[future] = (service, region)
-            # else: skip global services not in active_global_services
-
-        # Process completed futures
-        for future in concurrent.futures.as_completed(futures_map):
-            service, region = futures_map[future]
-            try:
-                resources, elapsed = future.result()
-                all_resources.extend(resources)
-                on_complete(service, resources, elapsed)
-            except Exception:
-                on_complete(service, [], 0.0)
+    return {
+        'account_id': account_id,
+        'service_list': service_list,
+        'region_list': region_list,
+        # S3 buckets are filtered by region only when regions were requested
+        'filter_regions': region_list if regions else None,
+        'service_regions': service_regions,
+        'service_units': service_units,
+        'tasks': tasks,
+        'tasks_pruned': tasks_pruned,
+    }
 
+
+def _start_progress(
+    plan: Dict[str, Any],
+    progress_callback: Optional[Callable[[str, str], None]]
+) -> None:
+    """Reset progress tracking for a planned scan and announce each service."""
+    global _service_progress, _service_timings
+    _service_progress = {}
+    _service_timings = {}
+
+    task_counts = {}
+    for service, _ in plan['tasks']:
+        task_counts[service] = task_counts.get(service, 0) + 1
+
+    for service in plan['service_list']:
+        units = [u for u in plan['service_units'][service] if u in task_counts]
+        for unit in units:
+            _service_progress[unit] = {'total': task_counts[unit], 'completed': 0, 'resources': 0}
+            if progress_callback:
+                progress_callback(unit, "Collecting...")
+        if not units and service in plan['service_regions']:
+            if progress_callback:
+                progress_callback(service, "Skipped: not offered in selected regions")
+
+
+def _record_completion(
+    service: str,
+    resources: List[Dict[str, Any]],
+    elapsed: float,
+    progress_callback: Optional[Callable[[str, str], None]]
+) -> None:
+    """Track completion, resources, and timing."""
+    with _lock:
+        _service_progress[service]['completed'] += 1
+        _service_progress[service]['resources'] += len(resources)
+
+        if service not in _service_timings:
+            _service_timings[service] = 0.0
+        _service_timings[service] += elapsed
+
+        progress = _service_progress[service]
+        if progress['completed'] >= progress['total']:
+            if progress_callback:
+                progress_callback(service, f"Done: {progress['resources']} resources")
+
+
+def order_tasks(
+    tasks: List[tuple],
+    max_workers: int,
+    history: Optional[TaskHistory] = None,
+    estimate_callback: Optional[Callable[[float], None]] = None
+) -> List[tuple]:
+    """
+    Order tasks for submission, longest expected first when history is available.
+
+    Args:
+        tasks: List of (service, region) tuples
+        max_workers: Number of parallel workers (for the duration estimate)
+        history: Optional TaskHistory with previous durations
+        estimate_callback: Optional callback(seconds) with the estimated scan duration
+
+    Returns:
+        Tasks in submission order
+    """
+    if history is None:
+        return tasks
+
+    # Longest expected tasks first, so slow ones don't start last
+    tasks = order_longest_first(tasks, history)
+    if estimate_callback:
+        estimate_callback(estimate_duration(
+            [history.expected(service, region) for service, region in tasks],
+            max_workers
+        ))
+    return tasks
+
+
+def _print_timing_summary(
+    elapsed_time: float,
+    resource_count: int,
+    client_stats: Dict[str, Any],
+    limiter_stats: Optional[Dict[str, Any]]
+) -> None:
+    """Print per-service timings, client and throttling statistics."""
+    print("\n" + "="*60)
+    print("SERVICE TIMING SUMMARY (sorted by total time)")
+    print("="*60)
+    sorted_timings = sorted(_service_timings.items(), key=lambda x: x[1], reverse=True)
+    for service, total_time in sorted_timings:
+        resources = _service_progress.get(service, {}).get('resources', 0)
+        print(f"{service:30} {total_time:8.2f}s  ({resources} resources)")
+    print("="*60)
+    print(f"{'TOTAL':30} {elapsed_time:8.2f}s  ({resource_count} resources)")
+    print("="*60)
+    print(f"{'Client construction':30} {client_stats['construction_seconds']:8.2f}s  "
+          f"({client_stats['clients_created']} created, {client_stats['cache_hits']} cache hits)")
+    print(f"{'Connection pool full':30} {client_stats['pool_full_events']:8}   "
+          f"(pool size {client_stats['pool_size']})")
+    if limiter_stats is not None:
+        print(f"{'Rate limiter wait':30} {limiter_stats['wait_seconds']:8.2f}s")
+        throttled = sorted(limiter_stats['throttles'].items(), key=lambda x: x[1], reverse=True)
+        if throttled:
+            print("-"*60)
+            print("THROTTLES (retried / failed after retries)")
+            for service, count in throttled:
+                failed = limiter_stats['throttle_failures'].get(service, 0)
+                print(f"{service:30} {count:8}   ({failed} failed)")
+    print("="*60 + "\n")
+
+
+def _build_metadata(
+    plan: Dict[str, Any],
+    resource_count: int,
+    elapsed_time: float,
+    throttles: Dict[str, int]
+) -> Dict[str, Any]:
+    """Assemble scan metadata from a finished scan."""
+    return {
+        'account_id': plan['account_id'],
+        'timestamp': time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime()),
+        'scan_duration_seconds': round(elapsed_time, 2),
+        'services_scanned': len(plan['service_list']),
+        'regions_scanned': len(plan['region_list']),
+        'tasks_pruned': plan['tasks_pruned'],
+        'throttles': throttles,
+        'resource_count': resource_count
+    }
+
+
+def _build_result(
+    plan: Dict[str, Any],
+    resources: List[Dict[str, Any]],
+    elapsed_time: float,
+    throttles: Dict[str, int]
+) -> Dict[str, Any]:
+    """Assemble the inventory result from a finished scan."""
+    return {
+        'metadata': _build_metadata(plan, len(resources), elapsed_time, throttles),
+        'resources': resources
+    }
+
+
+def iter_resources(
+    session,
+    services: Optional[List[str]] = None,
+    regions: Optional[List[str]] = None,
+    max_workers: int = 20,
+    progress_callback: Optional[Callable[[str, str], None]] = None,
+    show_timings: bool = False,
+    include_global: bool = False,
+    history: Optional[TaskHistory] = None,
+    estimate_callback: Optional[Callable[[float], None]] = None,
+    rate_limit: bool = True,
+    baseline: Optional[Baseline] = None,
+    cache: Optional[ResultCache] = None,
+    task_timeout: Optional[float] = None,
+    deadline: Optional[float] = None,
+    api_stats: Optional[ApiStats] = None,
+    tracer: Optional[Tracer] = None,
+    compact: bool = False,
+    bulk_tags: bool = False,
+    metadata: Optional[Dict[str, Any]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield resources from all specified services and regions as tasks complete.
+
+    Nothing is accumulated, so memory stays bounded by the tasks in flight
+    rather than the size of the account. Closing the generator early (or
+    Ctrl-C) cancels tasks that haven't started and stops running ones at
+    their next API call, without waiting for them.
+
+    Args:
+        session: boto3.Session to use
+        services: List of service names to collect (None for all)
+        regions: List of regions to collect from (None for all enabled)
+        max_workers: Maximum parallel workers
+        progress_callback: Optional callback(service_name, status) for progress updates
+        show_timings: If True, print service timing summary at the end
+        include_global: If True, include global services even when filtering by non-global regions
+        history: Optional TaskHistory; when set, tasks are submitted longest-first
+            and their durations are recorded for the next run
+        estimate_callback: Optional callback(seconds) with the estimated scan
+            duration, called before tasks are submitted (requires history)
+        rate_limit: If True, apply per-service token buckets and back off on throttling
+        baseline: Optional Baseline; slices whose fingerprint is unchanged are
+            reused from it instead of collected
+        cache: Optional ResultCache of per-(service, region) results
+        task_timeout: Optional seconds after which a running task is abandoned
+            (and stopped at its next API call)
+        deadline: Optional seconds for the whole scan; tasks not finished by
+            then are abandoned and listed in metadata['incomplete']
+        api_stats: Optional ApiStats to record every API call in
+        tracer: Optional Tracer to record task and API call spans in
+        compact: If True, yield compact Resource records instead of dicts
+        bulk_tags: If True, resolve tags from one Resource Groups Tagging API sweep per region
+        metadata: Optional dict, filled with the scan metadata once the
+            generator is exhausted
+
+    Yields:
+        Resource dictionaries
+    """
+    start_time = time.time()
+
+    plan = plan_scan(session, services, regions, include_global)
+    account_id = plan['account_id']
+    tasks = order_tasks(plan['tasks'], max_workers, history, estimate_callback)
+    _start_progress(plan, progress_callback)
+
+    resource_count = 0
+    futures_map = {}
+    started: Dict[int, float] = {}
+    incomplete = []
+
+    # One client cache per scan, pool sized so workers never queue for a connection.
+    # Abandoned tasks are reaped rather than left holding a worker thread: calls
+    # waiting for a rate limiter slot raise TaskCancelled, and a read can't hang
+    # for longer than the task timeout.
+    scope = CancellationScope()
+    limiter = RateLimiter(max_concurrency=max_workers, cancelled=scope.is_cancelled) if rate_limit else None
+    hooks = [scope] + [hook for hook in (api_stats, tracer, cache) if hook is not None]
+    clients = ClientFactory(
+        session, max_pool_connections=max_workers, limiter=limiter, hooks=hooks,
+        read_timeout=min(DEFAULT_READ_TIMEOUT, task_timeout) if task_timeout else None
+    )
+    if bulk_tags:
+        clients.tag_index = TagIndex(clients)
+
+    def run(token: int, service: str, region: Optional[str], func: Callable, *args) -> tuple:
+        started[token] = time.monotonic()
+        if tracer is None:
+            return scope.run(token, func, *args)
+        with tracer.task_span(f"{service} {region or 'global'}", service=service, region=region or 'global'):
+            return scope.run(token, func, *args)
+
+    def give_up(service: str, region: Optional[str], reason: str) -> None:
+        incomplete.append({'service': service, 'region': region, 'reason': reason})
+        if progress_callback:
+            progress_callback(service, f"Incomplete: {reason} ({region or 'global'})")
+
+    deadline_at = time.monotonic() + deadline if deadline else None
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+
+    try:
+        # Submit all collection tasks
+        for token, (service, region) in enumerate(tasks):
+            if service == 's3':
+                args = (collect_s3_with_region_filter, clients, account_id, plan['filter_regions'], cache)
+            else:
+                args = (collect_service_resources, clients, service, region, account_id, baseline, cache)
+            futures_map[executor.submit(run, token, service, region, *args)] = (token, service, region)
+
+        # Process completed futures, dropping each one once consumed
+        while futures_map:
+            # Wake up for the deadline, or when the oldest running task could time out
+            now = time.monotonic()
+            wakeups = []
+            if deadline_at is not None:
+                wakeups.append(deadline_at)
+            if task_timeout:
+                wakeups.append(now + task_timeout)
+                wakeups.extend(started[t] + task_timeout for t, _, _ in futures_map.values() if t in started)
+            timeout = max(0.0, min(wakeups) - now) if wakeups else None
+
+            done, _ = concurrent.futures.wait(
+                futures_map, timeout=timeout, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                token, service, region = futures_map.pop(future)
+                try:
+                    resources, elapsed = future.result()
+                except BaseException:
+                    # Includes TaskCancelled from a task stopped mid-flight
+                    _record_completion(service, [], 0.0, progress_callback)
+                    continue
+                _record_completion(service, resources, elapsed, progress_callback)
+                if history is not None:
+                    history.record(service, region, elapsed)
+                resource_count += len(resources)
+                yield from compact_records(resources) if compact else resources
+
+            now = time.monotonic()
+            if deadline_at is not None and now >= deadline_at:
+                for _, service, region in futures_map.values():
+                    give_up(service, region, 'deadline')
+                break
+
+            if task_timeout:
+                for future, (token, service, region) in list(futures_map.items()):
+                    if token in started and now - started[token] >= task_timeout:
+                        # Stop waiting; the task itself stops at its next API call
+                        scope.cancel(token)
+                        del futures_map[future]
+                        give_up(service, region, 'timeout')
+                        if history is not None:
+                            history.record(service, region, now - started[token])
+    finally:
+        # Reached on completion, deadline, Ctrl-C or the generator being closed:
+        # drop queued tasks and stop running ones without waiting for them
+        for future in futures_map:
+            future.cancel()
+        scope.cancel_all()
+        executor.shutdown(wait=False)
+        clients.close()
+
+    if history is not None:
+        history.save()
     elapsed_time = time.time() - start_time
 
     # Print timing summary if requested
+    limiter_stats = limiter.stats() if limiter is not None else None
     if show_timings:
-        print("\n" + "="*60)
-        print("SERVICE TIMING SUMMARY (sorted by total time)")
-        print("="*60)
-        sorted_timings = sorted(_service_timings.items(), key=lambda x: x[1], reverse=True)
-        for service, total_time in sorted_timings:
-            resources = _service_progress.get(service, {}).get('resources', 0)
-            print(f"{service:30} {total_time:8.2f}s  ({resources} resources)")
-        print("="*60)
-        print(f"{'TOTAL':30} {elapsed_time:8.2f}s  ({len(all_resources)} resources)")
-        print("="*60 + "\n")
-
-    # Build result
+        _print_timing_summary(elapsed_time, resource_count, clients.stats(), limiter_stats)
+        if baseline is not None:
+            baseline_stats = baseline.stats()
+            print(f"{'Baseline reuse':30} {baseline_stats['slices_reused']:8}   "
+                  f"({baseline_stats['resources_reused']} resources, "
+                  f"{len(baseline_stats['fingerprints'])} slices fingerprinted)\n")
+        if cache is not None:
+            cache_stats = cache.stats()
+            print(f"{'Result cache':30} {cache_stats['hit_rate']:8.0%}   "
+                  f"({cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+                  f"{cache_stats['skipped']} empty or failed results not stored)\n")
+        if clients.tag_index is not None:
+            tag_stats = clients.tag_index.stats()
+            print(f"{'Bulk tags':30} {tag_stats['hits']:8}   "
+                  f"({tag_stats['sweeps']} region sweeps, {tag_stats['fallbacks']} per-resource fallbacks)\n")
+
+    if metadata is not None:
+        metadata.update(_build_metadata(
+            plan, resource_count, elapsed_time,
+            limiter_stats['throttles'] if limiter_stats else {}
+        ))
+        metadata['incomplete'] = incomplete
+        if baseline is not None:
+            metadata.update(baseline.stats())
+
+
+def collect_all(
+    session,
+    services: Optional[List[str]] = None,
+    regions: Optional[List[str]] = None,
+    max_workers: int = 20,
+    progress_callback: Optional[Callable[[str, str], None]] = None,
+    show_timings: bool = False,
+    include_global: bool = False,
+    history: Optional[TaskHistory] = None,
+    estimate_callback: Optional[Callable[[float], None]] = None,
+    rate_limit: bool = True,
+    baseline: Optional[Baseline] = None,
+    cache: Optional[ResultCache] = None,
+    task_timeout: Optional[float] = None,
+    deadline: Optional[float] = None,
+    api_stats: Optional[ApiStats] = None,
+    tracer: Optional[Tracer] = None,
+    compact: bool = False,
+    bulk_tags: bool = False
+) -> Dict[str, Any]:
+    """
+    Collect resources from all specified services and regions.
+
+    Args:
+        session: boto3.Session to use
+        services: List of service names to collect (None for all)
+        regions: List of regions to collect from (None for all enabled)
+        max_workers: Maximum parallel workers
+        progress_callback: Optional callback(service_name, status) for progress updates
+        show_timings: If True, print service timing summary at the end
+        include_global: If True, include global services even when filtering by non-global regions
+        history: Optional TaskHistory; when set, tasks are submitted longest-first
+            and their durations are recorded for the next run
+        estimate_callback: Optional callback(seconds) with the estimated scan
+            duration, called before tasks are submitted (requires history)
+        rate_limit: If True, apply per-service token buckets and back off on throttling
+        baseline: Optional Baseline; slices whose fingerprint is unchanged are
+            reused from it instead of collected
+        cache: Optional ResultCache of per-(service, region) results
+        task_timeout: Optional seconds after which a running task is abandoned
+        deadline: Optional seconds for the whole scan; unfinished tasks are
+            listed in metadata['incomplete']
+        api_stats: Optional ApiStats to record every API call in
+        tracer: Optional Tracer to record task and API call spans in
+        compact: If True, store compact Resource records instead of dicts
+        bulk_tags: If True, resolve tags from one Resource Groups Tagging API sweep per region
+
+    Returns:
+        Dict with metadata and resources list
+    """
+    metadata = {}
+    resources = list(iter_resources(
+        session,
+        services=services,
+        regions=regions,
+        max_workers=max_workers,
+        progress_callback=progress_callback,
+        show_timings=show_timings,
+        include_global=include_global,
+        history=history,
+        estimate_callback=estimate_callback,
+        rate_limit=rate_limit,
+        baseline=baseline,
+        cache=cache,
+        task_timeout=task_timeout,
+        deadline=deadline,
+        api_stats=api_stats,
+        tracer=tracer,
+        compact=compact,
+        bulk_tags=bulk_tags,
+        metadata=metadata
+    ))
     return {
-        'metadata': {
-            'account_id': account_id,
-            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime()),
-            'scan_duration_seconds': round(elapsed_time, 2),
-            'services_scanned': len(service_list),
-            'regions_scanned': len(region_list),
-            'resource_count': len(all_resources)
-        },
-        'resources': all_resources
+        'metadata': metadata,
+        'resources': resources
     }
 
 
@@ -5,24 +5,14 @@ AWS Backup resource collector.
 import boto3
 from typing import List, Dict, Any, Optional
 
+from aws_inventory.tagging import lookup_tags
 
-def collect_backup_resources(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
-    """
-    Collect AWS Backup resources: vaults, plans, frameworks, report plans,
-    restore testing plans, and Backup Gateway resources.
-
-    Args:
-        session: boto3.Session to use
-        region: AWS region
-        account_id: AWS account ID
 
-    Returns:
-        List of resource dictionaries
-    """
+def _collect_vaults(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """Backup Vaults."""
     resources = []
     backup = session.client('backup', region_name=region)
 
-    # Backup Vaults
     try:
         paginator = backup.get_paginator('list_backup_vaults')
         for page in paginator.paginate():
@@ -35,12 +25,14 @@ def collect_backup_resources(session: boto3.Session, region: Optional[str], acco
                     continue
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = backup.list_tags(ResourceArn=vault_arn)
-                    tags = tag_response.get('Tags', {})
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, vault_arn)
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = backup.list_tags(ResourceArn=vault_arn)
+                        tags = tag_response.get('Tags', {})
+                    except Exception:
+                        pass
 
                 resources.append({
                     'service': 'backup',
@@ -64,7 +56,14 @@ def collect_backup_resources(session: boto3.Session, region: Optional[str], acco
     except Exception:
         pass
 
-    # Backup Plans
+    return resources
+
+
+def _collect_plans(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """Backup Plans."""
+    resources = []
+    backup = session.client('backup', region_name=region)
+
     try:
         paginator = backup.get_paginator('list_backup_plans')
         for page in paginator.paginate():
@@ -82,12 +81,14 @@ def collect_backup_resources(session: boto3.Session, region: Optional[str], acco
                     pass
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = backup.list_tags(ResourceArn=plan_arn)
-                    tags = tag_response.get('Tags', {})
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, plan_arn)
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = backup.list_tags(ResourceArn=plan_arn)
+                        tags = tag_response.get('Tags', {})
+                    except Exception:
+                        pass
 
                 resources.append({
                     'service': 'backup',
@@ -109,7 +110,14 @@ def collect_backup_resources(session: boto3.Session, region: Optional[str], acco
     except Exception:
         pass
 
-    # Frameworks (Compliance)
+    return resources
+
+
+def _collect_frameworks(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """Frameworks (Compliance)."""
+    resources = []
+    backup = session.client('backup', region_name=region)
+
     try:
         paginator = backup.get_paginator('list_frameworks')
         for page in paginator.paginate():
@@ -118,12 +126,14 @@ def collect_backup_resources(session: boto3.Session, region: Optional[str], acco
                 framework_arn = framework['FrameworkArn']
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = backup.list_tags(ResourceArn=framework_arn)
-                    tags = tag_response.get('Tags', {})
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, framework_arn)
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = backup.list_tags(ResourceArn=framework_arn)
+                        tags = tag_response.get('Tags', {})
+                    except Exception:
+                        pass
 
                 resources.append({
                     'service': 'backup',
@@ -143,7 +153,14 @@ def collect_backup_resources(session: boto3.Session, region: Optional[str], acco
     except Exception:
         pass
 
-    # Report Plans
+    return resources
+
+
+def _collect_report_plans(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """Report Plans."""
+    resources = []
+    backup = session.client('backup', region_name=region)
+
     try:
         paginator = backup.get_paginator('list_report_plans')
         for page in paginator.paginate():
@@ -152,12 +169,14 @@ def collect_backup_resources(session: boto3.Session, region: Optional[str], acco
                 report_arn = report['ReportPlanArn']
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = backup.list_tags(ResourceArn=report_arn)
-                    tags = tag_response.get('Tags', {})
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, report_arn)
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = backup.list_tags(ResourceArn=report_arn)
+                        tags = tag_response.get('Tags', {})
+                    except Exception:
+                        pass
 
                 resources.append({
                     'service': 'backup',
@@ -179,7 +198,14 @@ def collect_backup_resources(session: boto3.Session, region: Optional[str], acco
     except Exception:
         pass
 
-    # Restore Testing Plans
+    return resources
+
+
+def _collect_restore_testing_plans(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """Restore Testing Plans."""
+    resources = []
+    backup = session.client('backup', region_name=region)
+
     try:
         paginator = backup.get_paginator('list_restore_testing_plans')
         for page in paginator.paginate():
@@ -188,12 +214,14 @@ def collect_backup_resources(session: boto3.Session, region: Optional[str], acco
                 plan_arn = plan['RestoreTestingPlanArn']
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = backup.list_tags(ResourceArn=plan_arn)
-                    tags = tag_response.get('Tags', {})
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, plan_arn)
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = backup.list_tags(ResourceArn=plan_arn)
+                        tags = tag_response.get('Tags', {})
+                    except Exception:
+                        pass
 
                 resources.append({
                     'service': 'backup',
@@ -215,6 +243,35 @@ def collect_backup_resources(session: boto3.Session, region: Optional[str], acco
     except Exception:
         pass
 
+    return resources
+
+
+SUBRESOURCES = {
+    'vault': _collect_vaults,
+    'plan': _collect_plans,
+    'framework': _collect_frameworks,
+    'report-plan': _collect_report_plans,
+    'restore-testing-plan': _collect_restore_testing_plans,
+}
+
+
+def collect_backup_resources(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """
+    Collect AWS Backup resources: vaults, plans, frameworks, report plans,
+    restore testing plans, and Backup Gateway resources.
+
+    Args:
+        session: boto3.Session to use
+        region: AWS region
+        account_id: AWS account ID
+
+    Returns:
+        List of resource dictionaries
+    """
+    resources = []
+    for collect in SUBRESOURCES.values():
+        resources.extend(collect(session, region, account_id))
+
     # Note: Backup Gateway resources (gateways, hypervisors, virtual machines) skipped
     # for performance. They are on-premises resources rarely used and add ~16s overhead.
 
@@ -5,6 +5,8 @@ CloudFront resource collector.
 import boto3
 from typing import List, Dict, Any, Optional
 
+from aws_inventory.tagging import lookup_tags
+
 
 def collect_cloudfront_resources(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
     """
@@ -31,13 +33,15 @@ def collect_cloudfront_resources(session: boto3.Session, region: Optional[str],
                 dist_arn = dist['ARN']
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = cloudfront.list_tags_for_resource(Resource=dist_arn)
-                    for tag in tag_response.get('Tags', {}).get('Items', []):
-                        tags[tag.get('Key', '')] = tag.get('Value', '')
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, dist_arn)
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = cloudfront.list_tags_for_resource(Resource=dist_arn)
+                        for tag in tag_response.get('Tags', {}).get('Items', []):
+                            tags[tag.get('Key', '')] = tag.get('Value', '')
+                    except Exception:
+                        pass
 
                 origins = dist.get('Origins', {}).get('Items', [])
                 aliases = dist.get('Aliases', {}).get('Items', [])
@@ -5,6 +5,8 @@ CloudWatch resource collector.
 import boto3
 from typing import List, Dict, Any, Optional
 
+from aws_inventory.tagging import lookup_tags
+
 
 def collect_cloudwatch_resources(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
     """
@@ -31,13 +33,15 @@ def collect_cloudwatch_resources(session: boto3.Session, region: Optional[str],
                 alarm_arn = alarm['AlarmArn']
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = cloudwatch.list_tags_for_resource(ResourceARN=alarm_arn)
-                    for tag in tag_response.get('Tags', []):
-                        tags[tag.get('Key', '')] = tag.get('Value', '')
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, alarm_arn)
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = cloudwatch.list_tags_for_resource(ResourceARN=alarm_arn)
+                        for tag in tag_response.get('Tags', []):
+                            tags[tag.get('Key', '')] = tag.get('Value', '')
+                    except Exception:
+                        pass
 
                 resources.append({
                     'service': 'cloudwatch',
@@ -70,13 +74,15 @@ def collect_cloudwatch_resources(session: boto3.Session, region: Optional[str],
                 alarm_arn = alarm['AlarmArn']
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = cloudwatch.list_tags_for_resource(ResourceARN=alarm_arn)
-                    for tag in tag_response.get('Tags', []):
-                        tags[tag.get('Key', '')] = tag.get('Value', '')
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, alarm_arn)
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = cloudwatch.list_tags_for_resource(ResourceARN=alarm_arn)
+                        for tag in tag_response.get('Tags', []):
+                            tags[tag.get('Key', '')] = tag.get('Value', '')
+                    except Exception:
+                        pass
 
                 resources.append({
                     'service': 'cloudwatch',
@@ -8,23 +8,11 @@ from typing import List, Dict, Any, Optional
 from aws_inventory.collector import tags_to_dict, get_tag_value
 
 
-def collect_ec2_resources(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
-    """
-    Collect EC2 resources: instances, volumes, snapshots, AMIs, security groups,
-    key pairs, elastic IPs, network interfaces, placement groups.
-
-    Args:
-        session: boto3.Session to use
-        region: AWS region
-        account_id: AWS account ID
-
-    Returns:
-        List of resource dictionaries
-    """
+def _collect_instances(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """EC2 Instances."""
     resources = []
     ec2 = session.client('ec2', region_name=region)
 
-    # EC2 Instances
     try:
         paginator = ec2.get_paginator('describe_instances')
         for page in paginator.paginate():
@@ -54,7 +42,14 @@ def collect_ec2_resources(session: boto3.Session, region: Optional[str], account
     except Exception:
         pass
 
-    # EBS Volumes
+    return resources
+
+
+def _collect_volumes(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """EBS Volumes."""
+    resources = []
+    ec2 = session.client('ec2', region_name=region)
+
     try:
         paginator = ec2.get_paginator('describe_volumes')
         for page in paginator.paginate():
@@ -81,7 +76,14 @@ def collect_ec2_resources(session: boto3.Session, region: Optional[str], account
     except Exception:
         pass
 
-    # EBS Snapshots (owned by this account)
+    return resources
+
+
+def _collect_snapshots(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """EBS Snapshots (owned by this account)."""
+    resources = []
+    ec2 = session.client('ec2', region_name=region)
+
     try:
         paginator = ec2.get_paginator('describe_snapshots')
         for page in paginator.paginate(OwnerIds=[account_id]):
@@ -107,7 +109,14 @@ def collect_ec2_resources(session: boto3.Session, region: Optional[str], account
     except Exception:
         pass
 
-    # AMIs (owned by this account)
+    return resources
+
+
+def _collect_amis(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """AMIs (owned by this account)."""
+    resources = []
+    ec2 = session.client('ec2', region_name=region)
+
     try:
         response = ec2.describe_images(Owners=[account_id])
         for image in response.get('Images', []):
@@ -133,7 +142,14 @@ def collect_ec2_resources(session: boto3.Session, region: Optional[str], account
     except Exception:
         pass
 
-    # Security Groups
+    return resources
+
+
+def _collect_security_groups(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """Security Groups."""
+    resources = []
+    ec2 = session.client('ec2', region_name=region)
+
     try:
         paginator = ec2.get_paginator('describe_security_groups')
         for page in paginator.paginate():
@@ -157,7 +173,14 @@ def collect_ec2_resources(session: boto3.Session, region: Optional[str], account
     except Exception:
         pass
 
-    # Key Pairs
+    return resources
+
+
+def _collect_key_pairs(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """Key Pairs."""
+    resources = []
+    ec2 = session.client('ec2', region_name=region)
+
     try:
         response = ec2.describe_key_pairs()
         for kp in response.get('KeyPairs', []):
@@ -179,7 +202,14 @@ def collect_ec2_resources(session: boto3.Session, region: Optional[str], account
     except Exception:
         pass
 
-    # Elastic IPs
+    return resources
+
+
+def _collect_elastic_ips(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """Elastic IPs."""
+    resources = []
+    ec2 = session.client('ec2', region_name=region)
+
     try:
         response = ec2.describe_addresses()
         for addr in response.get('Addresses', []):
@@ -203,7 +233,14 @@ def collect_ec2_resources(session: boto3.Session, region: Optional[str], account
     except Exception:
         pass
 
-    # Network Interfaces
+    return resources
+
+
+def _collect_network_interfaces(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """Network Interfaces."""
+    resources = []
+    ec2 = session.client('ec2', region_name=region)
+
     try:
         paginator = ec2.get_paginator('describe_network_interfaces')
         for page in paginator.paginate():
@@ -229,7 +266,14 @@ def collect_ec2_resources(session: boto3.Session, region: Optional[str], account
     except Exception:
         pass
 
-    # Placement Groups
+    return resources
+
+
+def _collect_placement_groups(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """Placement Groups."""
+    resources = []
+    ec2 = session.client('ec2', region_name=region)
+
     try:
         response = ec2.describe_placement_groups()
         for pg in response.get('PlacementGroups', []):
@@ -252,3 +296,36 @@ def collect_ec2_resources(session: boto3.Session, region: Optional[str], account
         pass
 
     return resources
+
+
+SUBRESOURCES = {
+    'instance': _collect_instances,
+    'volume': _collect_volumes,
+    'snapshot': _collect_snapshots,
+    'ami': _collect_amis,
+    'security-group': _collect_security_groups,
+    'key-pair': _collect_key_pairs,
+    'elastic-ip': _collect_elastic_ips,
+    'network-interface': _collect_network_interfaces,
+    'placement-group': _collect_placement_groups,
+}
+
+
+def collect_ec2_resources(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """
+    Collect EC2 resources: instances, volumes, snapshots, AMIs, security groups,
+    key pairs, elastic IPs, network interfaces, placement groups.
+
+    Args:
+        session: boto3.Session to use
+        region: AWS region
+        account_id: AWS account ID
+
+    Returns:
+        List of resource dictionaries
+    """
+    resources = []
+    for collect in SUBRESOURCES.values():
+        resources.extend(collect(session, region, account_id))
+
+    return resources
@@ -5,6 +5,8 @@ ELBv2 (Application, Network, Gateway Load Balancers) resource collector.
 import boto3
 from typing import List, Dict, Any, Optional
 
+from aws_inventory.tagging import lookup_tags
+
 
 def collect_elbv2_resources(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
     """
@@ -30,14 +32,16 @@ def collect_elbv2_resources(session: boto3.Session, region: Optional[str], accou
                 load_balancers.append(lb)
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = elbv2.describe_tags(ResourceArns=[lb['LoadBalancerArn']])
-                    for tag_desc in tag_response.get('TagDescriptions', []):
-                        for tag in tag_desc.get('Tags', []):
-                            tags[tag.get('Key', '')] = tag.get('Value', '')
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, lb['LoadBalancerArn'])
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = elbv2.describe_tags(ResourceArns=[lb['LoadBalancerArn']])
+                        for tag_desc in tag_response.get('TagDescriptions', []):
+                            for tag in tag_desc.get('Tags', []):
+                                tags[tag.get('Key', '')] = tag.get('Value', '')
+                    except Exception:
+                        pass
 
                 lb_name = lb['LoadBalancerName']
                 resources.append({
@@ -68,14 +72,16 @@ def collect_elbv2_resources(session: boto3.Session, region: Optional[str], accou
         for page in paginator.paginate():
             for tg in page.get('TargetGroups', []):
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = elbv2.describe_tags(ResourceArns=[tg['TargetGroupArn']])
-                    for tag_desc in tag_response.get('TagDescriptions', []):
-                        for tag in tag_desc.get('Tags', []):
-                            tags[tag.get('Key', '')] = tag.get('Value', '')
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, tg['TargetGroupArn'])
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = elbv2.describe_tags(ResourceArns=[tg['TargetGroupArn']])
+                        for tag_desc in tag_response.get('TagDescriptions', []):
+                            for tag in tag_desc.get('Tags', []):
+                                tags[tag.get('Key', '')] = tag.get('Value', '')
+                    except Exception:
+                        pass
 
                 # Get target health
                 healthy_count = 0
@@ -122,14 +128,16 @@ def collect_elbv2_resources(session: boto3.Session, region: Optional[str], accou
             for page in paginator.paginate(LoadBalancerArn=lb['LoadBalancerArn']):
                 for listener in page.get('Listeners', []):
                     # Get tags
-                    tags = {}
-                    try:
-                        tag_response = elbv2.describe_tags(ResourceArns=[listener['ListenerArn']])
-                        for tag_desc in tag_response.get('TagDescriptions', []):
-                            for tag in tag_desc.get('Tags', []):
-                                tags[tag.get('Key', '')] = tag.get('Value', '')
-                    except Exception:
-                        pass
+                    tags = lookup_tags(session, region, listener['ListenerArn'])
+                    if tags is None:
+                        tags = {}
+                        try:
+                            tag_response = elbv2.describe_tags(ResourceArns=[listener['ListenerArn']])
+                            for tag_desc in tag_response.get('TagDescriptions', []):
+                                for tag in tag_desc.get('Tags', []):
+                                    tags[tag.get('Key', '')] = tag.get('Value', '')
+                        except Exception:
+                            pass
 
                     default_actions = listener.get('DefaultActions', [])
                     resources.append({
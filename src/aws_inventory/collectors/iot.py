@@ -5,45 +5,14 @@ IoT Core resource collector.
 import boto3
 from typing import List, Dict, Any, Optional
 
-# IoT Core supported regions
-# https://docs.aws.amazon.com/general/latest/gr/iot-core.html
-IOT_REGIONS = {
-    # US
-    'us-east-1', 'us-east-2', 'us-west-1', 'us-west-2',
-    # Asia Pacific
-    'ap-east-1', 'ap-northeast-1', 'ap-northeast-2', 'ap-south-1',
-    'ap-southeast-1', 'ap-southeast-2', 'ap-southeast-5',
-    # Canada
-    'ca-central-1',
-    # Europe
-    'eu-central-1', 'eu-north-1', 'eu-west-1', 'eu-west-2', 'eu-west-3', 'eu-south-2',
-    # Middle East
-    'me-central-1', 'me-south-1',
-    # South America
-    'sa-east-1',
-}
-
-
-def collect_iot_resources(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
-    """
-    Collect IoT Core resources: things, thing types, thing groups, policies, certificates.
-
-    Args:
-        session: boto3.Session to use
-        region: AWS region
-        account_id: AWS account ID
+from aws_inventory.tagging import lookup_tags
 
-    Returns:
-        List of resource dictionaries
-    """
-    # Skip unsupported regions to avoid timeouts
-    if region and region not in IOT_REGIONS:
-        return []
 
+def _collect_things(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """IoT Things."""
     resources = []
     iot = session.client('iot', region_name=region)
 
-    # IoT Things
     try:
         paginator = iot.get_paginator('list_things')
         for page in paginator.paginate():
@@ -77,7 +46,14 @@ def collect_iot_resources(session: boto3.Session, region: Optional[str], account
     except Exception:
         pass
 
-    # IoT Thing Types
+    return resources
+
+
+def _collect_thing_types(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """IoT Thing Types."""
+    resources = []
+    iot = session.client('iot', region_name=region)
+
     try:
         paginator = iot.get_paginator('list_thing_types')
         for page in paginator.paginate():
@@ -86,13 +62,15 @@ def collect_iot_resources(session: boto3.Session, region: Optional[str], account
                 tt_arn = thing_type.get('thingTypeArn', f"arn:aws:iot:{region}:{account_id}:thingtype/{tt_name}")
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = iot.list_tags_for_resource(resourceArn=tt_arn)
-                    for tag in tag_response.get('tags', []):
-                        tags[tag.get('Key', '')] = tag.get('Value', '')
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, tt_arn)
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = iot.list_tags_for_resource(resourceArn=tt_arn)
+                        for tag in tag_response.get('tags', []):
+                            tags[tag.get('Key', '')] = tag.get('Value', '')
+                    except Exception:
+                        pass
 
                 resources.append({
                     'service': 'iot',
@@ -113,7 +91,14 @@ def collect_iot_resources(session: boto3.Session, region: Optional[str], account
     except Exception:
         pass
 
-    # IoT Thing Groups
+    return resources
+
+
+def _collect_thing_groups(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """IoT Thing Groups."""
+    resources = []
+    iot = session.client('iot', region_name=region)
+
     try:
         paginator = iot.get_paginator('list_thing_groups')
         for page in paginator.paginate():
@@ -122,13 +107,15 @@ def collect_iot_resources(session: boto3.Session, region: Optional[str], account
                 group_arn = group.get('groupArn', f"arn:aws:iot:{region}:{account_id}:thinggroup/{group_name}")
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = iot.list_tags_for_resource(resourceArn=group_arn)
-                    for tag in tag_response.get('tags', []):
-                        tags[tag.get('Key', '')] = tag.get('Value', '')
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, group_arn)
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = iot.list_tags_for_resource(resourceArn=group_arn)
+                        for tag in tag_response.get('tags', []):
+                            tags[tag.get('Key', '')] = tag.get('Value', '')
+                    except Exception:
+                        pass
 
                 resources.append({
                     'service': 'iot',
@@ -143,7 +130,14 @@ def collect_iot_resources(session: boto3.Session, region: Optional[str], account
     except Exception:
         pass
 
-    # IoT Policies
+    return resources
+
+
+def _collect_policies(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """IoT Policies."""
+    resources = []
+    iot = session.client('iot', region_name=region)
+
     try:
         paginator = iot.get_paginator('list_policies')
         for page in paginator.paginate():
@@ -173,7 +167,14 @@ def collect_iot_resources(session: boto3.Session, region: Optional[str], account
     except Exception:
         pass
 
-    # IoT Certificates (active only)
+    return resources
+
+
+def _collect_certificates(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """IoT Certificates (active only)."""
+    resources = []
+    iot = session.client('iot', region_name=region)
+
     try:
         paginator = iot.get_paginator('list_certificates')
         for page in paginator.paginate():
@@ -203,3 +204,31 @@ def collect_iot_resources(session: boto3.Session, region: Optional[str], account
         pass
 
     return resources
+
+
+SUBRESOURCES = {
+    'thing': _collect_things,
+    'thing-type': _collect_thing_types,
+    'thing-group': _collect_thing_groups,
+    'policy': _collect_policies,
+    'certificate': _collect_certificates,
+}
+
+
+def collect_iot_resources(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """
+    Collect IoT Core resources: things, thing types, thing groups, policies, certificates.
+
+    Args:
+        session: boto3.Session to use
+        region: AWS region
+        account_id: AWS account ID
+
+    Returns:
+        List of resource dictionaries
+    """
+    resources = []
+    for collect in SUBRESOURCES.values():
+        resources.extend(collect(session, region, account_id))
+
+    return resources
@@ -5,6 +5,8 @@ KMS resource collector.
 import boto3
 from typing import List, Dict, Any, Optional
 
+from aws_inventory.tagging import lookup_tags
+
 
 def collect_kms_resources(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
     """
@@ -39,13 +41,15 @@ def collect_kms_resources(session: boto3.Session, region: Optional[str], account
                         continue
 
                     # Get tags
-                    tags = {}
-                    try:
-                        tag_response = kms.list_resource_tags(KeyId=key_id)
-                        for tag in tag_response.get('Tags', []):
-                            tags[tag.get('TagKey', '')] = tag.get('TagValue', '')
-                    except Exception:
-                        pass
+                    tags = lookup_tags(session, region, key_metadata['Arn'])
+                    if tags is None:
+                        tags = {}
+                        try:
+                            tag_response = kms.list_resource_tags(KeyId=key_id)
+                            for tag in tag_response.get('Tags', []):
+                                tags[tag.get('TagKey', '')] = tag.get('TagValue', '')
+                        except Exception:
+                            pass
 
                     # Get aliases for this key
                     aliases = []
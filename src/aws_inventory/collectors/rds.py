@@ -5,24 +5,14 @@ RDS resource collector.
 import boto3
 from typing import List, Dict, Any, Optional
 
+from aws_inventory.tagging import lookup_tags
 
-def collect_rds_resources(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
-    """
-    Collect RDS resources: DB instances, clusters, cluster snapshots, DB snapshots,
-    subnet groups, parameter groups, option groups.
-
-    Args:
-        session: boto3.Session to use
-        region: AWS region
-        account_id: AWS account ID
 
-    Returns:
-        List of resource dictionaries
-    """
+def _collect_db_instances(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """DB Instances."""
     resources = []
     rds = session.client('rds', region_name=region)
 
-    # DB Instances
     try:
         paginator = rds.get_paginator('describe_db_instances')
         for page in paginator.paginate():
@@ -30,15 +20,17 @@ def collect_rds_resources(session: boto3.Session, region: Optional[str], account
                 db_id = db['DBInstanceIdentifier']
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = rds.list_tags_for_resource(
-                        ResourceName=db['DBInstanceArn']
-                    )
-                    for tag in tag_response.get('TagList', []):
-                        tags[tag.get('Key', '')] = tag.get('Value', '')
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, db['DBInstanceArn'])
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = rds.list_tags_for_resource(
+                            ResourceName=db['DBInstanceArn']
+                        )
+                        for tag in tag_response.get('TagList', []):
+                            tags[tag.get('Key', '')] = tag.get('Value', '')
+                    except Exception:
+                        pass
 
                 resources.append({
                     'service': 'rds',
@@ -67,7 +59,14 @@ def collect_rds_resources(session: boto3.Session, region: Optional[str], account
     except Exception:
         pass
 
-    # DB Clusters (Aurora)
+    return resources
+
+
+def _collect_db_clusters(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """DB Clusters (Aurora)."""
+    resources = []
+    rds = session.client('rds', region_name=region)
+
     try:
         paginator = rds.get_paginator('describe_db_clusters')
         for page in paginator.paginate():
@@ -75,15 +74,17 @@ def collect_rds_resources(session: boto3.Session, region: Optional[str], account
                 cluster_id = cluster['DBClusterIdentifier']
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = rds.list_tags_for_resource(
-                        ResourceName=cluster['DBClusterArn']
-                    )
-                    for tag in tag_response.get('TagList', []):
-                        tags[tag.get('Key', '')] = tag.get('Value', '')
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, cluster['DBClusterArn'])
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = rds.list_tags_for_resource(
+                            ResourceName=cluster['DBClusterArn']
+                        )
+                        for tag in tag_response.get('TagList', []):
+                            tags[tag.get('Key', '')] = tag.get('Value', '')
+                    except Exception:
+                        pass
 
                 resources.append({
                     'service': 'rds',
@@ -110,7 +111,14 @@ def collect_rds_resources(session: boto3.Session, region: Optional[str], account
     except Exception:
         pass
 
-    # DB Snapshots (manual only, owned by account)
+    return resources
+
+
+def _collect_db_snapshots(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """DB Snapshots (manual only, owned by account)."""
+    resources = []
+    rds = session.client('rds', region_name=region)
+
     try:
         paginator = rds.get_paginator('describe_db_snapshots')
         for page in paginator.paginate(SnapshotType='manual'):
@@ -118,15 +126,17 @@ def collect_rds_resources(session: boto3.Session, region: Optional[str], account
                 snapshot_id = snapshot['DBSnapshotIdentifier']
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = rds.list_tags_for_resource(
-                        ResourceName=snapshot['DBSnapshotArn']
-                    )
-                    for tag in tag_response.get('TagList', []):
-                        tags[tag.get('Key', '')] = tag.get('Value', '')
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, snapshot['DBSnapshotArn'])
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = rds.list_tags_for_resource(
+                            ResourceName=snapshot['DBSnapshotArn']
+                        )
+                        for tag in tag_response.get('TagList', []):
+                            tags[tag.get('Key', '')] = tag.get('Value', '')
+                    except Exception:
+                        pass
 
                 resources.append({
                     'service': 'rds',
@@ -149,7 +159,14 @@ def collect_rds_resources(session: boto3.Session, region: Optional[str], account
     except Exception:
         pass
 
-    # DB Cluster Snapshots (manual only)
+    return resources
+
+
+def _collect_db_cluster_snapshots(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """DB Cluster Snapshots (manual only)."""
+    resources = []
+    rds = session.client('rds', region_name=region)
+
     try:
         paginator = rds.get_paginator('describe_db_cluster_snapshots')
         for page in paginator.paginate(SnapshotType='manual'):
@@ -157,15 +174,17 @@ def collect_rds_resources(session: boto3.Session, region: Optional[str], account
                 snapshot_id = snapshot['DBClusterSnapshotIdentifier']
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = rds.list_tags_for_resource(
-                        ResourceName=snapshot['DBClusterSnapshotArn']
-                    )
-                    for tag in tag_response.get('TagList', []):
-                        tags[tag.get('Key', '')] = tag.get('Value', '')
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, snapshot['DBClusterSnapshotArn'])
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = rds.list_tags_for_resource(
+                            ResourceName=snapshot['DBClusterSnapshotArn']
+                        )
+                        for tag in tag_response.get('TagList', []):
+                            tags[tag.get('Key', '')] = tag.get('Value', '')
+                    except Exception:
+                        pass
 
                 resources.append({
                     'service': 'rds',
@@ -188,7 +207,14 @@ def collect_rds_resources(session: boto3.Session, region: Optional[str], account
     except Exception:
         pass
 
-    # DB Subnet Groups
+    return resources
+
+
+def _collect_db_subnet_groups(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """DB Subnet Groups."""
+    resources = []
+    rds = session.client('rds', region_name=region)
+
     try:
         paginator = rds.get_paginator('describe_db_subnet_groups')
         for page in paginator.paginate():
@@ -196,15 +222,17 @@ def collect_rds_resources(session: boto3.Session, region: Optional[str], account
                 sg_name = sg['DBSubnetGroupName']
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = rds.list_tags_for_resource(
-                        ResourceName=sg['DBSubnetGroupArn']
-                    )
-                    for tag in tag_response.get('TagList', []):
-                        tags[tag.get('Key', '')] = tag.get('Value', '')
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, sg['DBSubnetGroupArn'])
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = rds.list_tags_for_resource(
+                            ResourceName=sg['DBSubnetGroupArn']
+                        )
+                        for tag in tag_response.get('TagList', []):
+                            tags[tag.get('Key', '')] = tag.get('Value', '')
+                    except Exception:
+                        pass
 
                 resources.append({
                     'service': 'rds',
@@ -224,7 +252,14 @@ def collect_rds_resources(session: boto3.Session, region: Optional[str], account
     except Exception:
         pass
 
-    # DB Parameter Groups (non-default)
+    return resources
+
+
+def _collect_db_parameter_groups(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """DB Parameter Groups (non-default)."""
+    resources = []
+    rds = session.client('rds', region_name=region)
+
     try:
         paginator = rds.get_paginator('describe_db_parameter_groups')
         for page in paginator.paginate():
@@ -236,15 +271,17 @@ def collect_rds_resources(session: boto3.Session, region: Optional[str], account
                     continue
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = rds.list_tags_for_resource(
-                        ResourceName=pg['DBParameterGroupArn']
-                    )
-                    for tag in tag_response.get('TagList', []):
-                        tags[tag.get('Key', '')] = tag.get('Value', '')
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, pg['DBParameterGroupArn'])
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = rds.list_tags_for_resource(
+                            ResourceName=pg['DBParameterGroupArn']
+                        )
+                        for tag in tag_response.get('TagList', []):
+                            tags[tag.get('Key', '')] = tag.get('Value', '')
+                    except Exception:
+                        pass
 
                 resources.append({
                     'service': 'rds',
@@ -262,7 +299,14 @@ def collect_rds_resources(session: boto3.Session, region: Optional[str], account
     except Exception:
         pass
 
-    # DB Option Groups (non-default)
+    return resources
+
+
+def _collect_option_groups(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """DB Option Groups (non-default)."""
+    resources = []
+    rds = session.client('rds', region_name=region)
+
     try:
         paginator = rds.get_paginator('describe_option_groups')
         for page in paginator.paginate():
@@ -274,15 +318,17 @@ def collect_rds_resources(session: boto3.Session, region: Optional[str], account
                     continue
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = rds.list_tags_for_resource(
-                        ResourceName=og['OptionGroupArn']
-                    )
-                    for tag in tag_response.get('TagList', []):
-                        tags[tag.get('Key', '')] = tag.get('Value', '')
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, og['OptionGroupArn'])
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = rds.list_tags_for_resource(
+                            ResourceName=og['OptionGroupArn']
+                        )
+                        for tag in tag_response.get('TagList', []):
+                            tags[tag.get('Key', '')] = tag.get('Value', '')
+                    except Exception:
+                        pass
 
                 resources.append({
                     'service': 'rds',
@@ -302,7 +348,14 @@ def collect_rds_resources(session: boto3.Session, region: Optional[str], account
     except Exception:
         pass
 
-    # RDS Proxies
+    return resources
+
+
+def _collect_db_proxies(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """RDS Proxies."""
+    resources = []
+    rds = session.client('rds', region_name=region)
+
     try:
         paginator = rds.get_paginator('describe_db_proxies')
         for page in paginator.paginate():
@@ -310,15 +363,17 @@ def collect_rds_resources(session: boto3.Session, region: Optional[str], account
                 proxy_name = proxy['DBProxyName']
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = rds.list_tags_for_resource(
-                        ResourceName=proxy['DBProxyArn']
-                    )
-                    for tag in tag_response.get('TagList', []):
-                        tags[tag.get('Key', '')] = tag.get('Value', '')
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, proxy['DBProxyArn'])
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = rds.list_tags_for_resource(
+                            ResourceName=proxy['DBProxyArn']
+                        )
+                        for tag in tag_response.get('TagList', []):
+                            tags[tag.get('Key', '')] = tag.get('Value', '')
+                    except Exception:
+                        pass
 
                 resources.append({
                     'service': 'rds',
@@ -341,3 +396,35 @@ def collect_rds_resources(session: boto3.Session, region: Optional[str], account
         pass
 
     return resources
+
+
+SUBRESOURCES = {
+    'db-instance': _collect_db_instances,
+    'db-cluster': _collect_db_clusters,
+    'db-snapshot': _collect_db_snapshots,
+    'db-cluster-snapshot': _collect_db_cluster_snapshots,
+    'db-subnet-group': _collect_db_subnet_groups,
+    'db-parameter-group': _collect_db_parameter_groups,
+    'option-group': _collect_option_groups,
+    'db-proxy': _collect_db_proxies,
+}
+
+
+def collect_rds_resources(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """
+    Collect RDS resources: DB instances, clusters, cluster snapshots, DB snapshots,
+    subnet groups, parameter groups, option groups.
+
+    Args:
+        session: boto3.Session to use
+        region: AWS region
+        account_id: AWS account ID
+
+    Returns:
+        List of resource dictionaries
+    """
+    resources = []
+    for collect in SUBRESOURCES.values():
+        resources.extend(collect(session, region, account_id))
+
+    return resources
@@ -5,6 +5,8 @@ Route53 resource collector.
 import boto3
 from typing import List, Dict, Any, Optional
 
+from aws_inventory.tagging import lookup_tags
+
 
 def collect_route53_resources(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
     """
@@ -20,6 +22,7 @@ def collect_route53_resources(session: boto3.Session, region: Optional[str], acc
     """
     resources = []
     route53 = session.client('route53')
+    partition = session.get_partition_for_region(session.region_name or 'us-east-1')
 
     # Hosted Zones
     try:
@@ -27,18 +30,21 @@ def collect_route53_resources(session: boto3.Session, region: Optional[str], acc
         for page in paginator.paginate():
             for zone in page.get('HostedZones', []):
                 zone_id = zone['Id'].split('/')[-1]
+                zone_arn = f"arn:{partition}:route53:::hostedzone/{zone_id}"
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = route53.list_tags_for_resource(
-                        ResourceType='hostedzone',
-                        ResourceId=zone_id
-                    )
-                    for tag in tag_response.get('ResourceTagSet', {}).get('Tags', []):
-                        tags[tag.get('Key', '')] = tag.get('Value', '')
-                except Exception:
-                    pass
+                tags = lookup_tags(session, None, zone_arn)
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = route53.list_tags_for_resource(
+                            ResourceType='hostedzone',
+                            ResourceId=zone_id
+                        )
+                        for tag in tag_response.get('ResourceTagSet', {}).get('Tags', []):
+                            tags[tag.get('Key', '')] = tag.get('Value', '')
+                    except Exception:
+                        pass
 
                 # Get record count
                 record_count = zone.get('ResourceRecordSetCount', 0)
@@ -47,7 +53,7 @@ def collect_route53_resources(session: boto3.Session, region: Optional[str], acc
                     'service': 'route53',
                     'type': 'hosted-zone',
                     'id': zone_id,
-                    'arn': f"arn:aws:route53:::hostedzone/{zone_id}",
+                    'arn': zone_arn,
                     'name': zone['Name'].rstrip('.'),
                     'region': 'global',
                     'details': {
@@ -68,18 +74,21 @@ def collect_route53_resources(session: boto3.Session, region: Optional[str], acc
         for page in paginator.paginate():
             for hc in page.get('HealthChecks', []):
                 hc_id = hc['Id']
+                hc_arn = f"arn:{partition}:route53:::healthcheck/{hc_id}"
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = route53.list_tags_for_resource(
-                        ResourceType='healthcheck',
-                        ResourceId=hc_id
-                    )
-                    for tag in tag_response.get('ResourceTagSet', {}).get('Tags', []):
-                        tags[tag.get('Key', '')] = tag.get('Value', '')
-                except Exception:
-                    pass
+                tags = lookup_tags(session, None, hc_arn)
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = route53.list_tags_for_resource(
+                            ResourceType='healthcheck',
+                            ResourceId=hc_id
+                        )
+                        for tag in tag_response.get('ResourceTagSet', {}).get('Tags', []):
+                            tags[tag.get('Key', '')] = tag.get('Value', '')
+                    except Exception:
+                        pass
 
                 config = hc.get('HealthCheckConfig', {})
                 name = tags.get('Name', config.get('FullyQualifiedDomainName') or config.get('IPAddress') or hc_id)
@@ -88,7 +97,7 @@ def collect_route53_resources(session: boto3.Session, region: Optional[str], acc
                     'service': 'route53',
                     'type': 'health-check',
                     'id': hc_id,
-                    'arn': f"arn:aws:route53:::healthcheck/{hc_id}",
+                    'arn': hc_arn,
                     'name': name,
                     'region': 'global',
                     'details': {
@@ -119,7 +128,7 @@ def collect_route53_resources(session: boto3.Session, region: Optional[str], acc
                 'service': 'route53',
                 'type': 'query-logging-config',
                 'id': qlc_id,
-                'arn': f"arn:aws:route53:::queryloggingconfig/{qlc_id}",
+                'arn': f"arn:{partition}:route53:::queryloggingconfig/{qlc_id}",
                 'name': f"qlc-{zone_id}",
                 'region': 'global',
                 'details': {
@@ -5,23 +5,14 @@ SageMaker resource collector.
 import boto3
 from typing import List, Dict, Any, Optional
 
+from aws_inventory.tagging import lookup_tags
 
-def collect_sagemaker_resources(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
-    """
-    Collect SageMaker resources: notebook instances, endpoints, models, domains.
-
-    Args:
-        session: boto3.Session to use
-        region: AWS region
-        account_id: AWS account ID
 
-    Returns:
-        List of resource dictionaries
-    """
+def _collect_notebook_instances(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """SageMaker Notebook Instances."""
     resources = []
     sagemaker = session.client('sagemaker', region_name=region)
 
-    # SageMaker Notebook Instances
     try:
         paginator = sagemaker.get_paginator('list_notebook_instances')
         for page in paginator.paginate():
@@ -30,13 +21,15 @@ def collect_sagemaker_resources(session: boto3.Session, region: Optional[str], a
                 nb_arn = nb['NotebookInstanceArn']
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = sagemaker.list_tags(ResourceArn=nb_arn)
-                    for tag in tag_response.get('Tags', []):
-                        tags[tag.get('Key', '')] = tag.get('Value', '')
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, nb_arn)
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = sagemaker.list_tags(ResourceArn=nb_arn)
+                        for tag in tag_response.get('Tags', []):
+                            tags[tag.get('Key', '')] = tag.get('Value', '')
+                    except Exception:
+                        pass
 
                 resources.append({
                     'service': 'sagemaker',
@@ -59,7 +52,14 @@ def collect_sagemaker_resources(session: boto3.Session, region: Optional[str], a
     except Exception:
         pass
 
-    # SageMaker Endpoints
+    return resources
+
+
+def _collect_endpoints(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """SageMaker Endpoints."""
+    resources = []
+    sagemaker = session.client('sagemaker', region_name=region)
+
     try:
         paginator = sagemaker.get_paginator('list_endpoints')
         for page in paginator.paginate():
@@ -68,13 +68,15 @@ def collect_sagemaker_resources(session: boto3.Session, region: Optional[str], a
                 endpoint_arn = endpoint['EndpointArn']
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = sagemaker.list_tags(ResourceArn=endpoint_arn)
-                    for tag in tag_response.get('Tags', []):
-                        tags[tag.get('Key', '')] = tag.get('Value', '')
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, endpoint_arn)
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = sagemaker.list_tags(ResourceArn=endpoint_arn)
+                        for tag in tag_response.get('Tags', []):
+                            tags[tag.get('Key', '')] = tag.get('Value', '')
+                    except Exception:
+                        pass
 
                 resources.append({
                     'service': 'sagemaker',
@@ -93,7 +95,14 @@ def collect_sagemaker_resources(session: boto3.Session, region: Optional[str], a
     except Exception:
         pass
 
-    # SageMaker Models
+    return resources
+
+
+def _collect_models(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """SageMaker Models."""
+    resources = []
+    sagemaker = session.client('sagemaker', region_name=region)
+
     try:
         paginator = sagemaker.get_paginator('list_models')
         for page in paginator.paginate():
@@ -102,13 +111,15 @@ def collect_sagemaker_resources(session: boto3.Session, region: Optional[str], a
                 model_arn = model['ModelArn']
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = sagemaker.list_tags(ResourceArn=model_arn)
-                    for tag in tag_response.get('Tags', []):
-                        tags[tag.get('Key', '')] = tag.get('Value', '')
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, model_arn)
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = sagemaker.list_tags(ResourceArn=model_arn)
+                        for tag in tag_response.get('Tags', []):
+                            tags[tag.get('Key', '')] = tag.get('Value', '')
+                    except Exception:
+                        pass
 
                 resources.append({
                     'service': 'sagemaker',
@@ -125,7 +136,14 @@ def collect_sagemaker_resources(session: boto3.Session, region: Optional[str], a
     except Exception:
         pass
 
-    # SageMaker Domains (Studio)
+    return resources
+
+
+def _collect_domains(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """SageMaker Domains (Studio)."""
+    resources = []
+    sagemaker = session.client('sagemaker', region_name=region)
+
     try:
         paginator = sagemaker.get_paginator('list_domains')
         for page in paginator.paginate():
@@ -135,13 +153,15 @@ def collect_sagemaker_resources(session: boto3.Session, region: Optional[str], a
                 domain_name = domain.get('DomainName', domain_id)
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = sagemaker.list_tags(ResourceArn=domain_arn)
-                    for tag in tag_response.get('Tags', []):
-                        tags[tag.get('Key', '')] = tag.get('Value', '')
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, domain_arn)
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = sagemaker.list_tags(ResourceArn=domain_arn)
+                        for tag in tag_response.get('Tags', []):
+                            tags[tag.get('Key', '')] = tag.get('Value', '')
+                    except Exception:
+                        pass
 
                 resources.append({
                     'service': 'sagemaker',
@@ -161,7 +181,14 @@ def collect_sagemaker_resources(session: boto3.Session, region: Optional[str], a
     except Exception:
         pass
 
-    # SageMaker Training Jobs (recent active)
+    return resources
+
+
+def _collect_training_jobs(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """SageMaker Training Jobs (recent active)."""
+    resources = []
+    sagemaker = session.client('sagemaker', region_name=region)
+
     try:
         paginator = sagemaker.get_paginator('list_training_jobs')
         for page in paginator.paginate(StatusEquals='InProgress', MaxResults=100):
@@ -170,13 +197,15 @@ def collect_sagemaker_resources(session: boto3.Session, region: Optional[str], a
                 job_arn = job['TrainingJobArn']
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = sagemaker.list_tags(ResourceArn=job_arn)
-                    for tag in tag_response.get('Tags', []):
-                        tags[tag.get('Key', '')] = tag.get('Value', '')
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, job_arn)
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = sagemaker.list_tags(ResourceArn=job_arn)
+                        for tag in tag_response.get('Tags', []):
+                            tags[tag.get('Key', '')] = tag.get('Value', '')
+                    except Exception:
+                        pass
 
                 resources.append({
                     'service': 'sagemaker',
@@ -196,7 +225,14 @@ def collect_sagemaker_resources(session: boto3.Session, region: Optional[str], a
     except Exception:
         pass
 
-    # SageMaker Feature Groups
+    return resources
+
+
+def _collect_feature_groups(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """SageMaker Feature Groups."""
+    resources = []
+    sagemaker = session.client('sagemaker', region_name=region)
+
     try:
         paginator = sagemaker.get_paginator('list_feature_groups')
         for page in paginator.paginate():
@@ -205,13 +241,15 @@ def collect_sagemaker_resources(session: boto3.Session, region: Optional[str], a
                 fg_arn = fg['FeatureGroupArn']
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = sagemaker.list_tags(ResourceArn=fg_arn)
-                    for tag in tag_response.get('Tags', []):
-                        tags[tag.get('Key', '')] = tag.get('Value', '')
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, fg_arn)
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = sagemaker.list_tags(ResourceArn=fg_arn)
+                        for tag in tag_response.get('Tags', []):
+                            tags[tag.get('Key', '')] = tag.get('Value', '')
+                    except Exception:
+                        pass
 
                 resources.append({
                     'service': 'sagemaker',
@@ -231,3 +269,32 @@ def collect_sagemaker_resources(session: boto3.Session, region: Optional[str], a
         pass
 
     return resources
+
+
+SUBRESOURCES = {
+    'notebook-instance': _collect_notebook_instances,
+    'endpoint': _collect_endpoints,
+    'model': _collect_models,
+    'domain': _collect_domains,
+    'training-job': _collect_training_jobs,
+    'feature-group': _collect_feature_groups,
+}
+
+
+def collect_sagemaker_resources(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """
+    Collect SageMaker resources: notebook instances, endpoints, models, domains.
+
+    Args:
+        session: boto3.Session to use
+        region: AWS region
+        account_id: AWS account ID
+
+    Returns:
+        List of resource dictionaries
+    """
+    resources = []
+    for collect in SUBRESOURCES.values():
+        resources.extend(collect(session, region, account_id))
+
+    return resources
@@ -5,6 +5,8 @@ SNS resource collector.
 import boto3
 from typing import List, Dict, Any, Optional
 
+from aws_inventory.tagging import lookup_tags
+
 
 def collect_sns_resources(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
     """
@@ -40,13 +42,15 @@ def collect_sns_resources(session: boto3.Session, region: Optional[str], account
             topic_name = topic_arn.split(':')[-1]
 
             # Get tags
-            tags = {}
-            try:
-                tag_response = sns.list_tags_for_resource(ResourceArn=topic_arn)
-                for tag in tag_response.get('Tags', []):
-                    tags[tag.get('Key', '')] = tag.get('Value', '')
-            except Exception:
-                pass
+            tags = lookup_tags(session, region, topic_arn)
+            if tags is None:
+                tags = {}
+                try:
+                    tag_response = sns.list_tags_for_resource(ResourceArn=topic_arn)
+                    for tag in tag_response.get('Tags', []):
+                        tags[tag.get('Key', '')] = tag.get('Value', '')
+                except Exception:
+                    pass
 
             resources.append({
                 'service': 'sns',
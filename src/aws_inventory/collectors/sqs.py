@@ -5,6 +5,8 @@ SQS resource collector.
 import boto3
 from typing import List, Dict, Any, Optional
 
+from aws_inventory.tagging import lookup_tags
+
 
 def collect_sqs_resources(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
     """
@@ -37,12 +39,14 @@ def collect_sqs_resources(session: boto3.Session, region: Optional[str], account
                     queue_name = queue_url.split('/')[-1]
 
                     # Get tags
-                    tags = {}
-                    try:
-                        tag_response = sqs.list_queue_tags(QueueUrl=queue_url)
-                        tags = tag_response.get('Tags', {})
-                    except Exception:
-                        pass
+                    tags = lookup_tags(session, region, queue_arn)
+                    if tags is None:
+                        tags = {}
+                        try:
+                            tag_response = sqs.list_queue_tags(QueueUrl=queue_url)
+                            tags = tag_response.get('Tags', {})
+                        except Exception:
+                            pass
 
                     resources.append({
                         'service': 'sqs',
@@ -5,6 +5,8 @@ Systems Manager resource collector.
 import boto3
 from typing import List, Dict, Any, Optional
 
+from aws_inventory.tagging import lookup_tags
+
 
 def collect_ssm_resources(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
     """
@@ -20,6 +22,7 @@ def collect_ssm_resources(session: boto3.Session, region: Optional[str], account
     """
     resources = []
     ssm = session.client('ssm', region_name=region)
+    partition = session.get_partition_for_region(region)
 
     # SSM Parameters
     try:
@@ -27,24 +30,27 @@ def collect_ssm_resources(session: boto3.Session, region: Optional[str], account
         for page in paginator.paginate():
             for param in page.get('Parameters', []):
                 param_name = param['Name']
+                param_arn = f"arn:{partition}:ssm:{region}:{account_id}:parameter{param_name if param_name.startswith('/') else '/' + param_name}"
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = ssm.list_tags_for_resource(
-                        ResourceType='Parameter',
-                        ResourceId=param_name
-                    )
-                    for tag in tag_response.get('TagList', []):
-                        tags[tag.get('Key', '')] = tag.get('Value', '')
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, param_arn)
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = ssm.list_tags_for_resource(
+                            ResourceType='Parameter',
+                            ResourceId=param_name
+                        )
+                        for tag in tag_response.get('TagList', []):
+                            tags[tag.get('Key', '')] = tag.get('Value', '')
+                    except Exception:
+                        pass
 
                 resources.append({
                     'service': 'ssm',
                     'type': 'parameter',
                     'id': param_name,
-                    'arn': f"arn:aws:ssm:{region}:{account_id}:parameter{param_name if param_name.startswith('/') else '/' + param_name}",
+                    'arn': param_arn,
                     'name': param_name,
                     'region': region,
                     'details': {
@@ -68,24 +74,27 @@ def collect_ssm_resources(session: boto3.Session, region: Optional[str], account
         for page in paginator.paginate(Filters=[{'Key': 'Owner', 'Values': ['Self']}]):
             for doc in page.get('DocumentIdentifiers', []):
                 doc_name = doc['Name']
+                doc_arn = f"arn:{partition}:ssm:{region}:{account_id}:document/{doc_name}"
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = ssm.list_tags_for_resource(
-                        ResourceType='Document',
-                        ResourceId=doc_name
-                    )
-                    for tag in tag_response.get('TagList', []):
-                        tags[tag.get('Key', '')] = tag.get('Value', '')
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, doc_arn)
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = ssm.list_tags_for_resource(
+                            ResourceType='Document',
+                            ResourceId=doc_name
+                        )
+                        for tag in tag_response.get('TagList', []):
+                            tags[tag.get('Key', '')] = tag.get('Value', '')
+                    except Exception:
+                        pass
 
                 resources.append({
                     'service': 'ssm',
                     'type': 'document',
                     'id': doc_name,
-                    'arn': f"arn:aws:ssm:{region}:{account_id}:document/{doc_name}",
+                    'arn': doc_arn,
                     'name': doc_name,
                     'region': region,
                     'details': {
@@ -109,24 +118,27 @@ def collect_ssm_resources(session: boto3.Session, region: Optional[str], account
             for mw in page.get('WindowIdentities', []):
                 mw_id = mw['WindowId']
                 mw_name = mw.get('Name', mw_id)
+                mw_arn = f"arn:{partition}:ssm:{region}:{account_id}:maintenancewindow/{mw_id}"
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = ssm.list_tags_for_resource(
-                        ResourceType='MaintenanceWindow',
-                        ResourceId=mw_id
-                    )
-                    for tag in tag_response.get('TagList', []):
-                        tags[tag.get('Key', '')] = tag.get('Value', '')
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, mw_arn)
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = ssm.list_tags_for_resource(
+                            ResourceType='MaintenanceWindow',
+                            ResourceId=mw_id
+                        )
+                        for tag in tag_response.get('TagList', []):
+                            tags[tag.get('Key', '')] = tag.get('Value', '')
+                    except Exception:
+                        pass
 
                 resources.append({
                     'service': 'ssm',
                     'type': 'maintenance-window',
                     'id': mw_id,
-                    'arn': f"arn:aws:ssm:{region}:{account_id}:maintenancewindow/{mw_id}",
+                    'arn': mw_arn,
                     'name': mw_name,
                     'region': region,
                     'details': {
@@ -150,24 +162,27 @@ def collect_ssm_resources(session: boto3.Session, region: Optional[str], account
             for pb in page.get('BaselineIdentities', []):
                 pb_id = pb['BaselineId']
                 pb_name = pb.get('BaselineName', pb_id)
+                pb_arn = f"arn:{partition}:ssm:{region}:{account_id}:patchbaseline/{pb_id}"
 
                 # Get tags
-                tags = {}
-                try:
-                    tag_response = ssm.list_tags_for_resource(
-                        ResourceType='PatchBaseline',
-                        ResourceId=pb_id
-                    )
-                    for tag in tag_response.get('TagList', []):
-                        tags[tag.get('Key', '')] = tag.get('Value', '')
-                except Exception:
-                    pass
+                tags = lookup_tags(session, region, pb_arn)
+                if tags is None:
+                    tags = {}
+                    try:
+                        tag_response = ssm.list_tags_for_resource(
+                            ResourceType='PatchBaseline',
+                            ResourceId=pb_id
+                        )
+                        for tag in tag_response.get('TagList', []):
+                            tags[tag.get('Key', '')] = tag.get('Value', '')
+                    except Exception:
+                        pass
 
                 resources.append({
                     'service': 'ssm',
                     'type': 'patch-baseline',
                     'id': pb_id,
-                    'arn': f"arn:aws:ssm:{region}:{account_id}:patchbaseline/{pb_id}",
+                    'arn': pb_arn,
                     'name': pb_name,
                     'region': region,
                     'details': {
@@ -193,7 +208,7 @@ def collect_ssm_resources(session: boto3.Session, region: Optional[str], account
                     'service': 'ssm',
                     'type': 'association',
                     'id': assoc_id,
-                    'arn': f"arn:aws:ssm:{region}:{account_id}:association/{assoc_id}",
+                    'arn': f"arn:{partition}:ssm:{region}:{account_id}:association/{assoc_id}",
                     'name': assoc.get('AssociationName') or assoc.get('Name', assoc_id),
                     'region': region,
                     'details': {
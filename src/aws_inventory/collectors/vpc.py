@@ -8,23 +8,11 @@ from typing import List, Dict, Any, Optional
 from aws_inventory.collector import tags_to_dict, get_tag_value
 
 
-def collect_vpc_resources(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
-    """
-    Collect VPC resources: VPCs, subnets, route tables, internet gateways,
-    NAT gateways, VPC endpoints, VPC peering, transit gateways.
-
-    Args:
-        session: boto3.Session to use
-        region: AWS region
-        account_id: AWS account ID
-
-    Returns:
-        List of resource dictionaries
-    """
+def _collect_vpcs(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """VPCs."""
     resources = []
     ec2 = session.client('ec2', region_name=region)
 
-    # VPCs
     try:
         paginator = ec2.get_paginator('describe_vpcs')
         for page in paginator.paginate():
@@ -49,7 +37,14 @@ def collect_vpc_resources(session: boto3.Session, region: Optional[str], account
     except Exception:
         pass
 
-    # Subnets
+    return resources
+
+
+def _collect_subnets(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """Subnets."""
+    resources = []
+    ec2 = session.client('ec2', region_name=region)
+
     try:
         paginator = ec2.get_paginator('describe_subnets')
         for page in paginator.paginate():
@@ -76,7 +71,14 @@ def collect_vpc_resources(session: boto3.Session, region: Optional[str], account
     except Exception:
         pass
 
-    # Route Tables
+    return resources
+
+
+def _collect_route_tables(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """Route Tables."""
+    resources = []
+    ec2 = session.client('ec2', region_name=region)
+
     try:
         paginator = ec2.get_paginator('describe_route_tables')
         for page in paginator.paginate():
@@ -100,7 +102,14 @@ def collect_vpc_resources(session: boto3.Session, region: Optional[str], account
     except Exception:
         pass
 
-    # Internet Gateways
+    return resources
+
+
+def _collect_internet_gateways(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """Internet Gateways."""
+    resources = []
+    ec2 = session.client('ec2', region_name=region)
+
     try:
         paginator = ec2.get_paginator('describe_internet_gateways')
         for page in paginator.paginate():
@@ -123,7 +132,14 @@ def collect_vpc_resources(session: boto3.Session, region: Optional[str], account
     except Exception:
         pass
 
-    # NAT Gateways
+    return resources
+
+
+def _collect_nat_gateways(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """NAT Gateways."""
+    resources = []
+    ec2 = session.client('ec2', region_name=region)
+
     try:
         paginator = ec2.get_paginator('describe_nat_gateways')
         for page in paginator.paginate():
@@ -154,7 +170,14 @@ def collect_vpc_resources(session: boto3.Session, region: Optional[str], account
     except Exception:
         pass
 
-    # VPC Endpoints
+    return resources
+
+
+def _collect_vpc_endpoints(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """VPC Endpoints."""
+    resources = []
+    ec2 = session.client('ec2', region_name=region)
+
     try:
         paginator = ec2.get_paginator('describe_vpc_endpoints')
         for page in paginator.paginate():
@@ -179,7 +202,14 @@ def collect_vpc_resources(session: boto3.Session, region: Optional[str], account
     except Exception:
         pass
 
-    # VPC Peering Connections
+    return resources
+
+
+def _collect_vpc_peerings(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """VPC Peering Connections."""
+    resources = []
+    ec2 = session.client('ec2', region_name=region)
+
     try:
         paginator = ec2.get_paginator('describe_vpc_peering_connections')
         for page in paginator.paginate():
@@ -210,7 +240,14 @@ def collect_vpc_resources(session: boto3.Session, region: Optional[str], account
     except Exception:
         pass
 
-    # Transit Gateways (owned by this account)
+    return resources
+
+
+def _collect_transit_gateways(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """Transit Gateways (owned by this account)."""
+    resources = []
+    ec2 = session.client('ec2', region_name=region)
+
     try:
         paginator = ec2.get_paginator('describe_transit_gateways')
         for page in paginator.paginate():
@@ -239,7 +276,14 @@ def collect_vpc_resources(session: boto3.Session, region: Optional[str], account
     except Exception:
         pass
 
-    # Transit Gateway Attachments
+    return resources
+
+
+def _collect_transit_gateway_attachments(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """Transit Gateway Attachments."""
+    resources = []
+    ec2 = session.client('ec2', region_name=region)
+
     try:
         paginator = ec2.get_paginator('describe_transit_gateway_attachments')
         for page in paginator.paginate():
@@ -268,7 +312,14 @@ def collect_vpc_resources(session: boto3.Session, region: Optional[str], account
     except Exception:
         pass
 
-    # DHCP Options Sets
+    return resources
+
+
+def _collect_dhcp_options(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """DHCP Options Sets."""
+    resources = []
+    ec2 = session.client('ec2', region_name=region)
+
     try:
         response = ec2.describe_dhcp_options()
         for dhcp in response.get('DhcpOptions', []):
@@ -288,7 +339,14 @@ def collect_vpc_resources(session: boto3.Session, region: Optional[str], account
     except Exception:
         pass
 
-    # Network ACLs
+    return resources
+
+
+def _collect_network_acls(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """Network ACLs."""
+    resources = []
+    ec2 = session.client('ec2', region_name=region)
+
     try:
         paginator = ec2.get_paginator('describe_network_acls')
         for page in paginator.paginate():
@@ -313,3 +371,38 @@ def collect_vpc_resources(session: boto3.Session, region: Optional[str], account
         pass
 
     return resources
+
+
+SUBRESOURCES = {
+    'vpc': _collect_vpcs,
+    'subnet': _collect_subnets,
+    'route-table': _collect_route_tables,
+    'internet-gateway': _collect_internet_gateways,
+    'nat-gateway': _collect_nat_gateways,
+    'vpc-endpoint': _collect_vpc_endpoints,
+    'vpc-peering': _collect_vpc_peerings,
+    'transit-gateway': _collect_transit_gateways,
+    'transit-gateway-attachment': _collect_transit_gateway_attachments,
+    'dhcp-options': _collect_dhcp_options,
+    'network-acl': _collect_network_acls,
+}
+
+
+def collect_vpc_resources(session: boto3.Session, region: Optional[str], account_id: str) -> List[Dict[str, Any]]:
+    """
+    Collect VPC resources: VPCs, subnets, route tables, internet gateways,
+    NAT gateways, VPC endpoints, VPC peering, transit gateways.
+
+    Args:
+        session: boto3.Session to use
+        region: AWS region
+        account_id: AWS account ID
+
+    Returns:
+        List of resource dictionaries
+    """
+    resources = []
+    for collect in SUBRESOURCES.values():
+        resources.extend(collect(session, region, account_id))
+
+    return resources
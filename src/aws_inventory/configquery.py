@@ -0,0 +1,503 @@
+"""
+Collection through AWS Config advanced queries.
+
+Where AWS Config records resources, one paginated SQL query per region (or
+a single query against an aggregator, covering every account and region it
+aggregates) returns resources of many types without calling each service's
+API. Config types are mapped onto awsmap's service/type schema below;
+anything Config doesn't record, or that isn't mapped, is collected by the
+normal collectors.
+"""
+
+import json
+import time
+import concurrent.futures
+from typing import List, Dict, Any, Optional, Callable, Set, Tuple
+
+from aws_inventory.auth import get_account_id, get_enabled_regions
+from aws_inventory.clients import ClientFactory
+from aws_inventory.scheduling import TaskHistory
+from aws_inventory.apistats import ApiStats
+from aws_inventory.records import compact_records
+from aws_inventory.collector import (
+    collect_all,
+    get_available_services,
+    get_subresource_types,
+    split_service,
+)
+
+
+def _first(items: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
+    return items[0] if items else {}
+
+
+# Config's configuration column is the service's describe output with
+# camelCase keys (instanceType, dBInstanceClass...). Each function below
+# maps it onto the details the type's collector reports.
+
+def _instance_details(c: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'instance_type': c.get('instanceType'),
+        'state': (c.get('state') or {}).get('name'),
+        'private_ip': c.get('privateIpAddress'),
+        'public_ip': c.get('publicIpAddress'),
+        'vpc_id': c.get('vpcId'),
+        'subnet_id': c.get('subnetId'),
+        'launch_time': str(c.get('launchTime') or ''),
+        'platform': c.get('platform') or 'linux',
+        'architecture': c.get('architecture'),
+    }
+
+
+def _volume_details(c: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'size_gb': c.get('size'),
+        'volume_type': c.get('volumeType'),
+        'state': c.get('state'),
+        'iops': c.get('iops'),
+        'encrypted': c.get('encrypted'),
+        'availability_zone': c.get('availabilityZone'),
+        'attachments': [a.get('instanceId') for a in c.get('attachments') or []],
+    }
+
+
+def _security_group_details(c: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'vpc_id': c.get('vpcId'),
+        'description': c.get('description'),
+        'ingress_rules': len(c.get('ipPermissions') or []),
+        'egress_rules': len(c.get('ipPermissionsEgress') or []),
+    }
+
+
+def _elastic_ip_details(c: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'public_ip': c.get('publicIp'),
+        'private_ip': c.get('privateIpAddress'),
+        'instance_id': c.get('instanceId'),
+        'network_interface_id': c.get('networkInterfaceId'),
+        'domain': c.get('domain'),
+    }
+
+
+def _network_interface_details(c: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'vpc_id': c.get('vpcId'),
+        'subnet_id': c.get('subnetId'),
+        'private_ip': c.get('privateIpAddress'),
+        'status': c.get('status'),
+        'interface_type': c.get('interfaceType'),
+        'attachment_instance': (c.get('attachment') or {}).get('instanceId'),
+    }
+
+
+def _vpc_details(c: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'cidr_block': c.get('cidrBlock'),
+        'state': c.get('state'),
+        'is_default': c.get('isDefault'),
+        'dhcp_options_id': c.get('dhcpOptionsId'),
+        'instance_tenancy': c.get('instanceTenancy'),
+    }
+
+
+def _subnet_details(c: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'vpc_id': c.get('vpcId'),
+        'cidr_block': c.get('cidrBlock'),
+        'availability_zone': c.get('availabilityZone'),
+        'state': c.get('state'),
+        'available_ip_count': c.get('availableIpAddressCount'),
+        'map_public_ip_on_launch': c.get('mapPublicIpOnLaunch'),
+        'default_for_az': c.get('defaultForAz'),
+    }
+
+
+def _route_table_details(c: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'vpc_id': c.get('vpcId'),
+        'routes_count': len(c.get('routes') or []),
+        'associations_count': len(c.get('associations') or []),
+    }
+
+
+def _internet_gateway_details(c: Dict[str, Any]) -> Dict[str, Any]:
+    attachment = _first(c.get('attachments'))
+    return {
+        'vpc_id': attachment.get('vpcId'),
+        'state': attachment.get('state', 'detached'),
+    }
+
+
+def _nat_gateway_details(c: Dict[str, Any]) -> Dict[str, Any]:
+    address = _first(c.get('natGatewayAddresses'))
+    return {
+        'vpc_id': c.get('vpcId'),
+        'subnet_id': c.get('subnetId'),
+        'state': c.get('state'),
+        'connectivity_type': c.get('connectivityType'),
+        'public_ip': address.get('publicIp'),
+        'private_ip': address.get('privateIp'),
+    }
+
+
+def _vpc_endpoint_details(c: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'vpc_id': c.get('vpcId'),
+        'service_name': c.get('serviceName'),
+        'endpoint_type': c.get('vpcEndpointType'),
+        'state': c.get('state'),
+        'private_dns_enabled': c.get('privateDnsEnabled'),
+    }
+
+
+def _vpc_peering_details(c: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'status': (c.get('status') or {}).get('code'),
+        'requester_vpc_id': (c.get('requesterVpcInfo') or {}).get('vpcId'),
+        'requester_cidr': (c.get('requesterVpcInfo') or {}).get('cidrBlock'),
+        'accepter_vpc_id': (c.get('accepterVpcInfo') or {}).get('vpcId'),
+        'accepter_cidr': (c.get('accepterVpcInfo') or {}).get('cidrBlock'),
+    }
+
+
+def _network_acl_details(c: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'vpc_id': c.get('vpcId'),
+        'is_default': c.get('isDefault'),
+        'entries_count': len(c.get('entries') or []),
+        'associations_count': len(c.get('associations') or []),
+    }
+
+
+def _db_instance_details(c: Dict[str, Any]) -> Dict[str, Any]:
+    endpoint = c.get('endpoint') or {}
+    return {
+        'engine': c.get('engine'),
+        'engine_version': c.get('engineVersion'),
+        'instance_class': c.get('dBInstanceClass'),
+        'status': c.get('dBInstanceStatus'),
+        'storage_type': c.get('storageType'),
+        'allocated_storage': c.get('allocatedStorage'),
+        'multi_az': c.get('multiAZ'),
+        'publicly_accessible': c.get('publiclyAccessible'),
+        'encrypted': c.get('storageEncrypted'),
+        'endpoint': endpoint.get('address'),
+        'port': endpoint.get('port'),
+        'vpc_id': (c.get('dBSubnetGroup') or {}).get('vpcId'),
+        'cluster_identifier': c.get('dBClusterIdentifier'),
+    }
+
+
+def _db_cluster_details(c: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'engine': c.get('engine'),
+        'engine_version': c.get('engineVersion'),
+        'engine_mode': c.get('engineMode'),
+        'status': c.get('status'),
+        'multi_az': c.get('multiAZ'),
+        'encrypted': c.get('storageEncrypted'),
+        'endpoint': c.get('endpoint'),
+        'reader_endpoint': c.get('readerEndpoint'),
+        'port': c.get('port'),
+        'members': len(c.get('dBClusterMembers') or []),
+        'serverless_v2_scaling': c.get('serverlessV2ScalingConfiguration'),
+    }
+
+
+# Config resource type -> (awsmap task it replaces, awsmap resource type,
+# details function, configuration key holding awsmap's id or None for
+# Config's resourceId). RDS's resourceId is the internal DbiResourceId /
+# DbClusterResourceId, not the identifier the rds collector uses.
+#
+# A task is only replaced when Config covers every resource type it
+# collects, so services with types Config doesn't record (AMIs, key
+# pairs...) are mapped per sub-resource. Only types whose Config
+# configuration has been checked against the collector's record are
+# listed; anything else is collected directly.
+CONFIG_TYPES: Dict[str, Tuple[str, str, Callable[[Dict[str, Any]], Dict[str, Any]], Optional[str]]] = {
+    'AWS::EC2::Instance': ('ec2:instance', 'instance', _instance_details, None),
+    'AWS::EC2::Volume': ('ec2:volume', 'volume', _volume_details, None),
+    'AWS::EC2::SecurityGroup': ('ec2:security-group', 'security-group', _security_group_details, None),
+    'AWS::EC2::EIP': ('ec2:elastic-ip', 'elastic-ip', _elastic_ip_details, None),
+    'AWS::EC2::NetworkInterface': ('ec2:network-interface', 'network-interface', _network_interface_details, None),
+    'AWS::EC2::VPC': ('vpc:vpc', 'vpc', _vpc_details, None),
+    'AWS::EC2::Subnet': ('vpc:subnet', 'subnet', _subnet_details, None),
+    'AWS::EC2::RouteTable': ('vpc:route-table', 'route-table', _route_table_details, None),
+    'AWS::EC2::InternetGateway': ('vpc:internet-gateway', 'internet-gateway', _internet_gateway_details, None),
+    'AWS::EC2::NatGateway': ('vpc:nat-gateway', 'nat-gateway', _nat_gateway_details, None),
+    'AWS::EC2::VPCEndpoint': ('vpc:vpc-endpoint', 'vpc-endpoint', _vpc_endpoint_details, None),
+    'AWS::EC2::VPCPeeringConnection': ('vpc:vpc-peering', 'vpc-peering', _vpc_peering_details, None),
+    'AWS::EC2::NetworkAcl': ('vpc:network-acl', 'network-acl', _network_acl_details, None),
+    'AWS::RDS::DBInstance': ('rds:db-instance', 'db-instance', _db_instance_details, 'dBInstanceIdentifier'),
+    'AWS::RDS::DBCluster': ('rds:db-cluster', 'db-cluster', _db_cluster_details, 'dBClusterIdentifier'),
+}
+
+QUERY_FIELDS = 'resourceId, resourceName, resourceType, arn, awsRegion, accountId, tags, configuration'
+
+
+def config_record(item: Dict[str, Any], account_id: str) -> Dict[str, Any]:
+    """
+    Convert an advanced query result row to an awsmap resource record.
+
+    Args:
+        item: Parsed row with the QUERY_FIELDS columns
+        account_id: Scanning account ID; resources of other accounts
+            (aggregator queries) get an account_id field
+
+    Returns:
+        Resource dictionary in the collectors' format
+    """
+    unit, resource_type, details_function, id_key = CONFIG_TYPES[item['resourceType']]
+    tags = {tag.get('key', ''): tag.get('value', '') for tag in item.get('tags') or []}
+    configuration = item.get('configuration')
+    if not isinstance(configuration, dict):
+        configuration = {}
+    details = details_function(configuration)
+    details['source'] = 'config'
+    if id_key:
+        resource_id = configuration.get(id_key) or item.get('resourceName')
+    else:
+        resource_id = item.get('resourceId')
+
+    record = {
+        'service': split_service(unit)[0],
+        'type': resource_type,
+        'id': resource_id,
+        'arn': item.get('arn'),
+        'name': item.get('resourceName') or tags.get('Name') or resource_id,
+        'region': item.get('awsRegion'),
+        'details': details,
+        'tags': tags
+    }
+    if item.get('accountId') and item['accountId'] != account_id:
+        record['account_id'] = item['accountId']
+    return record
+
+
+def recorded_types(session, region: str) -> Set[str]:
+    """
+    Get the mapped Config types a region's recorder is recording.
+
+    Args:
+        session: boto3.Session or ClientFactory to use
+        region: AWS region
+
+    Returns:
+        Set of CONFIG_TYPES keys (empty if no recorder is recording)
+    """
+    config = session.client('config', region_name=region)
+    try:
+        recorders = config.describe_configuration_recorders().get('ConfigurationRecorders', [])
+        statuses = config.describe_configuration_recorder_status().get('ConfigurationRecordersStatus', [])
+    except Exception:
+        return set()
+    recording = {s.get('name') for s in statuses if s.get('recording')}
+
+    types: Set[str] = set()
+    for recorder in recorders:
+        if recorder.get('name') not in recording:
+            continue
+        group = recorder.get('recordingGroup', {})
+        # Recorders created before recording strategies only have allSupported
+        strategy = group.get('recordingStrategy', {}).get('useOnly') or (
+            'ALL_SUPPORTED_RESOURCE_TYPES' if group.get('allSupported', True) else 'INCLUSION_BY_RESOURCE_TYPES'
+        )
+        if strategy == 'ALL_SUPPORTED_RESOURCE_TYPES':
+            types.update(CONFIG_TYPES)
+        elif strategy == 'EXCLUSION_BY_RESOURCE_TYPES':
+            excluded = set(group.get('exclusionByResourceTypes', {}).get('resourceTypes', []))
+            types.update(t for t in CONFIG_TYPES if t not in excluded)
+        else:
+            types.update(t for t in group.get('resourceTypes', []) if t in CONFIG_TYPES)
+    return types
+
+
+def _served_tasks(recorded: Set[str], requested: List[str]) -> Set[str]:
+    """
+    Get the requested tasks Config can replace.
+
+    A task is served only when every Config type mapped to it is recorded;
+    a whole-service task (codebuild, autoscaling...) with any type missing
+    is left to its collector.
+
+    Args:
+        recorded: Config types recorded in every scanned region
+        requested: Requested service or service:type names
+
+    Returns:
+        Set of task names (CONFIG_TYPES units) served by Config
+    """
+    wanted = set(requested)
+    task_types: Dict[str, Set[str]] = {}
+    for config_type, (unit, *_) in CONFIG_TYPES.items():
+        task_types.setdefault(unit, set()).add(config_type)
+    return {
+        unit for unit, unit_types in task_types.items()
+        if unit_types <= recorded and (unit in wanted or split_service(unit)[0] in wanted)
+    }
+
+
+def _query(session, region: str, types: List[str], aggregator: Optional[str],
+           regions: Optional[List[str]]) -> List[Dict[str, Any]]:
+    """Run the advanced query and return parsed rows."""
+    type_list = ', '.join(f"'{t}'" for t in sorted(types))
+    expression = f"SELECT {QUERY_FIELDS} WHERE resourceType IN ({type_list})"
+    config = session.client('config', region_name=region)
+
+    if aggregator:
+        if regions:
+            expression += f" AND awsRegion IN ({', '.join(repr(r) for r in regions)})"
+        paginator = config.get_paginator('select_aggregate_resource_config')
+        pages = paginator.paginate(Expression=expression, ConfigurationAggregatorName=aggregator,
+                                   PaginationConfig={'PageSize': 100})
+    else:
+        paginator = config.get_paginator('select_resource_config')
+        pages = paginator.paginate(Expression=expression, PaginationConfig={'PageSize': 100})
+
+    rows = []
+    for page in pages:
+        rows.extend(json.loads(result) for result in page.get('Results', []))
+    return rows
+
+
+def _split_tasks(services: List[str], served: Set[str]) -> List[str]:
+    """Get the collector tasks Config doesn't replace, as service or service:type names."""
+    fallback = []
+    for name in services:
+        service, subresource = split_service(name)
+        if name in served:
+            continue
+        if subresource is None and any(f"{service}:{t}" in served for t in get_subresource_types(service)):
+            fallback.extend(f"{service}:{t}" for t in get_subresource_types(service)
+                            if f"{service}:{t}" not in served)
+        else:
+            fallback.append(name)
+    return fallback
+
+
+def collect_with_config(
+    session,
+    services: Optional[List[str]] = None,
+    regions: Optional[List[str]] = None,
+    max_workers: int = 20,
+    progress_callback: Optional[Callable[[str, str], None]] = None,
+    show_timings: bool = False,
+    include_global: bool = False,
+    history: Optional[TaskHistory] = None,
+    estimate_callback: Optional[Callable[[float], None]] = None,
+    rate_limit: bool = True,
+    api_stats: Optional[ApiStats] = None,
+    compact: bool = False,
+    bulk_tags: bool = False,
+    aggregator: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Collect resources from AWS Config, and the rest with direct collectors.
+
+    A mapped task is taken from Config only if every scanned region's
+    recorder in the caller's account records its types. Without an
+    aggregator, each region is queried with select_resource_config. With
+    one, a single select_aggregate_resource_config query (in the session's
+    region) returns all aggregated accounts; direct collectors still only
+    scan the caller's account, so other accounts only have the types their
+    own recorders record.
+
+    Args:
+        session: boto3.Session to use
+        services: List of service names to collect (None for all)
+        regions: List of regions to collect from (None for all enabled)
+        max_workers: Maximum parallel workers
+        progress_callback: Optional callback(service_name, status) for progress updates
+        show_timings: If True, print the direct collectors' timing summary
+        include_global: If True, include global services even when filtering by non-global regions
+        history: Optional TaskHistory for direct collector task ordering
+        estimate_callback: Optional callback(seconds) with the estimated direct collection duration
+        rate_limit: If True, rate limit direct collectors
+        api_stats: Optional ApiStats to record every API call in
+        compact: If True, store compact Resource records instead of dicts
+        bulk_tags: If True, direct collectors resolve tags in bulk
+        aggregator: Optional Config aggregator name for an org-wide query
+
+    Returns:
+        Dict with metadata and resources list
+    """
+    start_time = time.time()
+    account_id = get_account_id(session)
+    requested = services or get_available_services()
+    clients = ClientFactory(session, max_pool_connections=max_workers,
+                            hooks=[api_stats] if api_stats is not None else None)
+
+    try:
+        # Direct collectors only scan this account, so its recorders decide
+        # which tasks Config replaces, with or without an aggregator
+        scanned_regions = regions or get_enabled_regions(session)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            per_region = list(executor.map(lambda r: recorded_types(clients, r), scanned_regions))
+        served = _served_tasks(set.intersection(*per_region) if per_region else set(), requested)
+
+        if aggregator:
+            # Other accounts can't be collected directly, so every requested
+            # type is queried; this account's rows are kept only for served
+            # tasks, as the collectors return the rest
+            query_regions = [session.region_name or 'us-east-1']
+            queried = _served_tasks(set(CONFIG_TYPES), requested)
+        else:
+            query_regions = scanned_regions
+            queried = served
+        types = [t for t in CONFIG_TYPES if CONFIG_TYPES[t][0] in queried]
+
+        resources = []
+        if types:
+            if progress_callback:
+                progress_callback('config', f"Querying {len(types)} resource types...")
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(_query, clients, r, types, aggregator, regions) for r in query_regions]
+                for future in concurrent.futures.as_completed(futures):
+                    resources.extend(
+                        config_record(row, account_id) for row in future.result()
+                        if CONFIG_TYPES[row['resourceType']][0] in served
+                        or row.get('accountId', account_id) != account_id
+                    )
+            if progress_callback:
+                progress_callback('config', f"Done: {len(resources)} resources")
+    finally:
+        clients.close()
+    query_seconds = time.time() - start_time
+
+    fallback = _split_tasks(requested, served)
+    result = {'metadata': {}, 'resources': []}
+    if fallback:
+        result = collect_all(
+            session,
+            services=fallback,
+            regions=regions,
+            max_workers=max_workers,
+            progress_callback=progress_callback,
+            show_timings=show_timings,
+            include_global=include_global,
+            history=history,
+            estimate_callback=estimate_callback,
+            rate_limit=rate_limit,
+            api_stats=api_stats,
+            bulk_tags=bulk_tags
+        )
+    resources.extend(result['resources'])
+    if compact:
+        resources = compact_records(resources)
+
+    metadata = result['metadata']
+    metadata.update({
+        'account_id': account_id,
+        'timestamp': time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime()),
+        'scan_duration_seconds': round(time.time() - start_time, 2),
+        'engine': 'config',
+        'config_aggregator': aggregator,
+        'config_query_seconds': round(query_seconds, 2),
+        'config_tasks': sorted(served),
+        'services_scanned': len({split_service(n)[0] for n in requested}),
+        'regions_scanned': max(metadata.get('regions_scanned', 0), len({r['region'] for r in resources})),
+        'resource_count': len(resources)
+    })
+    metadata.setdefault('throttles', {})
+    return {'metadata': metadata, 'resources': resources}
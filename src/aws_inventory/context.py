@@ -0,0 +1,158 @@
+"""
+Per-scan account metadata: caller identity, account alias and enabled regions.
+
+A ScanContext resolves the three lookups once, concurrently, and is attached
+to the boto3 session. get_account_id, get_enabled_regions and
+get_account_alias answer from the attached context, and collectors reach it
+through their ClientFactory (which proxies to the session), so a scan makes
+each call at most once. Optionally the context is kept on disk for a TTL,
+letting repeated runs skip the alias and region lookups; the credentials
+are still checked with one STS call.
+"""
+
+import os
+import json
+import time
+import hashlib
+import tempfile
+import concurrent.futures
+from typing import List, Dict, Any, Optional
+
+from aws_inventory.auth import validate_credentials, get_account_alias, get_enabled_regions
+
+
+DEFAULT_CONTEXT_FILE = os.path.join(os.path.expanduser('~'), '.awsmap', 'scan_context.json')
+
+
+class ScanContext:
+    """
+    Resolved account metadata for one set of credentials.
+
+    Holds plain data only, so it pickles into process-engine workers.
+    """
+
+    def __init__(
+        self,
+        account_id: str,
+        user_id: str,
+        arn: str,
+        alias: Optional[str],
+        enabled_regions: List[str],
+        resolved_at: Optional[float] = None,
+        from_cache: bool = False
+    ):
+        """
+        Args:
+            account_id: AWS account ID
+            user_id: Caller user ID
+            arn: Caller ARN
+            alias: Account alias (None if not set)
+            enabled_regions: Sorted enabled region names
+            resolved_at: Epoch seconds the values were fetched
+            from_cache: True if loaded from the on-disk cache
+        """
+        self.account_id = account_id
+        self.user_id = user_id
+        self.arn = arn
+        self.alias = alias
+        self.enabled_regions = list(enabled_regions)
+        self.resolved_at = resolved_at if resolved_at is not None else time.time()
+        self.from_cache = from_cache
+
+    @property
+    def identity(self) -> Dict[str, str]:
+        """Caller identity in validate_credentials() format."""
+        return {'account_id': self.account_id, 'user_id': self.user_id, 'arn': self.arn}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the JSON-serializable cache entry."""
+        return {
+            'account_id': self.account_id,
+            'user_id': self.user_id,
+            'arn': self.arn,
+            'alias': self.alias,
+            'enabled_regions': self.enabled_regions,
+            'resolved_at': self.resolved_at,
+        }
+
+    def attach(self, session) -> None:
+        """
+        Make the auth lookups on session (and ClientFactories wrapping it) use this context.
+
+        Args:
+            session: boto3.Session the scan runs with
+        """
+        session.scan_context = self
+
+    @classmethod
+    def resolve(cls, session, cache_file: Optional[str] = None, ttl: Optional[float] = None) -> 'ScanContext':
+        """
+        Resolve identity, alias and enabled regions, in parallel.
+
+        A cache hit still calls sts:GetCallerIdentity, so expired or revoked
+        credentials fail here rather than mid-scan; if they now belong to a
+        different account the entry is ignored.
+
+        Args:
+            session: boto3.Session to resolve for
+            cache_file: On-disk cache file (None to never read or write one)
+            ttl: Seconds a cache entry stays valid (None or 0 disables the cache)
+
+        Returns:
+            ScanContext
+
+        Raises:
+            ValueError: If credentials are invalid
+        """
+        key = _cache_key(session) if cache_file and ttl else None
+        if key is not None:
+            entry = _read_cache(cache_file).get(key)
+            if entry and time.time() - entry.get('resolved_at', 0) < ttl:
+                identity = validate_credentials(session)
+                if identity['account_id'] == entry.get('account_id'):
+                    return cls(from_cache=True, **{**entry, **identity})
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            identity = executor.submit(validate_credentials, session)
+            alias = executor.submit(get_account_alias, session)
+            regions = executor.submit(get_enabled_regions, session)
+            context = cls(alias=alias.result(), enabled_regions=regions.result(), **identity.result())
+
+        if key is not None:
+            _write_cache(cache_file, key, context.to_dict())
+        return context
+
+
+def _cache_key(session) -> Optional[str]:
+    """Key cache entries by profile and access key, without storing the key itself."""
+    credentials = session.get_credentials()
+    if credentials is None:
+        return None
+    access_key = credentials.get_frozen_credentials().access_key
+    raw = f"{session.profile_name}|{access_key}|{session.region_name}"
+    return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+
+def _read_cache(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(path: str, key: str, entry: Dict[str, Any]) -> None:
+    """Add an entry, dropping entries older than a day."""
+    data = _read_cache(path)
+    cutoff = time.time() - 86400
+    data = {k: v for k, v in data.items() if isinstance(v, dict) and v.get('resolved_at', 0) > cutoff}
+    data[key] = entry
+    try:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
@@ -0,0 +1,334 @@
+"""
+Fast enumeration through an AWS Resource Explorer aggregator index.
+
+An account with an aggregator index can list every indexed resource in
+every region with a few paginated ListResources calls, instead of ~150
+collectors per region. Records carry ARN, type, region and tags (when the
+view includes the tags property) but no service-specific details; services
+that need details are enriched by running their normal collectors.
+"""
+
+import time
+from typing import List, Dict, Any, Optional, Callable
+
+from aws_inventory.auth import get_account_id
+from aws_inventory.clients import ClientFactory
+from aws_inventory.scheduling import TaskHistory
+from aws_inventory.apistats import ApiStats
+from aws_inventory.records import compact_records
+from aws_inventory.collector import collect_all, split_service
+
+
+# Resource Explorer reports ARN service namespaces; awsmap names these services differently
+EXPLORER_SERVICES = {
+    'airflow': 'mwaa',
+    'aoss': 'opensearch-serverless',
+    'aps': 'amp',
+    'cloudhsm': 'cloudhsmv2',
+    'cognito-identity': 'cognito',
+    'cognito-idp': 'cognito',
+    'elasticfilesystem': 'efs',
+    'elasticloadbalancing': 'elbv2',
+    'elasticmapreduce': 'emr',
+    'es': 'opensearch',
+    'geo': 'location',
+    'lex': 'lexv2',
+    'pipes': 'eventbridge-pipes',
+    'scheduler': 'eventbridge-scheduler',
+    'ses': 'sesv2',
+    'states': 'stepfunctions',
+}
+
+# Resource types collected by awsmap's vpc service rather than ec2 (or elb rather than elbv2)
+EXPLORER_TYPE_SERVICES = {
+    'ec2:vpc': 'vpc',
+    'ec2:subnet': 'vpc',
+    'ec2:route-table': 'vpc',
+    'ec2:internet-gateway': 'vpc',
+    'ec2:natgateway': 'vpc',
+    'ec2:vpc-endpoint': 'vpc',
+    'ec2:vpc-peering-connection': 'vpc',
+    'ec2:transit-gateway': 'vpc',
+    'ec2:transit-gateway-attachment': 'vpc',
+    'ec2:dhcp-options': 'vpc',
+    'ec2:network-acl': 'vpc',
+    # Classic load balancers; v2 types are loadbalancer/app, loadbalancer/net, ...
+    'elasticloadbalancing:loadbalancer': 'elb',
+}
+
+# Resource Explorer resource types whose awsmap collector emits another type name;
+# types not listed keep the part after the service (ec2:instance -> instance)
+EXPLORER_TYPES = {
+    'backup:backup-plan': 'plan',
+    'backup:backup-vault': 'vault',
+    'cloudwatch:alarm': 'metric-alarm',
+    'ec2:image': 'ami',
+    'ec2:natgateway': 'nat-gateway',
+    'ec2:vpc-peering-connection': 'vpc-peering',
+    'elasticloadbalancing:listener/app': 'listener',
+    'elasticloadbalancing:listener/gwy': 'listener',
+    'elasticloadbalancing:listener/net': 'listener',
+    'elasticloadbalancing:loadbalancer': 'classic-load-balancer',
+    'elasticloadbalancing:loadbalancer/app': 'application-load-balancer',
+    'elasticloadbalancing:loadbalancer/gwy': 'gateway-load-balancer',
+    'elasticloadbalancing:loadbalancer/net': 'network-load-balancer',
+    'elasticloadbalancing:targetgroup': 'target-group',
+    'iot:thinggroup': 'thing-group',
+    'iot:thingtype': 'thing-type',
+    'rds:cluster': 'db-cluster',
+    'rds:cluster-snapshot': 'db-cluster-snapshot',
+    'rds:db': 'db-instance',
+    'rds:og': 'option-group',
+    'rds:pg': 'db-parameter-group',
+    'rds:snapshot': 'db-snapshot',
+    'rds:subgrp': 'db-subnet-group',
+    'route53:healthcheck': 'health-check',
+    'route53:hostedzone': 'hosted-zone',
+    'ssm:maintenancewindow': 'maintenance-window',
+    'ssm:patchbaseline': 'patch-baseline',
+    'states:activity': 'activity',
+    'states:stateMachine': 'state-machine',
+}
+
+
+def find_indexes(session) -> tuple:
+    """
+    Find the account's Resource Explorer aggregator index and the regions it covers.
+
+    Args:
+        session: boto3.Session or ClientFactory to use
+
+    Returns:
+        Tuple of (aggregator index region, set of regions with an index);
+        the aggregator only holds resources from regions that have one
+
+    Raises:
+        ValueError: If Resource Explorer has no aggregator index (or can't be reached)
+    """
+    explorer = session.client('resource-explorer-2', region_name=session.region_name or 'us-east-1')
+    aggregator_region = None
+    indexed_regions = set()
+    try:
+        paginator = explorer.get_paginator('list_indexes')
+        for page in paginator.paginate():
+            for index in page.get('Indexes', []):
+                indexed_regions.add(index['Region'])
+                if index.get('Type') == 'AGGREGATOR':
+                    aggregator_region = index['Region']
+    except Exception as e:
+        raise ValueError(f"Resource Explorer is not available: {e}")
+    if aggregator_region is None:
+        raise ValueError(
+            "No Resource Explorer aggregator index found. Create one "
+            "(Resource Explorer > Settings) or use --engine threads."
+        )
+    return aggregator_region, indexed_regions
+
+
+def explorer_record(resource: Dict[str, Any], account_id: str) -> Dict[str, Any]:
+    """
+    Convert a Resource Explorer resource to an awsmap resource record.
+
+    The Resource Explorer service namespace is mapped to the awsmap service
+    name (elasticloadbalancing -> elbv2, ec2:vpc -> vpc, ...), so records
+    match the collectors', and the resource type to the collector's type
+    name where they differ (rds:db -> db-instance, ...; see EXPLORER_TYPES).
+
+    Args:
+        resource: Resource from ListResources
+        account_id: Scanning account ID; resources owned by other accounts
+            (multi-account views) get an account_id field
+
+    Returns:
+        Resource dictionary in the collectors' format
+    """
+    arn = resource['Arn']
+    tags = {}
+    for prop in resource.get('Properties', []):
+        if prop.get('Name') == 'tags':
+            tags = {tag.get('Key', ''): tag.get('Value', '') for tag in prop.get('Data') or []}
+
+    resource_type = resource.get('ResourceType', '')
+    service = resource.get('Service', '')
+    service = EXPLORER_TYPE_SERVICES.get(resource_type) or EXPLORER_SERVICES.get(service, service)
+    resource_id = arn.split(':', 5)[-1]
+    resource_id = resource_id.split('/')[-1] if '/' in resource_id else resource_id.split(':')[-1]
+
+    record = {
+        'service': service,
+        'type': EXPLORER_TYPES.get(resource_type) or resource_type.split(':', 1)[-1],
+        'id': resource_id,
+        'arn': arn,
+        'name': tags.get('Name') or resource_id,
+        'region': resource.get('Region') or 'global',
+        'details': {
+            'resource_type': resource_type,
+            'last_reported_at': resource.get('LastReportedAt'),
+            'source': 'resource-explorer',
+        },
+        'tags': tags
+    }
+    owner = resource.get('OwningAccountId')
+    if owner and owner != account_id:
+        record['account_id'] = owner
+    return record
+
+
+def _enriched_types(services: List[str], enriched: List[Dict[str, Any]]) -> Dict[str, Optional[set]]:
+    """
+    Get the index records the enrichment collectors replace.
+
+    Enrichment scans the same regions the index records were filtered to,
+    so every (service, region) it covers is replaced whole, including
+    resources the index still lists but the collector no longer finds.
+
+    Args:
+        services: Enriched service names, optionally with a ':type' suffix
+        enriched: Records the enrichment collectors returned
+
+    Returns:
+        Dict of service -> None (every type) or the set of replaced types;
+        'service:type' names are matched on the types the collector returned
+    """
+    replaced: Dict[str, Optional[set]] = {}
+    for name in services:
+        service, subresource = split_service(name)
+        if subresource is None:
+            replaced[service] = None
+        elif service not in replaced or replaced[service] is not None:
+            replaced.setdefault(service, set()).add(subresource)
+    for record in enriched:
+        types = replaced.get(record['service'])
+        if types is not None:
+            types.add(record['type'])
+    return replaced
+
+
+def collect_with_explorer(
+    session,
+    services: Optional[List[str]] = None,
+    regions: Optional[List[str]] = None,
+    max_workers: int = 20,
+    progress_callback: Optional[Callable[[str, str], None]] = None,
+    show_timings: bool = False,
+    include_global: bool = False,
+    history: Optional[TaskHistory] = None,
+    estimate_callback: Optional[Callable[[float], None]] = None,
+    rate_limit: bool = True,
+    api_stats: Optional[ApiStats] = None,
+    compact: bool = False,
+    bulk_tags: bool = False
+) -> Dict[str, Any]:
+    """
+    Enumerate resources from Resource Explorer, enriching selected services.
+
+    Every indexed resource comes from the aggregator index. The services
+    listed in services are then collected by their normal collectors, and
+    their records replace all of the index's records for those services
+    (or, for 'service:type' names, for the types the collector returned).
+
+    Args:
+        session: boto3.Session to use
+        services: Services to enrich with detail collectors (None for none)
+        regions: Regions to keep (None for all); global resources are kept
+            when us-east-1 is among them or include_global is set
+        max_workers: Maximum parallel workers for enrichment
+        progress_callback: Optional callback(service_name, status) for progress updates
+        show_timings: If True, print the enrichment timing summary
+        include_global: If True, keep global resources whatever the regions
+        history: Optional TaskHistory for enrichment task ordering
+        estimate_callback: Optional callback(seconds) with the estimated enrichment duration
+        rate_limit: If True, rate limit enrichment collectors
+        api_stats: Optional ApiStats to record every API call in
+        compact: If True, store compact Resource records instead of dicts
+        bulk_tags: If True, enrichment collectors resolve tags in bulk
+
+    Returns:
+        Dict with metadata and resources list
+
+    Raises:
+        ValueError: If there is no aggregator index, or regions names a
+            region without an index (its resources would silently be missing)
+    """
+    start_time = time.time()
+    account_id = get_account_id(session)
+    clients = ClientFactory(session, hooks=[api_stats] if api_stats is not None else None)
+
+    try:
+        aggregator_region, indexed_regions = find_indexes(clients)
+        unindexed = sorted(set(regions or []) - indexed_regions)
+        if unindexed:
+            raise ValueError(
+                f"Resource Explorer has no index in {', '.join(unindexed)}, so the aggregator "
+                "can't list its resources. Turn on Resource Explorer there or use --engine threads."
+            )
+        if progress_callback:
+            progress_callback('resource-explorer', f"Listing ({aggregator_region})...")
+
+        keep_global = include_global or not regions or 'us-east-1' in regions
+        explorer = clients.client('resource-explorer-2', region_name=aggregator_region)
+        resources = []
+        paginator = explorer.get_paginator('list_resources')
+        for page in paginator.paginate(PaginationConfig={'PageSize': 1000}):
+            for resource in page.get('Resources', []):
+                record = explorer_record(resource, account_id)
+                if record['region'] == 'global':
+                    if not keep_global:
+                        continue
+                elif regions and record['region'] not in regions:
+                    continue
+                resources.append(record)
+            if progress_callback:
+                progress_callback('resource-explorer', f"Listing... ({len(resources)} resources)")
+    finally:
+        clients.close()
+
+    listed_seconds = time.time() - start_time
+    if progress_callback:
+        progress_callback('resource-explorer', f"Done: {len(resources)} resources")
+
+    enriched_count = 0
+    if services:
+        enriched = collect_all(
+            session,
+            services=services,
+            regions=regions,
+            max_workers=max_workers,
+            progress_callback=progress_callback,
+            show_timings=show_timings,
+            include_global=include_global,
+            history=history,
+            estimate_callback=estimate_callback,
+            rate_limit=rate_limit,
+            api_stats=api_stats,
+            bulk_tags=bulk_tags
+        )['resources']
+        replaced = _enriched_types(services, enriched)
+        resources = [
+            r for r in resources
+            if r['service'] not in replaced
+            or (replaced[r['service']] is not None and r['type'] not in replaced[r['service']])
+        ] + enriched
+        enriched_count = len(enriched)
+
+    if compact:
+        resources = compact_records(resources)
+
+    elapsed_time = time.time() - start_time
+    return {
+        'metadata': {
+            'account_id': account_id,
+            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime()),
+            'scan_duration_seconds': round(elapsed_time, 2),
+            'engine': 'resource-explorer',
+            'aggregator_region': aggregator_region,
+            'listing_seconds': round(listed_seconds, 2),
+            'enriched_services': list(services or []),
+            'enriched_resources': enriched_count,
+            'services_scanned': len({r['service'] for r in resources}),
+            'regions_scanned': len({r['region'] for r in resources}),
+            'throttles': {},
+            'resource_count': len(resources)
+        },
+        'resources': resources
+    }
@@ -1,11 +1,21 @@
 """
-Output formatters for inventory results - JSON, CSV, HTML.
+Output formatters for inventory results - JSON, NDJSON, CSV, HTML.
 """
 
-import json
-import csv
 import io
-from typing import Dict, Any, List
+import os
+import csv
+import json
+import zlib
+import base64
+import contextlib
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Iterable, Iterator, Optional, Callable, TextIO
+
+from aws_inventory.records import json_default
+from aws_inventory.searchindex import build_search_index
 
 
 def format_json(data: Dict[str, Any]) -> str:
@@ -18,7 +28,39 @@ def format_json(data: Dict[str, Any]) -> str:
     Returns:
         JSON string
     """
-    return json.dumps(data, indent=2, default=str)
+    return json.dumps(data, indent=2, default=json_default)
+
+
+def format_ndjson(data: Dict[str, Any]) -> str:
+    """
+    Format inventory data as newline-delimited JSON (one resource per line).
+
+    Args:
+        data: Inventory data with metadata and resources
+
+    Returns:
+        NDJSON string
+    """
+    return ''.join(json.dumps(r, default=json_default) + '\n' for r in data.get('resources', []))
+
+
+def write_ndjson(resources: Iterable[Dict[str, Any]], stream: TextIO) -> int:
+    """
+    Write resources to a stream as NDJSON, one line as each resource arrives.
+
+    Args:
+        resources: Iterable of resource dicts (e.g. from iter_resources)
+        stream: Text stream to write to
+
+    Returns:
+        Number of resources written
+    """
+    count = 0
+    for resource in resources:
+        stream.write(json.dumps(resource, default=json_default) + '\n')
+        count += 1
+    stream.flush()
+    return count
 
 
 def format_csv(data: Dict[str, Any]) -> str:
@@ -38,6 +80,9 @@ def format_csv(data: Dict[str, Any]) -> str:
 
     output = io.StringIO()
     fieldnames = ['service', 'type', 'id', 'name', 'region', 'arn', 'tags']
+    # Organization scans tag every resource with its account
+    if any('account_id' in r for r in resources):
+        fieldnames.insert(0, 'account_id')
     writer = csv.DictWriter(output, fieldnames=fieldnames, extrasaction='ignore')
     writer.writeheader()
 
@@ -46,6 +91,7 @@ def format_csv(data: Dict[str, Any]) -> str:
         tags_str = '; '.join(f"{k}={v}" for k, v in tags.items()) if tags else ''
 
         writer.writerow({
+            'account_id': resource.get('account_id', ''),
             'service': resource.get('service', ''),
             'type': resource.get('type', ''),
             'id': resource.get('id', ''),
@@ -58,211 +104,17 @@ def format_csv(data: Dict[str, Any]) -> str:
     return output.getvalue()
 
 
-def format_html(data: Dict[str, Any]) -> str:
-    """
-    Format inventory data as beautiful HTML report.
-
-    Args:
-        data: Inventory data with metadata and resources
-
-    Returns:
-        HTML string
-    """
-    resources = data.get('resources', [])
-    metadata = data.get('metadata', {})
-
-    account_id = metadata.get('account_id', 'Unknown')
-    timestamp = metadata.get('timestamp', '')
-    duration = metadata.get('scan_duration_seconds', 0)
-    total_resources = len(resources)
-
-    # Group by service
-    services = {}
-    for r in resources:
-        svc = r.get('service', 'unknown')
-        if svc not in services:
-            services[svc] = []
-        services[svc].append(r)
-
-    # Group by region
-    regions = {}
-    for r in resources:
-        reg = r.get('region', 'global') or 'global'
-        if reg not in regions:
-            regions[reg] = 0
-        regions[reg] += 1
-
-    # Collect all unique tags
-    all_tags = {}
-    for r in resources:
-        tags = r.get('tags', {})
-        for k, v in tags.items():
-            if k not in all_tags:
-                all_tags[k] = set()
-            all_tags[k].add(v)
-
-    # Count resource types
-    resource_types = {}
-    for r in resources:
-        rt = f"{r.get('service', '')}/{r.get('type', '')}"
-        resource_types[rt] = resource_types.get(rt, 0) + 1
-
-    # Escape function
-    def esc(s):
-        if s is None:
-            return ''
-        return str(s).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;')
-
-    # Build service options
-    service_options = '\n'.join(
-        f'<option value="{esc(s)}">{esc(s.upper())}</option>'
-        for s in sorted(services.keys())
-    )
-
-    # Build region options
-    region_options = '\n'.join(
-        f'<option value="{esc(r)}">{esc(r)}</option>'
-        for r in sorted(regions.keys())
-    )
-
-    # Build tag options (Key=Value format)
-    tag_options = []
-    for k in sorted(all_tags.keys()):
-        for v in sorted(all_tags[k]):
-            tag_options.append(f'<option value="{esc(k)}={esc(v)}">{esc(k)}={esc(v)}</option>')
-    tag_options_html = '\n'.join(tag_options)
-
-    # Detail value formatter
-    def format_detail_value(value):
-        if value is None:
-            return '<span class="detail-value null-value">&mdash;</span>'
-        if isinstance(value, bool):
-            cls = 'bool-true' if value else 'bool-false'
-            text = 'Yes' if value else 'No'
-            return f'<span class="detail-value {cls}">{text}</span>'
-        if isinstance(value, list):
-            if not value:
-                return '<span class="detail-value null-value">&mdash;</span>'
-            items = ''.join(f'<span class="detail-list-item">{esc(str(item))}</span>' for item in value)
-            return f'<span class="detail-value"><span class="detail-list">{items}</span></span>'
-        if isinstance(value, dict):
-            return f'<span class="detail-value">{esc(json.dumps(value, default=str))}</span>'
-        return f'<span class="detail-value">{esc(str(value))}</span>'
-
-    # Detail key formatter: snake_case -> Title Case
-    def format_detail_key(key):
-        return key.replace('_', ' ').title()
-
-    # Build service sections
-    num_columns = 5  # Type, Name, ID/ARN, Region, Tags
-    service_sections = []
-    for service_name in sorted(services.keys()):
-        service_resources = services[service_name]
-        count = len(service_resources)
-
-        rows = []
-        for r in service_resources:
-            tags = r.get('tags', {})
-            tag_badges = ''
-            all_tags_html = ''
-            if tags:
-                for k, v in list(tags.items())[:3]:
-                    tag_badges += f'<span class="tag">{esc(k)}={esc(v)}</span>'
-                if len(tags) > 3:
-                    tag_badges += f'<span class="tag more" onclick="toggleTags(this)">+{len(tags)-3}</span>'
-                    all_tags_html = '<div class="tags-tooltip">'
-                    for k, v in tags.items():
-                        all_tags_html += f'<span class="tag">{esc(k)}={esc(v)}</span>'
-                    all_tags_html += '</div>'
-
-            # Build tags data attribute for filtering
-            tags_data = '|'.join(f"{esc(k)}={esc(v)}" for k, v in tags.items()) if tags else ''
-            region_val = r.get('region', 'global') or 'global'
-
-            details = r.get('details', {})
-            has_details = bool(details)
-
-            # Main resource row
-            detail_attrs = ''
-            if has_details:
-                detail_text = ' '.join(str(v) for v in details.values()).lower()
-                detail_text = ''.join(c if c >= ' ' else ' ' for c in detail_text)
-                detail_attrs = f' data-has-details="true" data-details="{esc(detail_text)}" onclick="toggleDetails(this)"'
-
-            rows.append(f'''
-                <tr data-service="{esc(service_name)}" data-region="{esc(region_val)}" data-name="{esc(str(r.get('name', '')).lower())}" data-id="{esc(str(r.get('id', '')).lower())}" data-tags="{tags_data}"{detail_attrs}>
-                    <td>{esc(r.get('type', ''))}</td>
-                    <td>{esc(r.get('name', '') or r.get('id', ''))}</td>
-                    <td class="resource-id" title="Click to copy ARN" onclick="event.stopPropagation(); copyToClipboard(this)">{esc(r.get('arn', '') or r.get('id', ''))}</td>
-                    <td><span class="region-badge" data-region="{esc(region_val)}">{esc(region_val)}</span></td>
-                    <td class="tags-cell">{tag_badges}{all_tags_html}</td>
-                </tr>
-            ''')
-
-            # Detail row (hidden by default)
-            if has_details:
-                detail_items = ''.join(
-                    f'<div class="detail-item"><span class="detail-key">{esc(format_detail_key(k))}</span>{format_detail_value(v)}</div>'
-                    for k, v in details.items()
-                )
-                rows.append(f'''
-                <tr class="details-row collapsed">
-                    <td colspan="{num_columns}">
-                        <div class="details-panel">
-                            <div class="details-grid">{detail_items}</div>
-                        </div>
-                    </td>
-                </tr>
-            ''')
 
-        service_sections.append(f'''
-            <div class="service-section" data-service="{esc(service_name)}">
-                <div class="service-header" onclick="toggleSection(this)">
-                    <span class="service-name">{esc(service_name.upper())}</span>
-                    <span class="service-count">{count} resource{'s' if count != 1 else ''}</span>
-                    <span class="toggle-icon">+</span>
-                </div>
-                <div class="service-content collapsed">
-                    <table>
-                        <thead>
-                            <tr>
-                                <th>Type</th>
-                                <th>Name</th>
-                                <th>ID / ARN</th>
-                                <th>Region</th>
-                                <th>Tags</th>
-                            </tr>
-                        </thead>
-                        <tbody>
-                            {''.join(rows)}
-                        </tbody>
-                    </table>
-                </div>
-            </div>
-        ''')
+# Reports with more resources than this use the virtual (data-driven) HTML mode
+VIRTUAL_REPORT_THRESHOLD = 20000
 
-    # Build stats cards
-    top_services = sorted(services.items(), key=lambda x: len(x[1]), reverse=True)[:5]
-    service_stats = ''.join(
-        f'<div class="stat-bar"><span class="stat-label">{esc(s.upper())}</span><div class="bar" style="width: {min(100, len(r)*100//max(1,total_resources))}%"></div><span class="stat-value">{len(r)}</span></div>'
-        for s, r in top_services
-    )
+HTML_MODES = ('auto', 'static', 'virtual')
 
-    # Build region stats
-    top_regions = sorted(regions.items(), key=lambda x: x[1], reverse=True)[:5]
-    region_stats = ''.join(
-        f'<div class="stat-bar"><span class="stat-label">{esc(reg)}</span><div class="bar region-bar" style="width: {min(100, count*100//max(1,total_resources))}%"></div><span class="stat-value">{count}</span></div>'
-        for reg, count in top_regions
-    )
+# Resources per static report rendering task when sections render in parallel
+RENDER_CHUNK_SIZE = 2000
 
-    html = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>awsmap - {esc(account_id)}</title>
-    <style>
-        :root {{
+_HTML_STYLE = '''
+        :root {
             --primary: #6366f1;
             --primary-dark: #4f46e5;
             --secondary: #f97316;
@@ -271,99 +123,99 @@ def format_html(data: Dict[str, Any]) -> str:
             --text: #1e293b;
             --text-muted: #64748b;
             --border: #e2e8f0;
-        }}
+        }
 
-        .dark {{
+        .dark {
             --bg: #0f172a;
             --card: #1e293b;
             --text: #f1f5f9;
             --text-muted: #94a3b8;
             --border: #334155;
-        }}
+        }
 
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        * { margin: 0; padding: 0; box-sizing: border-box; }
 
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             background: var(--bg);
             color: var(--text);
             line-height: 1.6;
-        }}
+        }
 
-        .container {{ max-width: 1400px; margin: 0 auto; padding: 20px; }}
+        .container { max-width: 1400px; margin: 0 auto; padding: 20px; }
 
-        header {{
+        header {
             background: linear-gradient(135deg, var(--primary), var(--primary-dark));
             color: white;
             padding: 40px 20px;
             text-align: center;
             margin-bottom: 30px;
             border-radius: 16px;
-        }}
+        }
 
-        header h1 {{ font-size: 2.5em; margin-bottom: 10px; }}
-        header .subtitle {{ opacity: 0.9; font-size: 1.1em; }}
+        header h1 { font-size: 2.5em; margin-bottom: 10px; }
+        header .subtitle { opacity: 0.9; font-size: 1.1em; }
 
-        .meta-info {{
+        .meta-info {
             display: flex;
             justify-content: center;
             gap: 30px;
             margin-top: 20px;
             flex-wrap: wrap;
-        }}
+        }
 
-        .meta-item {{
+        .meta-item {
             background: rgba(255,255,255,0.2);
             padding: 8px 16px;
             border-radius: 20px;
             font-size: 0.95em;
-        }}
+        }
 
-        .stats-grid {{
+        .stats-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 20px;
             margin-bottom: 30px;
-        }}
+        }
 
-        .stat-card {{
+        .stat-card {
             background: var(--card);
             border-radius: 12px;
             padding: 24px;
             text-align: center;
             box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        }}
+        }
 
-        .stat-card .number {{
+        .stat-card .number {
             font-size: 2.5em;
             font-weight: 700;
             color: var(--primary);
-        }}
+        }
 
-        .stat-card .label {{
+        .stat-card .label {
             color: var(--text-muted);
             text-transform: uppercase;
             font-size: 0.85em;
             letter-spacing: 1px;
             margin-top: 5px;
-        }}
+        }
 
-        .controls {{
+        .controls {
             background: var(--card);
             border-radius: 12px;
             padding: 20px;
             margin-bottom: 30px;
             box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        }}
+        }
 
-        .controls-row {{
+        .controls-row {
             display: flex;
             gap: 15px;
             flex-wrap: wrap;
             align-items: center;
-        }}
+        }
 
-        .search-box {{
+        .search-box {
             flex: 1;
             min-width: 250px;
             padding: 12px 16px;
@@ -372,14 +224,14 @@ def format_html(data: Dict[str, Any]) -> str:
             font-size: 1em;
             background: var(--bg);
             color: var(--text);
-        }}
+        }
 
-        .search-box:focus {{
+        .search-box:focus {
             outline: none;
             border-color: var(--primary);
-        }}
+        }
 
-        .filter-select {{
+        .filter-select {
             padding: 12px 16px;
             border: 2px solid var(--border);
             border-radius: 8px;
@@ -387,32 +239,32 @@ def format_html(data: Dict[str, Any]) -> str:
             background: var(--bg);
             color: var(--text);
             min-width: 150px;
-        }}
+        }
 
-        .btn {{
+        .btn {
             padding: 12px 20px;
             border: none;
             border-radius: 8px;
             font-size: 1em;
             cursor: pointer;
             transition: all 0.2s;
-        }}
+        }
 
-        .btn-primary {{
+        .btn-primary {
             background: var(--primary);
             color: white;
-        }}
+        }
 
-        .btn-primary:hover {{
+        .btn-primary:hover {
             background: var(--primary-dark);
-        }}
+        }
 
-        .btn-secondary {{
+        .btn-secondary {
             background: var(--border);
             color: var(--text);
-        }}
+        }
 
-        .theme-toggle {{
+        .theme-toggle {
             position: fixed;
             top: 20px;
             right: 20px;
@@ -424,61 +276,61 @@ def format_html(data: Dict[str, Any]) -> str:
             border-radius: 50%;
             cursor: pointer;
             font-size: 1.2em;
-        }}
+        }
 
-        .charts-row {{
+        .charts-row {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
             gap: 20px;
             margin-bottom: 30px;
-        }}
+        }
 
-        .chart-card {{
+        .chart-card {
             background: var(--card);
             border-radius: 12px;
             padding: 24px;
             box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        }}
+        }
 
-        .chart-card h3 {{
+        .chart-card h3 {
             margin-bottom: 20px;
             color: var(--text);
-        }}
+        }
 
-        .stat-bar {{
+        .stat-bar {
             display: flex;
             align-items: center;
             gap: 10px;
             margin-bottom: 12px;
-        }}
+        }
 
-        .stat-bar .stat-label {{
+        .stat-bar .stat-label {
             width: 80px;
             font-size: 0.85em;
             color: var(--text-muted);
-        }}
+        }
 
-        .stat-bar .bar {{
+        .stat-bar .bar {
             height: 24px;
             background: linear-gradient(90deg, var(--primary), var(--secondary));
             border-radius: 4px;
             min-width: 4px;
-        }}
+        }
 
-        .stat-bar .stat-value {{
+        .stat-bar .stat-value {
             font-weight: 600;
             min-width: 40px;
-        }}
+        }
 
-        .service-section {{
+        .service-section {
             background: var(--card);
             border-radius: 12px;
             margin-bottom: 16px;
             overflow: hidden;
             box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        }}
+        }
 
-        .service-header {{
+        .service-header {
             display: flex;
             align-items: center;
             padding: 16px 20px;
@@ -486,65 +338,65 @@ def format_html(data: Dict[str, Any]) -> str:
             background: var(--card);
             border-bottom: 1px solid var(--border);
             transition: background 0.2s;
-        }}
+        }
 
-        .service-header:hover {{
+        .service-header:hover {
             background: var(--bg);
-        }}
+        }
 
-        .service-name {{
+        .service-name {
             font-weight: 600;
             font-size: 1.1em;
             color: var(--primary);
-        }}
+        }
 
-        .service-count {{
+        .service-count {
             margin-left: auto;
             margin-right: 15px;
             color: var(--text-muted);
             font-size: 0.95em;
-        }}
+        }
 
-        .toggle-icon {{
+        .toggle-icon {
             width: 24px;
             text-align: center;
             font-weight: bold;
             color: var(--text-muted);
-        }}
+        }
 
-        .service-content {{
+        .service-content {
             overflow-x: auto;
-        }}
+        }
 
-        .service-content.collapsed {{
+        .service-content.collapsed {
             display: none;
-        }}
+        }
 
-        table {{
+        table {
             width: 100%;
             border-collapse: collapse;
-        }}
+        }
 
-        th, td {{
+        th, td {
             padding: 12px 16px;
             text-align: left;
             border-bottom: 1px solid var(--border);
-        }}
+        }
 
-        th {{
+        th {
             background: var(--bg);
             font-weight: 600;
             color: var(--text-muted);
             text-transform: uppercase;
             font-size: 0.8em;
             letter-spacing: 0.5px;
-        }}
+        }
 
-        tr:hover {{
+        tr:hover {
             background: var(--bg);
-        }}
+        }
 
-        .resource-id {{
+        .resource-id {
             font-family: 'SF Mono', Monaco, monospace;
             font-size: 0.85em;
             color: var(--text-muted);
@@ -554,9 +406,9 @@ def format_html(data: Dict[str, Any]) -> str:
             line-height: 1.4;
             position: relative;
             padding-right: 24px;
-        }}
+        }
 
-        .resource-id::after {{
+        .resource-id::after {
             content: '\\1F4CB';
             position: absolute;
             right: 4px;
@@ -565,54 +417,54 @@ def format_html(data: Dict[str, Any]) -> str:
             opacity: 0;
             font-size: 0.9em;
             transition: opacity 0.2s;
-        }}
+        }
 
-        .resource-id:hover {{
+        .resource-id:hover {
             color: var(--primary);
             background: var(--bg);
-        }}
+        }
 
-        .resource-id:hover::after {{
+        .resource-id:hover::after {
             opacity: 0.7;
-        }}
+        }
 
-        .resource-id.copied::after {{
+        .resource-id.copied::after {
             content: '\\2705';
             opacity: 1;
-        }}
+        }
 
-        .region-badge {{
+        .region-badge {
             display: inline-block;
             padding: 4px 10px;
             border-radius: 12px;
             font-size: 0.85em;
             font-weight: 500;
-        }}
+        }
 
         /* Region color coding */
-        .region-badge[data-region^="us-"] {{ background: #dbeafe; color: #1e40af; }}
-        .region-badge[data-region^="eu-"] {{ background: #dcfce7; color: #166534; }}
-        .region-badge[data-region^="ap-"] {{ background: #fef3c7; color: #92400e; }}
-        .region-badge[data-region^="sa-"] {{ background: #fce7f3; color: #9d174d; }}
-        .region-badge[data-region^="ca-"] {{ background: #f3e8ff; color: #7c3aed; }}
-        .region-badge[data-region^="af-"] {{ background: #ffedd5; color: #c2410c; }}
-        .region-badge[data-region^="me-"] {{ background: #fee2e2; color: #b91c1c; }}
-        .region-badge[data-region="global"] {{ background: #e0e7ff; color: #4338ca; }}
-
-        .dark .region-badge[data-region^="us-"] {{ background: #1e3a5f; color: #93c5fd; }}
-        .dark .region-badge[data-region^="eu-"] {{ background: #14532d; color: #86efac; }}
-        .dark .region-badge[data-region^="ap-"] {{ background: #78350f; color: #fcd34d; }}
-        .dark .region-badge[data-region^="sa-"] {{ background: #831843; color: #f9a8d4; }}
-        .dark .region-badge[data-region^="ca-"] {{ background: #4c1d95; color: #c4b5fd; }}
-        .dark .region-badge[data-region^="af-"] {{ background: #7c2d12; color: #fdba74; }}
-        .dark .region-badge[data-region^="me-"] {{ background: #7f1d1d; color: #fca5a5; }}
-        .dark .region-badge[data-region="global"] {{ background: #312e81; color: #a5b4fc; }}
-
-        .stat-bar .region-bar {{
+        .region-badge[data-region^="us-"] { background: #dbeafe; color: #1e40af; }
+        .region-badge[data-region^="eu-"] { background: #dcfce7; color: #166534; }
+        .region-badge[data-region^="ap-"] { background: #fef3c7; color: #92400e; }
+        .region-badge[data-region^="sa-"] { background: #fce7f3; color: #9d174d; }
+        .region-badge[data-region^="ca-"] { background: #f3e8ff; color: #7c3aed; }
+        .region-badge[data-region^="af-"] { background: #ffedd5; color: #c2410c; }
+        .region-badge[data-region^="me-"] { background: #fee2e2; color: #b91c1c; }
+        .region-badge[data-region="global"] { background: #e0e7ff; color: #4338ca; }
+
+        .dark .region-badge[data-region^="us-"] { background: #1e3a5f; color: #93c5fd; }
+        .dark .region-badge[data-region^="eu-"] { background: #14532d; color: #86efac; }
+        .dark .region-badge[data-region^="ap-"] { background: #78350f; color: #fcd34d; }
+        .dark .region-badge[data-region^="sa-"] { background: #831843; color: #f9a8d4; }
+        .dark .region-badge[data-region^="ca-"] { background: #4c1d95; color: #c4b5fd; }
+        .dark .region-badge[data-region^="af-"] { background: #7c2d12; color: #fdba74; }
+        .dark .region-badge[data-region^="me-"] { background: #7f1d1d; color: #fca5a5; }
+        .dark .region-badge[data-region="global"] { background: #312e81; color: #a5b4fc; }
+
+        .stat-bar .region-bar {
             background: linear-gradient(90deg, #22c55e, #3b82f6);
-        }}
+        }
 
-        .tag {{
+        .tag {
             display: inline-block;
             padding: 2px 8px;
             background: linear-gradient(135deg, var(--primary), var(--secondary));
@@ -621,23 +473,23 @@ def format_html(data: Dict[str, Any]) -> str:
             font-size: 0.75em;
             margin-right: 4px;
             margin-bottom: 2px;
-        }}
+        }
 
-        .tag.more {{
+        .tag.more {
             background: var(--text-muted);
             cursor: pointer;
-        }}
+        }
 
-        .tag.more:hover {{
+        .tag.more:hover {
             background: var(--primary);
-        }}
+        }
 
-        .tags-cell {{
+        .tags-cell {
             max-width: 300px;
             position: relative;
-        }}
+        }
 
-        .tags-tooltip {{
+        .tags-tooltip {
             display: none;
             position: absolute;
             background: var(--card);
@@ -649,114 +501,114 @@ def format_html(data: Dict[str, Any]) -> str:
             max-width: 400px;
             top: 100%;
             left: 0;
-        }}
+        }
 
-        .tags-tooltip.show {{
+        .tags-tooltip.show {
             display: block;
-        }}
+        }
 
-        .tags-tooltip .tag {{
+        .tags-tooltip .tag {
             margin-bottom: 4px;
-        }}
+        }
 
         /* Detail rows */
-        .details-row {{
+        .details-row {
             background: var(--bg);
-        }}
+        }
 
-        .details-row.collapsed {{
+        .details-row.collapsed {
             display: none;
-        }}
+        }
 
-        .details-row:hover {{
+        .details-row:hover {
             background: var(--bg);
-        }}
+        }
 
-        .details-row td {{
+        .details-row td {
             padding: 0;
             border-bottom: 1px solid var(--border);
-        }}
+        }
 
-        .details-panel {{
+        .details-panel {
             padding: 16px 24px;
-        }}
+        }
 
-        .details-grid {{
+        .details-grid {
             display: grid;
             grid-template-columns: repeat(auto-fill, minmax(280px, 1fr));
             gap: 8px 24px;
-        }}
+        }
 
-        .detail-item {{
+        .detail-item {
             display: flex;
             gap: 8px;
             padding: 4px 0;
             min-width: 0;
             overflow: hidden;
-        }}
+        }
 
-        .detail-key {{
+        .detail-key {
             color: var(--text-muted);
             font-size: 0.85em;
             min-width: 120px;
             flex-shrink: 0;
-        }}
+        }
 
-        .detail-value {{
+        .detail-value {
             font-family: 'SF Mono', Monaco, monospace;
             font-size: 0.85em;
             overflow-wrap: break-word;
             min-width: 0;
-        }}
+        }
 
-        .detail-value.bool-true {{
+        .detail-value.bool-true {
             color: #16a34a;
-        }}
+        }
 
-        .detail-value.bool-false {{
+        .detail-value.bool-false {
             color: #dc2626;
-        }}
+        }
 
-        .dark .detail-value.bool-true {{
+        .dark .detail-value.bool-true {
             color: #4ade80;
-        }}
+        }
 
-        .dark .detail-value.bool-false {{
+        .dark .detail-value.bool-false {
             color: #f87171;
-        }}
+        }
 
-        .detail-value.null-value {{
+        .detail-value.null-value {
             color: var(--text-muted);
             font-style: italic;
-        }}
+        }
 
-        .detail-list {{
+        .detail-list {
             display: flex;
             flex-wrap: wrap;
             gap: 4px;
-        }}
+        }
 
-        .detail-list-item {{
+        .detail-list-item {
             display: inline-block;
             padding: 2px 8px;
             background: var(--border);
             border-radius: 10px;
             font-size: 0.85em;
-        }}
+        }
 
-        mark {{ background: #fef08a; color: #1e293b; padding: 1px 2px; border-radius: 2px; }}
-        .dark mark {{ background: #854d0e; color: #fef3c7; }}
+        mark { background: #fef08a; color: #1e293b; padding: 1px 2px; border-radius: 2px; }
+        .dark mark { background: #854d0e; color: #fef3c7; }
 
-        tr[data-has-details] {{
+        tr[data-has-details] {
             cursor: pointer;
-        }}
+        }
 
-        tr[data-has-details] td:first-child {{
+        tr[data-has-details] td:first-child {
             position: relative;
             padding-left: 28px;
-        }}
+        }
 
-        tr[data-has-details] td:first-child::before {{
+        tr[data-has-details] td:first-child::before {
             content: '\\25B6';
             position: absolute;
             left: 10px;
@@ -765,15 +617,15 @@ def format_html(data: Dict[str, Any]) -> str:
             font-size: 0.65em;
             color: var(--text-muted);
             transition: transform 0.2s;
-        }}
+        }
 
-        tr[data-has-details].expanded td:first-child::before {{
+        tr[data-has-details].expanded td:first-child::before {
             transform: translateY(-50%) rotate(90deg);
-        }}
+        }
 
-        .hidden {{ display: none !important; }}
+        .hidden { display: none !important; }
 
-        .toast {{
+        .toast {
             position: fixed;
             bottom: 20px;
             right: 20px;
@@ -784,339 +636,412 @@ def format_html(data: Dict[str, Any]) -> str:
             opacity: 0;
             transition: opacity 0.3s;
             z-index: 1000;
-        }}
+        }
 
-        .toast.show {{ opacity: 1; }}
+        .toast.show { opacity: 1; }
 
-        .export-btns {{
+        .export-btns {
             display: flex;
             gap: 10px;
             margin-top: 15px;
-        }}
+        }
 
-        footer {{
+        footer {
             text-align: center;
             padding: 30px 20px;
             color: var(--text-muted);
             border-top: 1px solid var(--border);
             margin-top: 40px;
-        }}
+        }
 
-        .footer-logo {{
+        .footer-logo {
             font-size: 1.5em;
             font-weight: 700;
             background: linear-gradient(135deg, #ff9900 0%, #ffb84d 100%);
             -webkit-background-clip: text;
             -webkit-text-fill-color: transparent;
             background-clip: text;
-        }}
-
-        @media (max-width: 768px) {{
-            header h1 {{ font-size: 1.8em; }}
-            .meta-info {{ flex-direction: column; gap: 10px; }}
-            .controls-row {{ flex-direction: column; }}
-            .search-box, .filter-select {{ width: 100%; }}
-        }}
-
-        @media print {{
-            .controls, .theme-toggle, .export-btns, .toggle-icon {{ display: none; }}
-            .service-content.collapsed {{ display: block; }}
-            .details-row.collapsed {{ display: table-row; }}
-            tr[data-has-details] td:first-child::before {{ content: none; }}
-            body {{ background: white; }}
-        }}
-    </style>
-</head>
-<body>
-    <button class="theme-toggle" onclick="toggleTheme()" title="Toggle dark mode">
-        <span id="theme-icon">&#x1F319;</span>
-    </button>
+        }
+
+        @media (max-width: 768px) {
+            header h1 { font-size: 1.8em; }
+            .meta-info { flex-direction: column; gap: 10px; }
+            .controls-row { flex-direction: column; }
+            .search-box, .filter-select { width: 100%; }
+        }
+
+        @media print {
+            .controls, .theme-toggle, .export-btns, .toggle-icon { display: none; }
+            .service-content.collapsed { display: block; }
+            .details-row.collapsed { display: table-row; }
+            tr[data-has-details] td:first-child::before { content: none; }
+            body { background: white; }
+        }
+'''
+
+_VIRTUAL_STYLE = '''
+        .vhead, .vrow {
+            display: grid;
+            grid-template-columns: 14% 20% 36% 12% 18%;
+            align-items: center;
+        }
 
-    <div class="container">
-        <header>
-            <h1>AWS Inventory Report</h1>
-            <div class="subtitle">Comprehensive Cloud Asset Discovery</div>
-            <div class="meta-info">
-                <span class="meta-item">Account: {esc(account_id)}</span>
-                <span class="meta-item">Generated: {esc(timestamp)}</span>
-                <span class="meta-item">Duration: {duration}s</span>
-            </div>
-        </header>
+        .vhead {
+            background: var(--bg);
+            font-weight: 600;
+            color: var(--text-muted);
+            text-transform: uppercase;
+            font-size: 0.8em;
+            letter-spacing: 0.5px;
+            border-bottom: 1px solid var(--border);
+        }
 
-        <div class="stats-grid">
-            <div class="stat-card">
-                <div class="number">{total_resources:,}</div>
-                <div class="label">Total Resources</div>
-            </div>
-            <div class="stat-card">
-                <div class="number">{len(services)}</div>
-                <div class="label">Services</div>
-            </div>
-            <div class="stat-card">
-                <div class="number">{len(regions)}</div>
-                <div class="label">Regions</div>
-            </div>
-            <div class="stat-card">
-                <div class="number">{len(resource_types)}</div>
-                <div class="label">Resource Types</div>
-            </div>
-        </div>
+        .vhead > div {
+            padding: 12px 16px;
+        }
 
-        <div class="charts-row">
-            <div class="chart-card">
-                <h3>Top Services</h3>
-                {service_stats}
-            </div>
-            <div class="chart-card">
-                <h3>Top Regions</h3>
-                {region_stats}
-            </div>
-        </div>
+        .vviewport {
+            overflow-y: auto;
+            position: relative;
+        }
 
-        <div class="controls">
-            <div class="controls-row">
-                <input type="text" class="search-box" id="searchBox" placeholder="Search resources..." onkeyup="debouncedFilter()">
-                <select class="filter-select" id="serviceFilter" onchange="filterResources()">
-                    <option value="">All Services</option>
-                    {service_options}
-                </select>
-                <select class="filter-select" id="regionFilter" onchange="filterResources()">
-                    <option value="">All Regions</option>
-                    {region_options}
-                </select>
-                <select class="filter-select" id="tagFilter" onchange="filterResources()">
-                    <option value="">All Tags</option>
-                    {tag_options_html}
-                </select>
-                <button class="btn btn-secondary" onclick="clearFilters()">Clear</button>
-                <button class="btn btn-secondary" onclick="expandAll()">Expand All</button>
-                <button class="btn btn-secondary" onclick="collapseAll()">Collapse All</button>
-            </div>
-            <div class="export-btns">
-                <button class="btn btn-primary" onclick="exportCSV()">Export CSV</button>
-                <button class="btn btn-primary" onclick="window.print()">Print</button>
-            </div>
-        </div>
+        .vspacer {
+            position: relative;
+        }
 
-        <div id="services-container">
-            {''.join(service_sections)}
-        </div>
+        .vrows {
+            position: absolute;
+            top: 0;
+            left: 0;
+            right: 0;
+            will-change: transform;
+        }
 
-        <footer>
-            <div class="footer-logo">awsmap</div>
-        </footer>
-    </div>
+        .vrow {
+            height: 44px;
+            border-bottom: 1px solid var(--border);
+        }
 
-    <div class="toast" id="toast">Copied!</div>
+        .vrow > div {
+            padding: 0 16px;
+            overflow: hidden;
+            white-space: nowrap;
+            text-overflow: ellipsis;
+        }
+
+        .vrow:hover, .vrow.selected {
+            background: var(--bg);
+        }
 
-    <script>
-        function toggleTheme() {{
+        .vrow.has-details {
+            cursor: pointer;
+        }
+
+        .vrow .resource-id {
+            max-width: none;
+        }
+
+        .service-content .details-panel {
+            border-top: 1px solid var(--border);
+            background: var(--bg);
+        }
+'''
+
+_COMMON_SCRIPT = '''
+        function toggleTheme() {
             document.body.classList.toggle('dark');
             const icon = document.getElementById('theme-icon');
             icon.innerHTML = document.body.classList.contains('dark') ? '&#x2600;' : '&#x1F319;';
             localStorage.setItem('theme', document.body.classList.contains('dark') ? 'dark' : 'light');
-        }}
+        }
 
-        if (localStorage.getItem('theme') === 'dark') {{
+        if (localStorage.getItem('theme') === 'dark') {
             document.body.classList.add('dark');
             document.getElementById('theme-icon').innerHTML = '&#x2600;';
-        }}
+        }
+
+        let debounceTimer;
+        function debouncedFilter() {
+            clearTimeout(debounceTimer);
+            debounceTimer = setTimeout(filterResources, 300);
+        }
 
-        function highlightMatches(element, term, selector) {{
+        function copyToClipboard(el) {
+            navigator.clipboard.writeText(el.textContent.trim()).then(() => {
+                el.classList.add('copied');
+                const toast = document.getElementById('toast');
+                toast.classList.add('show');
+                setTimeout(() => {
+                    toast.classList.remove('show');
+                    el.classList.remove('copied');
+                }, 2000);
+            });
+        }
+'''
+
+_SEARCH_SCRIPT = '''
+        // Parse a JSON data block, gunzipping it first if it was embedded compressed
+        async function readBlock(id) {
+            const el = document.getElementById(id);
+            if (el.dataset.encoding !== 'gzip-base64') return JSON.parse(el.textContent);
+            const binary = atob(el.textContent.trim());
+            const bytes = new Uint8Array(binary.length);
+            for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+            const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+            return JSON.parse(await new Response(stream).text());
+        }
+
+        const searchIndex = (() => {
+            let rows = 0, tokens = null, starts = null, postings = null, rowText = null;
+            const decoded = new Map();
+            const texts = new Map();
+
+            // raw: the embedded index; text(id): a row's searchable text, used
+            // to check terms joined by punctuation (IPs, hostnames) appear together
+            function init(raw, text) {
+                rows = raw.rows;
+                tokens = raw.tokens;
+                postings = raw.postings.split(' ');
+                starts = [0];
+                for (let at = tokens.indexOf(' '); at >= 0; at = tokens.indexOf(' ', at + 1)) starts.push(at + 1);
+                rowText = text;
+            }
+
+            function rowIds(i) {
+                let ids = decoded.get(i);
+                if (!ids) {
+                    let row = 0;
+                    ids = postings[i].split(',').map(delta => (row += parseInt(delta, 16)));
+                    decoded.set(i, ids);
+                }
+                return ids;
+            }
+
+            // Index of the token the character at offset belongs to
+            function tokenAt(offset) {
+                let lo = 0, hi = starts.length;
+                while (lo + 1 < hi) {
+                    const mid = (lo + hi) >> 1;
+                    if (starts[mid] <= offset) lo = mid; else hi = mid;
+                }
+                return lo;
+            }
+
+            function textOf(id) {
+                let text = texts.get(id);
+                if (text === undefined) {
+                    text = rowText(id).toLowerCase();
+                    texts.set(id, text);
+                }
+                return text;
+            }
+
+            // Rows with a token containing every search term (and, for terms
+            // joined by punctuation, containing them together), as a
+            // row -> 0/1 array (null when the search has no terms)
+            function match(search) {
+                if (tokens === null) return null;
+                const lower = search.toLowerCase();
+                const terms = lower.match(/[a-z0-9]+/g);
+                if (!terms) return null;
+                let result = null;
+                for (const term of terms) {
+                    const hits = new Uint8Array(rows);
+                    for (let at = tokens.indexOf(term); at >= 0; ) {
+                        const i = tokenAt(at);
+                        for (const id of rowIds(i)) {
+                            if (result === null || result[id]) hits[id] = 1;
+                        }
+                        at = i + 1 < starts.length ? tokens.indexOf(term, starts[i + 1]) : -1;
+                    }
+                    result = hits;
+                }
+                const phrases = lower.split(/\\s+/).filter(word => /[a-z0-9][^a-z0-9]+[a-z0-9]/.test(word));
+                if (phrases.length && rowText) {
+                    for (let id = 0; id < rows; id++) {
+                        if (result[id] && !phrases.every(phrase => textOf(id).includes(phrase))) result[id] = 0;
+                    }
+                }
+                return result;
+            }
+
+            return { init, match };
+        })();
+'''
+
+_STATIC_SCRIPT = '''
+        function highlightMatches(element, term, selector) {
             clearHighlights(element);
             if (!term) return;
-            element.querySelectorAll(selector || '.detail-value').forEach(node => {{
+            element.querySelectorAll(selector || '.detail-value').forEach(node => {
                 const walker = document.createTreeWalker(node, NodeFilter.SHOW_TEXT);
                 const textNodes = [];
                 while (walker.nextNode()) textNodes.push(walker.currentNode);
-                textNodes.forEach(textNode => {{
+                textNodes.forEach(textNode => {
                     const text = textNode.nodeValue;
                     const lower = text.toLowerCase();
                     const termLower = term.toLowerCase();
                     const frag = document.createDocumentFragment();
                     let lastIdx = 0, idx, found = false;
-                    while ((idx = lower.indexOf(termLower, lastIdx)) !== -1) {{
+                    while ((idx = lower.indexOf(termLower, lastIdx)) !== -1) {
                         found = true;
                         if (idx > lastIdx) frag.appendChild(document.createTextNode(text.substring(lastIdx, idx)));
                         const mark = document.createElement('mark');
                         mark.textContent = text.substring(idx, idx + term.length);
                         frag.appendChild(mark);
                         lastIdx = idx + term.length;
-                    }}
+                    }
                     if (!found) return;
                     if (lastIdx < text.length) frag.appendChild(document.createTextNode(text.substring(lastIdx)));
                     textNode.parentNode.replaceChild(frag, textNode);
-                }});
-            }});
-        }}
+                });
+            });
+        }
 
-        function clearHighlights(element) {{
-            element.querySelectorAll('mark').forEach(mark => {{
+        function clearHighlights(element) {
+            element.querySelectorAll('mark').forEach(mark => {
                 const parent = mark.parentNode;
                 parent.replaceChild(document.createTextNode(mark.textContent), mark);
                 parent.normalize();
-            }});
-        }}
-
-        let debounceTimer;
-        function debouncedFilter() {{
-            clearTimeout(debounceTimer);
-            debounceTimer = setTimeout(filterResources, 300);
-        }}
+            });
+        }
 
-        function toggleSection(header) {{
+        function toggleSection(header) {
             const content = header.nextElementSibling;
             const icon = header.querySelector('.toggle-icon');
             content.classList.toggle('collapsed');
             icon.textContent = content.classList.contains('collapsed') ? '+' : '-';
-        }}
+        }
 
-        function expandAll() {{
+        function expandAll() {
             document.querySelectorAll('.service-content').forEach(c => c.classList.remove('collapsed'));
             document.querySelectorAll('.toggle-icon').forEach(i => i.textContent = '-');
             document.querySelectorAll('.details-row').forEach(r => r.classList.remove('collapsed'));
             document.querySelectorAll('tr[data-has-details]').forEach(r => r.classList.add('expanded'));
-        }}
+        }
 
-        function collapseAll() {{
+        function collapseAll() {
             document.querySelectorAll('.service-content').forEach(c => c.classList.add('collapsed'));
             document.querySelectorAll('.toggle-icon').forEach(i => i.textContent = '+');
             document.querySelectorAll('.details-row').forEach(r => r.classList.add('collapsed'));
             document.querySelectorAll('tr[data-has-details]').forEach(r => r.classList.remove('expanded'));
-        }}
+        }
 
-        function toggleDetails(row) {{
+        function toggleDetails(row) {
             const detailRow = row.nextElementSibling;
-            if (detailRow && detailRow.classList.contains('details-row')) {{
+            if (detailRow && detailRow.classList.contains('details-row')) {
                 detailRow.classList.toggle('collapsed');
                 row.classList.toggle('expanded');
-            }}
-        }}
+            }
+        }
 
-        function filterResources() {{
+        function filterResources() {
             const search = document.getElementById('searchBox').value.toLowerCase();
             const service = document.getElementById('serviceFilter').value;
             const region = document.getElementById('regionFilter').value;
             const tag = document.getElementById('tagFilter').value;
+            const matches = search ? searchIndex.match(search) : null;
 
-            document.querySelectorAll('.service-section').forEach(section => {{
+            document.querySelectorAll('.service-section').forEach(section => {
                 const sectionService = section.dataset.service;
-                if (service && sectionService !== service) {{
+                if (service && sectionService !== service) {
                     section.classList.add('hidden');
                     return;
-                }}
+                }
 
                 let hasVisible = false;
-                section.querySelectorAll('tbody tr:not(.details-row)').forEach(row => {{
+                section.querySelectorAll('tbody tr:not(.details-row)').forEach(row => {
                     const rowService = row.dataset.service;
                     const rowRegion = row.dataset.region;
-                    const rowName = row.dataset.name;
-                    const rowId = row.dataset.id;
                     const rowTags = row.dataset.tags || '';
 
                     const matchService = !service || rowService === service;
                     const matchRegion = !region || rowRegion === region;
-                    const detailText = row.dataset.details || '';
-                    const matchSearch = !search || rowName.includes(search) || rowId.includes(search) || detailText.includes(search);
+                    const matchSearch = !matches || matches[Number(row.dataset.row)] === 1;
                     const matchTag = !tag || rowTags.split('|').includes(tag);
 
-                    const matchedInName = search && (rowName.includes(search) || rowId.includes(search));
-                    const matchedInDetails = search && detailText.includes(search);
-
-                    if (matchService && matchRegion && matchSearch && matchTag) {{
+                    if (matchService && matchRegion && matchSearch && matchTag) {
                         row.classList.remove('hidden');
                         hasVisible = true;
-                        if (search) {{
+                        if (search) {
                             highlightMatches(row, search, 'td:nth-child(-n+3)');
-                        }} else {{
+                        } else {
                             clearHighlights(row);
-                        }}
+                        }
                         const detailRow = row.nextElementSibling;
-                        if (detailRow && detailRow.classList.contains('details-row')) {{
+                        if (detailRow && detailRow.classList.contains('details-row')) {
                             detailRow.classList.remove('hidden');
-                            if (matchedInDetails) {{
+                            if (search) highlightMatches(detailRow, search);
+                            if (search && detailRow.querySelector('mark')) {
                                 detailRow.classList.remove('collapsed');
                                 row.classList.add('expanded');
                                 row.dataset.autoExpanded = 'true';
-                                highlightMatches(detailRow, search);
-                            }} else if (row.dataset.autoExpanded) {{
+                            } else if (row.dataset.autoExpanded) {
                                 detailRow.classList.add('collapsed');
                                 row.classList.remove('expanded');
                                 delete row.dataset.autoExpanded;
                                 clearHighlights(detailRow);
-                            }}
-                        }}
-                    }} else {{
+                            }
+                        }
+                    } else {
                         row.classList.add('hidden');
                         clearHighlights(row);
                         const detailRow = row.nextElementSibling;
-                        if (detailRow && detailRow.classList.contains('details-row')) {{
+                        if (detailRow && detailRow.classList.contains('details-row')) {
                             detailRow.classList.add('hidden');
                             clearHighlights(detailRow);
-                        }}
-                        if (row.dataset.autoExpanded) {{
+                        }
+                        if (row.dataset.autoExpanded) {
                             delete row.dataset.autoExpanded;
-                        }}
-                    }}
-                }});
+                        }
+                    }
+                });
 
                 section.classList.toggle('hidden', !hasVisible);
                 const content = section.querySelector('.service-content');
                 const icon = section.querySelector('.toggle-icon');
-                if (hasVisible && search) {{
+                if (hasVisible && search) {
                     content.classList.remove('collapsed');
                     if (icon) icon.textContent = '-';
                     section.dataset.autoExpanded = 'true';
-                }} else if (!search && section.dataset.autoExpanded) {{
+                } else if (!search && section.dataset.autoExpanded) {
                     content.classList.add('collapsed');
                     if (icon) icon.textContent = '+';
                     delete section.dataset.autoExpanded;
-                }}
-            }});
-        }}
+                }
+            });
+        }
 
-        function clearFilters() {{
+        function clearFilters() {
             document.getElementById('searchBox').value = '';
             document.getElementById('serviceFilter').value = '';
             document.getElementById('regionFilter').value = '';
             document.getElementById('tagFilter').value = '';
             filterResources();
-        }}
-
-        function copyToClipboard(el) {{
-            navigator.clipboard.writeText(el.textContent.trim()).then(() => {{
-                el.classList.add('copied');
-                const toast = document.getElementById('toast');
-                toast.classList.add('show');
-                setTimeout(() => {{
-                    toast.classList.remove('show');
-                    el.classList.remove('copied');
-                }}, 2000);
-            }});
-        }}
+        }
 
-        function toggleTags(el) {{
+        function toggleTags(el) {
             event.stopPropagation();
             const tooltip = el.parentElement.querySelector('.tags-tooltip');
-            if (tooltip) {{
+            if (tooltip) {
                 // Close any other open tooltips
-                document.querySelectorAll('.tags-tooltip.show').forEach(t => {{
+                document.querySelectorAll('.tags-tooltip.show').forEach(t => {
                     if (t !== tooltip) t.classList.remove('show');
-                }});
+                });
                 tooltip.classList.toggle('show');
-            }}
-        }}
+            }
+        }
 
         // Close tooltips when clicking outside
-        document.addEventListener('click', function(e) {{
-            if (!e.target.classList.contains('more') && !e.target.closest('.tags-tooltip')) {{
+        document.addEventListener('click', function(e) {
+            if (!e.target.classList.contains('more') && !e.target.closest('.tags-tooltip')) {
                 document.querySelectorAll('.tags-tooltip.show').forEach(t => t.classList.remove('show'));
-            }}
-        }});
+            }
+        });
 
-        function exportCSV() {{
+        function exportCSV() {
             let csv = 'Service,Type,Name,ID/ARN,Region\\n';
-            document.querySelectorAll('tbody tr:not(.hidden):not(.details-row)').forEach(row => {{
+            document.querySelectorAll('tbody tr:not(.hidden):not(.details-row)').forEach(row => {
                 const cells = row.querySelectorAll('td');
                 const data = [
                     row.dataset.service,
@@ -1126,30 +1051,895 @@ def format_html(data: Dict[str, Any]) -> str:
                     row.dataset.region
                 ].map(s => '"' + s.replace(/"/g, '""') + '"');
                 csv += data.join(',') + '\\n';
-            }});
+            });
 
-            const blob = new Blob([csv], {{type: 'text/csv'}});
+            const blob = new Blob([csv], {type: 'text/csv'});
             const url = URL.createObjectURL(blob);
             const a = document.createElement('a');
             a.href = url;
             a.download = 'aws-inventory.csv';
             a.click();
             URL.revokeObjectURL(url);
-        }}
-    </script>
-</body>
-</html>'''
-
-    return html
-
+        }
+
+        readBlock('search-index').then(index => {
+            const tableRows = new Map();
+            document.querySelectorAll('tr[data-row]').forEach(row => tableRows.set(Number(row.dataset.row), row));
+            searchIndex.init(index, id => {
+                const row = tableRows.get(id);
+                const detailRow = row.nextElementSibling;
+                const details = detailRow && detailRow.classList.contains('details-row') ? detailRow.textContent : '';
+                return row.textContent + '\\n' + details;
+            });
+            if (document.getElementById('searchBox').value) filterResources();
+        });
+'''
+
+_VIRTUAL_SCRIPT = '''
+        let DATA = null;
+        const ROW_HEIGHT = 44;  // keep in sync with .vrow height
+        const MAX_VIEWPORT = 600;
+        const OVERSCAN = 10;
+        const sections = [];
+
+        function esc(s) {
+            return String(s == null ? '' : s).replace(/&/g, '&amp;').replace(/</g, '&lt;')
+                .replace(/>/g, '&gt;').replace(/"/g, '&quot;');
+        }
+
+        function formatDetailKey(key) {
+            return key.replace(/_/g, ' ').replace(/\\w\\S*/g, w => w.charAt(0).toUpperCase() + w.slice(1).toLowerCase());
+        }
+
+        function formatDetailValue(value) {
+            if (value === null || value === undefined || (Array.isArray(value) && !value.length)) {
+                return '<span class="detail-value null-value">&mdash;</span>';
+            }
+            if (typeof value === 'boolean') {
+                return '<span class="detail-value ' + (value ? 'bool-true">Yes' : 'bool-false">No') + '</span>';
+            }
+            if (Array.isArray(value)) {
+                const items = value.map(item => '<span class="detail-list-item">' + esc(typeof item === 'object' && item !== null ? JSON.stringify(item) : item) + '</span>');
+                return '<span class="detail-value"><span class="detail-list">' + items.join('') + '</span></span>';
+            }
+            if (typeof value === 'object') {
+                return '<span class="detail-value">' + esc(JSON.stringify(value)) + '</span>';
+            }
+            return '<span class="detail-value">' + esc(value) + '</span>';
+        }
+
+        function rowHtml(sec, id) {
+            const row = DATA.rows[id];
+            const region = DATA.regions[row[4]];
+            const tags = row[5] || [];
+            let badges = '';
+            for (let i = 0; i < tags.length && i < 6; i += 2) {
+                badges += '<span class="tag">' + esc(tags[i]) + '=' + esc(tags[i + 1]) + '</span>';
+            }
+            if (tags.length > 6) {
+                const all = [];
+                for (let i = 0; i < tags.length; i += 2) all.push(tags[i] + '=' + tags[i + 1]);
+                badges += '<span class="tag more" title="' + esc(all.join('\\n')) + '">+' + (tags.length / 2 - 3) + '</span>';
+            }
+            const cls = 'vrow' + (row[6] ? ' has-details' : '') + (id === sec.selected ? ' selected' : '');
+            return '<div class="' + cls + '" data-row="' + id + '" onclick="toggleDetails(this)">' +
+                '<div>' + esc(DATA.types[row[0]]) + '</div>' +
+                '<div>' + esc(row[1] || row[2]) + '</div>' +
+                '<div class="resource-id" title="Click to copy ARN" onclick="event.stopPropagation(); copyToClipboard(this)">' + esc(row[3] || row[2]) + '</div>' +
+                '<div><span class="region-badge" data-region="' + esc(region) + '">' + esc(region) + '</span></div>' +
+                '<div class="tags-cell">' + badges + '</div></div>';
+        }
+
+        function render(sec) {
+            if (sec.content.classList.contains('collapsed')) return;
+            const total = sec.ids.length;
+            sec.viewport.style.height = Math.min(total * ROW_HEIGHT, MAX_VIEWPORT) + 'px';
+            sec.spacer.style.height = total * ROW_HEIGHT + 'px';
+            const top = sec.viewport.scrollTop;
+            const first = Math.max(0, Math.floor(top / ROW_HEIGHT) - OVERSCAN);
+            const last = Math.min(total, Math.ceil((top + MAX_VIEWPORT) / ROW_HEIGHT) + OVERSCAN);
+            const parts = [];
+            for (let i = first; i < last; i++) parts.push(rowHtml(sec, sec.ids[i]));
+            sec.rowsEl.style.transform = 'translateY(' + first * ROW_HEIGHT + 'px)';
+            sec.rowsEl.innerHTML = parts.join('');
+        }
+
+        function buildSections() {
+            const container = document.getElementById('services-container');
+            DATA.sections.forEach(([service, start, count]) => {
+                const el = document.createElement('div');
+                el.className = 'service-section';
+                el.dataset.service = service;
+                el.innerHTML =
+                    '<div class="service-header" onclick="toggleSection(this)">' +
+                    '<span class="service-name">' + esc(service.toUpperCase()) + '</span>' +
+                    '<span class="service-count"></span><span class="toggle-icon">+</span></div>' +
+                    '<div class="service-content collapsed">' +
+                    '<div class="vhead"><div>Type</div><div>Name</div><div>ID / ARN</div><div>Region</div><div>Tags</div></div>' +
+                    '<div class="vviewport"><div class="vspacer"><div class="vrows"></div></div></div>' +
+                    '<div class="details-panel hidden"></div></div>';
+                const sec = {
+                    service, start, count, el, ids: [], selected: -1,
+                    content: el.querySelector('.service-content'),
+                    viewport: el.querySelector('.vviewport'),
+                    spacer: el.querySelector('.vspacer'),
+                    rowsEl: el.querySelector('.vrows'),
+                    detailsEl: el.querySelector('.details-panel'),
+                    countEl: el.querySelector('.service-count')
+                };
+                for (let id = start; id < start + count; id++) sec.ids.push(id);
+                let pending = false;
+                sec.viewport.addEventListener('scroll', () => {
+                    if (pending) return;
+                    pending = true;
+                    requestAnimationFrame(() => { pending = false; render(sec); });
+                });
+                el.sec = sec;
+                sections.push(sec);
+                container.appendChild(el);
+                setCount(sec);
+            });
+        }
+
+        function setCount(sec) {
+            const n = sec.ids.length;
+            sec.countEl.textContent = (n === sec.count ? n.toLocaleString() : n.toLocaleString() + ' of ' + sec.count.toLocaleString()) +
+                ' resource' + (sec.count !== 1 ? 's' : '');
+        }
+
+        function setOpen(sec, open) {
+            sec.content.classList.toggle('collapsed', !open);
+            sec.el.querySelector('.toggle-icon').textContent = open ? '-' : '+';
+            render(sec);
+        }
+
+        function toggleSection(header) {
+            const sec = header.parentElement.sec;
+            setOpen(sec, sec.content.classList.contains('collapsed'));
+        }
+
+        function expandAll() {
+            sections.forEach(sec => { if (!sec.el.classList.contains('hidden')) setOpen(sec, true); });
+        }
+
+        function collapseAll() {
+            sections.forEach(sec => setOpen(sec, false));
+        }
+
+        function toggleDetails(rowEl) {
+            const sec = rowEl.closest('.service-section').sec;
+            const id = Number(rowEl.dataset.row);
+            const details = DATA.rows[id][6];
+            sec.selected = (sec.selected === id || !details) ? -1 : id;
+            if (sec.selected < 0) {
+                sec.detailsEl.classList.add('hidden');
+            } else {
+                sec.detailsEl.innerHTML = '<div class="details-grid">' + Object.keys(details).map(k =>
+                    '<div class="detail-item"><span class="detail-key">' + esc(formatDetailKey(k)) + '</span>' +
+                    formatDetailValue(details[k]) + '</div>').join('') + '</div>';
+                sec.detailsEl.classList.remove('hidden');
+            }
+            render(sec);
+        }
+
+        function hasTag(row, tag) {
+            const tags = row[5] || [];
+            for (let i = 0; i < tags.length; i += 2) {
+                if (tags[i] + '=' + tags[i + 1] === tag) return true;
+            }
+            return false;
+        }
+
+        function filterResources() {
+            if (DATA === null) return;
+            const search = document.getElementById('searchBox').value.toLowerCase();
+            const service = document.getElementById('serviceFilter').value;
+            const region = DATA.regions.indexOf(document.getElementById('regionFilter').value);
+            const tag = document.getElementById('tagFilter').value;
+            const matches = search ? searchIndex.match(search) : null;
 
-def format_output(data: Dict[str, Any], format_type: str) -> str:
-    """
+            sections.forEach(sec => {
+                if (service && sec.service !== service) {
+                    sec.el.classList.add('hidden');
+                    return;
+                }
+                const ids = [];
+                for (let id = sec.start; id < sec.start + sec.count; id++) {
+                    const row = DATA.rows[id];
+                    if (region >= 0 && row[4] !== region) continue;
+                    if (tag && !hasTag(row, tag)) continue;
+                    if (matches && !matches[id]) continue;
+                    ids.push(id);
+                }
+                sec.ids = ids;
+                sec.viewport.scrollTop = 0;
+                if (ids.indexOf(sec.selected) < 0) {
+                    sec.selected = -1;
+                    sec.detailsEl.classList.add('hidden');
+                }
+                setCount(sec);
+                sec.el.classList.toggle('hidden', !ids.length);
+                if (ids.length && search) {
+                    sec.autoExpanded = sec.autoExpanded || sec.content.classList.contains('collapsed');
+                    setOpen(sec, true);
+                } else if (!search && sec.autoExpanded) {
+                    sec.autoExpanded = false;
+                    setOpen(sec, false);
+                } else {
+                    render(sec);
+                }
+            });
+        }
+
+        function clearFilters() {
+            document.getElementById('searchBox').value = '';
+            document.getElementById('serviceFilter').value = '';
+            document.getElementById('regionFilter').value = '';
+            document.getElementById('tagFilter').value = '';
+            filterResources();
+        }
+
+        function exportCSV() {
+            const lines = ['Service,Type,Name,ID/ARN,Region'];
+            sections.forEach(sec => {
+                if (sec.el.classList.contains('hidden')) return;
+                sec.ids.forEach(id => {
+                    const row = DATA.rows[id];
+                    lines.push([sec.service, DATA.types[row[0]], row[1] || row[2], row[3] || row[2], DATA.regions[row[4]]]
+                        .map(s => '"' + String(s).replace(/"/g, '""') + '"').join(','));
+                });
+            });
+            const blob = new Blob([lines.join('\\n') + '\\n'], {type: 'text/csv'});
+            const url = URL.createObjectURL(blob);
+            const a = document.createElement('a');
+            a.href = url;
+            a.download = 'aws-inventory.csv';
+            a.click();
+            URL.revokeObjectURL(url);
+        }
+
+        Promise.all([readBlock('inventory-data'), readBlock('search-index')]).then(([data, index]) => {
+            DATA = data;
+            searchIndex.init(index, id => JSON.stringify(DATA.rows[id]));
+            buildSections();
+            filterResources();
+        });
+'''
+
+
+def _esc(s: Any) -> str:
+    """Escape a value for HTML text and attribute values."""
+    if s is None:
+        return ''
+    return str(s).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;')
+
+
+def _format_detail_value(value: Any) -> str:
+    """Render one details value as a detail-value span."""
+    if value is None:
+        return '<span class="detail-value null-value">&mdash;</span>'
+    if isinstance(value, bool):
+        cls = 'bool-true' if value else 'bool-false'
+        text = 'Yes' if value else 'No'
+        return f'<span class="detail-value {cls}">{text}</span>'
+    if isinstance(value, list):
+        if not value:
+            return '<span class="detail-value null-value">&mdash;</span>'
+        items = ''.join(f'<span class="detail-list-item">{_esc(str(item))}</span>' for item in value)
+        return f'<span class="detail-value"><span class="detail-list">{items}</span></span>'
+    if isinstance(value, dict):
+        return f'<span class="detail-value">{_esc(json.dumps(value, default=str))}</span>'
+    return f'<span class="detail-value">{_esc(str(value))}</span>'
+
+
+def _format_detail_key(key: str) -> str:
+    """snake_case -> Title Case"""
+    return key.replace('_', ' ').title()
+
+
+def _summarize(resources: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Group resources for the report overview.
+
+    Args:
+        resources: Resource dictionaries
+
+    Returns:
+        Dict with services (name -> resources), regions (name -> count),
+        tags (key -> set of values) and resource_types (service/type -> count)
+    """
+    services: Dict[str, List[Dict[str, Any]]] = {}
+    regions: Dict[str, int] = {}
+    all_tags: Dict[str, set] = {}
+    resource_types: Dict[str, int] = {}
+    for r in resources:
+        services.setdefault(r.get('service', 'unknown'), []).append(r)
+        reg = r.get('region', 'global') or 'global'
+        regions[reg] = regions.get(reg, 0) + 1
+        for k, v in (r.get('tags') or {}).items():
+            all_tags.setdefault(k, set()).add(v)
+        rt = f"{r.get('service', '')}/{r.get('type', '')}"
+        resource_types[rt] = resource_types.get(rt, 0) + 1
+    return {'services': services, 'regions': regions, 'tags': all_tags, 'resource_types': resource_types}
+
+
+def _html_page_start(metadata: Dict[str, Any], summary: Dict[str, Any], total_resources: int,
+                     extra_style: str = '') -> str:
+    """
+    Render the report from <!DOCTYPE> through the filter controls.
+
+    Args:
+        metadata: Inventory metadata
+        summary: Result of _summarize()
+        total_resources: Number of resources in the report
+        extra_style: Additional CSS for the report mode
+
+    Returns:
+        HTML up to and including the opening of #services-container
+    """
+    esc = _esc
+    account_id = metadata.get('account_id', 'Unknown')
+    timestamp = metadata.get('timestamp', '')
+    duration = metadata.get('scan_duration_seconds', 0)
+    services = summary['services']
+    regions = summary['regions']
+    all_tags = summary['tags']
+
+    # Build service options
+    service_options = '\n'.join(
+        f'<option value="{esc(s)}">{esc(s.upper())}</option>'
+        for s in sorted(services.keys())
+    )
+
+    # Build region options
+    region_options = '\n'.join(
+        f'<option value="{esc(r)}">{esc(r)}</option>'
+        for r in sorted(regions.keys())
+    )
+
+    # Build tag options (Key=Value format)
+    tag_options = []
+    for k in sorted(all_tags.keys()):
+        for v in sorted(all_tags[k]):
+            tag_options.append(f'<option value="{esc(k)}={esc(v)}">{esc(k)}={esc(v)}</option>')
+    tag_options_html = '\n'.join(tag_options)
+
+    # Build stats cards
+    top_services = sorted(services.items(), key=lambda x: len(x[1]), reverse=True)[:5]
+    service_stats = ''.join(
+        f'<div class="stat-bar"><span class="stat-label">{esc(s.upper())}</span><div class="bar" style="width: {min(100, len(r)*100//max(1,total_resources))}%"></div><span class="stat-value">{len(r)}</span></div>'
+        for s, r in top_services
+    )
+
+    # Build region stats
+    top_regions = sorted(regions.items(), key=lambda x: x[1], reverse=True)[:5]
+    region_stats = ''.join(
+        f'<div class="stat-bar"><span class="stat-label">{esc(reg)}</span><div class="bar region-bar" style="width: {min(100, count*100//max(1,total_resources))}%"></div><span class="stat-value">{count}</span></div>'
+        for reg, count in top_regions
+    )
+
+    return f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>awsmap - {esc(account_id)}</title>
+    <style>{_HTML_STYLE}{extra_style}    </style>
+</head>
+<body>
+    <button class="theme-toggle" onclick="toggleTheme()" title="Toggle dark mode">
+        <span id="theme-icon">&#x1F319;</span>
+    </button>
+
+    <div class="container">
+        <header>
+            <h1>AWS Inventory Report</h1>
+            <div class="subtitle">Comprehensive Cloud Asset Discovery</div>
+            <div class="meta-info">
+                <span class="meta-item">Account: {esc(account_id)}</span>
+                <span class="meta-item">Generated: {esc(timestamp)}</span>
+                <span class="meta-item">Duration: {duration}s</span>
+            </div>
+        </header>
+
+        <div class="stats-grid">
+            <div class="stat-card">
+                <div class="number">{total_resources:,}</div>
+                <div class="label">Total Resources</div>
+            </div>
+            <div class="stat-card">
+                <div class="number">{len(services)}</div>
+                <div class="label">Services</div>
+            </div>
+            <div class="stat-card">
+                <div class="number">{len(regions)}</div>
+                <div class="label">Regions</div>
+            </div>
+            <div class="stat-card">
+                <div class="number">{len(summary['resource_types'])}</div>
+                <div class="label">Resource Types</div>
+            </div>
+        </div>
+
+        <div class="charts-row">
+            <div class="chart-card">
+                <h3>Top Services</h3>
+                {service_stats}
+            </div>
+            <div class="chart-card">
+                <h3>Top Regions</h3>
+                {region_stats}
+            </div>
+        </div>
+
+        <div class="controls">
+            <div class="controls-row">
+                <input type="text" class="search-box" id="searchBox" placeholder="Search resources..." onkeyup="debouncedFilter()">
+                <select class="filter-select" id="serviceFilter" onchange="filterResources()">
+                    <option value="">All Services</option>
+                    {service_options}
+                </select>
+                <select class="filter-select" id="regionFilter" onchange="filterResources()">
+                    <option value="">All Regions</option>
+                    {region_options}
+                </select>
+                <select class="filter-select" id="tagFilter" onchange="filterResources()">
+                    <option value="">All Tags</option>
+                    {tag_options_html}
+                </select>
+                <button class="btn btn-secondary" onclick="clearFilters()">Clear</button>
+                <button class="btn btn-secondary" onclick="expandAll()">Expand All</button>
+                <button class="btn btn-secondary" onclick="collapseAll()">Collapse All</button>
+            </div>
+            <div class="export-btns">
+                <button class="btn btn-primary" onclick="exportCSV()">Export CSV</button>
+                <button class="btn btn-primary" onclick="window.print()">Print</button>
+            </div>
+        </div>
+
+        <div id="services-container">
+'''
+
+
+def _html_page_end() -> str:
+    """Render the markup between the service sections and the scripts."""
+    return '''
+        </div>
+
+        <footer>
+            <div class="footer-logo">awsmap</div>
+        </footer>
+    </div>
+
+    <div class="toast" id="toast">Copied!</div>
+
+'''
+
+
+def _render_rows(service_name: str, service_resources: List[Dict[str, Any]], first_row: int) -> str:
+    """
+    Render static report table rows (resource rows and their detail rows).
+
+    Args:
+        service_name: Service name
+        service_resources: Resources to render, in report order
+        first_row: Search index row number of the first resource
+
+    Returns:
+        Table row HTML
+    """
+    esc = _esc
+    num_columns = 5  # Type, Name, ID/ARN, Region, Tags
+
+    rows = []
+    for row_number, r in enumerate(service_resources, first_row):
+        tags = r.get('tags', {})
+        tag_badges = ''
+        all_tags_html = ''
+        if tags:
+            for k, v in list(tags.items())[:3]:
+                tag_badges += f'<span class="tag">{esc(k)}={esc(v)}</span>'
+            if len(tags) > 3:
+                tag_badges += f'<span class="tag more" onclick="toggleTags(this)">+{len(tags)-3}</span>'
+                all_tags_html = '<div class="tags-tooltip">'
+                for k, v in tags.items():
+                    all_tags_html += f'<span class="tag">{esc(k)}={esc(v)}</span>'
+                all_tags_html += '</div>'
+
+        # Build tags data attribute for filtering
+        tags_data = '|'.join(f"{esc(k)}={esc(v)}" for k, v in tags.items()) if tags else ''
+        region_val = r.get('region', 'global') or 'global'
+
+        details = r.get('details', {})
+        has_details = bool(details)
+
+        # Main resource row
+        detail_attrs = ''
+        if has_details:
+            detail_attrs = ' data-has-details="true" onclick="toggleDetails(this)"'
+
+        rows.append(f'''
+                <tr data-row="{row_number}" data-service="{esc(service_name)}" data-region="{esc(region_val)}" data-tags="{tags_data}"{detail_attrs}>
+                    <td>{esc(r.get('type', ''))}</td>
+                    <td>{esc(r.get('name', '') or r.get('id', ''))}</td>
+                    <td class="resource-id" title="Click to copy ARN" onclick="event.stopPropagation(); copyToClipboard(this)">{esc(r.get('arn', '') or r.get('id', ''))}</td>
+                    <td><span class="region-badge" data-region="{esc(region_val)}">{esc(region_val)}</span></td>
+                    <td class="tags-cell">{tag_badges}{all_tags_html}</td>
+                </tr>
+            ''')
+
+        # Detail row (hidden by default)
+        if has_details:
+            detail_items = ''.join(
+                f'<div class="detail-item"><span class="detail-key">{esc(_format_detail_key(k))}</span>{_format_detail_value(v)}</div>'
+                for k, v in details.items()
+            )
+            rows.append(f'''
+                <tr class="details-row collapsed">
+                    <td colspan="{num_columns}">
+                        <div class="details-panel">
+                            <div class="details-grid">{detail_items}</div>
+                        </div>
+                    </td>
+                </tr>
+            ''')
+
+    return ''.join(rows)
+
+
+def _section_start(service_name: str, count: int) -> str:
+    """Return a static report service section's markup up to its first row."""
+    esc = _esc
+    return f'''
+            <div class="service-section" data-service="{esc(service_name)}">
+                <div class="service-header" onclick="toggleSection(this)">
+                    <span class="service-name">{esc(service_name.upper())}</span>
+                    <span class="service-count">{count} resource{'s' if count != 1 else ''}</span>
+                    <span class="toggle-icon">+</span>
+                </div>
+                <div class="service-content collapsed">
+                    <table>
+                        <thead>
+                            <tr>
+                                <th>Type</th>
+                                <th>Name</th>
+                                <th>ID / ARN</th>
+                                <th>Region</th>
+                                <th>Tags</th>
+                            </tr>
+                        </thead>
+                        <tbody>
+                            '''
+
+
+_SECTION_END = '''
+                        </tbody>
+                    </table>
+                </div>
+            </div>
+        '''
+
+
+def _render_service_section(service_name: str, service_resources: List[Dict[str, Any]], first_row: int) -> str:
+    """
+    Render one service's collapsible table for the static report.
+
+    Args:
+        service_name: Service name
+        service_resources: The service's resources
+        first_row: Search index row number of the first resource
+
+    Returns:
+        service-section HTML
+    """
+    return (_section_start(service_name, len(service_resources))
+            + _render_rows(service_name, service_resources, first_row)
+            + _SECTION_END)
+
+
+def _render_sections(summary: Dict[str, Any], processes: int) -> Iterator[str]:
+    """
+    Yield the static report's service sections in order, as HTML pieces.
+
+    With more than one process, each service's rows are cut into chunks of
+    RENDER_CHUNK_SIZE resources rendered across a process pool, so a single
+    large service is spread over the workers too. At most two chunks per
+    worker are in flight, so finished HTML doesn't pile up ahead of the
+    writer.
+
+    Args:
+        summary: Result of _summarize()
+        processes: Number of worker processes (1 renders in this process)
+
+    Yields:
+        HTML strings, to be written in order
+    """
+    services = summary['services']
+    if processes <= 1:
+        first_row = 0
+        for service_name in sorted(services):
+            yield _render_service_section(service_name, services[service_name], first_row)
+            first_row += len(services[service_name])
+        return
+
+    # spawn, as in process_collector: the scan may have left threads running
+    ctx = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=processes, mp_context=ctx) as pool:
+        pending: deque = deque()
+
+        def pieces() -> Iterator[Any]:
+            # Fixed markup is passed through as-is, rows as futures
+            first_row = 0
+            for service_name in sorted(services):
+                service_resources = services[service_name]
+                yield _section_start(service_name, len(service_resources))
+                for offset in range(0, len(service_resources), RENDER_CHUNK_SIZE):
+                    chunk = service_resources[offset:offset + RENDER_CHUNK_SIZE]
+                    yield pool.submit(_render_rows, service_name, chunk, first_row + offset)
+                yield _SECTION_END
+                first_row += len(service_resources)
+
+        in_flight = 0
+        for piece in pieces():
+            pending.append(piece)
+            if not isinstance(piece, str):
+                in_flight += 1
+            while in_flight >= processes * 2 or (pending and isinstance(pending[0], str)):
+                head = pending.popleft()
+                if isinstance(head, str):
+                    yield head
+                else:
+                    in_flight -= 1
+                    yield head.result()
+        while pending:
+            head = pending.popleft()
+            yield head if isinstance(head, str) else head.result()
+
+
+def _write_virtual_payload(summary: Dict[str, Any], stream: Any) -> None:
+    """
+    Write the virtual report's data: each resource once, in compact rows.
+
+    Types and regions are stored once in lookup tables, tags as a flat
+    [key, value, ...] list and empty fields as 0. Rows are grouped by
+    service, so a section is a (service, start, count) slice of rows.
+    Rows are serialized one service at a time; the types table, only
+    complete once every row has been seen, comes last.
+
+    Args:
+        summary: Result of _summarize()
+        stream: Text stream (or compressing sink) to write the JSON object to
+    """
+    def dumps(value: Any) -> str:
+        # Keep '</script>' inside string values from closing the data block
+        return json.dumps(value, separators=(',', ':'), default=json_default).replace('</', '<\\/')
+
+    types: Dict[str, int] = {}
+    regions = {name: i for i, name in enumerate(sorted(summary['regions']))}
+    sections = []
+    start = 0
+    for service_name in sorted(summary['services']):
+        count = len(summary['services'][service_name])
+        sections.append([service_name, start, count])
+        start += count
+
+    stream.write(f'{{"regions":{dumps(list(regions))},"sections":{dumps(sections)},"rows":[')
+    first = True
+    for service_name in sorted(summary['services']):
+        rows = []
+        for r in summary['services'][service_name]:
+            tags = r.get('tags') or {}
+            rows.append([
+                types.setdefault(r.get('type', ''), len(types)),
+                r.get('name') or '',
+                r.get('id') or '',
+                r.get('arn') or '',
+                regions[r.get('region', 'global') or 'global'],
+                [str(x) for pair in tags.items() for x in pair] or 0,
+                r.get('details') or 0,
+            ])
+        if rows:
+            stream.write(('' if first else ',') + dumps(rows)[1:-1])
+            first = False
+    stream.write(f'],"types":{dumps(list(types))}}}')
+
+
+class _GzipBase64Writer:
+    """
+    Text sink that gzips what is written to it and writes the result to a
+    stream as base64, for embedding in the page (readBlock() undoes it).
+    """
+
+    def __init__(self, stream: TextIO):
+        """
+        Args:
+            stream: Text stream to write base64 text to
+        """
+        self.stream = stream
+        self.raw_bytes = 0
+        self.compressed_bytes = 0
+        self._gzip = zlib.compressobj(9, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        self._pending = b''
+
+    def _emit(self, data: bytes) -> None:
+        # base64 encodes 3-byte groups; keep the remainder for the next chunk
+        data = self._pending + data
+        cut = len(data) - len(data) % 3
+        self.stream.write(base64.b64encode(data[:cut]).decode('ascii'))
+        self._pending = data[cut:]
+        self.compressed_bytes += cut
+
+    def write(self, text: str) -> None:
+        data = text.encode('utf-8')
+        self.raw_bytes += len(data)
+        self._emit(self._gzip.compress(data))
+
+    def close(self) -> None:
+        """Flush the compressor and the final partial base64 group."""
+        self._emit(self._gzip.flush())
+        self.stream.write(base64.b64encode(self._pending).decode('ascii'))
+        self.compressed_bytes += len(self._pending)
+        self._pending = b''
+
+
+def _write_block(stream: TextIO, block_id: str, write: Callable[[TextIO], None], compress: bool,
+                 stats: Optional[Dict[str, Any]]) -> None:
+    """
+    Write a JSON data block, gzipped and base64-encoded when compress is set.
+
+    Args:
+        stream: Text stream to write the page to
+        block_id: Element ID the page script reads the block by
+        write: Function writing the block's JSON to the stream it's given
+        compress: If True, embed the JSON gzip-compressed as base64
+        stats: Optional dict; compressed blocks add their raw and
+            compressed sizes to stats['payload']
+    """
+    if not compress:
+        stream.write(f'    <script type="application/json" id="{block_id}">')
+        write(stream)
+        stream.write('</script>\n')
+        return
+    stream.write(f'    <script type="application/octet-stream" id="{block_id}" data-encoding="gzip-base64">')
+    sink = _GzipBase64Writer(stream)
+    write(sink)
+    sink.close()
+    stream.write('</script>\n')
+    if stats is not None:
+        payload = stats.setdefault('payload', {'raw_bytes': 0, 'compressed_bytes': 0})
+        payload['raw_bytes'] += sink.raw_bytes
+        payload['compressed_bytes'] += sink.compressed_bytes
+
+
+def _write_search_index(summary: Dict[str, Any], stream: TextIO, compress: bool,
+                        stats: Optional[Dict[str, Any]]) -> None:
+    """Build the search index over the report rows and write it as a JSON block."""
+    ordered = (r for name in sorted(summary['services']) for r in summary['services'][name])
+    index, index_stats = build_search_index(ordered)
+    if stats is not None:
+        stats['search_index'] = index_stats
+    _write_block(stream, 'search-index', lambda sink: sink.write(json.dumps(index, separators=(',', ':'))),
+                 compress, stats)
+
+
+def write_html(
+    data: Dict[str, Any],
+    stream: TextIO,
+    mode: str = 'auto',
+    stats: Optional[Dict[str, Any]] = None,
+    compress: bool = False,
+    processes: int = 1
+) -> None:
+    """
+    Write inventory data as an HTML report, one section at a time.
+
+    The static mode writes every resource as table rows. The virtual mode
+    embeds the inventory once as compact JSON and renders only the rows in
+    view, filtering in-memory arrays, so reports of a million resources
+    stay responsive. 'auto' picks virtual above VIRTUAL_REPORT_THRESHOLD
+    resources. Both modes embed an inverted search index (see searchindex).
+
+    Only one service section (or its JSON rows) is held as a string at a
+    time, so peak memory stays near the inventory itself.
+
+    With compress, the virtual report's data blocks are embedded
+    gzip-compressed as base64 and inflated in the browser with
+    DecompressionStream; the page stays a single offline file.
+
+    With processes above 1, the static report's sections are rendered
+    across a process pool and written in order (see _render_sections).
+
+    Args:
+        data: Inventory data with metadata and resources
+        stream: Text stream to write to
+        mode: Report mode (auto, static, virtual)
+        stats: Optional dict to add report statistics to (search_index:
+            rows, tokens, bytes and build seconds; payload: raw and
+            compressed bytes, with compress; render_processes: processes
+            the sections were rendered across, 1 for the virtual mode)
+        compress: If True, compress the embedded data (virtual mode only)
+        processes: Worker processes rendering static report sections
+            (ignored by the virtual mode)
+
+    Raises:
+        ValueError: If mode is not supported, or compress is set with
+            the static mode
+    """
+    if mode not in HTML_MODES:
+        raise ValueError(f"Unsupported HTML mode: {mode}")
+    if compress and mode == 'static':
+        raise ValueError("Compressed reports require the virtual HTML mode")
+    resources = data.get('resources', [])
+    if mode == 'auto':
+        mode = 'virtual' if compress or len(resources) > VIRTUAL_REPORT_THRESHOLD else 'static'
+    summary = _summarize(resources)
+    metadata = data.get('metadata', {})
+    if stats is not None:
+        stats['render_processes'] = max(1, processes) if mode == 'static' else 1
+
+    if mode == 'virtual':
+        stream.write(_html_page_start(metadata, summary, len(resources), extra_style=_VIRTUAL_STYLE))
+        stream.write(_html_page_end())
+        _write_block(stream, 'inventory-data', lambda sink: _write_virtual_payload(summary, sink), compress, stats)
+        _write_search_index(summary, stream, compress, stats)
+        stream.write(f'    <script>{_COMMON_SCRIPT}{_SEARCH_SCRIPT}{_VIRTUAL_SCRIPT}    </script>')
+    else:
+        stream.write(_html_page_start(metadata, summary, len(resources)))
+        for piece in _render_sections(summary, processes):
+            stream.write(piece)
+        stream.write(_html_page_end())
+        _write_search_index(summary, stream, False, stats)
+        stream.write(f'    <script>{_COMMON_SCRIPT}{_SEARCH_SCRIPT}{_STATIC_SCRIPT}    </script>')
+    stream.write('\n</body>\n</html>')
+
+
+def format_html(
+    data: Dict[str, Any],
+    mode: str = 'auto',
+    stats: Optional[Dict[str, Any]] = None,
+    compress: bool = False,
+    processes: int = 1
+) -> str:
+    """
+    Format inventory data as beautiful HTML report.
+
+    Args:
+        data: Inventory data with metadata and resources
+        mode: Report mode (auto, static, virtual; see write_html)
+        stats: Optional dict to add report statistics to
+        compress: If True, compress the embedded data (see write_html)
+        processes: Worker processes rendering static report sections
+
+    Returns:
+        HTML string
+
+    Raises:
+        ValueError: If mode is not supported, or compress is set with
+            the static mode
+    """
+    output = io.StringIO()
+    write_html(data, output, mode=mode, stats=stats, compress=compress, processes=processes)
+    return output.getvalue()
+
+
+def format_output(
+    data: Dict[str, Any],
+    format_type: str,
+    html_mode: str = 'auto',
+    stats: Optional[Dict[str, Any]] = None,
+    compress: bool = False,
+    processes: int = 1
+) -> str:
+    """
     Format inventory data in the specified format.
 
     Args:
         data: Inventory data with metadata and resources
-        format_type: Output format (json, csv, html)
+        format_type: Output format (json, ndjson, csv, html)
+        html_mode: HTML report mode (see format_html)
+        stats: Optional dict for format_html's report statistics
+        compress: If True, compress the HTML report's embedded data
+        processes: Worker processes rendering HTML report sections
 
     Returns:
         Formatted string
@@ -1161,10 +1951,12 @@ def format_output(data: Dict[str, Any], format_type: str) -> str:
 
     if format_type == 'json':
         return format_json(data)
+    elif format_type == 'ndjson':
+        return format_ndjson(data)
     elif format_type == 'csv':
         return format_csv(data)
     elif format_type == 'html':
-        return format_html(data)
+        return format_html(data, mode=html_mode, stats=stats, compress=compress, processes=processes)
     else:
         raise ValueError(f"Unsupported format: {format_type}")
 
@@ -1179,3 +1971,29 @@ def export_file(content: str, file_path: str) -> None:
     """
     with open(file_path, 'w', encoding='utf-8') as f:
         f.write(content)
+
+
+@contextlib.contextmanager
+def atomic_output(file_path: str) -> Iterator[TextIO]:
+    """
+    Open a temporary file next to file_path, moved over it once written.
+
+    If writing fails (or is interrupted), the temporary file is removed and
+    no partial output is left at file_path.
+
+    Args:
+        file_path: Destination file path
+
+    Yields:
+        Text stream to write the output to
+    """
+    directory, name = os.path.split(os.path.abspath(file_path))
+    temp_path = os.path.join(directory, f'.{name}.{os.getpid()}.tmp')
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            yield f
+        os.replace(temp_path, file_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+        raise
@@ -0,0 +1,239 @@
+"""
+Incremental rescans against a previous inventory (the baseline).
+
+A fingerprinter makes the cheap list calls for a (service, region) slice and
+reduces them to a string plus the number of resources of each type they
+found. When both match the baseline (its stored fingerprint and the records
+it holds for the slice), those records are reused and the collector, with
+its per-resource describe/tag calls, is skipped.
+
+Fingerprints are only worth having for services whose collector makes
+per-resource calls; for list-only collectors the fingerprint would cost as
+much as the collection itself.
+"""
+
+import json
+import hashlib
+import threading
+from collections import Counter
+from typing import List, Dict, Any, Optional, Callable, Iterable, Tuple
+
+
+def _fingerprint(items: Iterable[tuple]) -> str:
+    """
+    Reduce (id, timestamp, version...) tuples to a fingerprint string.
+
+    The fingerprint is the item count, the newest timestamp and a short
+    digest of every tuple, so deletions, creations and updates all change it.
+
+    Args:
+        items: Tuples whose first element is an id and second a timestamp
+
+    Returns:
+        Fingerprint string like "12|2024-05-01 10:00:00+00:00|3f2a..."
+    """
+    rows = sorted(tuple(str(v) for v in item) for item in items)
+    latest = max((row[1] for row in rows if row[1] != 'None'), default='')
+    digest = hashlib.sha1('\n'.join('\t'.join(row) for row in rows).encode('utf-8')).hexdigest()[:16]
+    return f"{len(rows)}|{latest}|{digest}"
+
+
+def _function_tags(session, region: Optional[str]) -> Dict[str, List[tuple]]:
+    """Get every tagged Lambda function's tags with one GetResources sweep."""
+    tagging = session.client('resourcegroupstaggingapi', region_name=region)
+    tags = {}
+    paginator = tagging.get_paginator('get_resources')
+    for page in paginator.paginate(ResourceTypeFilters=['lambda:function'], ResourcesPerPage=100):
+        for mapping in page.get('ResourceTagMappingList', []):
+            tags[mapping['ResourceARN']] = sorted(
+                (tag.get('Key', ''), tag.get('Value', '')) for tag in mapping.get('Tags', [])
+            )
+    return tags
+
+
+def fingerprint_lambda(session, region: Optional[str]) -> Tuple[str, Dict[str, int]]:
+    """
+    Functions (revision and tags), layers (latest version) and event source mappings.
+
+    Tag changes don't bump a function's RevisionId, so function tags come
+    from a Resource Groups Tagging API sweep (one call per 100 functions).
+    """
+    client = session.client('lambda', region_name=region)
+    tags = _function_tags(session, region)
+
+    functions = []
+    for page in client.get_paginator('list_functions').paginate():
+        for fn in page.get('Functions', []):
+            functions.append((fn['FunctionArn'], fn.get('LastModified'), fn.get('RevisionId'),
+                              tags.get(fn['FunctionArn'], [])))
+
+    layers = []
+    for page in client.get_paginator('list_layers').paginate():
+        for layer in page.get('Layers', []):
+            latest = layer.get('LatestMatchingVersion', {})
+            layers.append((layer['LayerArn'], latest.get('CreatedDate'), latest.get('Version')))
+
+    mappings = []
+    for page in client.get_paginator('list_event_source_mappings').paginate():
+        for esm in page.get('EventSourceMappings', []):
+            mappings.append((esm['UUID'], esm.get('LastModified'), esm.get('State')))
+
+    fingerprint = (f"functions={_fingerprint(functions)};layers={_fingerprint(layers)};"
+                   f"event-source-mappings={_fingerprint(mappings)}")
+    counts = {'function': len(functions), 'layer': len(layers), 'event-source-mapping': len(mappings)}
+    return fingerprint, counts
+
+
+# Service name to fingerprint function(session, region) -> (fingerprint,
+# resource count by type). Only services whose list calls are much cheaper
+# than their collector belong here.
+FINGERPRINTERS: Dict[str, Callable[[Any, Optional[str]], Tuple[str, Dict[str, int]]]] = {
+    'lambda': fingerprint_lambda,
+}
+
+
+def _slice_key(service: str, region: Optional[str]) -> str:
+    return f"{service}:{region or 'global'}"
+
+
+class Baseline:
+    """
+    A previous inventory plus the fingerprints recorded during this scan.
+
+    Thread-safe: collect() is called from every worker.
+    """
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            data: Previous inventory ({'metadata': ..., 'resources': [...]}),
+                or None to scan everything and only record fingerprints
+        """
+        metadata = (data or {}).get('metadata', {})
+        self.account_id = metadata.get('account_id')
+        self.fingerprints: Dict[str, str] = metadata.get('fingerprints', {})
+        self.slices: Dict[str, List[Dict[str, Any]]] = {}
+
+        # A tag-filtered baseline only holds some of each slice's records
+        if not metadata.get('tag_filter'):
+            for resource in (data or {}).get('resources', []):
+                key = _slice_key(resource.get('service', ''), resource.get('region'))
+                self.slices.setdefault(key, []).append(resource)
+        else:
+            self.fingerprints = {}
+
+        self._lock = threading.Lock()
+        self.current: Dict[str, str] = {}
+        self.slices_reused = 0
+        self.resources_reused = 0
+
+    @classmethod
+    def load(cls, path: str) -> 'Baseline':
+        """
+        Load a baseline from a JSON inventory file.
+
+        A missing file gives an empty baseline, so the first run of a daily
+        `--baseline` job does a full scan and records fingerprints.
+
+        Args:
+            path: Path to a previous `-f json` output
+
+        Returns:
+            Baseline
+
+        Raises:
+            ValueError: If the file isn't a JSON inventory
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return cls()
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Can't read baseline {path}: {e}")
+        if not isinstance(data, dict) or 'resources' not in data:
+            raise ValueError(f"Baseline {path} is not a JSON inventory")
+        return cls(data)
+
+    def collect(
+        self,
+        collector_func: Callable,
+        session,
+        service_name: str,
+        region: Optional[str],
+        account_id: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Collect a slice, reusing the baseline's records if its fingerprint matches.
+
+        The records are only reused if they also hold as many resources of
+        each type as the fingerprint counted, so a slice the baseline scan
+        collected incompletely (e.g. a swallowed AccessDenied) is rescanned.
+
+        Args:
+            collector_func: The service's collector function
+            session: boto3.Session (or ClientFactory) to use
+            service_name: Name of the AWS service
+            region: AWS region (None for global services)
+            account_id: AWS account ID
+
+        Returns:
+            List of resource dictionaries
+        """
+        fingerprinter = FINGERPRINTERS.get(service_name)
+        if fingerprinter is None:
+            return collector_func(session, region, account_id)
+
+        key = _slice_key(service_name, region)
+        try:
+            fingerprint, counts = fingerprinter(session, region)
+        except Exception:
+            # Can't tell whether anything changed - collect in full
+            return collector_func(session, region, account_id)
+
+        with self._lock:
+            self.current[key] = fingerprint
+
+        previous = self.slices.get(key, [])
+        expected = {resource_type: count for resource_type, count in counts.items() if count}
+        if (account_id == self.account_id and self.fingerprints.get(key) == fingerprint
+                and Counter(r.get('type') for r in previous) == Counter(expected)):
+            reused = [dict(r) for r in previous]
+            with self._lock:
+                self.slices_reused += 1
+                self.resources_reused += len(reused)
+            return reused
+
+        return collector_func(session, region, account_id)
+
+    def fingerprint(self, service_name: str, region: Optional[str]) -> Optional[str]:
+        """Get the fingerprint recorded for a slice during this scan, if any."""
+        with self._lock:
+            return self.current.get(_slice_key(service_name, region))
+
+    def record(self, service_name: str, region: Optional[str], fingerprint: str) -> None:
+        """
+        Record a slice's fingerprint taken elsewhere (e.g. stored with a cached result).
+
+        Args:
+            service_name: Name of the AWS service
+            region: AWS region (None for global services)
+            fingerprint: Fingerprint matching the slice's records in this scan
+        """
+        with self._lock:
+            self.current[_slice_key(service_name, region)] = fingerprint
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get reuse statistics.
+
+        Returns:
+            Dict with fingerprints (recorded this scan), slices_reused and
+            resources_reused
+        """
+        with self._lock:
+            return {
+                'fingerprints': dict(sorted(self.current.items())),
+                'slices_reused': self.slices_reused,
+                'resources_reused': self.resources_reused,
+            }
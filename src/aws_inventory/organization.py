@@ -0,0 +1,339 @@
+"""
+Organization-wide scanning: every member account through one scheduler.
+
+Accounts come from the organizations collector; each one is scanned through
+a role assumed from the caller's session. Tasks from all accounts share one
+thread pool, with a per-account cap so no single account monopolizes it (or
+its own API rate limits).
+"""
+
+import time
+import concurrent.futures
+from collections import deque
+from typing import List, Dict, Any, Optional, Callable
+
+import boto3
+import botocore.session
+from botocore.credentials import CredentialProvider, CredentialResolver, RefreshableCredentials
+
+from aws_inventory.auth import get_account_id
+from aws_inventory.cache import ResultCache
+from aws_inventory.clients import ClientFactory
+from aws_inventory.ratelimit import RateLimiter
+from aws_inventory.apistats import ApiStats
+from aws_inventory.tracing import Tracer
+from aws_inventory.records import compact_records
+from aws_inventory.tagging import TagIndex
+from aws_inventory.collector import (
+    plan_scan,
+    collect_service_resources,
+    collect_s3_with_region_filter,
+)
+from aws_inventory.collectors.organizations import collect_organizations_resources
+
+
+DEFAULT_ACCOUNT_WORKERS = 8
+
+# Accounts set up (role assumed, scan planned) at once, on their own threads
+# so setups never hold collection slots
+SETUP_WORKERS = 4
+
+ROLE_SESSION_NAME = 'awsmap'
+
+
+def list_org_accounts(session) -> List[Dict[str, str]]:
+    """
+    List the active accounts of the caller's organization.
+
+    Args:
+        session: boto3.Session in the management account (or a delegated administrator)
+
+    Returns:
+        List of {'id': account_id, 'name': account_name}, sorted by id
+
+    Raises:
+        ValueError: If no accounts are visible to the session
+    """
+    resources = collect_organizations_resources(session, None, get_account_id(session))
+    accounts = [
+        {'id': r['id'], 'name': r.get('name') or r['id']}
+        for r in resources
+        if r.get('type') == 'account' and r.get('details', {}).get('status') in (None, 'ACTIVE')
+    ]
+    if not accounts:
+        raise ValueError(
+            "No organization accounts found. --org-role must run from the management "
+            "account or a delegated administrator with organizations:ListAccounts."
+        )
+    return sorted(accounts, key=lambda a: a['id'])
+
+
+class _RoleCredentialProvider(CredentialProvider):
+    """Credential provider returning one member account's role credentials."""
+
+    METHOD = 'awsmap-assume-role'
+
+    def __init__(self, credentials: RefreshableCredentials):
+        self.credentials = credentials
+
+    def load(self) -> RefreshableCredentials:
+        return self.credentials
+
+
+def assume_role_session(session, account_id: str, role_name: str, sts=None) -> boto3.Session:
+    """
+    Create a session for a role in another account.
+
+    The credentials refresh themselves, so scans longer than the role's
+    session duration keep working.
+
+    Args:
+        session: boto3.Session allowed to assume the role
+        account_id: Target account ID
+        role_name: Role name (or path/name) in the target account
+        sts: Optional STS client of session (clients are thread-safe, sessions aren't)
+
+    Returns:
+        boto3.Session using the role's credentials
+    """
+    partition = session.get_partition_for_region(session.region_name or 'us-east-1')
+    role_arn = f"arn:{partition}:iam::{account_id}:role/{role_name}"
+    if sts is None:
+        sts = session.client('sts')
+
+    def refresh() -> Dict[str, str]:
+        creds = sts.assume_role(RoleArn=role_arn, RoleSessionName=ROLE_SESSION_NAME)['Credentials']
+        return {
+            'access_key': creds['AccessKeyId'],
+            'secret_key': creds['SecretAccessKey'],
+            'token': creds['SessionToken'],
+            'expiry_time': creds['Expiration'].isoformat(),
+        }
+
+    credentials = RefreshableCredentials.create_from_metadata(
+        metadata=refresh(),
+        refresh_using=refresh,
+        method=_RoleCredentialProvider.METHOD
+    )
+    botocore_session = botocore.session.get_session()
+    # The role's credentials are the only source; no env/profile fallback
+    botocore_session.register_component(
+        'credential_provider', CredentialResolver([_RoleCredentialProvider(credentials)])
+    )
+    if session.region_name:
+        botocore_session.set_config_variable('region', session.region_name)
+    return boto3.Session(botocore_session=botocore_session)
+
+
+class _AccountScan:
+    """Scheduling state for one account."""
+
+    def __init__(self, account: Dict[str, str]):
+        self.id = account['id']
+        self.name = account['name']
+        self.plan: Optional[Dict[str, Any]] = None
+        self.clients: Optional[ClientFactory] = None
+        self.limiter: Optional[RateLimiter] = None
+        self.queue: deque = deque()
+        self.in_flight = 0
+        self.remaining = 0
+        self.resources = 0
+        self.task_seconds = 0.0
+        self.error: Optional[str] = None
+
+
+def collect_organization(
+    session,
+    role_name: str,
+    services: Optional[List[str]] = None,
+    regions: Optional[List[str]] = None,
+    max_workers: int = 20,
+    account_workers: int = DEFAULT_ACCOUNT_WORKERS,
+    accounts: Optional[List[str]] = None,
+    progress_callback: Optional[Callable[[str, str], None]] = None,
+    show_timings: bool = False,
+    include_global: bool = False,
+    rate_limit: bool = True,
+    cache: Optional[ResultCache] = None,
+    api_stats: Optional[ApiStats] = None,
+    tracer: Optional[Tracer] = None,
+    compact: bool = False,
+    bulk_tags: bool = False
+) -> Dict[str, Any]:
+    """
+    Collect resources from every account in the organization.
+
+    Role assumption and region discovery run on a separate pool of
+    SETUP_WORKERS threads, so accounts start collecting as soon as their
+    own setup finishes while the others are still being set up. Each
+    account gets its own client cache and rate limiter (API limits are
+    per account), and at most account_workers of its tasks run at once.
+
+    Args:
+        session: boto3.Session in the management account
+        role_name: Role to assume in each member account
+        services: List of service names to collect (None for all)
+        regions: List of regions to collect from (None for all enabled, per account)
+        max_workers: Total parallel workers across all accounts
+        account_workers: Maximum parallel tasks per account
+        accounts: Optional account IDs to limit the scan to
+        progress_callback: Optional callback(account, status) for progress updates
+        show_timings: If True, print a per-account timing summary at the end
+        include_global: If True, include global services even when filtering by non-global regions
+        rate_limit: If True, apply per-service token buckets and back off on throttling
+        cache: Optional ResultCache of per-(account, service, region) results
+        api_stats: Optional ApiStats to record every API call in (all accounts)
+        tracer: Optional Tracer to record task and API call spans in (all accounts)
+        compact: If True, store compact Resource records instead of dicts
+        bulk_tags: If True, resolve tags from one Resource Groups Tagging API
+            sweep per account and region
+
+    Returns:
+        Dict with metadata and resources list; every resource has account_id
+
+    Raises:
+        ValueError: If no accounts are found
+    """
+    start_time = time.time()
+    caller_account = get_account_id(session)
+
+    org_accounts = list_org_accounts(session)
+    if accounts:
+        org_accounts = [a for a in org_accounts if a['id'] in accounts]
+    scans = {a['id']: _AccountScan(a) for a in org_accounts}
+    account_workers = max(1, min(account_workers, max_workers))
+    sts = session.client('sts')
+
+    def label(scan: _AccountScan) -> str:
+        return f"{scan.id} ({scan.name})" if scan.name != scan.id else scan.id
+
+    def setup(scan: _AccountScan) -> None:
+        # The caller's own account may not have the role
+        account_session = session if scan.id == caller_account else assume_role_session(session, scan.id, role_name, sts)
+        scan.plan = plan_scan(account_session, services, regions, include_global)
+        scan.limiter = RateLimiter(max_concurrency=account_workers) if rate_limit else None
+        scan.clients = ClientFactory(account_session, max_pool_connections=account_workers, limiter=scan.limiter,
+                                     hooks=[hook for hook in (api_stats, tracer) if hook is not None])
+        if bulk_tags:
+            scan.clients.tag_index = TagIndex(scan.clients)
+
+    def collect(scan: _AccountScan, service: str, region: Optional[str]) -> tuple:
+        if service == 's3':
+            return collect_s3_with_region_filter(scan.clients, scan.id, scan.plan['filter_regions'], cache)
+        return collect_service_resources(scan.clients, service, region, scan.id, None, cache)
+
+    def run_task(scan: _AccountScan, service: str, region: Optional[str]) -> tuple:
+        if tracer is None:
+            return collect(scan, service, region)
+        with tracer.task_span(f"{scan.id} {service} {region or 'global'}",
+                              account=scan.id, service=service, region=region or 'global'):
+            return collect(scan, service, region)
+
+    all_resources = []
+    setups = {}
+    pending = {}
+    order = deque(scans.values())
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=SETUP_WORKERS) as setup_executor, \
+            concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for scan in scans.values():
+            setups[setup_executor.submit(setup, scan)] = scan
+            if progress_callback:
+                progress_callback(label(scan), "Preparing...")
+
+        def fill() -> None:
+            # Round-robin over accounts with queued tasks and free slots
+            idle = 0
+            while len(pending) < max_workers and idle < len(order):
+                scan = order[0]
+                order.rotate(-1)
+                if scan.queue and scan.in_flight < account_workers:
+                    service, region = scan.queue.popleft()
+                    scan.in_flight += 1
+                    pending[executor.submit(run_task, scan, service, region)] = (scan, (service, region))
+                    idle = 0
+                else:
+                    idle += 1
+
+        while setups or pending:
+            done, _ = concurrent.futures.wait(
+                list(setups) + list(pending), return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                if future in setups:
+                    # Account setup finished
+                    scan = setups.pop(future)
+                    try:
+                        future.result()
+                    except Exception as e:
+                        scan.error = str(e)
+                        if progress_callback:
+                            progress_callback(label(scan), f"Failed: {e}")
+                        continue
+                    scan.queue.extend(scan.plan['tasks'])
+                    scan.remaining = len(scan.plan['tasks'])
+                    if scan.remaining == 0:
+                        scan.clients.close()
+                        if progress_callback:
+                            progress_callback(label(scan), "Done: 0 resources")
+                    elif progress_callback:
+                        progress_callback(label(scan), f"Collecting... ({scan.remaining} tasks)")
+                    continue
+
+                scan, _ = pending.pop(future)
+                scan.in_flight -= 1
+                scan.remaining -= 1
+                try:
+                    resources, elapsed = future.result()
+                except Exception:
+                    resources, elapsed = [], 0.0
+                if compact:
+                    resources = compact_records(resources)
+                for resource in resources:
+                    resource['account_id'] = scan.id
+                all_resources.extend(resources)
+                scan.resources += len(resources)
+                scan.task_seconds += elapsed
+
+                if scan.remaining == 0:
+                    scan.clients.close()
+                    if progress_callback:
+                        progress_callback(label(scan), f"Done: {scan.resources} resources")
+
+            fill()
+
+    elapsed_time = time.time() - start_time
+
+    throttles: Dict[str, int] = {}
+    for scan in scans.values():
+        if scan.limiter is not None:
+            for service, count in scan.limiter.stats()['throttles'].items():
+                throttles[service] = throttles.get(service, 0) + count
+
+    planned = [scan for scan in scans.values() if scan.plan is not None]
+
+    if show_timings:
+        print("\n" + "="*60)
+        print("ACCOUNT TIMING SUMMARY (sorted by total task time)")
+        print("="*60)
+        for scan in sorted(planned, key=lambda s: s.task_seconds, reverse=True):
+            print(f"{label(scan):40} {scan.task_seconds:8.2f}s  ({scan.resources} resources)")
+        print("="*60)
+        print(f"{'TOTAL':40} {elapsed_time:8.2f}s  ({len(all_resources)} resources)")
+        print("="*60 + "\n")
+
+    return {
+        'metadata': {
+            'account_id': caller_account,
+            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime()),
+            'scan_duration_seconds': round(elapsed_time, 2),
+            'services_scanned': max((len(s.plan['service_list']) for s in planned), default=0),
+            'regions_scanned': max((len(s.plan['region_list']) for s in planned), default=0),
+            'accounts_scanned': len(planned),
+            'accounts_failed': {scan.id: scan.error for scan in scans.values() if scan.error},
+            'tasks_pruned': sum(s.plan['tasks_pruned'] for s in planned),
+            'throttles': throttles,
+            'resource_count': len(all_resources)
+        },
+        'resources': all_resources
+    }
@@ -0,0 +1,345 @@
+"""
+Process-pool collection: shard the task list across CPU cores.
+
+botocore spends most of a large scan parsing responses and building dicts,
+which holds the GIL. Sharding (service, region) tasks across processes, each
+with its own session, client cache and thread pool, lets that work use
+every core. Results stream back to the parent over a pipe.
+"""
+
+import time
+import zlib
+import pickle
+import datetime
+import threading
+import multiprocessing
+import multiprocessing.connection
+import concurrent.futures
+from typing import List, Dict, Any, Optional, Callable
+
+import boto3
+import botocore.session
+from botocore.credentials import CredentialProvider, CredentialResolver, RefreshableCredentials
+
+from aws_inventory.clients import ClientFactory
+from aws_inventory.ratelimit import RateLimiter
+from aws_inventory.scheduling import TaskHistory
+from aws_inventory.apistats import ApiStats
+from aws_inventory.tracing import Tracer
+from aws_inventory.records import compact_records
+from aws_inventory.tagging import TagIndex
+from aws_inventory.context import ScanContext
+from aws_inventory.collector import (
+    plan_scan,
+    order_tasks,
+    collect_service_resources,
+    collect_s3_with_region_filter,
+    _start_progress,
+    _record_completion,
+    _print_timing_summary,
+    _build_result,
+)
+
+
+# How long a worker trusts credentials it got from the parent. Just above
+# botocore's 15 minute advisory refresh window, so workers ask the parent for
+# its (self-refreshing) credentials about once a minute and never run on SSO
+# or assumed-role keys the parent has replaced.
+CREDENTIAL_READ_TTL = datetime.timedelta(minutes=16)
+
+
+class _ParentCredentialProvider(CredentialProvider):
+    """Credential provider returning a worker's credentials refreshed from the parent."""
+
+    METHOD = 'awsmap-parent'
+
+    def __init__(self, credentials: RefreshableCredentials):
+        self.credentials = credentials
+
+    def load(self) -> RefreshableCredentials:
+        return self.credentials
+
+
+def _credential_metadata(credentials) -> Dict[str, Optional[str]]:
+    """Read the parent's current credentials in RefreshableCredentials metadata format."""
+    frozen = credentials.get_frozen_credentials()
+    expiry = datetime.datetime.now(datetime.timezone.utc) + CREDENTIAL_READ_TTL
+    return {
+        'access_key': frozen.access_key,
+        'secret_key': frozen.secret_key,
+        'token': frozen.token,
+        'expiry_time': expiry.isoformat(),
+    }
+
+
+def _worker_session(conn, conn_lock: threading.Lock, credentials: Dict[str, Any]) -> boto3.Session:
+    """
+    Create a worker's session from the credentials the parent sent.
+
+    Refreshable credentials (SSO, assumed roles) are re-read from the parent
+    over conn before they go stale, so long scans outlive the first token.
+
+    Args:
+        conn: The worker's end of the pipe
+        conn_lock: Lock serializing use of conn between threads
+        credentials: Dict with metadata, refreshable and region_name
+
+    Returns:
+        boto3.Session
+    """
+    metadata = credentials['metadata']
+    if not credentials['refreshable']:
+        return boto3.Session(
+            aws_access_key_id=metadata['access_key'],
+            aws_secret_access_key=metadata['secret_key'],
+            aws_session_token=metadata['token'],
+            region_name=credentials['region_name'],
+        )
+
+    def refresh() -> Dict[str, Optional[str]]:
+        with conn_lock:
+            conn.send_bytes(_encode(('credentials',)))
+            return _decode(conn.recv_bytes())
+
+    refreshable = RefreshableCredentials.create_from_metadata(
+        metadata=metadata,
+        refresh_using=refresh,
+        method=_ParentCredentialProvider.METHOD
+    )
+    botocore_session = botocore.session.get_session()
+    botocore_session.register_component(
+        'credential_provider', CredentialResolver([_ParentCredentialProvider(refreshable)])
+    )
+    if credentials['region_name']:
+        botocore_session.set_config_variable('region', credentials['region_name'])
+    return boto3.Session(botocore_session=botocore_session)
+
+
+def _encode(message: Any) -> bytes:
+    """Serialize a message for the pipe (pickle keeps datetimes, zlib shrinks it)."""
+    return zlib.compress(pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL), 1)
+
+
+def _decode(payload: bytes) -> Any:
+    return pickle.loads(zlib.decompress(payload))
+
+
+def _merge_counts(total: Dict[str, Any], part: Dict[str, Any]) -> None:
+    """Add numeric values (and nested per-service counts) of part into total."""
+    for key, value in part.items():
+        if isinstance(value, dict):
+            _merge_counts(total.setdefault(key, {}), value)
+        elif isinstance(value, (int, float)):
+            total[key] = total.get(key, 0) + value
+
+
+def _shard_worker(
+    conn,
+    credentials: Dict[str, Any],
+    tasks: List[tuple],
+    account_id: str,
+    filter_regions: Optional[List[str]],
+    max_workers: int,
+    rate_share: Optional[float],
+    record_api_stats: bool = False,
+    trace_name: Optional[str] = None,
+    bulk_tags: bool = False,
+    scan_context: Optional[ScanContext] = None
+) -> None:
+    """
+    Collect one shard of tasks in a child process.
+
+    Sends ('result', service, region, resources, elapsed) per task, then
+    ('done', client_stats, limiter_stats, api_stats_raw, trace). With
+    refreshable credentials it also sends ('credentials',) and reads the
+    parent's fresh credential metadata back. Every message is sent with
+    _encode(). trace_name turns on span recording, labelling this process
+    in the trace. scan_context is the parent's ScanContext, attached so the
+    worker doesn't resolve it again.
+    """
+    conn_lock = threading.Lock()
+    try:
+        session = _worker_session(conn, conn_lock, credentials)
+        if scan_context is not None:
+            scan_context.attach(session)
+        limiter = RateLimiter(max_concurrency=max_workers, share=rate_share) if rate_share else None
+        api_stats = ApiStats() if record_api_stats else None
+        tracer = Tracer(trace_name) if trace_name else None
+        clients = ClientFactory(session, max_pool_connections=max_workers, limiter=limiter,
+                                hooks=[hook for hook in (api_stats, tracer) if hook is not None])
+        if bulk_tags:
+            clients.tag_index = TagIndex(clients)
+
+        def run(service: str, region: Optional[str]) -> tuple:
+            if service == 's3':
+                return collect_s3_with_region_filter(clients, account_id, filter_regions)
+            return collect_service_resources(clients, service, region, account_id)
+
+        def run_traced(service: str, region: Optional[str]) -> tuple:
+            with tracer.task_span(f"{service} {region or 'global'}", service=service, region=region or 'global'):
+                return run(service, region)
+
+        def run_timed(service: str, region: Optional[str]) -> tuple:
+            # A failed task still took its time; TaskHistory (--lpt) needs it
+            start = time.time()
+            try:
+                return (run if tracer is None else run_traced)(service, region)
+            except Exception:
+                return [], time.time() - start
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures_map = {}
+            for service, region in tasks:
+                future = executor.submit(run_timed, service, region)
+                futures_map[future] = (service, region)
+
+            for future in concurrent.futures.as_completed(futures_map):
+                service, region = futures_map[future]
+                resources, elapsed = future.result()
+                with conn_lock:
+                    conn.send_bytes(_encode(('result', service, region, resources, elapsed)))
+
+        clients.close()
+        with conn_lock:
+            conn.send_bytes(_encode((
+                'done', clients.stats(), limiter.stats() if limiter else None,
+                api_stats.raw() if api_stats else None,
+                tracer.export() if tracer else None
+            )))
+    finally:
+        conn.close()
+
+
+def collect_all_sharded(
+    session,
+    services: Optional[List[str]] = None,
+    regions: Optional[List[str]] = None,
+    max_workers: int = 20,
+    processes: int = 2,
+    progress_callback: Optional[Callable[[str, str], None]] = None,
+    show_timings: bool = False,
+    include_global: bool = False,
+    history: Optional[TaskHistory] = None,
+    estimate_callback: Optional[Callable[[float], None]] = None,
+    rate_limit: bool = True,
+    api_stats: Optional[ApiStats] = None,
+    tracer: Optional[Tracer] = None,
+    compact: bool = False,
+    bulk_tags: bool = False
+) -> Dict[str, Any]:
+    """
+    Collect resources from all specified services and regions across processes.
+
+    Tasks are planned and ordered in the parent, then dealt round-robin to
+    the worker processes (so longest-first ordering stays balanced). Each
+    process runs max_workers / processes threads.
+
+    Args:
+        session: boto3.Session to use (its credentials are passed to workers)
+        services: List of service names to collect (None for all)
+        regions: List of regions to collect from (None for all enabled)
+        max_workers: Total parallel workers across all processes
+        processes: Number of worker processes
+        progress_callback: Optional callback(service_name, status) for progress updates
+        show_timings: If True, print service timing summary at the end
+        include_global: If True, include global services even when filtering by non-global regions
+        history: Optional TaskHistory for longest-first ordering
+        estimate_callback: Optional callback(seconds) with the estimated scan duration
+        rate_limit: If True, rate limit each process with an equal share of the budget
+        api_stats: Optional ApiStats; each process records its own and they are merged here
+        tracer: Optional Tracer; spans recorded in each process are merged into it
+        compact: If True, store compact Resource records instead of dicts
+            (converted here, so the pipe still carries plain dicts)
+        bulk_tags: If True, each process resolves tags from its own Resource
+            Groups Tagging API sweep per region of its tasks
+
+    Returns:
+        Dict with metadata and resources list
+    """
+    start_time = time.time()
+
+    plan = plan_scan(session, services, regions, include_global)
+    tasks = order_tasks(plan['tasks'], max_workers, history, estimate_callback)
+    _start_progress(plan, progress_callback)
+
+    processes = max(1, min(processes, len(tasks)))
+    threads = max(1, max_workers // processes)
+    shards = [tasks[i::processes] for i in range(processes)]
+
+    # Resolve credentials here, so profiles/SSO/MFA aren't re-resolved per
+    # process; workers ask again over their pipe when they're refreshable
+    resolved = session.get_credentials()
+    if resolved is None:
+        raise ValueError("No AWS credentials found")
+    credentials = {
+        'metadata': _credential_metadata(resolved),
+        'refreshable': isinstance(resolved, RefreshableCredentials),
+        'region_name': session.region_name,
+    }
+
+    # spawn: forking a process that already runs threads isn't safe
+    ctx = multiprocessing.get_context('spawn')
+    workers = {}
+    for index, shard in enumerate(shards):
+        parent_conn, child_conn = ctx.Pipe()
+        proc = ctx.Process(
+            target=_shard_worker,
+            args=(child_conn, credentials, shard, plan['account_id'], plan['filter_regions'],
+                  threads, 1.0 / processes if rate_limit else None, api_stats is not None,
+                  f"awsmap shard {index}" if tracer is not None else None, bulk_tags,
+                  getattr(session, 'scan_context', None)),
+            daemon=True
+        )
+        proc.start()
+        child_conn.close()
+        workers[parent_conn] = (proc, set(shard))
+
+    all_resources = []
+    pool_size = 0
+    client_stats: Dict[str, Any] = {}
+    limiter_stats: Optional[Dict[str, Any]] = {} if rate_limit else None
+
+    while workers:
+        for conn in multiprocessing.connection.wait(list(workers)):
+            proc, pending = workers[conn]
+            try:
+                message = _decode(conn.recv_bytes())
+            except (EOFError, OSError):
+                # Worker died - count its unfinished tasks as empty
+                for service, region in pending:
+                    _record_completion(service, [], 0.0, progress_callback)
+                del workers[conn]
+                proc.join()
+                continue
+
+            if message[0] == 'credentials':
+                conn.send_bytes(_encode(_credential_metadata(resolved)))
+            elif message[0] == 'result':
+                _, service, region, resources, elapsed = message
+                pending.discard((service, region))
+                all_resources.extend(compact_records(resources) if compact else resources)
+                _record_completion(service, resources, elapsed, progress_callback)
+                if history is not None:
+                    history.record(service, region, elapsed)
+            else:
+                _, shard_client_stats, shard_limiter_stats, shard_api_stats, shard_trace = message
+                pool_size = shard_client_stats['pool_size']
+                _merge_counts(client_stats, shard_client_stats)
+                if limiter_stats is not None and shard_limiter_stats:
+                    _merge_counts(limiter_stats, shard_limiter_stats)
+                if api_stats is not None and shard_api_stats:
+                    api_stats.merge(shard_api_stats)
+                if tracer is not None and shard_trace:
+                    tracer.merge(shard_trace)
+
+    if history is not None:
+        history.save()
+    elapsed_time = time.time() - start_time
+
+    if show_timings:
+        # Pools aren't shared between processes, so report the per-process size
+        client_stats['pool_size'] = pool_size
+        _print_timing_summary(elapsed_time, len(all_resources), client_stats, limiter_stats)
+
+    throttles = limiter_stats.get('throttles', {}) if limiter_stats else {}
+    return _build_result(plan, all_resources, elapsed_time, throttles)
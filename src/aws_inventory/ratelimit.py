@@ -0,0 +1,338 @@
+"""
+Client-side rate limiting with adaptive (AIMD) concurrency.
+"""
+
+import time
+import asyncio
+import threading
+from typing import Dict, Any, Optional, Tuple, Callable
+
+from aws_inventory.cancellation import TaskCancelled
+
+
+# Requests per second per (service, region), for control-plane APIs with low
+# account-level limits. Keys are boto3 service names.
+SERVICE_RATE_LIMITS = {
+    'iam': 10.0,
+    'organizations': 5.0,
+    'route53': 5.0,
+    'route53domains': 5.0,
+    'cloudfront': 10.0,
+    'sso-admin': 10.0,
+    'budgets': 5.0,
+    'ce': 5.0,
+    'health': 10.0,
+    'shield': 5.0,
+    'globalaccelerator': 5.0,
+    'networkmanager': 5.0,
+}
+DEFAULT_RATE_LIMIT = 50.0
+
+# Starting concurrency for the services above (others start at the worker count)
+CONTROL_PLANE_CONCURRENCY = 4
+
+# Multiplicative decrease applied to the concurrency limit on throttling
+BACKOFF_FACTOR = 0.5
+
+# How often an aiobotocore call waiting for a concurrency slot checks again
+ASYNC_SLOT_POLL_SECONDS = 0.01
+
+# How often a call waiting for a concurrency slot checks for cancellation
+SLOT_POLL_SECONDS = 0.5
+
+# Longest a call waits for a concurrency slot before going ahead without one,
+# so a slot that was never released can't stall a scan
+SLOT_WAIT_TIMEOUT = 120.0
+
+# Error codes botocore's standard retry mode treats as throttling
+THROTTLE_ERROR_CODES = {
+    'Throttling',
+    'ThrottlingException',
+    'ThrottledException',
+    'RequestThrottledException',
+    'TooManyRequestsException',
+    'ProvisionedThroughputExceededException',
+    'TransactionInProgressException',
+    'RequestLimitExceeded',
+    'BandwidthLimitExceeded',
+    'LimitExceededException',
+    'RequestThrottled',
+    'SlowDown',
+    'PriorRequestNotComplete',
+    'EC2ThrottledException',
+}
+
+
+def is_throttle_response(response: Optional[tuple]) -> bool:
+    """
+    Check whether a botocore (http_response, parsed) tuple is a throttle.
+
+    Args:
+        response: (http_response, parsed_response) tuple or None
+
+    Returns:
+        True if the response carries a throttling error code
+    """
+    if not response:
+        return False
+    parsed = response[1] or {}
+    return parsed.get('Error', {}).get('Code') in THROTTLE_ERROR_CODES
+
+
+class TokenBucket:
+    """Classic token bucket: `rate` tokens per second, up to `burst` stored."""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take one token without waiting for it.
+
+        Returns:
+            Seconds the caller must wait before using the token
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Reserve the token now; a negative balance is the queue ahead of us
+            self.tokens -= 1
+            return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping until one is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class AdaptiveConcurrency:
+    """
+    Concurrency limit adjusted with AIMD.
+
+    Each success grows the limit by about one slot per full window
+    (additive increase); each throttle multiplies it by BACKOFF_FACTOR.
+    """
+
+    def __init__(self, initial: int, maximum: int):
+        self.maximum = max(1, maximum)
+        self.limit = float(max(1, min(initial, self.maximum)))
+        self.in_flight = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, timeout: Optional[float] = None, cancelled: Optional[Callable[[], bool]] = None) -> bool:
+        """
+        Take a slot, waiting until one is free.
+
+        Args:
+            timeout: Seconds to wait at most (None waits indefinitely)
+            cancelled: Checked while waiting; the wait ends when it returns True
+
+        Returns:
+            True if a slot was taken, False on timeout or cancellation
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                if cancelled is not None and cancelled():
+                    return False
+                wait = SLOT_POLL_SECONDS if cancelled is not None else None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    wait = min(wait, remaining) if wait is not None else remaining
+                self._cond.wait(wait)
+            self.in_flight += 1
+            return True
+
+    def try_acquire(self) -> bool:
+        """Take a slot if one is free, without waiting."""
+        with self._cond:
+            if self.in_flight >= int(self.limit):
+                return False
+            self.in_flight += 1
+            return True
+
+    def release(self) -> None:
+        with self._cond:
+            self.in_flight = max(0, self.in_flight - 1)
+            self._cond.notify()
+
+    def on_success(self) -> None:
+        with self._cond:
+            if self.limit < self.maximum:
+                self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+                self._cond.notify()
+
+    def on_throttle(self) -> None:
+        with self._cond:
+            self.limit = max(1.0, self.limit * BACKOFF_FACTOR)
+
+
+class RateLimiter:
+    """
+    Per-(service, region) token buckets and AIMD concurrency for a scan.
+
+    Attaches to botocore clients through their event system, so every
+    collector is covered without code changes (register_async() does the
+    same for aiobotocore clients, waiting without blocking the event loop):
+
+    - before-call: wait for a concurrency slot
+    - before-send: wait for a token (once per HTTP attempt, retries included)
+    - needs-retry: count throttles and back off
+    - after-call / after-call-error: release the slot
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        rates: Optional[Dict[str, float]] = None,
+        share: float = 1.0,
+        cancelled: Optional[Callable[[], bool]] = None
+    ):
+        """
+        Args:
+            max_concurrency: Upper bound for any (service, region) concurrency limit
+            rates: Requests per second by service (defaults to SERVICE_RATE_LIMITS)
+            share: Fraction of each rate this limiter may use, when several
+                processes split one account's budget
+            cancelled: Optional check for the calling thread's task being
+                cancelled (CancellationScope.is_cancelled); a cancelled call
+                waiting for a slot raises TaskCancelled
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.cancelled = cancelled
+        self.rates = SERVICE_RATE_LIMITS if rates is None else rates
+        self.share = share
+        self._lock = threading.Lock()
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._concurrency: Dict[Tuple[str, str], AdaptiveConcurrency] = {}
+        self.throttles: Dict[str, int] = {}
+        self.throttle_failures: Dict[str, int] = {}
+        self.wait_time = 0.0
+
+    def _get(self, service: str, region: str) -> Tuple[TokenBucket, AdaptiveConcurrency]:
+        key = (service, region)
+        with self._lock:
+            if key not in self._buckets:
+                rate = self.rates.get(service, DEFAULT_RATE_LIMIT) * self.share
+                initial = CONTROL_PLANE_CONCURRENCY if service in self.rates else self.max_concurrency
+                self._buckets[key] = TokenBucket(rate)
+                self._concurrency[key] = AdaptiveConcurrency(initial, self.max_concurrency)
+            return self._buckets[key], self._concurrency[key]
+
+    def _count(self, counter: Dict[str, int], service: str) -> None:
+        with self._lock:
+            counter[service] = counter.get(service, 0) + 1
+
+    def _add_wait(self, seconds: float) -> None:
+        if seconds > 0:
+            with self._lock:
+                self.wait_time += seconds
+
+    def register(self, client, service_name: str) -> None:
+        """
+        Attach rate limiting hooks to a botocore client.
+
+        Args:
+            client: botocore client
+            service_name: boto3 service name the client was created for
+        """
+        bucket, concurrency = self._get(service_name, client.meta.region_name or 'global')
+
+        def before_call(context, **kwargs):
+            start = time.monotonic()
+            acquired = concurrency.acquire(timeout=SLOT_WAIT_TIMEOUT, cancelled=self.cancelled)
+            self._add_wait(time.monotonic() - start)
+            if acquired:
+                context['awsmap_slot'] = True
+            elif self.cancelled is not None and self.cancelled():
+                raise TaskCancelled()
+
+        def before_send(**kwargs):
+            self._add_wait(bucket.acquire())
+
+        self._register_handlers(client, service_name, concurrency, before_call, before_send)
+
+    def register_async(self, client, service_name: str) -> None:
+        """
+        Attach rate limiting hooks to an aiobotocore client.
+
+        Shares the (service, region) budget with the botocore clients of the
+        same scan.
+
+        Args:
+            client: aiobotocore client
+            service_name: boto3 service name the client was created for
+        """
+        bucket, concurrency = self._get(service_name, client.meta.region_name or 'global')
+
+        async def before_call(context, **kwargs):
+            start = time.monotonic()
+            while not concurrency.try_acquire():
+                await asyncio.sleep(ASYNC_SLOT_POLL_SECONDS)
+            context['awsmap_slot'] = True
+            self._add_wait(time.monotonic() - start)
+
+        async def before_send(**kwargs):
+            wait = bucket.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._add_wait(wait)
+
+        self._register_handlers(client, service_name, concurrency, before_call, before_send)
+
+    def _register_handlers(self, client, service_name: str, concurrency: AdaptiveConcurrency,
+                           before_call: Any, before_send: Any) -> None:
+        """Register the slot/token waits and the shared throttle and release hooks."""
+        def needs_retry(response=None, **kwargs):
+            if is_throttle_response(response):
+                self._count(self.throttles, service_name)
+                concurrency.on_throttle()
+
+        def after_call(context, parsed=None, **kwargs):
+            if context.pop('awsmap_slot', False):
+                concurrency.release()
+            error_code = (parsed or {}).get('Error', {}).get('Code')
+            if error_code in THROTTLE_ERROR_CODES:
+                # Retries exhausted; the collector will see an empty result
+                self._count(self.throttle_failures, service_name)
+            elif not error_code:
+                concurrency.on_success()
+
+        def after_call_error(context, **kwargs):
+            if context.pop('awsmap_slot', False):
+                concurrency.release()
+
+        events = client.meta.events
+        events.register('before-call', before_call)
+        events.register('before-send', before_send)
+        events.register('needs-retry', needs_retry)
+        events.register('after-call', after_call)
+        events.register('after-call-error', after_call_error)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get throttling statistics.
+
+        Returns:
+            Dict with per-service throttles and throttle_failures, and total wait_seconds
+        """
+        with self._lock:
+            return {
+                'throttles': dict(self.throttles),
+                'throttle_failures': dict(self.throttle_failures),
+                'wait_seconds': round(self.wait_time, 2),
+            }
@@ -0,0 +1,182 @@
+"""
+Compact resource records for large inventories.
+
+Collectors build plain dicts. A Resource holds the same fields in slots,
+with service, type, region and account strings (and tag keys) interned, so
+a million EC2 records share one 'ec2' and one 'us-east-1' instead of each
+carrying its own copy plus a per-record hash table. Resource implements
+the mapping protocol, so code written against dicts (r['id'], r.get('tags'),
+r['account_id'] = ...) keeps working.
+"""
+
+import sys
+from collections.abc import MutableMapping
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+
+
+# Standard resource fields, in the order collectors write them
+FIELDS = ('service', 'type', 'id', 'arn', 'name', 'region', 'details', 'tags', 'account_id')
+
+_INTERNED = frozenset(('service', 'type', 'region', 'account_id'))
+_SLOTS = frozenset(FIELDS)
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+class Resource(MutableMapping):
+    """
+    Slotted resource record with a dict compatibility view.
+
+    Fields outside FIELDS are kept in a small overflow dict, created only
+    when a collector uses one.
+    """
+
+    __slots__ = FIELDS + ('_extra',)
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            data: Resource dictionary to copy fields from
+        """
+        self._extra = None
+        if data:
+            for key, value in data.items():
+                self[key] = value
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Resource':
+        """Create a record from a collector's resource dict."""
+        return cls(data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get a plain dict copy (fields in collector order)."""
+        return dict(self.items())
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _SLOTS:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in _SLOTS:
+            if key in _INTERNED:
+                value = _intern(value)
+            elif key == 'tags' and value:
+                value = {_intern(k): v for k, v in value.items()}
+            setattr(self, key, value)
+            return
+        if self._extra is None:
+            self._extra = {}
+        self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in _SLOTS:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+            return
+        if self._extra is None:
+            raise KeyError(key)
+        del self._extra[key]
+
+    def __iter__(self) -> Iterator[str]:
+        for key in FIELDS:
+            if hasattr(self, key):
+                yield key
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key: object) -> bool:
+        if key in _SLOTS:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (Resource, dict)):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Resource({self.to_dict()!r})"
+
+    def __reduce__(self):
+        return (Resource, (self.to_dict(),))
+
+
+def compact_records(resources: Iterable[Dict[str, Any]]) -> List[Resource]:
+    """
+    Convert collector dicts to Resource records.
+
+    Args:
+        resources: Resource dictionaries (Resources are passed through)
+
+    Returns:
+        List of Resource records
+    """
+    return [r if isinstance(r, Resource) else Resource(r) for r in resources]
+
+
+def json_default(value: Any) -> Any:
+    """
+    json.dumps default= hook: Resources serialize as dicts, anything else as str.
+
+    Args:
+        value: Object json can't serialize natively
+
+    Returns:
+        JSON-serializable replacement
+    """
+    if isinstance(value, Resource):
+        return value.to_dict()
+    return str(value)
+
+
+def _deep_sizeof(obj: Any, seen: set) -> int:
+    """Size of obj and everything it references, counting shared objects once."""
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, Resource):
+        size += sum(_deep_sizeof(getattr(obj, key), seen) for key in FIELDS if hasattr(obj, key))
+        if obj._extra is not None:
+            size += _deep_sizeof(obj._extra, seen)
+    elif isinstance(obj, dict):
+        size += sum(_deep_sizeof(k, seen) + _deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_deep_sizeof(item, seen) for item in obj)
+    return size
+
+
+def memory_per_resource(resources: List[Dict[str, Any]], sample: int = 1000) -> float:
+    """
+    Measure the average memory held per resource record.
+
+    Walks an evenly spaced sample of records, including nested details and
+    tags. Objects shared between records (interned strings) count once, so
+    the figure reflects what the whole list really costs.
+
+    Args:
+        resources: Resource dicts or Resource records
+        sample: Maximum number of records to walk
+
+    Returns:
+        Average bytes per record (0.0 for an empty list)
+    """
+    if not resources:
+        return 0.0
+    step = max(1, len(resources) // sample)
+    picked = resources[::step][:sample]
+    seen: set = set()
+    return sum(_deep_sizeof(r, seen) for r in picked) / len(picked)
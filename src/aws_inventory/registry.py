@@ -0,0 +1,167 @@
+"""
+Static collector registry: service name to collector module and metadata.
+
+GENERATED by scripts/generate_registry.py - do not edit by hand.
+
+Each entry has:
+    module: Module name in aws_inventory.collectors
+    function: Collector function name
+    async_function: Async collector function name, or None
+    subresources: Resource types scheduled as separate tasks, to function name
+"""
+
+from typing import Dict, Any
+
+
+COLLECTORS: Dict[str, Dict[str, Any]] = {
+    'accessanalyzer': {'module': 'accessanalyzer', 'function': 'collect_accessanalyzer_resources', 'async_function': None, 'subresources': {}},
+    'acm': {'module': 'acm', 'function': 'collect_acm_resources', 'async_function': None, 'subresources': {}},
+    'acm-pca': {'module': 'acm_pca', 'function': 'collect_acm_pca_resources', 'async_function': None, 'subresources': {}},
+    'amp': {'module': 'amp', 'function': 'collect_amp_resources', 'async_function': None, 'subresources': {}},
+    'amplify': {'module': 'amplify', 'function': 'collect_amplify_resources', 'async_function': None, 'subresources': {}},
+    'apigateway': {'module': 'apigateway', 'function': 'collect_apigateway_resources', 'async_function': None, 'subresources': {}},
+    'apigatewayv2': {'module': 'apigatewayv2', 'function': 'collect_apigatewayv2_resources', 'async_function': None, 'subresources': {}},
+    'appconfig': {'module': 'appconfig', 'function': 'collect_appconfig_resources', 'async_function': None, 'subresources': {}},
+    'appflow': {'module': 'appflow', 'function': 'collect_appflow_resources', 'async_function': None, 'subresources': {}},
+    'application-autoscaling': {'module': 'applicationautoscaling', 'function': 'collect_applicationautoscaling_resources', 'async_function': None, 'subresources': {}},
+    'apprunner': {'module': 'apprunner', 'function': 'collect_apprunner_resources', 'async_function': None, 'subresources': {}},
+    'appsync': {'module': 'appsync', 'function': 'collect_appsync_resources', 'async_function': None, 'subresources': {}},
+    'athena': {'module': 'athena', 'function': 'collect_athena_resources', 'async_function': None, 'subresources': {}},
+    'auditmanager': {'module': 'auditmanager', 'function': 'collect_auditmanager_resources', 'async_function': None, 'subresources': {}},
+    'autoscaling': {'module': 'autoscaling', 'function': 'collect_autoscaling_resources', 'async_function': None, 'subresources': {}},
+    'backup': {'module': 'backup', 'function': 'collect_backup_resources', 'async_function': None, 'subresources': {'vault': '_collect_vaults', 'plan': '_collect_plans', 'framework': '_collect_frameworks', 'report-plan': '_collect_report_plans', 'restore-testing-plan': '_collect_restore_testing_plans'}},
+    'batch': {'module': 'batch', 'function': 'collect_batch_resources', 'async_function': None, 'subresources': {}},
+    'bedrock': {'module': 'bedrock', 'function': 'collect_bedrock_resources', 'async_function': None, 'subresources': {}},
+    'budgets': {'module': 'budgets', 'function': 'collect_budgets_resources', 'async_function': None, 'subresources': {}},
+    'ce': {'module': 'ce', 'function': 'collect_ce_resources', 'async_function': None, 'subresources': {}},
+    'cleanrooms': {'module': 'cleanrooms', 'function': 'collect_cleanrooms_resources', 'async_function': None, 'subresources': {}},
+    'cloudformation': {'module': 'cloudformation', 'function': 'collect_cloudformation_resources', 'async_function': None, 'subresources': {}},
+    'cloudfront': {'module': 'cloudfront', 'function': 'collect_cloudfront_resources', 'async_function': None, 'subresources': {}},
+    'cloudhsmv2': {'module': 'cloudhsmv2', 'function': 'collect_cloudhsmv2_resources', 'async_function': None, 'subresources': {}},
+    'cloudtrail': {'module': 'cloudtrail', 'function': 'collect_cloudtrail_resources', 'async_function': None, 'subresources': {}},
+    'cloudwatch': {'module': 'cloudwatch', 'function': 'collect_cloudwatch_resources', 'async_function': None, 'subresources': {}},
+    'codeartifact': {'module': 'codeartifact', 'function': 'collect_codeartifact_resources', 'async_function': None, 'subresources': {}},
+    'codebuild': {'module': 'codebuild', 'function': 'collect_codebuild_resources', 'async_function': None, 'subresources': {}},
+    'codedeploy': {'module': 'codedeploy', 'function': 'collect_codedeploy_resources', 'async_function': None, 'subresources': {}},
+    'codepipeline': {'module': 'codepipeline', 'function': 'collect_codepipeline_resources', 'async_function': None, 'subresources': {}},
+    'cognito': {'module': 'cognito', 'function': 'collect_cognito_resources', 'async_function': None, 'subresources': {}},
+    'comprehend': {'module': 'comprehend', 'function': 'collect_comprehend_resources', 'async_function': None, 'subresources': {}},
+    'compute-optimizer': {'module': 'computeoptimizer', 'function': 'collect_computeoptimizer_resources', 'async_function': None, 'subresources': {}},
+    'config': {'module': 'config', 'function': 'collect_config_resources', 'async_function': None, 'subresources': {}},
+    'connect': {'module': 'connect', 'function': 'collect_connect_resources', 'async_function': None, 'subresources': {}},
+    'datasync': {'module': 'datasync', 'function': 'collect_datasync_resources', 'async_function': None, 'subresources': {}},
+    'datazone': {'module': 'datazone', 'function': 'collect_datazone_resources', 'async_function': None, 'subresources': {}},
+    'dax': {'module': 'dax', 'function': 'collect_dax_resources', 'async_function': None, 'subresources': {}},
+    'detective': {'module': 'detective', 'function': 'collect_detective_resources', 'async_function': None, 'subresources': {}},
+    'devicefarm': {'module': 'devicefarm', 'function': 'collect_devicefarm_resources', 'async_function': None, 'subresources': {}},
+    'directconnect': {'module': 'directconnect', 'function': 'collect_directconnect_resources', 'async_function': None, 'subresources': {}},
+    'dlm': {'module': 'dlm', 'function': 'collect_dlm_resources', 'async_function': None, 'subresources': {}},
+    'dms': {'module': 'dms', 'function': 'collect_dms_resources', 'async_function': None, 'subresources': {}},
+    'docdb': {'module': 'docdb', 'function': 'collect_docdb_resources', 'async_function': None, 'subresources': {}},
+    'ds': {'module': 'ds', 'function': 'collect_ds_resources', 'async_function': None, 'subresources': {}},
+    'dsql': {'module': 'dsql', 'function': 'collect_dsql_resources', 'async_function': None, 'subresources': {}},
+    'dynamodb': {'module': 'dynamodb', 'function': 'collect_dynamodb_resources', 'async_function': None, 'subresources': {}},
+    'ec2': {'module': 'ec2', 'function': 'collect_ec2_resources', 'async_function': None, 'subresources': {'instance': '_collect_instances', 'volume': '_collect_volumes', 'snapshot': '_collect_snapshots', 'ami': '_collect_amis', 'security-group': '_collect_security_groups', 'key-pair': '_collect_key_pairs', 'elastic-ip': '_collect_elastic_ips', 'network-interface': '_collect_network_interfaces', 'placement-group': '_collect_placement_groups'}},
+    'ecr': {'module': 'ecr', 'function': 'collect_ecr_resources', 'async_function': None, 'subresources': {}},
+    'ecr-public': {'module': 'ecr_public', 'function': 'collect_ecr_public_resources', 'async_function': None, 'subresources': {}},
+    'ecs': {'module': 'ecs', 'function': 'collect_ecs_resources', 'async_function': None, 'subresources': {}},
+    'efs': {'module': 'efs', 'function': 'collect_efs_resources', 'async_function': None, 'subresources': {}},
+    'eks': {'module': 'eks', 'function': 'collect_eks_resources', 'async_function': None, 'subresources': {}},
+    'elasticache': {'module': 'elasticache', 'function': 'collect_elasticache_resources', 'async_function': None, 'subresources': {}},
+    'elasticbeanstalk': {'module': 'elasticbeanstalk', 'function': 'collect_elasticbeanstalk_resources', 'async_function': None, 'subresources': {}},
+    'elb': {'module': 'elb', 'function': 'collect_elb_resources', 'async_function': None, 'subresources': {}},
+    'elbv2': {'module': 'elbv2', 'function': 'collect_elbv2_resources', 'async_function': None, 'subresources': {}},
+    'emr': {'module': 'emr', 'function': 'collect_emr_resources', 'async_function': None, 'subresources': {}},
+    'emr-serverless': {'module': 'emrserverless', 'function': 'collect_emrserverless_resources', 'async_function': None, 'subresources': {}},
+    'eventbridge-pipes': {'module': 'pipes', 'function': 'collect_pipes_resources', 'async_function': None, 'subresources': {}},
+    'eventbridge-scheduler': {'module': 'scheduler', 'function': 'collect_scheduler_resources', 'async_function': None, 'subresources': {}},
+    'events': {'module': 'events', 'function': 'collect_events_resources', 'async_function': None, 'subresources': {}},
+    'firehose': {'module': 'firehose', 'function': 'collect_firehose_resources', 'async_function': None, 'subresources': {}},
+    'fis': {'module': 'fis', 'function': 'collect_fis_resources', 'async_function': None, 'subresources': {}},
+    'fms': {'module': 'fms', 'function': 'collect_fms_resources', 'async_function': None, 'subresources': {}},
+    'frauddetector': {'module': 'frauddetector', 'function': 'collect_frauddetector_resources', 'async_function': None, 'subresources': {}},
+    'fsx': {'module': 'fsx', 'function': 'collect_fsx_resources', 'async_function': None, 'subresources': {}},
+    'gamelift': {'module': 'gamelift', 'function': 'collect_gamelift_resources', 'async_function': None, 'subresources': {}},
+    'globalaccelerator': {'module': 'globalaccelerator', 'function': 'collect_globalaccelerator_resources', 'async_function': None, 'subresources': {}},
+    'glue': {'module': 'glue', 'function': 'collect_glue_resources', 'async_function': None, 'subresources': {}},
+    'grafana': {'module': 'grafana', 'function': 'collect_grafana_resources', 'async_function': None, 'subresources': {}},
+    'guardduty': {'module': 'guardduty', 'function': 'collect_guardduty_resources', 'async_function': None, 'subresources': {}},
+    'health': {'module': 'health', 'function': 'collect_health_resources', 'async_function': None, 'subresources': {}},
+    'iam': {'module': 'iam', 'function': 'collect_iam_resources', 'async_function': None, 'subresources': {}},
+    'imagebuilder': {'module': 'imagebuilder', 'function': 'collect_imagebuilder_resources', 'async_function': None, 'subresources': {}},
+    'inspector2': {'module': 'inspector2', 'function': 'collect_inspector2_resources', 'async_function': None, 'subresources': {}},
+    'iot': {'module': 'iot', 'function': 'collect_iot_resources', 'async_function': None, 'subresources': {'thing': '_collect_things', 'thing-type': '_collect_thing_types', 'thing-group': '_collect_thing_groups', 'policy': '_collect_policies', 'certificate': '_collect_certificates'}},
+    'iotsitewise': {'module': 'iotsitewise', 'function': 'collect_iotsitewise_resources', 'async_function': None, 'subresources': {}},
+    'ivs': {'module': 'ivs', 'function': 'collect_ivs_resources', 'async_function': None, 'subresources': {}},
+    'kafka': {'module': 'kafka', 'function': 'collect_kafka_resources', 'async_function': None, 'subresources': {}},
+    'kendra': {'module': 'kendra', 'function': 'collect_kendra_resources', 'async_function': None, 'subresources': {}},
+    'keyspaces': {'module': 'keyspaces', 'function': 'collect_keyspaces_resources', 'async_function': None, 'subresources': {}},
+    'kinesis': {'module': 'kinesis', 'function': 'collect_kinesis_resources', 'async_function': None, 'subresources': {}},
+    'kms': {'module': 'kms', 'function': 'collect_kms_resources', 'async_function': None, 'subresources': {}},
+    'lakeformation': {'module': 'lakeformation', 'function': 'collect_lakeformation_resources', 'async_function': None, 'subresources': {}},
+    'lambda': {'module': 'lambda_', 'function': 'collect_lambda__resources', 'async_function': 'collect_lambda__resources_async', 'subresources': {}},
+    'lexv2': {'module': 'lexv2', 'function': 'collect_lexv2_resources', 'async_function': None, 'subresources': {}},
+    'lightsail': {'module': 'lightsail', 'function': 'collect_lightsail_resources', 'async_function': None, 'subresources': {}},
+    'location': {'module': 'location', 'function': 'collect_location_resources', 'async_function': None, 'subresources': {}},
+    'logs': {'module': 'logs', 'function': 'collect_logs_resources', 'async_function': None, 'subresources': {}},
+    'macie2': {'module': 'macie2', 'function': 'collect_macie2_resources', 'async_function': None, 'subresources': {}},
+    'mediaconnect': {'module': 'mediaconnect', 'function': 'collect_mediaconnect_resources', 'async_function': None, 'subresources': {}},
+    'mediaconvert': {'module': 'mediaconvert', 'function': 'collect_mediaconvert_resources', 'async_function': None, 'subresources': {}},
+    'medialive': {'module': 'medialive', 'function': 'collect_medialive_resources', 'async_function': None, 'subresources': {}},
+    'mediapackage': {'module': 'mediapackage', 'function': 'collect_mediapackage_resources', 'async_function': None, 'subresources': {}},
+    'mediastore': {'module': 'mediastore', 'function': 'collect_mediastore_resources', 'async_function': None, 'subresources': {}},
+    'mediatailor': {'module': 'mediatailor', 'function': 'collect_mediatailor_resources', 'async_function': None, 'subresources': {}},
+    'memorydb': {'module': 'memorydb', 'function': 'collect_memorydb_resources', 'async_function': None, 'subresources': {}},
+    'mq': {'module': 'mq', 'function': 'collect_mq_resources', 'async_function': None, 'subresources': {}},
+    'mwaa': {'module': 'mwaa', 'function': 'collect_mwaa_resources', 'async_function': None, 'subresources': {}},
+    'neptune': {'module': 'neptune', 'function': 'collect_neptune_resources', 'async_function': None, 'subresources': {}},
+    'network-firewall': {'module': 'network_firewall', 'function': 'collect_network_firewall_resources', 'async_function': None, 'subresources': {}},
+    'networkmanager': {'module': 'networkmanager', 'function': 'collect_networkmanager_resources', 'async_function': None, 'subresources': {}},
+    'opensearch': {'module': 'opensearch', 'function': 'collect_opensearch_resources', 'async_function': None, 'subresources': {}},
+    'opensearch-serverless': {'module': 'opensearchserverless', 'function': 'collect_opensearchserverless_resources', 'async_function': None, 'subresources': {}},
+    'organizations': {'module': 'organizations', 'function': 'collect_organizations_resources', 'async_function': None, 'subresources': {}},
+    'outposts': {'module': 'outposts', 'function': 'collect_outposts_resources', 'async_function': None, 'subresources': {}},
+    'personalize': {'module': 'personalize', 'function': 'collect_personalize_resources', 'async_function': None, 'subresources': {}},
+    'polly': {'module': 'polly', 'function': 'collect_polly_resources', 'async_function': None, 'subresources': {}},
+    'quicksight': {'module': 'quicksight', 'function': 'collect_quicksight_resources', 'async_function': None, 'subresources': {}},
+    'ram': {'module': 'ram', 'function': 'collect_ram_resources', 'async_function': None, 'subresources': {}},
+    'rds': {'module': 'rds', 'function': 'collect_rds_resources', 'async_function': None, 'subresources': {'db-instance': '_collect_db_instances', 'db-cluster': '_collect_db_clusters', 'db-snapshot': '_collect_db_snapshots', 'db-cluster-snapshot': '_collect_db_cluster_snapshots', 'db-subnet-group': '_collect_db_subnet_groups', 'db-parameter-group': '_collect_db_parameter_groups', 'option-group': '_collect_option_groups', 'db-proxy': '_collect_db_proxies'}},
+    'redshift': {'module': 'redshift', 'function': 'collect_redshift_resources', 'async_function': None, 'subresources': {}},
+    'redshift-serverless': {'module': 'redshiftserverless', 'function': 'collect_redshiftserverless_resources', 'async_function': None, 'subresources': {}},
+    'rekognition': {'module': 'rekognition', 'function': 'collect_rekognition_resources', 'async_function': None, 'subresources': {}},
+    'resiliencehub': {'module': 'resiliencehub', 'function': 'collect_resiliencehub_resources', 'async_function': None, 'subresources': {}},
+    'resource-explorer-2': {'module': 'resourceexplorer', 'function': 'collect_resourceexplorer_resources', 'async_function': None, 'subresources': {}},
+    'resource-groups': {'module': 'resourcegroups', 'function': 'collect_resourcegroups_resources', 'async_function': None, 'subresources': {}},
+    'route53': {'module': 'route53', 'function': 'collect_route53_resources', 'async_function': None, 'subresources': {}},
+    'route53domains': {'module': 'route53domains', 'function': 'collect_route53domains_resources', 'async_function': None, 'subresources': {}},
+    'route53resolver': {'module': 'route53resolver', 'function': 'collect_route53resolver_resources', 'async_function': None, 'subresources': {}},
+    's3': {'module': 's3', 'function': 'collect_s3_resources', 'async_function': None, 'subresources': {}},
+    'sagemaker': {'module': 'sagemaker', 'function': 'collect_sagemaker_resources', 'async_function': None, 'subresources': {'notebook-instance': '_collect_notebook_instances', 'endpoint': '_collect_endpoints', 'model': '_collect_models', 'domain': '_collect_domains', 'training-job': '_collect_training_jobs', 'feature-group': '_collect_feature_groups'}},
+    'schemas': {'module': 'schemas', 'function': 'collect_schemas_resources', 'async_function': None, 'subresources': {}},
+    'secretsmanager': {'module': 'secretsmanager', 'function': 'collect_secretsmanager_resources', 'async_function': None, 'subresources': {}},
+    'securityhub': {'module': 'securityhub', 'function': 'collect_securityhub_resources', 'async_function': None, 'subresources': {}},
+    'securitylake': {'module': 'securitylake', 'function': 'collect_securitylake_resources', 'async_function': None, 'subresources': {}},
+    'serverlessrepo': {'module': 'serverlessrepo', 'function': 'collect_serverlessrepo_resources', 'async_function': None, 'subresources': {}},
+    'service-quotas': {'module': 'servicequotas', 'function': 'collect_servicequotas_resources', 'async_function': None, 'subresources': {}},
+    'servicecatalog': {'module': 'servicecatalog', 'function': 'collect_servicecatalog_resources', 'async_function': None, 'subresources': {}},
+    'servicediscovery': {'module': 'servicediscovery', 'function': 'collect_servicediscovery_resources', 'async_function': None, 'subresources': {}},
+    'sesv2': {'module': 'sesv2', 'function': 'collect_sesv2_resources', 'async_function': None, 'subresources': {}},
+    'shield': {'module': 'shield', 'function': 'collect_shield_resources', 'async_function': None, 'subresources': {}},
+    'sns': {'module': 'sns', 'function': 'collect_sns_resources', 'async_function': None, 'subresources': {}},
+    'sqs': {'module': 'sqs', 'function': 'collect_sqs_resources', 'async_function': None, 'subresources': {}},
+    'ssm': {'module': 'ssm', 'function': 'collect_ssm_resources', 'async_function': None, 'subresources': {}},
+    'sso': {'module': 'sso', 'function': 'collect_sso_resources', 'async_function': None, 'subresources': {}},
+    'stepfunctions': {'module': 'stepfunctions', 'function': 'collect_stepfunctions_resources', 'async_function': None, 'subresources': {}},
+    'storagegateway': {'module': 'storagegateway', 'function': 'collect_storagegateway_resources', 'async_function': None, 'subresources': {}},
+    'synthetics': {'module': 'synthetics', 'function': 'collect_synthetics_resources', 'async_function': None, 'subresources': {}},
+    'textract': {'module': 'textract', 'function': 'collect_textract_resources', 'async_function': None, 'subresources': {}},
+    'timestream-influxdb': {'module': 'timestream_influxdb', 'function': 'collect_timestream_influxdb_resources', 'async_function': None, 'subresources': {}},
+    'transcribe': {'module': 'transcribe', 'function': 'collect_transcribe_resources', 'async_function': None, 'subresources': {}},
+    'transfer': {'module': 'transfer', 'function': 'collect_transfer_resources', 'async_function': None, 'subresources': {}},
+    'translate': {'module': 'translate', 'function': 'collect_translate_resources', 'async_function': None, 'subresources': {}},
+    'vpc': {'module': 'vpc', 'function': 'collect_vpc_resources', 'async_function': None, 'subresources': {'vpc': '_collect_vpcs', 'subnet': '_collect_subnets', 'route-table': '_collect_route_tables', 'internet-gateway': '_collect_internet_gateways', 'nat-gateway': '_collect_nat_gateways', 'vpc-endpoint': '_collect_vpc_endpoints', 'vpc-peering': '_collect_vpc_peerings', 'transit-gateway': '_collect_transit_gateways', 'transit-gateway-attachment': '_collect_transit_gateway_attachments', 'dhcp-options': '_collect_dhcp_options', 'network-acl': '_collect_network_acls'}},
+    'vpc-lattice': {'module': 'vpc_lattice', 'function': 'collect_vpc_lattice_resources', 'async_function': None, 'subresources': {}},
+    'wafv2': {'module': 'wafv2', 'function': 'collect_wafv2_resources', 'async_function': None, 'subresources': {}},
+    'workspaces': {'module': 'workspaces', 'function': 'collect_workspaces_resources', 'async_function': None, 'subresources': {}},
+    'xray': {'module': 'xray', 'function': 'collect_xray_resources', 'async_function': None, 'subresources': {}},
+}
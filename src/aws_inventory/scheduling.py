@@ -0,0 +1,136 @@
+"""
+History-driven task scheduling (longest processing time first).
+"""
+
+import os
+import json
+import heapq
+import threading
+from typing import List, Dict, Optional, Tuple
+
+
+DEFAULT_HISTORY_FILE = os.path.join(os.path.expanduser('~'), '.awsmap', 'task_history.json')
+
+# Expected duration for tasks never seen before (seconds)
+DEFAULT_TASK_SECONDS = 1.0
+
+# Weight of the newest measurement in the moving average
+SMOOTHING = 0.5
+
+
+def _task_key(service: str, region: Optional[str]) -> str:
+    return f"{service}:{region or 'global'}"
+
+
+class TaskHistory:
+    """
+    Per-(service, region) task durations from previous scans.
+
+    Stored as a small JSON file of exponentially smoothed durations, so a
+    single slow or fast run doesn't dominate the next schedule.
+    """
+
+    def __init__(self, path: str = DEFAULT_HISTORY_FILE):
+        """
+        Args:
+            path: JSON file to load from and save to
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self.durations: Dict[str, float] = {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self.durations = {k: float(v) for k, v in json.load(f).items()}
+        except (OSError, ValueError, AttributeError):
+            self.durations = {}
+
+    def expected(self, service: str, region: Optional[str]) -> float:
+        """
+        Get the expected duration of a task.
+
+        Falls back to the service's average in other regions, then to
+        DEFAULT_TASK_SECONDS.
+
+        Args:
+            service: Service name
+            region: Region (None for global tasks)
+
+        Returns:
+            Expected duration in seconds
+        """
+        key = _task_key(service, region)
+        if key in self.durations:
+            return self.durations[key]
+
+        prefix = f"{service}:"
+        same_service = [v for k, v in self.durations.items() if k.startswith(prefix)]
+        if same_service:
+            return sum(same_service) / len(same_service)
+        return DEFAULT_TASK_SECONDS
+
+    def record(self, service: str, region: Optional[str], elapsed: float) -> None:
+        """
+        Record a measured task duration.
+
+        Args:
+            service: Service name
+            region: Region (None for global tasks)
+            elapsed: Measured duration in seconds
+        """
+        key = _task_key(service, region)
+        with self._lock:
+            previous = self.durations.get(key)
+            if previous is None:
+                self.durations[key] = elapsed
+            else:
+                self.durations[key] = SMOOTHING * elapsed + (1 - SMOOTHING) * previous
+
+    def save(self) -> None:
+        """Write durations to disk (errors are ignored)."""
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with self._lock:
+                data = {k: round(v, 3) for k, v in sorted(self.durations.items())}
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=1)
+        except OSError:
+            pass
+
+
+def order_longest_first(
+    tasks: List[Tuple[str, Optional[str]]],
+    history: TaskHistory
+) -> List[Tuple[str, Optional[str]]]:
+    """
+    Sort (service, region) tasks by expected duration, longest first.
+
+    Args:
+        tasks: List of (service, region) tuples
+        history: TaskHistory with previous durations
+
+    Returns:
+        New list in submission order
+    """
+    return sorted(tasks, key=lambda t: history.expected(t[0], t[1]), reverse=True)
+
+
+def estimate_duration(durations: List[float], workers: int) -> float:
+    """
+    Estimate the wall time of running tasks in order on a worker pool.
+
+    Simulates greedy list scheduling: each task goes to the worker that
+    frees up first.
+
+    Args:
+        durations: Expected task durations, in submission order
+        workers: Number of parallel workers
+
+    Returns:
+        Estimated wall time in seconds
+    """
+    if not durations:
+        return 0.0
+    finish_times = [0.0] * max(1, min(workers, len(durations)))
+    for duration in durations:
+        heapq.heappush(finish_times, heapq.heappop(finish_times) + duration)
+    return max(finish_times)
@@ -0,0 +1,99 @@
+"""
+Inverted search index for HTML reports.
+
+Report search used to scan every row's name, ID and details text on each
+keystroke. The index maps each lowercase alphanumeric token of a resource's
+name, ID, ARN, tags and detail values to the report rows containing it, so
+the browser answers a query by finding each term as a substring of the
+joined token list and intersecting the matching tokens' postings. Terms the
+query joins with punctuation (an IP address, a hostname) are also checked
+together against the candidate rows' text.
+
+Encoding, chosen to stay small and cheap to parse: tokens are sorted and
+joined by spaces; each token's row list is delta-encoded in hex, comma
+separated, and the lists are joined by spaces in token order.
+"""
+
+import re
+import json
+import time
+from typing import Dict, Any, Iterable, Iterator, List, Tuple
+
+from aws_inventory.records import json_default
+
+
+_TOKEN = re.compile(r'[a-z0-9]+')
+
+
+def _texts(resource: Dict[str, Any]) -> Iterator[str]:
+    """Yield the searchable strings of a resource."""
+    for key in ('name', 'id', 'arn'):
+        if resource.get(key):
+            yield str(resource[key])
+    for k, v in (resource.get('tags') or {}).items():
+        yield str(k)
+        yield str(v)
+    for value in (resource.get('details') or {}).values():
+        if value is None:
+            continue
+        if isinstance(value, (dict, list)):
+            yield json.dumps(value, default=json_default)
+        else:
+            yield str(value)
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into index tokens.
+
+    Args:
+        text: Any text
+
+    Returns:
+        Lowercase alphanumeric runs, whole: a term can match anywhere in a
+        token, so cutting long ones (hashes, encoded blobs) would hide
+        their tails from search
+    """
+    return _TOKEN.findall(text.lower())
+
+
+def build_search_index(resources: Iterable[Dict[str, Any]]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Build the encoded index for resources in report row order.
+
+    Args:
+        resources: Resources, the n-th being report row n
+
+    Returns:
+        Tuple of (index dict with rows, tokens and postings,
+        stats dict with rows, tokens, bytes and seconds)
+    """
+    start = time.time()
+    postings: Dict[str, List[int]] = {}
+    rows = 0
+    for row, resource in enumerate(resources):
+        for token in set(tokenize(' '.join(_texts(resource)))):
+            postings.setdefault(token, []).append(row)
+        rows = row + 1
+
+    encoded = []
+    for token in sorted(postings):
+        previous = 0
+        deltas = []
+        for row in postings[token]:
+            deltas.append(format(row - previous, 'x'))
+            previous = row
+        encoded.append(','.join(deltas))
+
+    index = {
+        'rows': rows,
+        'tokens': ' '.join(sorted(postings)),
+        'postings': ' '.join(encoded),
+    }
+    stats = {
+        'rows': rows,
+        'tokens': len(postings),
+        'bytes': len(index['tokens']) + len(index['postings']),
+        'seconds': round(time.time() - start, 3),
+    }
+    return index, stats
@@ -0,0 +1,183 @@
+"""
+Bulk tag resolution through the Resource Groups Tagging API.
+
+Most collectors fetch tags with one list_tags call per resource. A TagIndex
+instead sweeps resourcegroupstaggingapi:GetResources once per region and
+keeps an ARN -> tags dict, so those collectors look tags up locally and only
+call their own tag API for resource types the sweep doesn't cover.
+"""
+
+import threading
+from typing import Dict, List, Optional
+
+
+# Resource types whose tags the sweep is trusted for, by ARN service.
+# None means every resource of the service. GetResources only returns
+# resources that have (or had) tags, so for these types an ARN missing from
+# the index means "no tags". The sweep asks only for these types.
+#
+# IoT things aren't taggable (they have attributes instead), so thing tags
+# come from the IoT collector as before; IoT policies are left out too, as
+# only newer policies carry tags the sweep reports.
+COVERED_TYPES: Dict[str, Optional[frozenset]] = {
+    'sqs': None,
+    'sns': None,
+    'kms': frozenset({'key'}),
+    'elasticloadbalancing': frozenset({'loadbalancer', 'targetgroup', 'listener'}),
+    'cloudwatch': frozenset({'alarm'}),
+    'rds': frozenset({'db', 'cluster', 'snapshot', 'cluster-snapshot', 'subgrp', 'pg', 'og', 'db-proxy'}),
+    'sagemaker': frozenset({'notebook-instance', 'endpoint', 'model', 'domain', 'training-job', 'feature-group'}),
+    'backup': frozenset({'backup-vault', 'backup-plan', 'framework', 'report-plan', 'restore-testing-plan'}),
+    'cloudfront': frozenset({'distribution'}),
+    'route53': frozenset({'hostedzone', 'healthcheck'}),
+    'ssm': frozenset({'parameter', 'document', 'maintenancewindow', 'patchbaseline'}),
+    'iot': frozenset({'thinggroup', 'thingtype'}),
+}
+
+# Region whose sweep covers global resources (CloudFront distributions)
+GLOBAL_TAG_REGION = 'us-east-1'
+
+
+def _resource_type(arn: str) -> Optional[tuple]:
+    """Get (service, resource type) from an ARN, or None if it isn't one."""
+    parts = arn.split(':', 5)
+    if len(parts) < 6 or parts[0] != 'arn':
+        return None
+    # The type ends at the first '/' or ':' (names after it may contain either)
+    resource = parts[5]
+    ends = [i for i in (resource.find('/'), resource.find(':')) if i >= 0]
+    return parts[2], resource[:min(ends)] if ends else resource
+
+
+def _type_filters() -> List[str]:
+    """Get GetResources ResourceTypeFilters ('service' or 'service:type') for COVERED_TYPES."""
+    filters = []
+    for service, types in sorted(COVERED_TYPES.items()):
+        if types is None:
+            filters.append(service)
+        else:
+            filters.extend(f"{service}:{resource_type}" for resource_type in sorted(types))
+    return filters
+
+
+class TagIndex:
+    """
+    Lazily built ARN -> tags index, one GetResources sweep per region.
+
+    The first lookup in a region runs the sweep; lookups from other threads
+    in that region wait for it. A region whose sweep fails (e.g. no
+    tag:GetResources permission) is marked unavailable and every lookup in
+    it returns None, so collectors fall back to their own tag calls.
+    """
+
+    def __init__(self, session):
+        """
+        Args:
+            session: boto3.Session or ClientFactory to create tagging clients from
+        """
+        self.session = session
+        self._lock = threading.Lock()
+        self._region_locks: Dict[str, threading.Lock] = {}
+        self._indexes: Dict[str, Optional[Dict[str, Dict[str, str]]]] = {}
+        self._partitions: Dict[str, Optional[str]] = {}
+        self.sweeps = 0
+        self.hits = 0
+        self.fallbacks = 0
+
+    def _sweep(self, region: str) -> Dict[str, Dict[str, str]]:
+        tagging = self.session.client('resourcegroupstaggingapi', region_name=region)
+        index = {}
+        paginator = tagging.get_paginator('get_resources')
+        for page in paginator.paginate(ResourcesPerPage=100, ResourceTypeFilters=_type_filters()):
+            for mapping in page.get('ResourceTagMappingList', []):
+                index[mapping['ResourceARN']] = {
+                    tag.get('Key', ''): tag.get('Value', '') for tag in mapping.get('Tags', [])
+                }
+        return index
+
+    def _index(self, region: str) -> Optional[Dict[str, Dict[str, str]]]:
+        with self._lock:
+            region_lock = self._region_locks.setdefault(region, threading.Lock())
+        with region_lock:
+            if region not in self._indexes:
+                try:
+                    self._indexes[region] = self._sweep(region)
+                except Exception:
+                    self._indexes[region] = None
+                with self._lock:
+                    self.sweeps += 1
+            return self._indexes[region]
+
+    def _partition(self, region: str) -> Optional[str]:
+        with self._lock:
+            if region not in self._partitions:
+                try:
+                    self._partitions[region] = self.session.get_partition_for_region(region)
+                except Exception:
+                    self._partitions[region] = None
+            return self._partitions[region]
+
+    def lookup(self, region: Optional[str], arn: str) -> Optional[Dict[str, str]]:
+        """
+        Get a resource's tags from the index.
+
+        Args:
+            region: Region the resource lives in (None for global resources)
+            arn: Resource ARN
+
+        Returns:
+            Tags dict (empty if the resource has none), or None if the index
+            can't answer and the caller should fetch the tags itself
+        """
+        resource_type = _resource_type(arn or '')
+        covered = resource_type is not None and resource_type[0] in COVERED_TYPES
+        if covered:
+            types = COVERED_TYPES[resource_type[0]]
+            covered = types is None or resource_type[1] in types
+        # An ARN built for another partition (e.g. arn:aws: in aws-cn) would
+        # never be in the sweep, so it must not read as "no tags"
+        if covered:
+            covered = arn.split(':', 2)[1] == self._partition(region or GLOBAL_TAG_REGION)
+        index = self._index(region or GLOBAL_TAG_REGION) if covered else None
+
+        with self._lock:
+            if index is None:
+                self.fallbacks += 1
+                return None
+            self.hits += 1
+        return dict(index.get(arn, {}))
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get index statistics.
+
+        Returns:
+            Dict with sweeps, hits (tags answered from the index) and
+            fallbacks (lookups left to the collector)
+        """
+        with self._lock:
+            return {'sweeps': self.sweeps, 'hits': self.hits, 'fallbacks': self.fallbacks}
+
+
+def lookup_tags(session, region: Optional[str], arn: str) -> Optional[Dict[str, str]]:
+    """
+    Look a resource's tags up in the scan's TagIndex, if it has one.
+
+    Collectors call this before their own tag API:
+
+        tags = lookup_tags(session, region, arn)
+        if tags is None:
+            tags = ...per-resource call...
+
+    Args:
+        session: The session (ClientFactory) the collector was given
+        region: Region the resource lives in (None for global resources)
+        arn: Resource ARN
+
+    Returns:
+        Tags dict, or None if there is no index or it doesn't cover the resource
+    """
+    index = getattr(session, 'tag_index', None)
+    if index is None:
+        return None
+    return index.lookup(region, arn)
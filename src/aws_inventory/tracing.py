@@ -0,0 +1,257 @@
+"""
+Span recording for scans, exported as Chrome trace events or OTLP JSON.
+
+One span per (service, region) task and a child span per AWS API call,
+recorded through the same client hooks as the rate limiter. Open Chrome
+trace files in Perfetto (https://ui.perfetto.dev) or chrome://tracing.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import threading
+import contextlib
+from typing import List, Dict, Any, Iterator
+
+from aws_inventory.ratelimit import is_throttle_response
+
+
+def _new_id(bits: int = 64) -> str:
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+def _in_event_loop() -> bool:
+    # No need to import asyncio just to find out it isn't running
+    asyncio = sys.modules.get('asyncio')
+    if asyncio is None:
+        return False
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
+class Tracer:
+    """
+    Thread-safe span recorder.
+
+    Timestamps are wall-clock microseconds, so spans recorded in worker
+    processes line up with the parent's when merged.
+    """
+
+    def __init__(self, process_name: str = 'awsmap'):
+        """
+        Args:
+            process_name: Label for this process in the trace
+        """
+        self.pid = os.getpid()
+        self.process_name = process_name
+        self.trace_id = _new_id(128)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._workers: Dict[int, int] = {}
+        self.spans: List[Dict[str, Any]] = []
+        self.processes: Dict[int, str] = {self.pid: process_name}
+
+    @staticmethod
+    def _now() -> int:
+        return int(time.time() * 1_000_000)
+
+    def _worker(self) -> int:
+        """Small, stable worker number for the current thread."""
+        ident = threading.get_ident()
+        with self._lock:
+            if ident not in self._workers:
+                self._workers[ident] = len(self._workers)
+            return self._workers[ident]
+
+    def _add(self, span: Dict[str, Any]) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    @contextlib.contextmanager
+    def task_span(self, name: str, **args) -> Iterator[None]:
+        """
+        Record a task span around the body; API calls inside become children.
+
+        Args:
+            name: Span name, e.g. 'ec2:snapshot us-east-1'
+            **args: Extra attributes (service, region, account...)
+        """
+        span_id = _new_id()
+        parent = getattr(self._local, 'span_id', None)
+        self._local.span_id = span_id
+        start = self._now()
+        try:
+            yield
+        finally:
+            self._local.span_id = parent
+            self._add({
+                'name': name, 'cat': 'task', 'start': start, 'dur': self._now() - start,
+                'pid': self.pid, 'tid': self._worker(), 'thread': threading.get_ident(),
+                'span_id': span_id, 'parent_id': parent, 'async': False, 'args': args,
+            })
+
+    def register(self, client, service_name: str) -> None:
+        """
+        Attach API call span hooks to a botocore or aiobotocore client.
+
+        Args:
+            client: botocore or aiobotocore client
+            service_name: boto3 service name the client was created for
+        """
+        region = client.meta.region_name or 'global'
+
+        def before_call(model, context, **kwargs):
+            context['awsmap_trace'] = {
+                'name': f"{service_name}.{model.name}",
+                'start': self._now(),
+                'parent_id': getattr(self._local, 'span_id', None),
+                # Concurrent calls on one event loop thread can't nest, so
+                # they're exported as async spans
+                'async': _in_event_loop(),
+                'throttles': 0,
+            }
+
+        def needs_retry(response=None, request_dict=None, **kwargs):
+            if is_throttle_response(response) and request_dict:
+                span = request_dict.get('context', {}).get('awsmap_trace')
+                if span is not None:
+                    span['throttles'] += 1
+
+        def finish(context, parsed=None, exception=None):
+            span = context.pop('awsmap_trace', None)
+            if span is None:
+                return
+            parsed = parsed or {}
+            args = {
+                'region': region,
+                'retries': parsed.get('ResponseMetadata', {}).get('RetryAttempts', 0),
+                'throttles': span['throttles'],
+            }
+            error = parsed.get('Error', {}).get('Code') or (type(exception).__name__ if exception else None)
+            if error:
+                args['error'] = error
+            self._add({
+                'name': span['name'], 'cat': 'api', 'start': span['start'],
+                'dur': self._now() - span['start'], 'pid': self.pid, 'tid': self._worker(),
+                'thread': threading.get_ident(), 'span_id': _new_id(),
+                'parent_id': span['parent_id'], 'async': span['async'], 'args': args,
+            })
+
+        def after_call(context, parsed=None, **kwargs):
+            finish(context, parsed=parsed)
+
+        def after_call_error(context, exception=None, **kwargs):
+            finish(context, exception=exception)
+
+        events = client.meta.events
+        events.register('before-call', before_call)
+        events.register('needs-retry', needs_retry)
+        events.register('after-call', after_call)
+        events.register('after-call-error', after_call_error)
+
+    def export(self) -> Dict[str, Any]:
+        """Get recorded spans and process names (picklable, for merging)."""
+        with self._lock:
+            return {'spans': list(self.spans), 'processes': dict(self.processes)}
+
+    def merge(self, exported: Dict[str, Any]) -> None:
+        """
+        Add spans recorded by another Tracer (e.g. in a worker process).
+
+        Args:
+            exported: Output of another instance's export()
+        """
+        with self._lock:
+            self.spans.extend(exported['spans'])
+            self.processes.update(exported['processes'])
+
+    def to_chrome(self) -> Dict[str, Any]:
+        """
+        Convert spans to Chrome trace event format.
+
+        Returns:
+            Dict with traceEvents
+        """
+        data = self.export()
+        events = []
+        for pid, name in data['processes'].items():
+            events.append({'name': 'process_name', 'ph': 'M', 'pid': pid, 'args': {'name': name}})
+        workers = sorted({(s['pid'], s['tid']) for s in data['spans']})
+        for pid, tid in workers:
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': f"worker {tid}"}})
+
+        for span in sorted(data['spans'], key=lambda s: s['start']):
+            args = dict(span['args'], thread=span['thread'])
+            if span['async']:
+                # Async spans may overlap on one thread; pair begin/end by id
+                common = {'name': span['name'], 'cat': span['cat'], 'pid': span['pid'],
+                          'tid': span['tid'], 'id': span['span_id']}
+                events.append(dict(common, ph='b', ts=span['start'], args=args))
+                events.append(dict(common, ph='e', ts=span['start'] + span['dur']))
+            else:
+                events.append({
+                    'name': span['name'], 'cat': span['cat'], 'ph': 'X',
+                    'ts': span['start'], 'dur': span['dur'],
+                    'pid': span['pid'], 'tid': span['tid'], 'args': args,
+                })
+            if span['args'].get('throttles'):
+                events.append({'name': 'throttled', 'cat': 'throttle', 'ph': 'i', 's': 't',
+                               'ts': span['start'] + span['dur'], 'pid': span['pid'], 'tid': span['tid'],
+                               'args': {'call': span['name'], 'throttles': span['args']['throttles']}})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """
+        Convert spans to OTLP JSON (an ExportTraceServiceRequest).
+
+        Returns:
+            Dict with resourceSpans
+        """
+        def attribute(key: str, value: Any) -> Dict[str, Any]:
+            if isinstance(value, bool):
+                return {'key': key, 'value': {'boolValue': value}}
+            if isinstance(value, int):
+                return {'key': key, 'value': {'intValue': str(value)}}
+            return {'key': key, 'value': {'stringValue': str(value)}}
+
+        spans = []
+        for span in self.export()['spans']:
+            attributes = [attribute(k, v) for k, v in span['args'].items() if v is not None]
+            attributes += [attribute('process.pid', span['pid']), attribute('thread.id', span['thread']),
+                           attribute('awsmap.worker', span['tid'])]
+            otlp_span = {
+                'traceId': self.trace_id,
+                'spanId': span['span_id'],
+                'name': span['name'],
+                'kind': 3 if span['cat'] == 'api' else 1,  # CLIENT / INTERNAL
+                'startTimeUnixNano': str(span['start'] * 1000),
+                'endTimeUnixNano': str((span['start'] + span['dur']) * 1000),
+                'attributes': attributes,
+            }
+            if span['parent_id']:
+                otlp_span['parentSpanId'] = span['parent_id']
+            if span['args'].get('error'):
+                otlp_span['status'] = {'code': 2, 'message': span['args']['error']}
+            spans.append(otlp_span)
+
+        return {'resourceSpans': [{
+            'resource': {'attributes': [attribute('service.name', 'awsmap')]},
+            'scopeSpans': [{'scope': {'name': 'aws_inventory'}, 'spans': spans}],
+        }]}
+
+    def write(self, path: str, trace_format: str = 'chrome') -> None:
+        """
+        Write the trace to a file.
+
+        Args:
+            path: Output file path
+            trace_format: 'chrome' or 'otlp'
+        """
+        data = self.to_otlp() if trace_format == 'otlp' else self.to_chrome()
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
@@ -0,0 +1,100 @@
+import json
+import threading
+from types import SimpleNamespace
+
+from botocore.hooks import HierarchicalEmitter
+
+from aws_inventory.cache import DEFAULT_CACHE_TTL, ResultCache
+
+ACCOUNT = '123456789012'
+BUCKET = {'service': 's3', 'type': 'bucket', 'id': 'logs', 'region': 'us-east-1', 'details': {}, 'tags': {}}
+
+
+def _client():
+    return SimpleNamespace(meta=SimpleNamespace(region_name='us-east-1', events=HierarchicalEmitter()))
+
+
+def test_put_then_get(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    cache.track()
+
+    assert cache.put(ACCOUNT, 's3', None, [BUCKET], fingerprint='fp')
+    assert cache.get(ACCOUNT, 's3', None) == [BUCKET]
+    assert cache.lookup(ACCOUNT, 's3', None) == {'resources': [BUCKET], 'fingerprint': 'fp'}
+    assert cache.get(ACCOUNT, 's3', 'eu-west-1') is None
+    assert cache.stats()['hits'] == 2
+
+
+def test_subtask_file_names_have_no_colon(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    cache.track()
+
+    assert cache.put(ACCOUNT, 'ec2:snapshot', 'us-east-1', [BUCKET])
+    assert [p.name for p in (tmp_path / ACCOUNT).iterdir()] == ['ec2%3Asnapshot.us-east-1.json']
+    assert cache.get(ACCOUNT, 'ec2:snapshot', 'us-east-1') == [BUCKET]
+
+
+def test_expired_and_refresh_entries_miss(tmp_path):
+    cache = ResultCache(str(tmp_path), ttls={'sqs': 60})
+    cache.put(ACCOUNT, 'sqs', 'us-east-1', [BUCKET])
+    path = tmp_path / ACCOUNT / 'sqs.us-east-1.json'
+    entry = json.loads(path.read_text())
+    entry['created'] -= 61
+    path.write_text(json.dumps(entry))
+
+    assert cache.get(ACCOUNT, 'sqs', 'us-east-1') is None
+
+    cache.put(ACCOUNT, 'sqs', 'us-east-1', [BUCKET])
+    assert ResultCache(str(tmp_path), refresh=True).get(ACCOUNT, 'sqs', 'us-east-1') is None
+
+
+def test_ttl_falls_back_from_subtask_to_service():
+    cache = ResultCache(ttls={'ec2': 120})
+
+    assert cache.ttl('ec2:snapshot') == 120
+    assert cache.ttl('iam') == 6 * 3600
+    assert cache.ttl('sqs') == DEFAULT_CACHE_TTL
+
+
+def test_empty_results_are_not_stored(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    cache.track()
+
+    assert not cache.put(ACCOUNT, 'sqs', 'us-east-1', [])
+    assert cache.get(ACCOUNT, 'sqs', 'us-east-1') is None
+    assert cache.stats()['skipped'] == 1
+
+
+def test_results_of_tasks_with_failed_calls_are_not_stored(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    client = _client()
+    cache.register(client, 's3')
+
+    cache.track()
+    client.meta.events.emit('after-call.s3.GetBucketPolicy', parsed={'Error': {'Code': 'NoSuchBucketPolicy'}})
+    assert cache.put(ACCOUNT, 's3', None, [BUCKET])
+
+    cache.track()
+    client.meta.events.emit('after-call.s3.ListBuckets', parsed={'Error': {'Code': 'SlowDown'}})
+    assert not cache.put(ACCOUNT, 's3', None, [BUCKET])
+
+    cache.track()
+    client.meta.events.emit('after-call-error.s3.ListBuckets', exception=OSError())
+    assert not cache.put(ACCOUNT, 's3', None, [BUCKET])
+
+
+def test_failures_are_tracked_per_thread(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    client = _client()
+    cache.register(client, 'iam')
+    cache.track()
+
+    def other_task():
+        cache.track()
+        client.meta.events.emit('after-call.iam.ListRoles', parsed={'Error': {'Code': 'AccessDenied'}})
+
+    thread = threading.Thread(target=other_task)
+    thread.start()
+    thread.join()
+
+    assert cache.put(ACCOUNT, 'iam', None, [BUCKET])
@@ -0,0 +1,32 @@
+from collections import Counter
+
+import boto3
+import pytest
+
+from aws_inventory import collector
+
+
+@pytest.fixture
+def session(monkeypatch):
+    monkeypatch.setattr(collector, 'get_account_id', lambda s: '123456789012')
+    monkeypatch.setattr(collector, 'get_enabled_regions', lambda s: ['us-east-1', 'eu-west-1'])
+    return boto3.Session(region_name='us-east-1', aws_access_key_id='a', aws_secret_access_key='b')
+
+
+def test_subtasks_covered_by_their_service_are_dropped(session):
+    plan = collector.plan_scan(session, ['ec2', 'ec2:snapshot', 'ec2'], ['us-east-1'])
+
+    assert plan['service_list'] == ['ec2']
+    assert not [task for task, count in Counter(plan['tasks']).items() if count > 1]
+    assert plan['tasks'].count(('ec2:snapshot', 'us-east-1')) == 1
+
+
+def test_subtask_alone_is_scheduled_alone(session):
+    plan = collector.plan_scan(session, ['ec2:snapshot'], ['us-east-1', 'eu-west-1'])
+
+    assert plan['tasks'] == [('ec2:snapshot', 'us-east-1'), ('ec2:snapshot', 'eu-west-1')]
+
+
+def test_unknown_subtask_is_rejected(session):
+    with pytest.raises(ValueError):
+        collector.plan_scan(session, ['ec2:nope'], ['us-east-1'])
@@ -0,0 +1,145 @@
+import json
+from types import SimpleNamespace
+
+from aws_inventory import configquery
+
+from aws_inventory.collector import get_subresource_types
+from aws_inventory.configquery import (
+    CONFIG_TYPES, _served_tasks, _split_tasks, collect_with_config, config_record, recorded_types,
+)
+
+
+def _session(group, recording=True):
+    config = SimpleNamespace(
+        describe_configuration_recorders=lambda: {
+            'ConfigurationRecorders': [{'name': 'default', 'recordingGroup': group}]
+        },
+        describe_configuration_recorder_status=lambda: {
+            'ConfigurationRecordersStatus': [{'name': 'default', 'recording': recording}]
+        },
+    )
+    return SimpleNamespace(client=lambda service_name, region_name=None, **kwargs: config)
+
+
+def test_recorded_types_all_supported():
+    group = {'allSupported': True, 'recordingStrategy': {'useOnly': 'ALL_SUPPORTED_RESOURCE_TYPES'}}
+
+    assert recorded_types(_session(group), 'us-east-1') == set(CONFIG_TYPES)
+
+
+def test_recorded_types_exclusion_strategy():
+    group = {
+        'allSupported': False,
+        'exclusionByResourceTypes': {'resourceTypes': ['AWS::EC2::Volume', 'AWS::CodeBuild::ReportGroup']},
+        'recordingStrategy': {'useOnly': 'EXCLUSION_BY_RESOURCE_TYPES'},
+    }
+
+    assert recorded_types(_session(group), 'us-east-1') == (
+        set(CONFIG_TYPES) - {'AWS::EC2::Volume'}
+    )
+
+
+def test_recorded_types_inclusion_and_stopped_recorders():
+    group = {
+        'allSupported': False,
+        'resourceTypes': ['AWS::EC2::Volume', 'AWS::S3::Bucket'],
+        'recordingStrategy': {'useOnly': 'INCLUSION_BY_RESOURCE_TYPES'},
+    }
+
+    assert recorded_types(_session(group), 'us-east-1') == {'AWS::EC2::Volume'}
+    assert recorded_types(_session(group, recording=False), 'us-east-1') == set()
+
+
+def test_only_recorded_tasks_of_requested_services_are_served():
+    recorded = {'AWS::RDS::DBInstance', 'AWS::EC2::Volume'}
+
+    served = _served_tasks(recorded, ['rds', 'sqs', 'acm'])
+
+    assert served == {'rds:db-instance'}
+    fallback = _split_tasks(['rds', 'sqs', 'acm'], served)
+    assert 'rds:db-instance' not in fallback
+    assert 'rds:db-cluster' in fallback
+    assert fallback[-2:] == ['sqs', 'acm']
+
+
+def test_split_tasks_falls_back_per_subresource():
+    served = _served_tasks({'AWS::EC2::Instance', 'AWS::EC2::Volume'}, ['ec2'])
+
+    assert served == {'ec2:instance', 'ec2:volume'}
+    fallback = _split_tasks(['ec2'], served)
+    assert 'ec2:instance' not in fallback
+    assert set(fallback) == {f"ec2:{t}" for t in get_subresource_types('ec2')} - served
+
+
+def test_config_record_uses_collector_ids_and_details():
+    row = {
+        'resourceId': 'db-ABCDEFGHIJKL',
+        'resourceName': 'main',
+        'resourceType': 'AWS::RDS::DBInstance',
+        'arn': 'arn:aws:rds:us-east-1:123456789012:db:main',
+        'awsRegion': 'us-east-1',
+        'accountId': '210987654321',
+        'tags': [{'key': 'team', 'value': 'core'}],
+        'configuration': {
+            'dBInstanceIdentifier': 'main',
+            'dBInstanceClass': 'db.t3.micro',
+            'engine': 'postgres',
+            'endpoint': {'address': 'main.example.com', 'port': 5432},
+            'dbiResourceId': 'db-ABCDEFGHIJKL',
+        },
+    }
+
+    record = config_record(row, '123456789012')
+
+    assert (record['service'], record['type'], record['id'], record['name']) == ('rds', 'db-instance', 'main', 'main')
+    assert record['details']['instance_class'] == 'db.t3.micro'
+    assert record['details']['endpoint'] == 'main.example.com'
+    assert record['details']['port'] == 5432
+    assert 'dbi_resource_id' not in record['details']
+    assert record['tags'] == {'team': 'core'}
+    assert record['account_id'] == '210987654321'
+
+
+def test_config_record_keeps_ec2_resource_ids():
+    row = {
+        'resourceId': 'i-0abc',
+        'resourceType': 'AWS::EC2::Instance',
+        'awsRegion': 'us-east-1',
+        'tags': [{'key': 'Name', 'value': 'web'}],
+        'configuration': {'instanceType': 't3.micro', 'state': {'name': 'running'}, 'platform': None},
+    }
+
+    record = config_record(row, '123456789012')
+
+    assert (record['id'], record['name']) == ('i-0abc', 'web')
+    assert record['details']['state'] == 'running'
+    assert record['details']['platform'] == 'linux'
+
+
+def test_aggregator_keeps_only_served_rows_of_the_callers_account(monkeypatch):
+    group = {'allSupported': False, 'resourceTypes': ['AWS::EC2::Volume'],
+             'recordingStrategy': {'useOnly': 'INCLUSION_BY_RESOURCE_TYPES'}}
+    rows = [
+        {'resourceId': 'vol-1', 'resourceType': 'AWS::EC2::Volume', 'accountId': '123456789012'},
+        {'resourceId': 'i-1', 'resourceType': 'AWS::EC2::Instance', 'accountId': '123456789012'},
+        {'resourceId': 'i-2', 'resourceType': 'AWS::EC2::Instance', 'accountId': '210987654321'},
+    ]
+    queries = []
+    session = _session(group)
+    config = session.client('config')
+    config.get_paginator = lambda name: SimpleNamespace(
+        paginate=lambda **kwargs: queries.append(kwargs) or [{'Results': [json.dumps(r) for r in rows]}]
+    )
+    session.region_name = 'us-east-1'
+    fallback = []
+    monkeypatch.setattr(configquery, 'get_account_id', lambda s: '123456789012')
+    monkeypatch.setattr(configquery, 'collect_all', lambda s, services, **kwargs: fallback.extend(services) or {
+        'metadata': {}, 'resources': []
+    })
+
+    result = collect_with_config(session, services=['ec2'], regions=['us-east-1'], aggregator='org')
+
+    assert "'AWS::EC2::Instance'" in queries[0]['Expression']
+    assert sorted(r['id'] for r in result['resources']) == ['i-2', 'vol-1']
+    assert result['metadata']['config_tasks'] == ['ec2:volume']
+    assert 'ec2:instance' in fallback and 'ec2:volume' not in fallback
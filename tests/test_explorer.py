@@ -0,0 +1,76 @@
+from types import SimpleNamespace
+
+import pytest
+
+from aws_inventory import explorer
+from aws_inventory.explorer import _enriched_types, collect_with_explorer, explorer_record, find_indexes
+
+
+INDEXES = [
+    {'Region': 'us-east-1', 'Type': 'AGGREGATOR'},
+    {'Region': 'eu-west-1', 'Type': 'LOCAL'},
+]
+
+
+def _session(indexes, resources=()):
+    pages = {'list_indexes': [{'Indexes': indexes}], 'list_resources': [{'Resources': list(resources)}]}
+    client = SimpleNamespace(
+        get_paginator=lambda name: SimpleNamespace(paginate=lambda **kwargs: iter(pages[name]))
+    )
+    return SimpleNamespace(region_name='us-east-1', client=lambda service_name, **kwargs: client)
+
+
+def _resource(arn, resource_type, region='us-east-1'):
+    return {'Arn': arn, 'ResourceType': resource_type, 'Service': resource_type.split(':')[0], 'Region': region}
+
+
+def test_explorer_record_uses_collector_service_and_type_names():
+    db = explorer_record(_resource('arn:aws:rds:us-east-1:123456789012:db:main', 'rds:db'), '123456789012')
+    alb = explorer_record(_resource(
+        'arn:aws:elasticloadbalancing:us-east-1:123456789012:loadbalancer/app/web/abc',
+        'elasticloadbalancing:loadbalancer/app'), '123456789012')
+    queue = explorer_record(_resource('arn:aws:sqs:us-east-1:123456789012:orders', 'sqs:queue'), '123456789012')
+
+    assert (db['service'], db['type'], db['id']) == ('rds', 'db-instance', 'main')
+    assert (alb['service'], alb['type']) == ('elbv2', 'application-load-balancer')
+    assert (queue['service'], queue['type']) == ('sqs', 'queue')
+
+
+def test_find_indexes_returns_aggregator_and_indexed_regions():
+    assert find_indexes(_session(INDEXES)) == ('us-east-1', {'us-east-1', 'eu-west-1'})
+
+    with pytest.raises(ValueError, match='No Resource Explorer aggregator index'):
+        find_indexes(_session([{'Region': 'eu-west-1', 'Type': 'LOCAL'}]))
+
+
+def test_enriched_types_replace_whole_services_or_returned_types():
+    enriched = [{'service': 'ec2', 'type': 'snapshot'}, {'service': 'sqs', 'type': 'queue'}]
+
+    assert _enriched_types(['sqs', 'ec2:snapshot'], enriched) == {'sqs': None, 'ec2': {'snapshot'}}
+    assert _enriched_types(['ec2:image', 'ec2'], enriched) == {'ec2': None}
+
+
+def test_collect_with_explorer_rejects_unindexed_regions(monkeypatch):
+    monkeypatch.setattr(explorer, 'get_account_id', lambda session: '123456789012')
+
+    with pytest.raises(ValueError, match='no index in ap-south-1'):
+        collect_with_explorer(_session(INDEXES), regions=['eu-west-1', 'ap-south-1'])
+
+
+def test_enrichment_drops_index_records_the_collector_no_longer_finds(monkeypatch):
+    resources = [
+        _resource('arn:aws:sqs:us-east-1:123456789012:orders', 'sqs:queue'),
+        _resource('arn:aws:sqs:us-east-1:123456789012:deleted', 'sqs:queue'),
+        _resource('arn:aws:sns:us-east-1:123456789012:alerts', 'sns:topic'),
+    ]
+    collected = {'service': 'sqs', 'type': 'queue', 'arn': resources[0]['Arn'], 'region': 'us-east-1'}
+    monkeypatch.setattr(explorer, 'get_account_id', lambda session: '123456789012')
+    monkeypatch.setattr(explorer, 'collect_all', lambda session, **kwargs: {'resources': [collected]})
+
+    result = collect_with_explorer(_session(INDEXES, resources), services=['sqs'], regions=['us-east-1'])
+
+    assert sorted(r['arn'] for r in result['resources']) == [
+        'arn:aws:sns:us-east-1:123456789012:alerts',
+        'arn:aws:sqs:us-east-1:123456789012:orders',
+    ]
+    assert collected in result['resources']
@@ -0,0 +1,125 @@
+from aws_inventory.incremental import Baseline, fingerprint_lambda
+
+ACCOUNT = '123456789012'
+FUNCTION_ARN = f'arn:aws:lambda:us-east-1:{ACCOUNT}:function:api'
+
+
+class FakePaginator:
+    def __init__(self, pages):
+        self.pages = pages
+
+    def paginate(self, **kwargs):
+        return iter(self.pages)
+
+
+class FakeClient:
+    def __init__(self, pages):
+        self.pages = pages
+
+    def get_paginator(self, operation):
+        return FakePaginator(self.pages.get(operation, [{}]))
+
+
+class FakeSession:
+    def __init__(self, tags=None, revision='r1'):
+        self.clients = {
+            'lambda': FakeClient({
+                'list_functions': [{'Functions': [
+                    {'FunctionArn': FUNCTION_ARN, 'LastModified': '2024-05-01', 'RevisionId': revision},
+                ]}],
+            }),
+            'resourcegroupstaggingapi': FakeClient({
+                'get_resources': [{'ResourceTagMappingList': [
+                    {'ResourceARN': FUNCTION_ARN, 'Tags': [{'Key': k, 'Value': v} for k, v in (tags or {}).items()]},
+                ]}],
+            }),
+        }
+
+    def client(self, service_name, region_name=None):
+        return self.clients[service_name]
+
+
+def _function_record(tags=None):
+    return {'service': 'lambda', 'type': 'function', 'id': 'api', 'arn': FUNCTION_ARN,
+            'region': 'us-east-1', 'details': {}, 'tags': tags or {}}
+
+
+def _baseline(session, resources):
+    fingerprint, _ = fingerprint_lambda(session, 'us-east-1')
+    return Baseline({
+        'metadata': {'account_id': ACCOUNT, 'fingerprints': {'lambda:us-east-1': fingerprint}},
+        'resources': resources,
+    })
+
+
+def _collector(calls):
+    def collect(session, region, account_id):
+        calls.append(region)
+        return [_function_record({'Env': 'new'})]
+    return collect
+
+
+def test_fingerprint_changes_with_tags_and_revision():
+    base, counts = fingerprint_lambda(FakeSession({'Env': 'prod'}), 'us-east-1')
+
+    assert counts == {'function': 1, 'layer': 0, 'event-source-mapping': 0}
+    assert fingerprint_lambda(FakeSession({'Env': 'dev'}), 'us-east-1')[0] != base
+    assert fingerprint_lambda(FakeSession({'Env': 'prod'}, revision='r2'), 'us-east-1')[0] != base
+    assert fingerprint_lambda(FakeSession({'Env': 'prod'}), 'us-east-1')[0] == base
+
+
+def test_unchanged_slice_is_reused():
+    session = FakeSession({'Env': 'prod'})
+    baseline = _baseline(session, [_function_record({'Env': 'prod'})])
+    calls = []
+
+    resources = baseline.collect(_collector(calls), session, 'lambda', 'us-east-1', ACCOUNT)
+
+    assert calls == []
+    assert resources == [_function_record({'Env': 'prod'})]
+    assert baseline.stats()['slices_reused'] == 1
+
+
+def test_slice_missing_from_baseline_is_rescanned():
+    # The fingerprint matches, but the baseline scan came back empty
+    session = FakeSession({'Env': 'prod'})
+    baseline = _baseline(session, [])
+    calls = []
+
+    baseline.collect(_collector(calls), session, 'lambda', 'us-east-1', ACCOUNT)
+
+    assert calls == ['us-east-1']
+    assert baseline.stats()['slices_reused'] == 0
+
+
+def test_changed_fingerprint_or_other_account_is_rescanned():
+    baseline = _baseline(FakeSession({'Env': 'prod'}), [_function_record({'Env': 'prod'})])
+    calls = []
+
+    baseline.collect(_collector(calls), FakeSession({'Env': 'dev'}), 'lambda', 'us-east-1', ACCOUNT)
+    baseline.collect(_collector(calls), FakeSession({'Env': 'prod'}), 'lambda', 'us-east-1', '999999999999')
+
+    assert calls == ['us-east-1', 'us-east-1']
+
+
+def test_tag_filtered_baseline_is_never_reused():
+    session = FakeSession()
+    fingerprint, _ = fingerprint_lambda(session, 'us-east-1')
+    baseline = Baseline({
+        'metadata': {'account_id': ACCOUNT, 'fingerprints': {'lambda:us-east-1': fingerprint},
+                     'tag_filter': {'Env': ['prod']}},
+        'resources': [_function_record()],
+    })
+    calls = []
+
+    baseline.collect(_collector(calls), session, 'lambda', 'us-east-1', ACCOUNT)
+
+    assert calls == ['us-east-1']
+
+
+def test_services_without_fingerprinter_always_collect():
+    calls = []
+
+    Baseline().collect(_collector(calls), FakeSession(), 'cloudformation', 'us-east-1', ACCOUNT)
+
+    assert calls == ['us-east-1']
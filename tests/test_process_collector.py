@@ -0,0 +1,43 @@
+import datetime
+import multiprocessing
+import threading
+
+from botocore.credentials import Credentials, RefreshableCredentials
+
+from aws_inventory.process_collector import _credential_metadata, _decode, _encode, _worker_session
+
+
+def _metadata(access_key, minutes):
+    expiry = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(minutes=minutes)
+    return {'access_key': access_key, 'secret_key': 'secret', 'token': 'token', 'expiry_time': expiry.isoformat()}
+
+
+def test_static_credentials_are_passed_as_is():
+    credentials = {'metadata': _credential_metadata(Credentials('AKIA1', 'secret')),
+                   'refreshable': False, 'region_name': 'eu-west-1'}
+    parent, child = multiprocessing.Pipe()
+
+    session = _worker_session(child, threading.Lock(), credentials)
+
+    assert session.get_credentials().get_frozen_credentials().access_key == 'AKIA1'
+    assert session.region_name == 'eu-west-1'
+
+
+def test_refreshable_credentials_are_re_read_from_the_parent():
+    parent_credentials = RefreshableCredentials.create_from_metadata(
+        metadata=_metadata('AKIA2', 60), refresh_using=lambda: _metadata('AKIA3', 60), method='test'
+    )
+    parent, child = multiprocessing.Pipe()
+
+    def serve():
+        assert _decode(parent.recv_bytes()) == ('credentials',)
+        parent.send_bytes(_encode(_credential_metadata(parent_credentials)))
+
+    server = threading.Thread(target=serve)
+    server.start()
+    # Already inside the mandatory refresh window, so the first read asks the parent
+    credentials = {'metadata': _metadata('AKIA1', 5), 'refreshable': True, 'region_name': None}
+    session = _worker_session(child, threading.Lock(), credentials)
+
+    assert session.get_credentials().get_frozen_credentials().access_key == 'AKIA2'
+    server.join(5)
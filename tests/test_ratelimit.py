@@ -0,0 +1,197 @@
+import asyncio
+import http.server
+import threading
+from types import SimpleNamespace
+
+import boto3
+import pytest
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from botocore.hooks import HierarchicalEmitter
+
+from aws_inventory.cancellation import CancellationScope, TaskCancelled
+
+from aws_inventory.ratelimit import (
+    AdaptiveConcurrency,
+    RateLimiter,
+    TokenBucket,
+    is_throttle_response,
+)
+
+
+def _fake_client(region='us-east-1'):
+    return SimpleNamespace(meta=SimpleNamespace(region_name=region, events=HierarchicalEmitter()))
+
+
+def test_is_throttle_response():
+    assert is_throttle_response((None, {'Error': {'Code': 'ThrottlingException'}}))
+    assert not is_throttle_response((None, {'Error': {'Code': 'AccessDenied'}}))
+    assert not is_throttle_response((None, None))
+    assert not is_throttle_response(None)
+
+
+def test_token_bucket_waits_once_burst_is_spent():
+    bucket = TokenBucket(rate=1000.0, burst=2)
+
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() > 0.0
+
+
+def test_adaptive_concurrency_aimd():
+    concurrency = AdaptiveConcurrency(initial=8, maximum=10)
+
+    concurrency.on_throttle()
+    assert concurrency.limit == 4.0
+    for _ in range(4):
+        concurrency.on_success()
+    assert 4.9 < concurrency.limit < 5.1
+
+    for _ in range(10):
+        concurrency.on_throttle()
+    assert concurrency.limit == 1.0
+
+    for _ in range(1000):
+        concurrency.on_success()
+    assert concurrency.limit == 10
+
+
+def test_adaptive_concurrency_blocks_at_limit():
+    concurrency = AdaptiveConcurrency(initial=1, maximum=1)
+    concurrency.acquire()
+    acquired = threading.Event()
+
+    def second():
+        concurrency.acquire()
+        acquired.set()
+
+    thread = threading.Thread(target=second, daemon=True)
+    thread.start()
+    assert not acquired.wait(0.05)
+    concurrency.release()
+    assert acquired.wait(1.0)
+
+
+def test_adaptive_concurrency_acquire_times_out():
+    concurrency = AdaptiveConcurrency(initial=1, maximum=1)
+    assert concurrency.acquire()
+
+    assert not concurrency.acquire(timeout=0.05)
+    assert concurrency.in_flight == 1
+
+
+def test_adaptive_concurrency_acquire_stops_when_cancelled():
+    concurrency = AdaptiveConcurrency(initial=1, maximum=1)
+    concurrency.acquire()
+    cancelled = threading.Event()
+    result = []
+
+    thread = threading.Thread(target=lambda: result.append(concurrency.acquire(cancelled=cancelled.is_set)))
+    thread.start()
+    cancelled.set()
+    thread.join(2.0)
+
+    assert result == [False]
+    assert concurrency.in_flight == 1
+
+
+def test_rate_limiter_raises_task_cancelled_while_waiting_for_a_slot():
+    limiter = RateLimiter(max_concurrency=1, cancelled=lambda: True)
+    client = _fake_client()
+    limiter.register(client, 'ec2')
+    _, concurrency = limiter._get('ec2', 'us-east-1')
+    concurrency.acquire()
+
+    with pytest.raises(TaskCancelled):
+        client.meta.events.emit('before-call.ec2.DescribeVpcs', context={})
+    assert concurrency.in_flight == 1
+
+
+def test_rate_limiter_hooks_count_throttles_and_release_slots():
+    limiter = RateLimiter(max_concurrency=4)
+    client = _fake_client()
+    limiter.register(client, 'iam')
+    events = client.meta.events
+    _, concurrency = limiter._get('iam', 'us-east-1')
+
+    context = {}
+    events.emit('before-call.iam.ListRoles', context=context)
+    assert concurrency.in_flight == 1
+    events.emit('needs-retry.iam.ListRoles', response=(None, {'Error': {'Code': 'Throttling'}}))
+    events.emit('after-call.iam.ListRoles', context=context, parsed={'Error': {'Code': 'Throttling'}})
+
+    assert concurrency.in_flight == 0
+    assert limiter.stats()['throttles'] == {'iam': 1}
+    assert limiter.stats()['throttle_failures'] == {'iam': 1}
+
+
+def test_rate_limiter_starts_control_plane_services_low():
+    limiter = RateLimiter(max_concurrency=40)
+
+    assert limiter._get('iam', 'global')[1].limit == 4
+    assert limiter._get('ec2', 'us-east-1')[1].limit == 40
+
+
+def test_register_async_waits_without_blocking_the_loop():
+    from aiobotocore.hooks import AioHierarchicalEmitter
+
+    limiter = RateLimiter(max_concurrency=1)
+    client = SimpleNamespace(meta=SimpleNamespace(region_name='us-east-1', events=AioHierarchicalEmitter()))
+    limiter.register_async(client, 'sqs')
+    events = client.meta.events
+    _, concurrency = limiter._get('sqs', 'us-east-1')
+
+    async def call(name, order):
+        context = {}
+        await events.emit('before-call.sqs.ListQueues', context=context)
+        order.append(name)
+        await asyncio.sleep(0.02)
+        await events.emit('after-call.sqs.ListQueues', context=context, parsed={})
+
+    async def run():
+        order = []
+        await asyncio.gather(call('a', order), call('b', order))
+        return order
+
+    assert asyncio.run(run()) == ['a', 'b']
+    assert concurrency.in_flight == 0
+
+
+def test_cancel_during_retries_releases_the_slot():
+    scope = CancellationScope()
+    limiter = RateLimiter(max_concurrency=4, cancelled=scope.is_cancelled)
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_POST(self):
+            # Cancel the task while its call is in flight, then ask for a retry
+            scope.cancel('task')
+            self.rfile.read(int(self.headers.get('content-length') or 0))
+            self.send_response(500)
+            self.send_header('content-length', '0')
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.HTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        client = boto3.client(
+            'sqs', region_name='us-east-1', endpoint_url=f"http://127.0.0.1:{server.server_port}",
+            aws_access_key_id='AKIDTEST', aws_secret_access_key='secret',
+            config=Config(retries={'mode': 'standard', 'max_attempts': 2}),
+        )
+        scope.register(client, 'sqs')
+        limiter.register(client, 'sqs')
+        _, concurrency = limiter._get('sqs', 'us-east-1')
+
+        def list_twice():
+            with pytest.raises(ClientError):
+                client.list_queues()
+            client.list_queues()
+
+        with pytest.raises(TaskCancelled):
+            scope.run('task', list_twice)
+        assert concurrency.in_flight == 0
+    finally:
+        server.shutdown()
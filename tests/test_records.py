@@ -0,0 +1,69 @@
+import json
+import pickle
+
+import pytest
+
+from aws_inventory.records import Resource, compact_records, json_default, memory_per_resource
+
+
+def _resource(**overrides):
+    data = {
+        'service': 'ec2',
+        'type': 'instance',
+        'id': 'i-0123',
+        'arn': 'arn:aws:ec2:us-east-1:123456789012:instance/i-0123',
+        'name': 'web',
+        'region': 'us-east-1',
+        'details': {'state': 'running'},
+        'tags': {'Name': 'web'},
+    }
+    data.update(overrides)
+    return data
+
+
+def test_resource_behaves_like_the_dict_it_was_built_from():
+    data = _resource()
+    record = Resource(data)
+
+    assert record == data
+    assert record['id'] == 'i-0123'
+    assert record.get('missing') is None
+    assert list(record) == list(data)
+    assert len(record) == len(data)
+    assert record.to_dict() == data
+
+
+def test_resource_keeps_extra_fields_and_deletes():
+    record = Resource(_resource())
+    record['account_id'] = '123456789012'
+    record['custom'] = 1
+
+    assert record['custom'] == 1
+    assert list(record)[-2:] == ['account_id', 'custom']
+    del record['custom']
+    del record['name']
+    assert 'custom' not in record and 'name' not in record
+    with pytest.raises(KeyError):
+        record['name']
+
+
+def test_resource_interns_shared_strings():
+    first = Resource(_resource(region=''.join(['us-', 'east-1'])))
+    second = Resource(_resource(region=''.join(['us-', 'east', '-1'])))
+
+    assert first['region'] is second['region']
+
+
+def test_compact_records_pickle_and_json_round_trip():
+    records = compact_records([_resource(), Resource(_resource(id='i-2'))])
+
+    assert all(isinstance(r, Resource) for r in records)
+    assert pickle.loads(pickle.dumps(records[0])) == records[0]
+    assert json.loads(json.dumps(records, default=json_default))[1]['id'] == 'i-2'
+
+
+def test_memory_per_resource_is_lower_for_compact_records():
+    resources = [_resource(id=f"i-{n}", name=f"web-{n}") for n in range(200)]
+
+    assert memory_per_resource([]) == 0.0
+    assert memory_per_resource(compact_records(resources)) < memory_per_resource(resources)
@@ -0,0 +1,56 @@
+from aws_inventory.scheduling import (
+    DEFAULT_TASK_SECONDS,
+    TaskHistory,
+    estimate_duration,
+    order_longest_first,
+)
+
+
+def test_expected_falls_back_to_service_average_then_default(tmp_path):
+    history = TaskHistory(str(tmp_path / 'history.json'))
+    history.record('ec2', 'us-east-1', 10.0)
+    history.record('ec2', 'eu-west-1', 20.0)
+
+    assert history.expected('ec2', 'us-east-1') == 10.0
+    assert history.expected('ec2', 'ap-south-1') == 15.0
+    assert history.expected('s3', None) == DEFAULT_TASK_SECONDS
+
+
+def test_record_smooths_repeated_measurements(tmp_path):
+    history = TaskHistory(str(tmp_path / 'history.json'))
+    history.record('iam', None, 10.0)
+    history.record('iam', None, 20.0)
+
+    assert history.expected('iam', None) == 15.0
+
+
+def test_save_and_reload(tmp_path):
+    path = str(tmp_path / 'nested' / 'history.json')
+    history = TaskHistory(path)
+    history.record('lambda', 'us-east-1', 1.23456)
+    history.save()
+
+    assert TaskHistory(path).expected('lambda', 'us-east-1') == 1.235
+
+
+def test_corrupt_history_file_is_ignored(tmp_path):
+    path = tmp_path / 'history.json'
+    path.write_text('not json')
+
+    assert TaskHistory(str(path)).durations == {}
+
+
+def test_order_longest_first(tmp_path):
+    history = TaskHistory(str(tmp_path / 'history.json'))
+    history.record('ec2', 'us-east-1', 30.0)
+    history.record('s3', None, 5.0)
+    tasks = [('s3', None), ('sqs', 'us-east-1'), ('ec2', 'us-east-1')]
+
+    assert order_longest_first(tasks, history) == [('ec2', 'us-east-1'), ('s3', None), ('sqs', 'us-east-1')]
+
+
+def test_estimate_duration_greedy_list_scheduling():
+    assert estimate_duration([], 4) == 0.0
+    assert estimate_duration([5, 1, 1, 1, 1, 1], 2) == 5.0
+    assert estimate_duration([1, 1, 1, 1, 1, 5], 2) == 7.0
+    assert estimate_duration([3, 3], 8) == 3.0
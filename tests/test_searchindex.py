@@ -0,0 +1,66 @@
+from aws_inventory.searchindex import build_search_index, tokenize
+
+
+def _postings(index):
+    """Decode the index to {token: [rows]}."""
+    decoded = {}
+    for token, encoded in zip(index['tokens'].split(' '), index['postings'].split(' ')):
+        row = 0
+        decoded[token] = []
+        for delta in encoded.split(','):
+            row += int(delta, 16)
+            decoded[token].append(row)
+    return decoded
+
+
+def _substring_rows(index, term):
+    """Rows with a token containing term, the way the report script matches."""
+    return {row for token, rows in _postings(index).items() if term in token for row in rows}
+
+
+def test_tokenize_splits_and_lowercases():
+    assert tokenize('MyProd-App 10.0.1.5') == ['myprod', 'app', '10', '0', '1', '5']
+
+
+def test_build_search_index_encodes_sorted_tokens_and_row_deltas():
+    resources = [
+        {'name': 'myprod-app', 'id': 'i-1', 'details': {'ip': '10.0.1.5'}},
+        {'name': 'staging', 'id': 'i-2', 'tags': {'env': 'prod'}},
+        {'name': 'myprod-db', 'id': 'i-3', 'details': {'ports': [5432], 'note': None}},
+    ]
+
+    index, stats = build_search_index(resources)
+
+    tokens = index['tokens'].split(' ')
+    assert tokens == sorted(tokens)
+    assert index['rows'] == stats['rows'] == 3
+    assert stats['tokens'] == len(tokens)
+    postings = _postings(index)
+    assert postings['myprod'] == [0, 2]
+    assert postings['5432'] == [2]
+    assert 'none' not in postings
+
+
+def test_terms_match_inside_tokens():
+    resources = [{'name': 'myprod-app'}, {'name': 'production'}, {'name': 'staging'}]
+    index, _ = build_search_index(resources)
+
+    assert _substring_rows(index, 'prod') == {0, 1}
+    assert _substring_rows(index, 'rod') == {0, 1}
+    assert _substring_rows(index, 'stag') == {2}
+
+
+def test_terms_match_past_the_start_of_long_tokens():
+    token = 'x' * 40 + 'tail'
+    index, _ = build_search_index([{'name': 'short'}, {'name': 'blob', 'details': {'hash': token}}])
+
+    assert token in index['tokens'].split(' ')
+    assert _substring_rows(index, 'tail') == {1}
+
+
+def test_empty_index():
+    index, stats = build_search_index([])
+
+    assert index['rows'] == 0
+    assert index['tokens'] == ''
+    assert stats['tokens'] == 0
@@ -0,0 +1,82 @@
+from types import SimpleNamespace
+
+from aws_inventory.tagging import TagIndex, _resource_type, _type_filters, lookup_tags
+
+
+class FakePaginator:
+    def __init__(self, pages, calls):
+        self.pages = pages
+        self.calls = calls
+
+    def paginate(self, **kwargs):
+        self.calls.append(kwargs)
+        if isinstance(self.pages, Exception):
+            raise self.pages
+        return iter(self.pages)
+
+
+class FakeSession:
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    def client(self, service_name, region_name=None):
+        return SimpleNamespace(get_paginator=lambda name: FakePaginator(self.pages, self.calls))
+
+    def get_partition_for_region(self, region_name):
+        return 'aws-cn' if region_name.startswith('cn-') else 'aws'
+
+
+QUEUE_ARN = 'arn:aws:sqs:us-east-1:123456789012:orders'
+
+
+def test_resource_type_from_arn():
+    assert _resource_type(QUEUE_ARN) == ('sqs', 'orders')
+    assert _resource_type('arn:aws:rds:us-east-1:123456789012:db:main') == ('rds', 'db')
+    assert _resource_type('arn:aws:ssm:us-east-1:123456789012:parameter/app/key') == ('ssm', 'parameter')
+    assert _resource_type('arn:aws:route53:::hostedzone/Z123') == ('route53', 'hostedzone')
+    assert _resource_type('not-an-arn') is None
+
+
+def test_type_filters_cover_every_trusted_type():
+    filters = _type_filters()
+
+    assert 'sqs' in filters
+    assert 'kms:key' in filters
+    assert 'route53:hostedzone' in filters
+    assert not any(f.startswith('lambda') for f in filters)
+
+
+def test_lookup_sweeps_once_per_region_with_type_filters():
+    session = FakeSession([{'ResourceTagMappingList': [
+        {'ResourceARN': QUEUE_ARN, 'Tags': [{'Key': 'team', 'Value': 'core'}]},
+    ]}])
+    index = TagIndex(session)
+
+    assert index.lookup('us-east-1', QUEUE_ARN) == {'team': 'core'}
+    assert index.lookup('us-east-1', 'arn:aws:sqs:us-east-1:123456789012:untagged') == {}
+    assert len(session.calls) == 1
+    assert session.calls[0]['ResourceTypeFilters'] == _type_filters()
+    assert index.stats() == {'sweeps': 1, 'hits': 2, 'fallbacks': 0}
+
+
+def test_lookup_falls_back_for_uncovered_types_and_failed_sweeps():
+    index = TagIndex(FakeSession(RuntimeError('AccessDenied')))
+
+    assert index.lookup('us-east-1', 'arn:aws:lambda:us-east-1:123456789012:function:f') is None
+    assert index.lookup('us-east-1', 'arn:aws:iot:us-east-1:123456789012:thing/sensor') is None
+    assert index.lookup('us-east-1', QUEUE_ARN) is None
+    assert index.stats()['fallbacks'] == 3
+
+
+def test_lookup_falls_back_for_arns_from_another_partition():
+    index = TagIndex(FakeSession([{'ResourceTagMappingList': []}]))
+
+    assert index.lookup('cn-north-1', 'arn:aws:ssm:cn-north-1:123456789012:parameter/app/key') is None
+    assert index.lookup(None, 'arn:aws-cn:route53:::hostedzone/Z123') is None
+    assert index.lookup('cn-north-1', 'arn:aws-cn:ssm:cn-north-1:123456789012:parameter/app/key') == {}
+    assert index.stats() == {'sweeps': 1, 'hits': 1, 'fallbacks': 2}
+
+
+def test_lookup_tags_without_an_index():
+    assert lookup_tags(SimpleNamespace(), 'us-east-1', QUEUE_ARN) is None